@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+NAME: cc_fake_controller_9800.py
+
+CLASSIFICATION: test tool
+
+PURPOSE:
+Stands in for the CLI of a cisco 9800 controller on stdin/stdout, so that
+cc_session_9800_3504.py and cc_module_9800_3504.py can be exercised without a
+controller. It prompts for User:/Password:, enable, config, config-wlan,
+config-policy-tag and config-line modes, pages long output with --More-- until
+'terminal length 0' is sent and asks 'Are you sure' before radio shutdowns.
+Other commands are accepted and ignored.
+
+EXAMPLE:
+    ./cc_fake_controller_9800.py --prompt WLC1 --user admin --passwd Cisco123
+
+    ./cc_module_9800_3504.py --scheme ssh --dest localhost --port 8887 --user admin --passwd Cisco123 --ap APA453.0E7B.CF9C
+        --series 9800 --prompt "WLC1" --timeout 3 --band '5g' --persistent_session
+        --spawn_command "./cc_fake_controller_9800.py --prompt WLC1 --ap APA453.0E7B.CF9C"
+
+    --drop_after 5 exits after five commands, as a dropped connection would.
+
+COPYWRITE
+    Copyright 2022 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+
+INCLUDE_IN_README
+"""
+
+import sys
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit()
+
+import argparse
+
+PAGE_LINES = 8
+
+AP_SUMMARY = """Number of APs: 1
+
+AP Name                          Slots    AP Model              Ethernet MAC    Radio MAC       Location                          Country     IP Address                                 State
+-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+{ap:<32} 3        C9136I-B              6849.9275.1dac  d4ad.bda0.5c40  {location:<33} US          192.168.100.112                            Registered"""
+
+DOT11_SUMMARY = """AP Name                          Mac Address     Slot    Admin State    Oper State    Width    Txpwr           Channel                                    Mode
+-------------------------------------------------------------------------------------------------------------------------------------------------------------
+{ap:<32} d4ad.bda0.5c40  {slot}       {admin:<14} {oper:<13} {width:<8} *{txpower}/8 (23 dBm)   ({channel})*                                  Local"""
+
+WLAN_SUMMARY = """Number of WLANs: 1
+
+ID   Profile Name                     SSID                             Status Security
+-------------------------------------------------------------------------------------------------------------
+{wlan_id:<4} {wlan:<32} {wlan:<32} {status:<6} [WPA2][PSK][AES]"""
+
+
+class FakeController:
+    def __init__(self, prompt='WLC', user='admin', passwd='Cisco123', ap='AP0000.0000.0000',
+                 location='default location', drop_after=0):
+        self.prompt = prompt
+        self.user = user
+        self.passwd = passwd
+        self.ap = ap
+        self.location = location
+        self.drop_after = drop_after
+        self.commands = 0
+        self.mode = '>'
+        self.paging = True
+        self.radio = {'admin': 'Enabled', 'txpower': 1, 'channel': 36, 'width': 20}
+        self.wlan = {'wlan': 'open-wlan', 'wlan_id': 1, 'status': 'UP'}
+
+    def prompt_text(self):
+        if self.mode in ('>', '#'):
+            return self.prompt + self.mode
+        return "%s(%s)#" % (self.prompt, self.mode)
+
+    def show(self, text):
+        lines = text.split("\n")
+        for i, line in enumerate(lines):
+            print(line)
+            if self.paging and i and (i % PAGE_LINES == 0) and (i < len(lines) - 1):
+                input(" --More-- ")
+
+    def confirm(self):
+        input("Are you sure you want to continue? (y/n)[y]:")
+
+    def login(self):
+        for _attempt in range(3):
+            user = input("User:")
+            passwd = input("Password:")
+            if user.strip() == self.user and passwd.strip() == self.passwd:
+                return True
+            print("% Authentication failed")
+        return False
+
+    def command(self, line):
+        words = line.split()
+        if not words:
+            return True
+        cmd = " ".join(words)
+        if cmd == "logout" or (cmd == "exit" and self.mode in ('>', '#')):
+            return False
+        if self.mode == '>':
+            if cmd in ("en", "enable"):
+                if input("Password:").strip() == self.passwd:
+                    self.mode = '#'
+                else:
+                    print("% Bad passwords")
+            else:
+                print("% Invalid input detected at '^' marker.")
+            return True
+        if cmd == "end":
+            self.mode = '#'
+        elif cmd == "exit":
+            self.mode = '#' if self.mode == 'config' else 'config'
+        elif cmd == "terminal length 0":
+            self.paging = False
+        elif cmd in ("config t", "configure terminal"):
+            self.mode = 'config'
+        elif self.mode == 'config' and words[0] == "wlan" and len(words) == 2:
+            self.wlan['wlan'] = words[1]
+            self.mode = 'config-wlan'
+        elif self.mode == 'config' and cmd.startswith("wireless tag policy"):
+            self.mode = 'config-policy-tag'
+        elif self.mode == 'config' and cmd == "line console 0":
+            self.mode = 'config-line'
+        elif self.mode == 'config-wlan' and cmd in ("shutdown", "no shutdown"):
+            self.wlan['status'] = 'DOWN' if cmd == "shutdown" else 'UP'
+        elif cmd == "show ap summary":
+            self.show(AP_SUMMARY.format(ap=self.ap, location=self.location))
+        elif cmd.startswith("show ap dot11") and cmd.endswith("summary"):
+            self.show(DOT11_SUMMARY.format(ap=self.ap, slot=1, oper='Up' if self.radio['admin'] == 'Enabled' else 'Down',
+                                           **self.radio))
+        elif cmd == "show wlan summary":
+            self.show(WLAN_SUMMARY.format(**self.wlan))
+        elif cmd.startswith("show"):
+            self.show("\n".join("%s line %d" % (cmd, n) for n in range(PAGE_LINES * 2)))
+        elif words[-1] == "shutdown" and "dot11" in words:
+            # radio shutdown, 'no ... shutdown' turns it back on
+            if words[0] != "no" and "no" not in words[1:4]:
+                self.confirm()
+                self.radio['admin'] = 'Disabled'
+            else:
+                self.radio['admin'] = 'Enabled'
+        elif "txpower" in words:
+            self.radio['txpower'] = words[-1]
+        elif "width" in words:
+            self.radio['width'] = words[-1]
+        elif "channel" in words:
+            self.radio['channel'] = words[-1]
+        return True
+
+    def serve(self):
+        if not self.login():
+            return
+        while True:
+            try:
+                line = input(self.prompt_text())
+            except EOFError:
+                return
+            self.commands += 1
+            if not self.command(line):
+                return
+            if self.drop_after and self.commands >= self.drop_after:
+                return
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='cc_fake_controller_9800.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="fake cisco 9800 controller CLI for cc_session_9800_3504.py and cc_module_9800_3504.py")
+    parser.add_argument("--prompt", type=str, help="controller prompt", default="WLC1")
+    parser.add_argument("--user", type=str, help="credential login/username", default="admin")
+    parser.add_argument("--passwd", type=str, help="credential password", default="Cisco123")
+    parser.add_argument("--ap", type=str, help="ap name shown in summaries", default="APA453.0E7B.CF9C")
+    parser.add_argument("--location", type=str, help="ap location shown in show ap summary", default="default location")
+    parser.add_argument("--drop_after", type=int, help="exit after this many commands, 0 never", default=0)
+    args = parser.parse_args()
+
+    FakeController(prompt=args.prompt,
+                   user=args.user,
+                   passwd=args.passwd,
+                   ap=args.ap,
+                   location=args.location,
+                   drop_after=args.drop_after).serve()
+
+
+if __name__ == "__main__":
+    main()
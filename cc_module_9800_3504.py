@@ -50,6 +50,7 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../")))
 
 logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
+cc_session = importlib.import_module("cc_session_9800_3504")
 
 
 class create_controller_series_object:
@@ -69,7 +70,9 @@ class create_controller_series_object:
                  ap_dual_band_slot_6g=None,
                  port=None,
                  timeout=None,
-                 pwd=None
+                 pwd=None,
+                 persistent_session=False,
+                 spawn_command=None
                  ):
         if scheme is None:
             raise ValueError('Controller scheme must be set: serial, ssh or telnet')
@@ -170,6 +173,12 @@ class create_controller_series_object:
         self.dtim = None
         self.spatial_stream = None  # default cannot be NONE for send command
         self.mcs_tx_index = None    # default cannot be NONE for send command
+        # 9800: run the commands send_command() knows over one logged in
+        # cc_session_9800_3504.ControllerSession instead of a wifi_ctl_9800_3504.py per command
+        self.persistent_session = persistent_session
+        # command spawned in place of ssh/telnet by the session, e.g. cc_fake_controller_9800.py
+        self.spawn_command = spawn_command
+        self.session = None
 
     # TODO update the wifi_ctl_9800_3504 to use 24g, 5g, 6g
 
@@ -206,6 +215,106 @@ class create_controller_series_object:
             #    logger.critical("ap_band_slot_6g needs to be set to 2 or 3")
             #    raise ValueError("ap_band_slot_6g needs to be set to 2 or 3")
 #
+    # band names as used in the 9800 cli: ap name <ap> dot11 <band> slot <slot> ...
+    # returns None for bands the 9800 cli lines below do not cover
+    def cli_band(self):
+        return {'24g': '24ghz', '5g': '5ghz', '6g': '6ghz',
+                'dual_band_5g': 'dual-band', 'dual_band_6g': 'dual-band'}.get(self.band)
+
+    # the 9800 cli lines wifi_ctl_9800_3504.py sends for self.action
+    # returns (mode, [commands]), or None for actions that still go through wifi_ctl_9800_3504.py
+    def session_commands(self):
+        if self.series != "9800":
+            return None
+        if self.action == "cmd":
+            return "exec", [self.value]
+        if self.action == "summary":
+            return "exec", ["show ap summary"]
+        if self.action in ["show_ap_wlan_summary", "show_wlan_summary"]:
+            return "exec", [{"show_ap_wlan_summary": "show ap wlan summary",
+                             "show_wlan_summary": "show wlan summary"}[self.action]]
+        if self.action == "11r_logs":
+            return "exec", ["sh wi stats client detail | inc 11r"]
+        if self.action in ["disable_network_6ghz", "disable_network_5ghz", "disable_network_24ghz"]:
+            return "config", ["ap dot11 {band} shutdown".format(band=self.action.split('_')[-1])]
+        if self.action in ["enable_network_6ghz", "enable_network_5ghz", "enable_network_24ghz"]:
+            return "config", ["no ap dot11 {band} shutdown".format(band=self.action.split('_')[-1])]
+        if self.action == "dual_band_mode_shutdown":
+            return "exec", ["ap name {ap} dot11 dual-band shutdown".format(ap=self.ap)]
+        if self.action == "dual_band_no_mode_shutdown":
+            return "exec", ["ap name {ap} no dot11 dual-band shutdown".format(ap=self.ap)]
+        if self.action == "no_logging_console":
+            return "config", ["no logging console"]
+        if self.action == "line_console_0":
+            return "config", ["line console 0"]
+        if self.action == "enable_wlan":
+            return "config", ["wlan {wlan}".format(wlan=self.wlan), "no shutdown"]
+        if self.action == "disable_wlan":
+            return "config", ["wlan {wlan}".format(wlan=self.wlan), "shutdown"]
+        if self.action == "delete_wlan":
+            return "config", ["no wlan {wlan}".format(wlan=self.wlan)]
+        if self.action == "wireless_tag_policy":
+            return "config", ["wireless tag policy {policy_tag}".format(policy_tag=self.tag_policy),
+                              "wlan {wlan} policy {policy_profile}".format(wlan=self.wlan, policy_profile=self.policy_profile)]
+
+        # the remaining actions name the band, other bands go through wifi_ctl_9800_3504.py
+        band = self.cli_band()
+        if band is None:
+            return None
+        ap_slot = "ap name {ap} dot11 {band} slot {slot}".format(ap=self.ap, band=band, slot=self.ap_band_slot)
+        if self.action == "advanced":
+            return "exec", ["show ap dot11 {band} summary".format(band=band)]
+        if self.action.startswith("show_ap_bssid_"):
+            return "exec", ["show ap name {ap} wlan dot11 {band}".format(ap=self.ap, band=band)]
+        if self.action == "txPower":
+            return "exec", ["{ap_slot} txpower {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "channel":
+            return "exec", ["{ap_slot} channel {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "bandwidth":
+            return "exec", ["{ap_slot} channel width {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "manual":
+            if band == 'dual-band':
+                return "exec", ["{ap_slot} role manual client-serving".format(ap_slot=ap_slot)]
+            return "exec", ["{ap_slot} radio role manual client-serving".format(ap_slot=ap_slot)]
+        if self.action == "auto":
+            return "exec", ["{ap_slot} radio role auto".format(ap_slot=ap_slot)]
+        if self.action == "disable_operation_status" or self.action.startswith("disable_network_dual_band"):
+            return "exec", ["{ap_slot} shutdown".format(ap_slot=ap_slot)]
+        if self.action == "enable_operation_status" or self.action.startswith("enable_network_dual_band"):
+            return "exec", ["ap name {ap} no dot11 {band} slot {slot} shutdown".format(
+                ap=self.ap, band=band, slot=self.ap_band_slot)]
+        if self.action == "config_dual_band_mode":
+            return "exec", ["{ap_slot} band {band}".format(ap_slot=ap_slot, band=self.band.split('_')[-1] + "hz")]
+        if self.action in ["ap_dot11_dot11ax_mcs_tx_index_spatial_stream", "no_ap_dot11_dot11ax_mcs_tx_index_spatial_stream"]:
+            mcs_band = {'6g': '6ghz', 'dual_band_6g': '6ghz', '5g': '5ghz', 'dual_band_5g': '5ghz', '24g': '24ghz'}[self.band]
+            command = "ap dot11 {band} dot11ax mcs tx index {index} spatial-stream {stream}".format(
+                band=mcs_band, index=self.mcs_tx_index, stream=self.spatial_stream)
+            if self.action.startswith("no_"):
+                command = "no " + command
+            return "config", [command]
+        if self.action == "dtim" and self.band in ['6g', '5g']:
+            return "config", ["wlan {wlan}".format(wlan=self.wlan), "dtim dot11 {band} {value}".format(band=band, value=self.value)]
+        return None
+
+    def get_session(self):
+        if self.session is None:
+            self.session = cc_session.ControllerSession(scheme=self.scheme,
+                                                        dest=self.dest,
+                                                        port=self.port,
+                                                        user=self.user,
+                                                        passwd=self.passwd,
+                                                        prompt=self.prompt,
+                                                        timeout=self.timeout,
+                                                        spawn_command=self.spawn_command)
+        return self.session
+
+    # log out of the persistent session, if one was opened
+    def close_session(self):
+        if self.session is not None:
+            logger.info("controller session stats {stats}".format(stats=self.session.get_stats()))
+            self.session.close()
+            self.session = None
+
     # TODO consolidate the command formats
 
     def send_command(self):
@@ -214,6 +323,14 @@ class create_controller_series_object:
 
         logger.info("action {action}".format(action=self.action))
 
+        if self.persistent_session:
+            session_commands = self.session_commands()
+            if session_commands is not None:
+                mode, commands = session_commands
+                summary_output = self.get_session().run_many(commands, mode=mode)
+                logger.info(summary_output)
+                return summary_output
+
         # set the ap_band_slot 24g = ap_band_slot 0 , 5g ap_band_slot = 1 / 2, 6g - ap_band_slot 2 / 3 so needs to be passed in
 
         # Command base
@@ -1159,6 +1276,8 @@ INCLUDE_IN_README
     parser.add_argument("--series", type=str, help="controller series", choices=["9800", "3504"], required=True)
     parser.add_argument("--scheme", type=str, choices=["serial", "ssh", "telnet"], help="Connect via serial, ssh or telnet")
     parser.add_argument("--timeout", type=str, help="timeout value", default=3)
+    parser.add_argument("--persistent_session", help="9800: log in once and keep the controller session open between commands", action='store_true')
+    parser.add_argument("--spawn_command", type=str, help="with --persistent_session, command to spawn instead of ssh/telnet, e.g. './cc_fake_controller_9800.py --prompt WLC1'")
     parser.add_argument("--lf_logger_config_json", help="[debug configuration] --lf_logger_config_json <json file> , json configuration of logger")
     parser.add_argument("--debug", help='--debug flag present debug on  enable debugging', action='store_true')
     parser.add_argument('--log_level', default=None, help='--log_level <level>', choices=['debug', 'info', 'warning', 'error', 'critical'])
@@ -1191,7 +1310,9 @@ INCLUDE_IN_README
         ap=args.ap,
         port=args.port,
         band=args.band,
-        timeout=args.timeout)
+        timeout=args.timeout,
+        persistent_session=args.persistent_session,
+        spawn_command=args.spawn_command)
 
     # TODO add ability to select tests
     # cs.show_ap_summary()
@@ -1200,6 +1321,7 @@ INCLUDE_IN_README
 
     # sample to dump status
     sample_test_dump_status(cs=cs)
+    cs.close_session()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+"""
+NAME: cc_session_9800_3504.py
+
+CLASSIFICATION: module
+
+PURPOSE:
+Long lived CLI session to a cisco 9800 controller. The session logs in once, keeps
+track of which prompt (mode) the CLI is at, and runs commands by reading up to the
+next prompt instead of sleeping. If the connection drops it logs in again and
+re-runs the commands that were interrupted.
+cc_module_9800_3504.py uses it in place of starting wifi_ctl_9800_3504.py for
+every command when persistent_session is set.
+
+SETUP:
+None
+
+EXAMPLE:
+    session = ControllerSession(scheme='ssh', dest='localhost', port=8887, user='admin',
+                                passwd='Cisco123', prompt='WLC1', timeout=10)
+    summary = session.run("show ap summary")
+    session.run_many(["wlan open-wlan", "shutdown"], mode='config')
+    session.close()
+
+    cc_fake_controller_9800.py stands in for the controller:
+    session = ControllerSession(scheme='ssh', dest='localhost', port=8887, user='admin',
+                                passwd='Cisco123', prompt='WLC1',
+                                spawn_command='./cc_fake_controller_9800.py --prompt WLC1')
+
+COPYWRITE
+    Copyright 2022 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+
+INCLUDE_IN_README
+"""
+
+import sys
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit()
+
+import logging
+import time
+import pexpect
+
+logger = logging.getLogger(__name__)
+
+MORE = "--More--"
+ARE_YOU_SURE = "Are you sure you want to continue? (y/n)[y]:"
+FINGERPRINT = "you want to continue connecting (yes/no/[fingerprint])?"
+ESCAPE_CHARACTER = "Escape character is '^]'."
+PRESS_RETURN = "Press RETURN to get started."
+BAD_SECRETS = "Bad secrets"
+
+# CLI modes, named after the prompt suffix
+MODE_USER = "user"                          # WLC>
+MODE_EXEC = "exec"                          # WLC#
+MODE_CONFIG = "config"                      # WLC(config)#
+MODE_CONFIG_WLAN = "config-wlan"            # WLC(config-wlan)#
+MODE_POLICY_TAG = "config-policy-tag"       # WLC(config-policy-tag)#
+MODE_CONFIG_LINE = "config-line"            # WLC(config-line)#
+
+
+class ControllerSession:
+    def __init__(self,
+                 scheme='ssh',
+                 dest='localhost',
+                 port=None,
+                 user=None,
+                 passwd=None,
+                 prompt='WLC',
+                 timeout=10,
+                 tty='/dev/ttyUSB0',
+                 baud=115200,
+                 login_attempts=4,
+                 spawn_command=None):
+        """
+        :param scheme: ssh, telnet or serial
+        :param timeout: seconds to wait for each prompt
+        :param login_attempts: connections to try before giving up
+        :param spawn_command: command to spawn instead of ssh/telnet, such as the fake
+        controller CLI
+        """
+        if scheme not in ('ssh', 'telnet', 'serial'):
+            raise ValueError("ControllerSession scheme must be ssh, telnet or serial")
+        if user is None or passwd is None:
+            raise ValueError("ControllerSession requires user and passwd")
+        self.scheme = scheme
+        self.dest = dest
+        self.port = port
+        self.user = user
+        self.passwd = passwd
+        self.prompt = prompt
+        self.timeout = float(timeout)
+        self.tty = tty
+        self.baud = baud
+        self.login_attempts = login_attempts
+        self.spawn_command = spawn_command
+        # most specific first; a prompt is never a substring of another
+        self.prompts = [
+            (prompt + "(config-wlan)#", MODE_CONFIG_WLAN),
+            (prompt + "(config-policy-tag)#", MODE_POLICY_TAG),
+            (prompt + "(config-line)#", MODE_CONFIG_LINE),
+            (prompt + "(config)#", MODE_CONFIG),
+            (prompt + "#", MODE_EXEC),
+            (prompt + ">", MODE_USER),
+        ]
+        self.child = None
+        self.serial_port = None
+        self.mode = None
+        self.logins = 0
+        self.reconnects = 0
+        self.commands_sent = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def spawn(self):
+        if self.spawn_command:
+            logger.info("spawn: {cmd}".format(cmd=self.spawn_command))
+            return pexpect.spawn(self.spawn_command, encoding='utf-8', codec_errors='ignore')
+        if self.scheme == 'serial':
+            import serial
+            from pexpect_serial import SerialSpawn
+            self.serial_port = serial.Serial(self.tty, self.baud, timeout=5)
+            return SerialSpawn(self.serial_port, encoding='utf-8', codec_errors='ignore')
+        if self.scheme == 'ssh':
+            cmd = "ssh -p%d -o PubkeyAuthentication=no %s@%s" % (int(self.port or 22), self.user, self.dest)
+        else:
+            cmd = "telnet %s %d" % (self.dest, int(self.port or 23))
+        logger.info("spawn: {cmd}".format(cmd=cmd))
+        return pexpect.spawn(cmd, encoding='utf-8', codec_errors='ignore')
+
+    def connect(self):
+        """
+        Spawn the connection and log in until the enable (#) prompt with paging off.
+        :return: True; raises ConnectionError after login_attempts failed connections
+        """
+        for attempt in range(1, self.login_attempts + 1):
+            self.drop()
+            try:
+                self.child = self.spawn()
+                if self.login():
+                    self.logins += 1
+                    logger.info("controller session logged in, attempt {attempt}".format(attempt=attempt))
+                    return True
+            except (pexpect.EOF, pexpect.TIMEOUT, OSError) as e:
+                logger.info("controller login attempt {attempt} failed: {error}".format(attempt=attempt, error=e))
+            time.sleep(1)
+        self.drop()
+        raise ConnectionError("controller session could not log in to {dest} after {attempts} attempts".format(
+            dest=self.dest, attempts=self.login_attempts))
+
+    def login(self):
+        # walk whatever the controller presents until the enable prompt
+        patterns = [FINGERPRINT, "Username:", "User:", "Password:", ESCAPE_CHARACTER, PRESS_RETURN, BAD_SECRETS]
+        prompt_index = len(patterns)
+        patterns += [prompt for prompt, _mode in self.prompts]
+        patterns += [pexpect.TIMEOUT, pexpect.EOF]
+        timeouts = 0
+        for _step in range(12):
+            i = self.child.expect_exact(patterns, timeout=self.timeout)
+            if i == 0:
+                self.child.sendline("yes")
+            elif i in (1, 2):
+                self.child.sendline(self.user)
+            elif i == 3:
+                # login and enable passwords are the same
+                self.child.sendline(self.passwd)
+            elif i in (4, 5, 6):
+                self.child.sendline("")
+            elif i < prompt_index + len(self.prompts):
+                mode = self.prompts[i - prompt_index][1]
+                if mode == MODE_USER:
+                    self.child.sendline("en")
+                elif mode != MODE_EXEC:
+                    self.child.sendline("end")
+                else:
+                    self.mode = MODE_EXEC
+                    # disable --More-- for easier scripting
+                    self.send_and_read("terminal length 0")
+                    return True
+            elif i == len(patterns) - 2:
+                timeouts += 1
+                if timeouts > 1:
+                    return False
+                self.child.sendline("")
+            else:
+                return False
+        return False
+
+    def send_and_read(self, command):
+        """
+        Send one line and read until the next prompt, answering --More-- and
+        'Are you sure' on the way. Raises pexpect.TIMEOUT or pexpect.EOF if no prompt comes.
+        :return: output of the command without the echoed command line
+        """
+        patterns = [MORE, ARE_YOU_SURE] + [prompt for prompt, _mode in self.prompts]
+        self.child.sendline(command)
+        self.commands_sent += 1
+        output = ""
+        while True:
+            i = self.child.expect_exact(patterns, timeout=self.timeout)
+            output += self.child.before
+            if i == 0:
+                self.child.send(" ")
+            elif i == 1:
+                output += self.child.after
+                self.child.sendline("y")
+            else:
+                self.mode = self.prompts[i - 2][1]
+                break
+        lines = output.replace("\r", "").split("\n")
+        if lines and lines[0].strip() == command.strip():
+            lines = lines[1:]
+        return "\n".join(lines)
+
+    def enter_mode(self, mode=MODE_EXEC):
+        """
+        Move the CLI to exec (#) or config mode. Sub-modes such as config-wlan are
+        entered by the commands themselves, from config mode.
+        """
+        if self.mode == mode:
+            return
+        if self.mode not in (MODE_EXEC, MODE_USER):
+            self.send_and_read("end")
+        if mode == MODE_CONFIG:
+            self.send_and_read("config t")
+        if self.mode != mode:
+            logger.warning("controller session expected {expected} mode, at {mode}".format(expected=mode, mode=self.mode))
+
+    def run_many(self, commands=(), mode=MODE_EXEC, retries=1):
+        """
+        Run commands in order, starting from mode. If the connection drops, log in
+        again and run all of them again, up to retries times.
+        :param mode: MODE_EXEC or MODE_CONFIG
+        :return: the combined output
+        """
+        for attempt in range(retries + 1):
+            try:
+                if self.child is None:
+                    self.connect()
+                self.enter_mode(mode)
+                output = ""
+                for command in commands:
+                    logger.info("controller command: {command}".format(command=command))
+                    output += self.send_and_read(command)
+                return output
+            except (pexpect.EOF, pexpect.TIMEOUT, OSError) as e:
+                logger.warning("controller session lost running {commands}: {error}".format(
+                    commands=commands, error=type(e).__name__))
+                self.drop()
+                if attempt < retries:
+                    self.reconnects += 1
+        raise ConnectionError("controller session failed running {commands}".format(commands=commands))
+
+    def run(self, command, mode=MODE_EXEC, retries=1):
+        return self.run_many([command], mode=mode, retries=retries)
+
+    def drop(self):
+        # close the connection without logging out
+        if self.child is not None:
+            try:
+                self.child.close(force=True)
+            except BaseException:
+                logger.info("controller session close failed")
+            self.child = None
+        if self.serial_port is not None:
+            self.serial_port.close()
+            self.serial_port = None
+        self.mode = None
+
+    def close(self):
+        """
+        Log out and close the connection.
+        """
+        if self.child is None:
+            return
+        try:
+            if self.mode not in (MODE_EXEC, MODE_USER):
+                self.send_and_read("end")
+            self.child.sendline("logout")
+            if self.scheme == 'telnet' and not self.spawn_command:
+                self.child.sendline("\x1b\r")
+        except (pexpect.EOF, pexpect.TIMEOUT, OSError):
+            logger.info("controller session closed before logout")
+        self.drop()
+
+    def get_stats(self):
+        return {
+            "logins": self.logins,
+            "reconnects": self.reconnects,
+            "commands_sent": self.commands_sent,
+        }
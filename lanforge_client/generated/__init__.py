@@ -0,0 +1,387 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Modules of the auto generated LFJsonCommand and LFJsonQuery members, written
+    by lanforge_api_split.py, and the members each one defines. LFJsonCommand and
+    LFJsonQuery look members up here and import their module on first use.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+COMMAND_FAMILIES = {
+    "cmd_add": (
+        "post_add_arm_endp",
+        "AddBgpPeerFlags",
+        "post_add_bgp_peer",
+        "post_add_bond",
+        "AddBrBrFlags",
+        "post_add_br",
+        "AddCdFlags",
+        "post_add_cd",
+        "post_add_cd_endp",
+        "post_add_cd_vr",
+        "AddChamberChamberFlags",
+        "AddChamberTurntableType",
+        "post_add_chamber",
+        "AddChamberCxChamberCxFlags",
+        "post_add_chamber_cx",
+        "post_add_chamber_path",
+        "AddChannelGroupTypes",
+        "post_add_channel_group",
+        "post_add_cx",
+        "AddDutDutFlags",
+        "post_add_dut",
+        "post_add_dut_notes",
+        "AddDutSsidDutFlags",
+        "post_add_dut_ssid",
+        "AddEndpPayloadPattern",
+        "AddEndpType",
+        "post_add_endp",
+        "post_add_event",
+        "AddFileEndpFioFlags",
+        "AddFileEndpPayloadPattern",
+        "AddFileEndpType",
+        "post_add_file_endp",
+        "post_add_gen_endp",
+        "post_add_gre",
+        "AddGroupFlags",
+        "post_add_group",
+        "AddL4EndpHttpAuthType",
+        "AddL4EndpProxyAuthType",
+        "AddL4EndpType",
+        "post_add_l4_endp",
+        "AddMonitorFlags",
+        "post_add_monitor",
+        "post_add_mvlan",
+        "post_add_ppp_link",
+        "AddProfileProfileFlags",
+        "AddProfileWifiMode",
+        "post_add_profile",
+        "post_add_profile_notes",
+        "post_add_rdd",
+        "post_add_sec_ip",
+        "AddStaFlags",
+        "AddStaMode",
+        "AddStaRate",
+        "post_add_sta",
+        "AddT1SpanBuildout",
+        "AddT1SpanType",
+        "post_add_t1_span",
+        "post_add_text_blob",
+        "post_add_tgcx",
+        "AddThresholdThreshId",
+        "AddThresholdThreshType",
+        "post_add_threshold",
+        "post_add_tm",
+        "AddTrafficProfileTrafficProfileFlags",
+        "AddTrafficProfileWifiMode",
+        "post_add_traffic_profile",
+        "post_add_traffic_profile_notes",
+        "AddVapFlags",
+        "AddVapMode",
+        "post_add_vap",
+        "AddVenueFreq24",
+        "AddVenueFreq5",
+        "post_add_venue",
+        "post_add_vlan",
+        "post_add_voip_endp",
+        "AddVrFlags",
+        "post_add_vr",
+        "AddVrBgpFlags",
+        "post_add_vr_bgp",
+        "AddVrcxFlags",
+        "post_add_vrcx",
+        "post_add_vrcx2",
+        "AddWlEndpWleFlags",
+        "post_add_wl_endp",
+    ),
+    "cmd_misc": (
+        "post_admin",
+        "post_apply_vr_cfg",
+        "post_blink_attenuator",
+        "CShowPortsProbeFlags",
+        "post_c_show_ports",
+        "post_cancel_vr_cfg",
+        "post_clear_cd_counters",
+        "post_clear_cx_counters",
+        "post_clear_endp_counters",
+        "post_clear_group",
+        "ClearPortCountersExtra",
+        "post_clear_port_counters",
+        "post_clear_resource_counters",
+        "post_clear_wp_counters",
+        "post_create_client",
+        "DiagType",
+        "post_diag",
+        "post_discover",
+        "post_do_pesq",
+        "post_file",
+        "post_flash_attenuator",
+        "post_getavglatency",
+        "post_getinrxbps",
+        "post_getinrxrate",
+        "post_getintxrate",
+        "post_getipadd",
+        "post_getmac",
+        "post_getmask",
+        "post_getpktdrops",
+        "post_getrxendperrpkts",
+        "post_getrxpkts",
+        "post_getrxporterrpkts",
+        "post_gettxpkts",
+        "post_gossip",
+        "post_help",
+        "post_init_wiser",
+        "post_licenses",
+        "post_load",
+        "LogLevelLevel",
+        "post_log_level",
+        "post_log_msg",
+        "post_login",
+        "post_motd",
+        "post_nc_show_cd",
+        "post_nc_show_channel_groups",
+        "post_nc_show_endpoints",
+        "post_nc_show_pesq",
+        "NcShowPortsProbeFlags",
+        "post_nc_show_ports",
+        "post_nc_show_ppp_links",
+        "post_nc_show_spans",
+        "post_nc_show_vr",
+        "post_nc_show_vrcx",
+        "post_notify_dhcp",
+        "post_port_reset_completed",
+        "post_probe_port",
+        "post_probe_ports",
+        "post_quiesce_endp",
+        "post_quiesce_group",
+        "post_quit",
+        "post_reboot_os",
+        "post_report",
+        "ResetPortPreIfdown",
+        "post_reset_port",
+        "post_reset_serial_span",
+        "post_rpt_script",
+        "ScanWifiExtra",
+        "post_scan_wifi",
+        "post_shutdown",
+        "post_shutdown_os",
+        "post_shutdown_resource",
+        "SniffPortFlags",
+        "post_sniff_port",
+        "post_start_endp",
+        "post_start_group",
+        "post_start_ppp_link",
+        "post_stop_endp",
+        "post_stop_group",
+        "post_stop_ppp_link",
+        "post_tail",
+        "post_tm_register",
+        "post_tm_unregister",
+        "post_version",
+        "post_who",
+        "post_wifi_cli_cmd",
+        "post_wifi_event",
+        "post_wiser_reset",
+        "post_write",
+    ),
+    "cmd_rm": (
+        "post_rm_attenuator",
+        "post_rm_cd",
+        "post_rm_cd_endp",
+        "post_rm_cd_vr",
+        "post_rm_chamber",
+        "post_rm_chamber_path",
+        "post_rm_channel_group",
+        "post_rm_client",
+        "post_rm_cx",
+        "post_rm_db",
+        "post_rm_dut",
+        "post_rm_endp",
+        "post_rm_event",
+        "post_rm_group",
+        "post_rm_ppp_link",
+        "post_rm_profile",
+        "post_rm_resource",
+        "post_rm_rfgen",
+        "post_rm_sec_ip",
+        "post_rm_span",
+        "post_rm_test_mgr",
+        "post_rm_text_blob",
+        "post_rm_tgcx",
+        "post_rm_threshold",
+        "post_rm_traffic_profile",
+        "post_rm_venue",
+        "post_rm_vlan",
+        "post_rm_vr",
+        "post_rm_vrcx",
+        "post_rm_wanpath",
+    ),
+    "cmd_set": (
+        "SetArmInfoArmFlags",
+        "post_set_arm_info",
+        "SetAttenuatorMode",
+        "post_set_attenuator",
+        "post_set_chamber",
+        "post_set_cx_report_timer",
+        "SetCxStateCxState",
+        "post_set_cx_state",
+        "post_set_endp_addr",
+        "post_set_endp_details",
+        "SetEndpFilePlayback",
+        "post_set_endp_file",
+        "SetEndpFlagFlag",
+        "post_set_endp_flag",
+        "SetEndpPayloadPayloadType",
+        "post_set_endp_payload",
+        "post_set_endp_pld_bounds",
+        "post_set_endp_proxy",
+        "post_set_endp_quiesce",
+        "post_set_endp_report_timer",
+        "SetEndpTosTos",
+        "post_set_endp_tos",
+        "post_set_endp_tx_bounds",
+        "SetEventInterestEiFlags",
+        "SetEventInterestEvents1",
+        "SetEventInterestEvents2",
+        "post_set_event_interest",
+        "SetEventPriorityEvent",
+        "SetEventPriorityPriority",
+        "post_set_event_priority",
+        "post_set_fe_info",
+        "SetFlagFlag",
+        "post_set_flag",
+        "post_set_gen_cmd",
+        "post_set_gps_info",
+        "post_set_ifup_script",
+        "post_set_license",
+        "post_set_mc_endp",
+        "post_set_password",
+        "SetPollModeMode",
+        "post_set_poll_mode",
+        "SetPortCmdFlags",
+        "SetPortCurrentFlags",
+        "SetPortDhcpClientId",
+        "SetPortDhcpHostname",
+        "SetPortDhcpVendorId",
+        "SetPortFlags2",
+        "SetPortInterest",
+        "post_set_port",
+        "post_set_port_alias",
+        "post_set_ppp_link_state",
+        "SetResourceResourceFlags",
+        "post_set_resource",
+        "SetRfgenRfgenFlags",
+        "post_set_rfgen",
+        "SetScriptFlags",
+        "SetScriptType",
+        "post_set_script",
+        "post_set_sec_ip",
+        "post_set_voip_info",
+        "post_set_vrcx_cost",
+        "post_set_wanlink_info",
+        "SetWanlinkPcapCapture",
+        "post_set_wanlink_pcap",
+        "SetWanpathCorruptionFlags",
+        "post_set_wanpath_corruption",
+        "post_set_wanpath_filter",
+        "SetWanpathRunningRunning",
+        "post_set_wanpath_running",
+        "SetWifiCorruptionsCorruptFlags",
+        "post_set_wifi_corruptions",
+        "post_set_wifi_custom",
+        "post_set_wifi_extra",
+        "post_set_wifi_extra2",
+        "SetWifiRadioFlags",
+        "SetWifiRadioMode",
+        "post_set_wifi_radio",
+        "post_set_wifi_txo",
+        "SetWlCorruptionFlags",
+        "post_set_wl_corruption",
+        "SetWlQdiscQdisc",
+        "post_set_wl_qdisc",
+    ),
+    "cmd_show": (
+        "ShowAlertsType",
+        "post_show_alerts",
+        "post_show_attenuators",
+        "post_show_cd",
+        "post_show_chamber",
+        "post_show_channel_groups",
+        "post_show_clients",
+        "post_show_cx",
+        "post_show_cxe",
+        "post_show_dbs",
+        "post_show_dut",
+        "post_show_endp_payload",
+        "post_show_endpoints",
+        "post_show_err",
+        "post_show_event_interest",
+        "ShowEventsType",
+        "post_show_events",
+        "post_show_files",
+        "post_show_group",
+        "post_show_pesq",
+        "post_show_ports",
+        "post_show_ppp_links",
+        "post_show_profile",
+        "post_show_resources",
+        "post_show_rfgen",
+        "post_show_rt",
+        "post_show_script_results",
+        "post_show_spans",
+        "post_show_text_blob",
+        "post_show_tm",
+        "post_show_traffic_profile",
+        "post_show_venue",
+        "post_show_vr",
+        "post_show_vrcx",
+        "post_show_wanpaths",
+    ),
+}
+
+QUERY_FAMILIES = {
+    "query_cx": (
+        "get_cx",
+        "get_endp",
+        "get_fileio",
+        "get_generic",
+        "get_layer4",
+        "get_test_group",
+        "get_voip",
+        "get_voip_endp",
+    ),
+    "query_misc": (
+        "get_alerts",
+        "alerts_since",
+        "alerts_last_events",
+        "alerts_before",
+        "events_between",
+        "events_get_event",
+        "events_last_events",
+        "events_since",
+        "get_control",
+        "get_endsession",
+        "get_events",
+        "get_gui_cli",
+        "get_newsession",
+        "get_quit",
+        "get_status_msg",
+        "status_msg_new_session",
+        "status_msg_delete_session",
+        "status_msg_delete_message",
+        "get_text",
+        "get_ws_msg",
+    ),
+    "query_ports": (
+        "get_attenuator",
+        "get_chamber",
+        "get_dut",
+        "get_port",
+        "get_probe",
+        "get_radiostatus",
+        "get_resource",
+        "get_scan",
+        "get_stations",
+        "get_vr",
+        "get_vrcx",
+        "get_wl",
+        "get_wl_endp",
+    ),
+}
@@ -0,0 +1,3059 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonCommand members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonCommand imports this module the first time one of
+    them is used: call them through LFJsonCommand, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+# flag and enum classes: name: (base, {member: value}); LFJsonCommand builds each class
+# the first time it is used
+ENUMS = {
+    # <CLI-JSON/ADD_BGP_PEER>
+    "AddBgpPeerFlags": ("IntFlag", {
+        "ENABLE_PEER": 0x1,         # Set this to zero if you don't want this peer enabled.
+        "PEER_CLIENT": 0x2,         # Sets corresponding Xorp flag in BGP Peer section.
+        "PEER_CONFED_MEMBER": 0x4,  # Sets corresponding Xorp flag in BGP Peer section.
+        "PEER_UNICAST_V4": 0x8,     # Sets corresponding Xorp flag in BGP Peer section.
+    }),
+    # <CLI-JSON/ADD_BR>
+    "AddBrBrFlags": ("Enum", {
+        "none": 0,         # no features
+        "stp_enabled": 1,  # Enable Spanning Tree Protocol (STP)
+    }),
+    # <CLI-JSON/ADD_CD>
+    "AddCdFlags": ("Enum", {
+        "ERR": 2,      # Set to kernel mode.
+        "RUNNING": 1,  # Set to running state.
+    }),
+    # <CLI-JSON/ADD_CHAMBER>
+    "AddChamberChamberFlags": ("IntFlag", {
+        "OPEN": 0x4,     # (3) Door is open, no real isolation right now.
+        "PHANTOM": 0x1,  # (1) Chamber is not actually here right now.
+        "VIRTUAL": 0x2,  # (2) No real chamber, open-air grouping of equipment.
+    }),
+    "AddChamberTurntableType": ("IntFlag", {
+        "COMXIM": 0x1,  # ComXim stand-alone USB connected turn-table.
+        "CT840A": 0x2,  # Modbus API turntable in CT840A 2D chamber.
+        "CT850A": 0x0,  # TCP-IP Connected turntable in CT850A 2D chamber.
+    }),
+    # <CLI-JSON/ADD_CHAMBER_CX>
+    "AddChamberCxChamberCxFlags": ("Enum", {
+        "CONNECTED": 1,   # (1) Connected to something. If flag is not set, connection is open to the air
+        "TERMINATED": 2,  # (2) Connection is terminated, signal shall not pass!
+    }),
+    # <CLI-JSON/ADD_CHANNEL_GROUP>
+    "AddChannelGroupTypes": ("Enum", {
+        "clear": "clear",        # Channel(s) are bundled into a single span. No conversion or
+        "e_m": "e&amp;m",        # Channel(s) are signalled using E&amp;M signalling (specific
+        "fcshdlc": "fcshdlc",    # The zapdel driver performs HDLC encoding and decoding on the
+        "fxogs": "fxogs",        # Channel(s) are signalled using FXO Groundstart protocol.
+        "fxoks": "fxoks",        # Channel(s) are signalled using FXO Koolstart protocol.
+        "fxols": "fxols",        # Channel(s) are signalled using FXO Loopstart protocol.
+        "fxsgs": "fxsgs",        # Channel(s) are signalled using FXS Groundstart protocol.
+        "fxsks": "fxsks",        # Channel(s) are signalled using FXS Koolstart protocol.
+        "fxsls": "fxsls",        # Channel(s) are signalled using FXS Loopstart protocol.
+        "indclear": "indclear",  # Like 'clear' except all channels are treated individually and
+        "nethdlc": "nethdlc",    # The zaptel driver bundles the channels together into an
+        "rawhdlc": "rawhdlc",    # The zaptel driver performs HDLC encoding and decoding on the
+        "unused": "unused",      # No signalling is performed, each channel in the list remains idle
+    }),
+    # <CLI-JSON/ADD_DUT>
+    "AddDutDutFlags": ("IntFlag", {
+        "p_11r": 0x200,        # Use .11r connection logic on all ssids, deprecated, see add_dut_ssid.
+        "AP_MODE": 0x2,        # (2) DUT acts as AP.
+        "DHCPD_LAN": 0x40,     # Provides DHCP server on LAN port
+        "DHCPD_WAN": 0x80,     # Provides DHCP server on WAN port
+        "EAP_PEAP": 0x800,     # Use EAP-PEAP connection logic on all ssids, deprecated, see add_dut_ssid.
+        "EAP_TTLS": 0x400,     # Use EAP-TTLS connection logic on all ssids, deprecated, see add_dut_ssid.
+        "INACTIVE": 0x4,       # (3) Ignore this in ChamberView, etc
+        "NOT_DHCPCD": 0x1000,  # Station/edge device that is NOT using DHCP.
+        "STA_MODE": 0x1,       # (1) DUT acts as Station.
+        "WEP": 0x8,            # Use WEP encryption on all ssids, deprecated, see add_dut_ssid.
+        "WPA": 0x10,           # Use WPA encryption on all ssids, deprecated, see add_dut_ssid.
+        "WPA2": 0x20,          # Use WPA2 encryption on all ssids, deprecated, see add_dut_ssid.
+        "WPA3": 0x100,         # Use WPA3 encryption on all ssids, deprecated, see add_dut_extras.
+    }),
+    # <CLI-JSON/ADD_DUT_SSID>
+    "AddDutSsidDutFlags": ("IntFlag", {
+        "p_11r": 0x200,     # Use .11r connection logic
+        "EAP_PEAP": 0x800,  # Use EAP-PEAP connection logic
+        "EAP_TTLS": 0x400,  # Use EAP-TTLS connection logic
+        "WEP": 0x8,         # Use WEP encryption
+        "WPA": 0x10,        # Use WPA encryption
+        "WPA2": 0x20,       # Use WPA2 encryption
+        "WPA3": 0x100,      # Use WPA3 encryption
+    }),
+    # <CLI-JSON/ADD_ENDP>
+    "AddEndpPayloadPattern": ("Enum", {
+        "PRBS_11_8_10": "PRBS_11_8_10",  # PRBS (see above)
+        "PRBS_15_0_14": "PRBS_15_0_14",  # PRBS (see above)
+        "PRBS_4_0_3": "PRBS_4_0_3",      # Use linear feedback shift register to generate pseudo random sequence.
+        "PRBS_7_0_6": "PRBS_7_0_6",      # PRBS (see above)
+        "custom": "custom",              # Enter your own payload with the set_endp_payload cmd.
+        "decreasing": "decreasing",      # bytes start at FF and decrease, wrapping if needed
+        "increasing": "increasing",      # bytes start at 00 and increase, wrapping if needed
+        "ones": "ones",                  # payload is all ones (FF)
+        "random": "random",              # generate a new random payload each time sent
+        "random_fixed": "random_fixed",  # means generate one random payload, and send it over and over again.
+        "zeros": "zeros",                # payload is all zeros (00)
+    }),
+    "AddEndpType": ("Enum", {
+        "custom_ether": "custom_ether",    # LF frames with custom options, use with playback
+        "custom_mc_udp": "custom_mc_udp",  # LF Multicast UDP IPv4
+        "custom_tcp": "custom_tcp",        # LF TCP IPv4 frame with custom options
+        "custom_udp": "custom_udp",        # LF UDP IPv4 frame with custom options
+        "lf": "lf",                        # LF protocol
+        "lf_sctp": "lf_sctp",              # SCTP IPv4 protocol
+        "lf_sctp6": "lf_sctp6",            # SCTP IPv6 protocol
+        "lf_tcp": "lf_tcp",                # TCP IPv4 connection
+        "lf_tcp6": "lf_tcp6",              # TCP IPv6 connection
+        "lf_udp": "lf_udp",                # UDP IPv4 connection
+        "lf_udp6": "lf_udp6",              # UDP IPv6 connection
+        "mc_udp": "mc_udp",                # LF Multicast IPv4
+    }),
+    # <CLI-JSON/ADD_FILE_ENDP>
+    "AddFileEndpFioFlags": ("IntFlag", {
+        "AUTO_MOUNT": 0x2,      # (2) Attempt to mount with the provided information if not already mounted.
+        "AUTO_UNMOUNT": 0x4,    # (4) Attempt to un-mount when stopping test.
+        "CHECK_MOUNT": 0x1,     # (1) Attempt to verify NFS and SMB mounts match the configured values.
+        "O_APPEND": 0x200,      # (512) Open files for writing with O_APPEND instead
+        "O_DIRECT": 0x8,        # (8) Open file with O_DIRECT flag, disables caching. Must use block-size
+        "O_LARGEFILE": 0x20,    # (32) Open files with O_LARGEFILE. This allows greater than 2GB files on
+        "UNLINK_BW": 0x10,      # (16) Unlink file before writing. This works around issues with CIFS for some
+        "UNMOUNT_FORCE": 0x40,  # (64) Use -f flag when calling umount
+        "UNMOUNT_LAZY": 0x80,   # (128) Use -l flag when calling umount
+        "USE_FSTATFS": 0x100,   # (256) Use fstatfs system call to verify file-system type when opening files.
+    }),
+    "AddFileEndpPayloadPattern": ("Enum", {
+        "PRBS_11_8_10": "PRBS_11_8_10",  # PRBS (see above)
+        "PRBS_15_0_14": "PRBS_15_0_14",  # PRBS (see above)
+        "PRBS_4_0_3": "PRBS_4_0_3",      # Use linear feedback shift register to generate pseudo random sequence.
+        "PRBS_7_0_6": "PRBS_7_0_6",      # PRBS (see above)
+        "custom": "custom",              # Enter your own payload with the set_endp_payload cmd.
+        "decreasing": "decreasing",      # bytes start at FF and decrease, wrapping if needed.
+        "increasing": "increasing",      # bytes start at 00 and increase, wrapping if needed.
+        "ones": "ones",                  # Payload is all ones (FF).
+        "random": "random",              # generate a new random payload each time sent.
+        "random_fixed": "random_fixed",  # Means generate one random payload, and send it over
+        "zeros": "zeros",                # Payload is all zeros (00).
+    }),
+    "AddFileEndpType": ("Enum", {
+        "fe_cifs": "fe_cifs",            # Does a CIFS (Samba) mount
+        "fe_cifs_ip6": "fe_cifs/ip6",    # Does an IPv6 CIFS mount
+        "fe_generic": "fe_generic",      # Uses unspecified file protocol
+        "fe_iscsi": "fe_iscsi",          # Does a ISCSI mount
+        "fe_nfs": "fe_nfs",              # Does an NFSv3 mount
+        "fe_nfs_ip6": "fe_nfs/ip6",      # Does a NFSv3 IPv6 mount
+        "fe_nfs4": "fe_nfs4",            # Does an NFSv4 mount
+        "fe_nfs4_ip6": "fe_nfs4/ip6",    # Does a NFSv4 IPv6 mount
+        "fe_smb2": "fe_smb2",            # Does a SMB v2.0 mount
+        "fe_smb2_ip6": "fe_smb2/ip6",    # Does a SMB v2.0 IPv6 mount
+        "fe_smb21": "fe_smb21",          # Does a SMB v2.1 mount
+        "fe_smb21_ip6": "fe_smb21/ip6",  # Does a SMB v2.1 IPv6 mount
+        "fe_smb30": "fe_smb30",          # Does a SMB v3.0 mount
+        "fe_smb30_ip6": "fe_smb30/ip6",  # Does a SMB v3.0 IPv6 mount
+    }),
+    # <CLI-JSON/ADD_GROUP>
+    "AddGroupFlags": ("IntFlag", {
+        "group_total_rates": 0x4,  # Set rates as total for group.
+    }),
+    # <CLI-JSON/ADD_L4_ENDP>
+    "AddL4EndpHttpAuthType": ("IntFlag", {
+        "BASIC": 0x1,         # Basic authentication
+        "DIGEST": 0x2,        # Digest (MD5) authentication
+        "GSSNEGOTIATE": 0x4,  # GSS authentication
+        "NTLM": 0x8,          # NTLM authentication
+    }),
+    "AddL4EndpProxyAuthType": ("IntFlag", {
+        "BASIC": 0x1,                     # 1 Basic authentication
+        "BIND_DNS": 0x200,                # 512 Make DNS requests go out endpoints Port.
+        "DIGEST": 0x2,                    # 2 Digest (MD5) authentication
+        "DISABLE_EPSV": 0x1000,           # 4096 Disable FTP EPSV option
+        "DISABLE_PASV": 0x800,            # 2048 Disable FTP PASV option (will use PORT command)
+        "GSSNEGOTIATE": 0x4,              # 4 GSS authentication
+        "INCLUDE_HEADERS": 0x100,         # 256 especially for IMAP
+        "NTLM": 0x8,                      # 8 NTLM authentication
+        "USE_DEFLATE_COMPRESSION": 0x80,  # 128 Use deflate compression
+        "USE_GZIP_COMPRESSION": 0x40,     # 64 Use gzip compression
+        "USE_IPV6": 0x400,                # 1024 Resolve URL is IPv6. Will use IPv4 if not selected.
+        "USE_PROXY_CACHE": 0x20,          # 32 Use proxy cache
+    }),
+    "AddL4EndpType": ("IntFlag", {
+        "l4_generic": 0x0,  # Layer 4 type
+    }),
+    # <CLI-JSON/ADD_MONITOR>
+    "AddMonitorFlags": ("IntFlag", {
+        "disable_ht40": 0x800,        # Disable HT-40 even if hardware and AP support it.
+        "disable_ht80": 0x8000000,    # Disable HT80 (for AC chipset NICs only)
+        "ht160_enable": 0x100000000,  # Enable HT160 mode.
+    }),
+    # <CLI-JSON/ADD_PROFILE>
+    "AddProfileProfileFlags": ("IntFlag", {
+        "p_11r": 0x40,           # Use 802.11r roaming setup.
+        "ALLOW_11W": 0x800,      # Set 11w (MFP/PMF) to optional.
+        "BSS_TRANS": 0x400,      # Enable BSS Transition logic
+        "DHCP_SERVER": 0x1,      # This should provide DHCP server.
+        "EAP_PEAP": 0x200,       # Enable EAP-PEAP
+        "EAP_TTLS": 0x80,        # Use 802.1x EAP-TTLS
+        "NAT": 0x100,            # Enable NAT if this object is in a virtual router
+        "SKIP_DHCP_ROAM": 0x10,  # Ask station to not re-do DHCP on roam.
+        "WEP": 0x2,              # Use WEP encryption
+        "WPA": 0x4,              # Use WPA encryption
+        "WPA2": 0x8,             # Use WPA2 encryption
+        "WPA3": 0x20,            # Use WPA3 encryption
+    }),
+    "AddProfileWifiMode": ("Enum", {
+        "p_802_11a": "802.11a",      # 802.11a
+        "AUTO": "AUTO",              # 802.11g
+        "aAX": "aAX",                # 802.11a-AX (6E disables /n and /ac)
+        "abg": "abg",                # 802.11abg
+        "abgn": "abgn",              # 802.11abgn
+        "abgnAC": "abgnAC",          # 802.11abgn-AC
+        "abgnAX": "abgnAX",          # 802.11abgn-AX
+        "an": "an",                  # 802.11an
+        "anAC": "anAC",              # 802.11an-AC
+        "anAX": "anAX",              # 802.11an-AX
+        "as_is": "as_is",            # Make no changes to current configuration
+        "b": "b",                    # 802.11b
+        "bg": "bg",                  # 802.11bg
+        "bgn": "bgn",                # 802.11bgn
+        "bgnAC": "bgnAC",            # 802.11bgn-AC
+        "bgnAX": "bgnAX",            # 802.11bgn-AX
+        "bond": "bond",              # Bonded pair of Ethernet ports.
+        "bridged_ap": "bridged_ap",  # AP device in bridged mode. The EIDs may specify radio and bridged port.
+        "client": "client",          # Client-side non-WiFi device (Ethernet port, for instance).
+        "g": "g",                    # 802.11g
+        "mobile_sta": "mobile_sta",  # Mobile station device. Expects to connect to DUT AP(s) and upstream
+        "monitor": "monitor",        # Monitor device/sniffer. The EIDs may specify which radios to use.
+        "peer": "peer",              # Edge device, client or server (Ethernet port, for instance).
+        "rdd": "rdd",                # Pair of redirect devices, typically associated with VR to act as traffic
+        "routed_ap": "routed_ap",    # AP in routed mode. The EIDs may specify radio and upstream port.
+        "sta": "sta",                # Station device, most likely non mobile. The EIDs may specify radio(s) to
+        "uplink": "uplink",          # Uplink towards rest of network (can go in virtual router and do NAT)
+        "upstream": "upstream",      # Upstream server device. The EIDs may specify which ports to use.
+        "vlan": "vlan",              # 802.1q VLAN. Specify VID with the 'freq' option.
+    }),
+    # <CLI-JSON/ADD_STA>
+    "AddStaFlags": ("IntFlag", {
+        "p_80211r_pmska_cache": 0x4000000,    # Enable oportunistic PMSKA caching for WPA2 (Related to
+        "p_80211u_additional": 0x100000,      # AP requires additional step for access (802.11u Interworking)
+        "p_80211u_auto": 0x40000,             # Enable 802.11u (Interworking) Auto-internetworking feature.
+        "p_80211u_e911": 0x200000,            # AP claims emergency services reachable (802.11u Interworking)
+        "p_80211u_e911_unauth": 0x400000,     # AP provides Unauthenticated emergency services (802.11u
+        "p_80211u_enable": 0x20000,           # Enable 802.11u (Interworking) feature.
+        "p_80211u_gw": 0x80000,               # AP Provides access to internet (802.11u Interworking)
+        "p_8021x_radius": 0x2000000,          # Use 802.1x (RADIUS for AP).
+        "create_admin_down": 0x1000000000,    # Station should be created admin-down.
+        "custom_conf": 0x20,                  # Use Custom wpa_supplicant config file.
+        "disable_obss_scan": 0x400000000000,  # Disable OBSS SCAN feature in supplicant.
+        "disable_ofdma": 0x200000000000,      # Disable OFDMA mode
+        "disable_twt": 0x100000000000,        # Disable TWT mode
+        "disable_fast_reauth": 0x200000000,   # Disable fast_reauth option for virtual stations.
+        "disable_gdaf": 0x1000000,            # AP: Disable DGAF (used by HotSpot 2.0).
+        "disable_ht80": 0x8000000,            # Disable HT80 (for AC chipset NICs only)
+        "disable_roam": 0x80000000,           # Disable automatic station roaming based on scan results.
+        "disable_sgi": 0x4000,                # Disable SGI (Short Guard Interval).
+        "hs20_enable": 0x800000,              # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
+        "ht160_enable": 0x100000000,          # Enable HT160 mode.
+        "ht40_disable": 0x800,                # Disable HT-40 even if hardware and AP support it.
+        "ibss_mode": 0x20000000,              # Station should be in IBSS mode.
+        "lf_sta_migrate": 0x8000,             # OK-To-Migrate (Allow station migration between LANforge
+        "mesh_mode": 0x400000000,             # Station should be in MESH mode.
+        "no_supp_op_class_ie": 0x4000000000,  # Do not include supported-oper-class-IE in assoc requests. May
+        "osen_enable": 0x40000000,            # Enable OSEN protocol (OSU Server-only Authentication)
+        "passive_scan": 0x2000,               # Use passive scanning (don't send probe requests).
+        "power_save_enable": 0x800000000,     # Station should enable power-save. May not work in all
+        "scan_ssid": 0x1000,                  # Enable SCAN-SSID flag in wpa_supplicant.
+        "txo_enable": 0x8000000000,           # Enable/disable tx-offloads, typically managed by set_wifi_txo
+        "use_bss_transition": 0x80000000000,  # Enable BSS transition.
+        "use_wpa3": 0x10000000000,            # Enable WPA-3 (SAE Personal) mode.
+        "verbose": 0x10000,                   # Verbose-Debug: Increase debug info in wpa-supplicant and
+        "wds_mode": 0x2000000000,             # WDS station (sort of like a lame mesh), not supported on
+        "wep_enable": 0x200,                  # Use wpa_supplicant configured for WEP encryption.
+        "wpa2_enable": 0x400,                 # Use wpa_supplicant configured for WPA2 encryption.
+        "wpa_enable": 0x10,                   # Enable WPA
+    }),
+    "AddStaMode": ("Enum", {
+        "p_802_11a": 1,  # 802.11a
+        "AUTO": 0,       # 802.11g
+        "aAX": 15,       # 802.11a-AX (6E disables /n and /ac)
+        "abg": 4,        # 802.11abg
+        "abgn": 5,       # 802.11abgn
+        "abgnAC": 8,     # 802.11abgn-AC
+        "abgnAX": 12,    # 802.11abgn-AX
+        "an": 10,        # 802.11an
+        "anAC": 9,       # 802.11an-AC
+        "anAX": 14,      # 802.11an-AX
+        "b": 2,          # 802.11b
+        "bg": 7,         # 802.11bg
+        "bgn": 6,        # 802.11bgn
+        "bgnAC": 11,     # 802.11bgn-AC
+        "bgnAX": 13,     # 802.11bgn-AX
+        "g": 3,          # 802.11g
+    }),
+    "AddStaRate": ("Enum", {
+        "p_a_g": "/a/g",          # 6 Mbps, 9 Mbps, 12 Mbps, 18 Mbps, 24 Mbps, 36 Mbps, 48 Mbps, 54 Mbps
+        "p_b": "/b",              # 1Mbps, 2Mbps, 5.5 Mbps, 11 Mbps
+        "DEFAULT": "DEFAULT",     # Use maximum available speed
+        "MCS0_76": "MCS0-76",     # /n rates
+        "p_bitmap_": "[bitmap]",  # <b>'0xff 00 ...'</b> to directly specify the MCS bitmap.
+    }),
+    # <CLI-JSON/ADD_T1_SPAN>
+    "AddT1SpanBuildout": ("Enum", {
+        "p_15db": 6,    # -15db (CSU)
+        "p_22_5db": 7,  # -22.5db (CSU)
+        "p_7_5db": 5,   # -7.5db (CSU)
+        "p_0db": 8,     # 0db (CSU)
+        "p_133_ft": 0,  # 1-133 feet
+        "p_266_ft": 1,  # 122-266 feet
+        "p_399_ft": 2,  # 266-399 feet
+        "p_533_ft": 3,  # 399-533 feet
+        "p_655_ft": 4,  # 533-655 feet
+    }),
+    "AddT1SpanType": ("Enum", {
+        "Digium_T1": "Digium_T1",    #
+        "Sangoma_E1": "Sangoma_E1",  #
+        "Sangoma_T1": "Sangoma_T1",  #
+    }),
+    # <CLI-JSON/ADD_THRESHOLD>
+    "AddThresholdThreshId": ("Enum", {
+        "Delete_Marked": -3,  # Delete any marked.
+        "Mark_All": -2,       # Mark all
+    }),
+    "AddThresholdThreshType": ("Enum", {
+        "NO_RX_SINCE": 6,          # Have not received any bytes/packets in specified time.
+        "RX_BPS_RATE_OOR_1m": 5,   # rx-bps over last 1 minute is out of range.
+        "RX_BPS_RATE_OOR_30S": 3,  # rx-bps over last 30 seconds is out of range.
+        "RX_BPS_RATE_OOR_3S": 1,   # rx-bps over last 3 seconds is out of range.
+        "TT_RX_DROP_OOR": 8,       # RX Drop percentage is out of range (per-million).
+        "TT_RX_LAT_OOR": 7,        # Latency running-average out of range.
+        "TX_BPS_RATE_OOR_1m": 4,   # tx-bps over last 1 minute is out of range.
+        "TX_BPS_RATE_OOR_30S": 2,  # tx-bps over last 30 seconds is out of range.
+        "TX_BPS_RATE_OOR_3S": 0,   # tx-bps over last 3 seconds is out of range.
+    }),
+    # <CLI-JSON/ADD_TRAFFIC_PROFILE>
+    "AddTrafficProfileTrafficProfileFlags": ("IntFlag", {
+        "BI_DIRECTIONAL": 0x2,  # Should we do bi-directional traffic?
+        "IPERF_UDP": 0x4,       # If Iperf, should use UDP. If not set, then will use TCP.
+        "UP": 0x1,              # Upload direction (this not set means download)
+    }),
+    "AddTrafficProfileWifiMode": ("Enum", {
+        "Iperf3_Client": "Iperf3-Client",  # iperf3 client
+        "Iperf3_Server": "Iperf3-Server",  # iperf3 server
+        "as_is": "as_is",                  # Make no changes to current configuration
+        "http": "http",                    # Not yet implemented
+        "https": "https",                  # Not yet implemented
+        "tcp": "tcp",                      #
+        "udp": "udp",                      #
+    }),
+    # <CLI-JSON/ADD_VAP>
+    "AddVapFlags": ("IntFlag", {
+        "p_80211h_enable": 0x10000000,        # Enable 802.11h (needed for running on DFS channels) Requires
+        "p_80211r_pmska_cache": 0x4000000,    # Enable oportunistic PMSKA caching for WPA2 (Related to
+        "p_80211u_additional": 0x100000,      # AP requires additional step for access (802.11u Interworking)
+        "p_80211u_auto": 0x40000,             # Enable 802.11u (Interworking) Auto-internetworking feature.
+        "p_80211u_e911": 0x200000,            # AP claims emergency services reachable (802.11u Interworking)
+        "p_80211u_e911_unauth": 0x400000,     # AP provides Unauthenticated emergency services (802.11u
+        "p_80211u_enable": 0x20000,           # Enable 802.11u (Interworking) feature.
+        "p_80211u_gw": 0x80000,               # AP Provides access to internet (802.11u Interworking)
+        "p_8021x_radius": 0x2000000,          # Use 802.1x (RADIUS for AP).
+        "create_admin_down": 0x1000000000,    # Station should be created admin-down.
+        "disable_dgaf": 0x1000000,            # AP Disable DGAF (used by HotSpot 2.0).
+        "disable_ht40": 0x800,                # Disable HT-40 (will use HT-20 if available).
+        "disable_ht80": 0x8000000,            # Disable HT80 (for AC chipset NICs only)
+        "enable_80211d": 0x40,                # Enable 802.11D to broadcast country-code &amp; channels in
+        "enable_wpa": 0x10,                   # Enable WPA
+        "hostapd_config": 0x20,               # Use Custom hostapd config file.
+        "hs20_enable": 0x800000,              # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
+        "ht160_enable": 0x100000000,          # Enable HT160 mode.
+        "osen_enable": 0x40000000,            # Enable OSEN protocol (OSU Server-only Authentication)
+        "pri_sec_ch_enable": 0x100,           # Enable Primary/Secondary channel switch.
+        "short_preamble": 0x80,               # Allow short-preamble
+        "use_bss_load": 0x20000000000,        # Enable BSS Load IE in Beacons and Probe Responses (.11e).
+        "use_bss_transition": 0x80000000000,  # Enable BSS transition.
+        "use_rrm_report": 0x40000000000,      # Enable Radio measurements IE in beacon and probe responses.
+        "use_wpa3": 0x10000000000,            # Enable WPA-3 (SAE Personal) mode.
+        "verbose": 0x10000,                   # Verbose-Debug: Increase debug info in wpa-supplicant and
+        "wep_enable": 0x200,                  # Enable WEP Encryption
+        "wpa2_enable": 0x400,                 # Enable WPA2 Encryption
+    }),
+    "AddVapMode": ("Enum", {
+        "p_802_11a": 1,  # 802.11a
+        "AUTO": 0,       # 802.11g
+        "aAX": 15,       # 802.11a-AX (6E disables /n and /ac)
+        "abg": 4,        # 802.11abg
+        "abgn": 5,       # 802.11abgn
+        "abgnAC": 8,     # 802.11abgn-AC
+        "abgnAX": 12,    # 802.11abgn-AX
+        "an": 10,        # 802.11an
+        "anAC": 9,       # 802.11an-AC
+        "anAX": 14,      # 802.11an-AX
+        "b": 2,          # 802.11b
+        "bg": 7,         # 802.11bg
+        "bgn": 6,        # 802.11bgn
+        "bgnAC": 11,     # 802.11bgn-AC
+        "bgnAX": 13,     # 802.11bgn-AX
+        "g": 3,          # 802.11g
+    }),
+    # <CLI-JSON/ADD_VENUE>
+    "AddVenueFreq24": ("IntFlag", {
+        "ALL": 0xffff,  # ALL
+        "Ch_1": 0x1,    # Channel 1
+        "Ch_2": 0x2,    # Channel 2
+        "Ch_3": 0x4,    # Channel 3
+    }),
+    "AddVenueFreq5": ("IntFlag", {
+        "Ch_100": 0x800,      # Channel 100 5500
+        "Ch_104": 0x1000,     # Channel 104 5520
+        "Ch_108": 0x2000,     # Channel 108 5540
+        "Ch_112": 0x4000,     # Channel 112 5560
+        "Ch_116": 0x8000,     # Channel 116 5580
+        "Ch_120": 0x10000,    # Channel 120 5600
+        "Ch_124": 0x20000,    # Channel 124 5620
+        "Ch_128": 0x40000,    # Channel 128 5640
+        "Ch_132": 0x80000,    # Channel 132 5660
+        "Ch_136": 0x100000,   # Channel 136 5680
+        "Ch_140": 0x200000,   # Channel 140 5700
+        "Ch_149": 0x400000,   # Channel 149 5745
+        "Ch_153": 0x800000,   # Channel 153 5765
+        "Ch_157": 0x1000000,  # Channel 157 5785
+        "Ch_161": 0x2000000,  # Channel 161 5805
+        "Ch_165": 0x4000000,  # Channel 165 5825
+        "Ch_36": 0x1,         # Channel 36 5180
+        "Ch_38": 0x2,         # Channel 38 5190
+        "Ch_40": 0x4,         # Channel 40 5200
+        "Ch_42": 0x8,         # Channel 42 5210
+        "Ch_44": 0x10,        # Channel 44 5220
+        "Ch_46": 0x20,        # Channel 46 5230
+        "Ch_48": 0x40,        # Channel 48 5240
+        "Ch_52": 0x80,        # Channel 52 5260
+        "Ch_56": 0x100,       # Channel 56 5280
+        "Ch_60": 0x200,       # Channel 60 5300
+        "Ch_64": 0x400,       # Channel 64 5320
+    }),
+    # <CLI-JSON/ADD_VR>
+    "AddVrFlags": ("IntFlag", {
+        "p_4BYTE_AS_NUMBER": 0x40,  # Sets corresponding Xorp flag.
+        "BGP_CONFED": 0x100,        # Configure BGP in a confederation.
+        "BGP_DAMPING": 0x200,       # Enable BGP damping section in Xorp configuration file.
+        "ENABLE_BGP": 0x20,         # Set this to zero if you don't want BGP on this VR.
+        "RIP_ACCEPT_DR": 0x800,     # Tell RIP to accept default-routes.
+        "ROUTE_REFLECTOR": 0x80,    # Act as BGP Route Reflector.
+        "USE_IPV6": 0x10,           # Enable IPv6 OSPF routing for this virtual router.
+        "USE_IPV6_RADVD": 0x8,      # Enable IPv6 RADV Daemon for interfaces in this virtual router.
+        "USE_RIP": 0x400,           # Enable RIP routing protocol in Xorp.
+        "USE_XORP_MCAST": 0x2,      # Enable Xorp Multicast routing (requires OSPF to be enabled currently)
+        "USE_XORP_OLSR": 0x1000,    # Enable OLSR routing protocol in Xorp.
+        "USE_XORP_OSPF": 0x1,       # Enable Xorp router daemon with OSPF (IPv4) protocol
+        "USE_XORP_SHA": 0x4,        # Enable Telcordia's Xorp SHA option (requires OSPF to be enabled)
+    }),
+    # <CLI-JSON/ADD_VR_BGP>
+    "AddVrBgpFlags": ("IntFlag", {
+        "p_4BYTE_AS_NUMBER": 0x40,  # Sets corresponding Xorp flag.
+        "BGP_CONFED": 0x100,        # Configure BGP in a confederation.
+        "BGP_DAMPING": 0x200,       # Enable BGP damping section in Xorp configuration file.
+        "ENABLE_BGP": 0x20,         # Set this to zero if you don't want BGP on this VR.
+        "ROUTE_REFLECTOR": 0x80,    # Act as BGP Route Reflector.
+    }),
+    # <CLI-JSON/ADD_VRCX>
+    "AddVrcxFlags": ("IntFlag", {
+        "custom_dhcpd": 0x400,   # Use custom DHCP config file
+        "dhcpd_enabled": 0x200,  # Serve IPv4 DHCP on this interface
+        "ipv6_enabled": 0x2000,  # Serve IPv6 DHCP on this interface
+        "nat_enabled": 0x100,    # This connection will NAT outgoing packets
+        "subnet_0": 0x1,         # Specify subnet 0
+        "subnet_1": 0x2,         # Specify subnet 1
+        "subnet_2": 0x4,         # Specify subnet 2
+        "subnet_3": 0x8,         # Specify subnet 3
+        "subnet_4": 0x10,        # Specify subnet 4
+        "subnet_5": 0x20,        # Specify subnet 5
+        "subnet_6": 0x40,        # Specify subnet 6
+        "subnet_7": 0x80,        # Specify subnet 7
+        "use_multicast": 0x800,  # Use this interface for multicast and-rp
+        "use_vrrp": 0x1000,      # Use this interface for VRRP
+    }),
+    # <CLI-JSON/ADD_WL_ENDP>
+    "AddWlEndpWleFlags": ("Enum", {
+        "SHOW_WP": 1,  # Show WanPaths in wanlink endpoint table in GUI
+    }),
+}
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_ARM_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_arm_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_arm_endp(self, 
+                      alias: str = None,      # Name of endpoint. [R]
+                      cpu_id: str = None,     # Preferred CPU ID on which this endpoint should run.
+                      mx_pkt_sz: str = None,  # Maximum packet size, including all Ethernet headers.
+                      pkt_sz: str = None,     # Minimum packet size, including all Ethernet headers.
+                      port: str = None,       # Port number. [W]
+                      pps: str = None,        # Packets per second to generate.
+                      resource: int = None,   # Resource number. [W]
+                      shelf: int = 1,         # Shelf name/id. Required. [R][D:1]
+                      tos: str = None,        # The Type of Service, can be HEX. See set_endp_tos for details.
+                      p_type: str = None,     # Endpoint Type : arm_udp. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_arm_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if cpu_id is not None:
+        data["cpu_id"] = cpu_id
+    if mx_pkt_sz is not None:
+        data["mx_pkt_sz"] = mx_pkt_sz
+    if pkt_sz is not None:
+        data["pkt_sz"] = pkt_sz
+    if port is not None:
+        data["port"] = port
+    if pps is not None:
+        data["pps"] = pps
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if tos is not None:
+        data["tos"] = tos
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_arm_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_BGP_PEER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_bgp_peer
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_bgp_peer(self, 
+                      p_as: str = None,             # BGP Peer Autonomous System number, 0-65535
+                      delay_open_time: str = None,  # BGP Peer delay open time.
+                      flags: str = None,            # Virtual router BGP Peer flags, see above for definitions.
+                      holdtime: str = None,         # BGP Peer hold-time.
+                      local_dev: str = None,        # BGP Peer Local interface.
+                      nexthop: str = None,          # BGP Peer Nexthop, IPv4 Address.
+                      nexthop6: str = None,         # BGP Peer IPv6 Nexthop address.
+                      peer_id: str = None,          # BGP Peer Identifier: IPv4 Address
+                      peer_index: str = None,       # Peer index in this virtual router (0-7).
+                      resource: int = None,         # Resource number. [W]
+                      shelf: int = 1,               # Shelf name/id. [R][D:1]
+                      vr_id: str = None,            # Name of virtual router. [R]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_bgp_peer(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if p_as is not None:
+        data["as"] = p_as
+    if delay_open_time is not None:
+        data["delay_open_time"] = delay_open_time
+    if flags is not None:
+        data["flags"] = flags
+    if holdtime is not None:
+        data["holdtime"] = holdtime
+    if local_dev is not None:
+        data["local_dev"] = local_dev
+    if nexthop is not None:
+        data["nexthop"] = nexthop
+    if nexthop6 is not None:
+        data["nexthop6"] = nexthop6
+    if peer_id is not None:
+        data["peer_id"] = peer_id
+    if peer_index is not None:
+        data["peer_index"] = peer_index
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vr_id is not None:
+        data["vr_id"] = vr_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_bgp_peer",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_BOND> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_bond
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_bond(self, 
+                  network_devs: str = None,  # Comma-separated list of network devices: eth1,eth2,eth3... [W]
+                  port: str = None,          # Name of the bond device. [W]
+                  resource: int = None,      # Resource number. [W]
+                  shelf: int = 1,            # Shelf number. [R][D:1]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_bond(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if network_devs is not None:
+        data["network_devs"] = network_devs
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_bond",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_BR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_br
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_br(self, 
+                br_aging_time: str = None,        # MAC aging time, in seconds, 32-bit number.
+                br_flags: str = None,             # Bridge flags, see above.
+                br_forwarding_delay: str = None,  # How long to wait until the bridge will start forwarding packets.
+                br_hello_time: str = None,        # How often does the bridge send out STP hello packets.
+                br_max_age: str = None,           # How long until STP considers a non-responsive bridge dead.
+                br_priority: str = None,          # Bridge priority, 16-bit number.
+                network_devs: str = None,         # Comma-separated list of network devices: eth1,eth2,eth3...
+                port: str = None,                 # Name of the bridge device. [W]
+                resource: int = None,             # Resource number. [W]
+                shelf: int = 1,                   # Shelf number. [R][D:1]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_br(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if br_aging_time is not None:
+        data["br_aging_time"] = br_aging_time
+    if br_flags is not None:
+        data["br_flags"] = br_flags
+    if br_forwarding_delay is not None:
+        data["br_forwarding_delay"] = br_forwarding_delay
+    if br_hello_time is not None:
+        data["br_hello_time"] = br_hello_time
+    if br_max_age is not None:
+        data["br_max_age"] = br_max_age
+    if br_priority is not None:
+        data["br_priority"] = br_priority
+    if network_devs is not None:
+        data["network_devs"] = network_devs
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_br",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_cd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_cd(self, 
+                alias: str = None,         # Name of Collision Domain. [W]
+                bps: str = None,           # Maximum speed at which this collision domain can run.
+                flags: str = None,         # See above. Leave blank or use 'NA' for no default values.
+                report_timer: int = None,  # How often to report stats.
+                resource: int = None,      # Resource number. [W]
+                shelf: int = 1,            # Shelf name/id. [R][D:1]
+                state: str = None,         # RUNNING or STOPPED (default is RUNNING). Use this to start/stop.
+                p_type: str = None,        # CD Type: WIFI, WISER_SURFACE, WISER_SURFACE_AIR, WISER_AIR_AIR,
+                # WISER_NCW
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_cd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if bps is not None:
+        data["bps"] = bps
+    if flags is not None:
+        data["flags"] = flags
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if state is not None:
+        data["state"] = state
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_cd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CD_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_cd_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_cd_endp(self, 
+                     cd: str = None,    # Name of Collision Domain. [R]
+                     endp: str = None,  # Endpoint name/id. [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_cd_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd is not None:
+        data["cd"] = cd
+    if endp is not None:
+        data["endp"] = endp
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_cd_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CD_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_cd_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_cd_vr(self, 
+                   cd: str = None,  # Name of Collision Domain. [R]
+                   vr: str = None,  # Virtual-Router name/ID. [R]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_cd_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd is not None:
+        data["cd"] = cd
+    if vr is not None:
+        data["vr"] = vr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_cd_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CHAMBER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_chamber
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_chamber(self, 
+                     chamber_type: str = None,    # Chamber type, see above. Use 1 for Medium if uncertain. [W]
+                     dut_name1: str = None,       # Name of first DUT in this chamber or NA
+                     dut_name2: str = None,       # Name of second DUT in this chamber or NA
+                     dut_name3: str = None,       # Name of third DUT in this chamber or NA
+                     dut_name4: str = None,       # Name of fourth DUT in this chamber or NA
+                     flags: str = None,           # Flag field for Chamber, see above. [W]
+                     flags_mask: str = None,      # Mask of what flags to pay attention to, or NA for all.
+                     height: str = None,          # Height to be used when drawn in the LANforge-GUI.
+                     isolation: str = None,       # Estimated isolation in db for this chamber.
+                     lanforge1: str = None,       # EID of first LANforge Resource in this chamber or NA
+                     lanforge2: str = None,       # EID of second LANforge Resource in this chamber or NA
+                     lanforge3: str = None,       # EID of third LANforge Resource in this chamber or NA
+                     lanforge4: str = None,       # EID of fourth LANforge Resource in this chamber or NA
+                     name: str = None,            # Name of Chamber, unique identifier. [R]
+                     resource: int = None,        # LANforge Resource ID for controlling turn-table via serial
+                     # protocol.
+                     sma_count: str = None,       # Number of SMA connectors on this chamber, default is 16.
+                     turntable_type: str = None,  # Turn-Table type: see above.
+                     width: str = None,           # Width to be used when drawn in the LANforge-GUI.
+                     x: str = None,               # X coordinate to be used when drawn in the LANforge-GUI.
+                     y: str = None,               # Y coordinate to be used when drawn in the LANforge-GUI.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_chamber(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chamber_type is not None:
+        data["chamber_type"] = chamber_type
+    if dut_name1 is not None:
+        data["dut_name1"] = dut_name1
+    if dut_name2 is not None:
+        data["dut_name2"] = dut_name2
+    if dut_name3 is not None:
+        data["dut_name3"] = dut_name3
+    if dut_name4 is not None:
+        data["dut_name4"] = dut_name4
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if height is not None:
+        data["height"] = height
+    if isolation is not None:
+        data["isolation"] = isolation
+    if lanforge1 is not None:
+        data["lanforge1"] = lanforge1
+    if lanforge2 is not None:
+        data["lanforge2"] = lanforge2
+    if lanforge3 is not None:
+        data["lanforge3"] = lanforge3
+    if lanforge4 is not None:
+        data["lanforge4"] = lanforge4
+    if name is not None:
+        data["name"] = name
+    if resource is not None:
+        data["resource"] = resource
+    if sma_count is not None:
+        data["sma_count"] = sma_count
+    if turntable_type is not None:
+        data["turntable_type"] = turntable_type
+    if width is not None:
+        data["width"] = width
+    if x is not None:
+        data["x"] = x
+    if y is not None:
+        data["y"] = y
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_chamber",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CHAMBER_CX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_chamber_cx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_chamber_cx(self, 
+                        a_id: str = None,            # EidAntenna in string format for A side connection.
+                        atten_id: str = None,        # EID for the Attenuator module if one is inline on this
+                        # connection.
+                        b_id: str = None,            # EidAntenna in string format for B side connection.
+                        connection_idx: str = None,  # Connection index, currently up to 32 connections supported
+                        # (0-31) [R]
+                        flags: str = None,           # Flag field for Chamber Connection, see above.
+                        flags_mask: str = None,      # Mask of what flags to pay attention to, or NA for all.
+                        internal: str = None,        # Internal (1) or not (0): Internal connections are no longer
+                        # supported.
+                        min_atten: str = None,       # Specify minimum attenuation in 10ths of a db. Distance
+                        # logic will not set atten below this.
+                        name: str = None,            # Name of Chamber, unique identifier. [R]
+                        zrssi2: str = None,          # Specify 2.4Ghz zero-attenuation RSSI in 10ths of a db.
+                        # Distance logic will consider this in its calculations.
+                        zrssi5: str = None,          # Specify 5Ghz zero-attenuation RSSI in 10ths of a db.
+                        # Distance logic will consider this in its calculations.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_chamber_cx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if a_id is not None:
+        data["a_id"] = a_id
+    if atten_id is not None:
+        data["atten_id"] = atten_id
+    if b_id is not None:
+        data["b_id"] = b_id
+    if connection_idx is not None:
+        data["connection_idx"] = connection_idx
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if internal is not None:
+        data["internal"] = internal
+    if min_atten is not None:
+        data["min_atten"] = min_atten
+    if name is not None:
+        data["name"] = name
+    if zrssi2 is not None:
+        data["zrssi2"] = zrssi2
+    if zrssi5 is not None:
+        data["zrssi5"] = zrssi5
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_chamber_cx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CHAMBER_PATH> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_chamber_path
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_chamber_path(self, 
+                          chamber: str = None,  # Chamber Name. [R]
+                          content: str = None,  # <tt>[BLANK]</tt> will erase all content, any other text will
+                          # be appended to existing text.
+                          path: str = None,     # Path Name [R]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_chamber_path(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chamber is not None:
+        data["chamber"] = chamber
+    if content is not None:
+        data["content"] = content
+    if path is not None:
+        data["path"] = path
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_chamber_path",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CHANNEL_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_channel_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_channel_group(self, 
+                           alias: str = None,      # Name for this Channel Group. [R]
+                           channels: str = None,   # List of channels to add to this group.
+                           idle_flag: str = None,  # Idle flag (byte) for this channel group, for instance:
+                           # 0x7e
+                           mtu: str = None,        # MTU (and MRU) for this channel group. Must be a multiple
+                           # of the number of channels if configuring a T1 WanLink.
+                           resource: int = None,   # Resource number. [W]
+                           shelf: int = 1,         # Shelf name/id. [R][D:1]
+                           span_num: str = None,   # The span number. First span is 1, second is 2... [W]
+                           p_type: str = None,     # The channel-type. Use 'clear' for PPP links.
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_channel_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if channels is not None:
+        data["channels"] = channels
+    if idle_flag is not None:
+        data["idle_flag"] = idle_flag
+    if mtu is not None:
+        data["mtu"] = mtu
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span_num is not None:
+        data["span_num"] = span_num
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_channel_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_CX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_cx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_cx(self, 
+                alias: str = None,     # Name of the Cross Connect to create. [R]
+                rx_endp: str = None,   # Name of Receiving endpoint. [W]
+                test_mgr: str = None,  # Name of test-manager to create the CX on. [W][D:default_tm]
+                tx_endp: str = None,   # Name of Transmitting endpoint. [R]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_cx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if rx_endp is not None:
+        data["rx_endp"] = rx_endp
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if tx_endp is not None:
+        data["tx_endp"] = tx_endp
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_cx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_DUT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_dut
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_dut(self, 
+                 antenna_count1: str = None,  # Antenna count for first radio.
+                 antenna_count2: str = None,  # Antenna count for second radio.
+                 antenna_count3: str = None,  # Antenna count for third radio.
+                 api_id: str = None,          # DUT API Identifier (none specified yet)
+                 bssid1: str = None,          # BSSID for first radio.
+                 bssid2: str = None,          # BSSID for second radio.
+                 bssid3: str = None,          # BSSID for third radio.
+                 eap_id: str = None,          # EAP Identifier, for EAP-PEAP.
+                 flags: str = None,           # Flag field for DUT, see above. [W]
+                 flags_mask: str = None,      # Optional mask to specify what DUT flags are being set.
+                 hw_version: str = None,      # DUT Hardware Version information
+                 img_file: str = None,        # File-Name for image to represent DUT.
+                 lan_port: str = None,        # IP/Mask for LAN port
+                 mgt_ip: str = None,          # Management IP Address to access DUT
+                 model_num: str = None,       # DUT Model information
+                 name: str = None,            # Name of DUT, cannot contain '.' [R]
+                 passwd1: str = None,         # WiFi Password that can be used to connect to DUT
+                 passwd2: str = None,         # WiFi Password that can be used to connect to DUT
+                 passwd3: str = None,         # WiFi Password that can be used to connect to DUT
+                 serial_num: str = None,      # DUT Identifier (serial-number, etc)
+                 serial_port: str = None,     # Resource and Serial port name on LANforge that connects to DUT
+                 # (1.2.ttyS0).
+                 ssid1: str = None,           # WiFi SSID that can be used to connect to DUT
+                 ssid2: str = None,           # WiFi SSID that can be used to connect to DUT
+                 ssid3: str = None,           # WiFi SSID that can be used to connect to DUT
+                 sw_version: str = None,      # DUT Software Version information
+                 top_left_x: str = None,      # X Location for Chamber View.
+                 top_left_y: str = None,      # X Location for Chamber View.
+                 wan_port: str = None,        # IP/Mask for WAN port
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_dut(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if antenna_count1 is not None:
+        data["antenna_count1"] = antenna_count1
+    if antenna_count2 is not None:
+        data["antenna_count2"] = antenna_count2
+    if antenna_count3 is not None:
+        data["antenna_count3"] = antenna_count3
+    if api_id is not None:
+        data["api_id"] = api_id
+    if bssid1 is not None:
+        data["bssid1"] = bssid1
+    if bssid2 is not None:
+        data["bssid2"] = bssid2
+    if bssid3 is not None:
+        data["bssid3"] = bssid3
+    if eap_id is not None:
+        data["eap_id"] = eap_id
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if hw_version is not None:
+        data["hw_version"] = hw_version
+    if img_file is not None:
+        data["img_file"] = img_file
+    if lan_port is not None:
+        data["lan_port"] = lan_port
+    if mgt_ip is not None:
+        data["mgt_ip"] = mgt_ip
+    if model_num is not None:
+        data["model_num"] = model_num
+    if name is not None:
+        data["name"] = name
+    if passwd1 is not None:
+        data["passwd1"] = passwd1
+    if passwd2 is not None:
+        data["passwd2"] = passwd2
+    if passwd3 is not None:
+        data["passwd3"] = passwd3
+    if serial_num is not None:
+        data["serial_num"] = serial_num
+    if serial_port is not None:
+        data["serial_port"] = serial_port
+    if ssid1 is not None:
+        data["ssid1"] = ssid1
+    if ssid2 is not None:
+        data["ssid2"] = ssid2
+    if ssid3 is not None:
+        data["ssid3"] = ssid3
+    if sw_version is not None:
+        data["sw_version"] = sw_version
+    if top_left_x is not None:
+        data["top_left_x"] = top_left_x
+    if top_left_y is not None:
+        data["top_left_y"] = top_left_y
+    if wan_port is not None:
+        data["wan_port"] = wan_port
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_dut",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_DUT_NOTES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_dut_notes
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_dut_notes(self, 
+                       dut: str = None,   # DUT Name. [R]
+                       text: str = None,  # [BLANK] will erase all, any other text will be appended to
+                       # existing text.
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_dut_notes(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if dut is not None:
+        data["dut"] = dut
+    if text is not None:
+        data["text"] = text
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_dut_notes",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_DUT_SSID> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_dut_ssid
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_dut_ssid(self, 
+                      bssid: str = None,            # BSSID for cooresponding SSID.
+                      name: str = None,             # Name of DUT, cannot contain '.' [R]
+                      passwd: str = None,           # WiFi Password that can be used to connect to DUT
+                      ssid: str = None,             # WiFi SSID that can be used to connect to DUT
+                      ssid_flags: str = None,       # SSID flags, see above.
+                      ssid_flags_mask: str = None,  # SSID flags mask
+                      ssid_idx: str = None,         # Index of the SSID. Zero-based indexing: (0 - 7) [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_dut_ssid(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if bssid is not None:
+        data["bssid"] = bssid
+    if name is not None:
+        data["name"] = name
+    if passwd is not None:
+        data["passwd"] = passwd
+    if ssid is not None:
+        data["ssid"] = ssid
+    if ssid_flags is not None:
+        data["ssid_flags"] = ssid_flags
+    if ssid_flags_mask is not None:
+        data["ssid_flags_mask"] = ssid_flags_mask
+    if ssid_idx is not None:
+        data["ssid_idx"] = ssid_idx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_dut_ssid",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_endp(self, 
+                  alias: str = None,                     # Name of endpoint. [R]
+                  ip_port: str = None,                   # IP Port: IP port for layer three endpoints. Use -1 to let
+                  # the LANforge server automatically configure the ip_port.
+                  # Layer 2 endpoints will ignore
+                  is_pkt_sz_random: str = None,          # Yes means use random sized packets, anything else means NO.
+                  is_rate_bursty: str = None,            # Yes means bursty, anything else means NO.
+                  max_pkt: str = None,                   # Maximum packet size, including all headers. 0 means 'same',
+                  # -1 means AUTO (5.3.2+) [D:0]
+                  max_rate: str = None,                  # Maximum transmit rate (bps), used if in bursty mode.
+                  min_pkt: str = None,                   # Minimum packet size, including all headers. -1 means AUTO
+                  # (5.3.2+) [W][D:-1]
+                  min_rate: str = None,                  # Minimum transmit rate (bps), or only rate if not bursty. [W]
+                  multi_conn: str = None,                # If > 0, will create separate process with this many
+                  # connections per endpoint. See AUTO_HELPER flag
+                  payload_pattern: str = None,           # Payload pattern, see above.
+                  port: str = None,                      # Port/Interface name or number. [R]
+                  resource: int = None,                  # Resource number. [W]
+                  send_bad_crc_per_million: str = None,  # If NIC supports it, will randomly send X per million packets
+                  # with bad ethernet Frame Check Sum.
+                  shelf: int = 1,                        # Shelf name/id. [R][D:1]
+                  ttl: str = None,                       # Time-to-live, used by UDP Multicast Endpoints only.
+                  p_type: str = None,                    # Endpoint Type: See above. [W]
+                  use_checksum: str = None,              # Yes means checksum the payload, anything else means NO.
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if ip_port is not None:
+        data["ip_port"] = ip_port
+    if is_pkt_sz_random is not None:
+        data["is_pkt_sz_random"] = is_pkt_sz_random
+    if is_rate_bursty is not None:
+        data["is_rate_bursty"] = is_rate_bursty
+    if max_pkt is not None:
+        data["max_pkt"] = max_pkt
+    if max_rate is not None:
+        data["max_rate"] = max_rate
+    if min_pkt is not None:
+        data["min_pkt"] = min_pkt
+    if min_rate is not None:
+        data["min_rate"] = min_rate
+    if multi_conn is not None:
+        data["multi_conn"] = multi_conn
+    if payload_pattern is not None:
+        data["payload_pattern"] = payload_pattern
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if send_bad_crc_per_million is not None:
+        data["send_bad_crc_per_million"] = send_bad_crc_per_million
+    if shelf is not None:
+        data["shelf"] = shelf
+    if ttl is not None:
+        data["ttl"] = ttl
+    if p_type is not None:
+        data["type"] = p_type
+    if use_checksum is not None:
+        data["use_checksum"] = use_checksum
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_EVENT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_event
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_event(self, 
+                   details: str = None,   # Event text description. Cannot include double-quote characters. [R]
+                   event_id: str = None,  # Numeric ID for the event to modify, or 'new' if creating a new one.
+                   # [W][D:new]
+                   name: str = None,      # Event entity name.
+                   priority: str = None,  # See set_event_priority for available priorities.
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_event(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if details is not None:
+        data["details"] = details
+    if event_id is not None:
+        data["event_id"] = event_id
+    if name is not None:
+        data["name"] = name
+    if priority is not None:
+        data["priority"] = priority
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_event",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_FILE_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_file_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_file_endp(self, 
+                       alias: str = None,            # Name of endpoint. [R]
+                       directory: str = None,        # The directory to read/write in. Absolute path suggested.
+                       # [W]
+                       fio_flags: str = None,        # File-IO flags, see above for details.
+                       max_read_rate: str = None,    # Maximum read rate, bits-per-second.
+                       max_write_rate: str = None,   # Maximum write rate, bits-per-second.
+                       min_read_rate: str = None,    # Minimum read rate, bits-per-second.
+                       min_write_rate: str = None,   # Minimum write rate, bits-per-second.
+                       mount_dir: str = None,        # Directory to mount/unmount (if blank, will use
+                       # 'directory').
+                       mount_options: str = None,    # Optional mount options, passed to the mount command. 'NONE'
+                       # clears.
+                       payload_pattern: str = None,  # Payload pattern, see above.
+                       port: str = None,             # Port number. [W]
+                       prefix: str = None,           # The prefix of the file(s) to read/write.
+                       resource: int = None,         # Resource number. [W]
+                       retry_timer: str = None,      # Number of miliseconds to retry errored IO calls before
+                       # giving up.
+                       server_mount: str = None,     # The server to mount, ex:
+                       # <tt>192.168.100.5/exports/test1</tt> [W]
+                       shelf: int = 1,               # Shelf name/id. [R][D:1]
+                       p_type: str = None,           # Endpoint Type (like <tt>fe_nfs</tt>) [W]
+                       volume: str = None,           # iSCSI volume to mount
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_file_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if directory is not None:
+        data["directory"] = directory
+    if fio_flags is not None:
+        data["fio_flags"] = fio_flags
+    if max_read_rate is not None:
+        data["max_read_rate"] = max_read_rate
+    if max_write_rate is not None:
+        data["max_write_rate"] = max_write_rate
+    if min_read_rate is not None:
+        data["min_read_rate"] = min_read_rate
+    if min_write_rate is not None:
+        data["min_write_rate"] = min_write_rate
+    if mount_dir is not None:
+        data["mount_dir"] = mount_dir
+    if mount_options is not None:
+        data["mount_options"] = mount_options
+    if payload_pattern is not None:
+        data["payload_pattern"] = payload_pattern
+    if port is not None:
+        data["port"] = port
+    if prefix is not None:
+        data["prefix"] = prefix
+    if resource is not None:
+        data["resource"] = resource
+    if retry_timer is not None:
+        data["retry_timer"] = retry_timer
+    if server_mount is not None:
+        data["server_mount"] = server_mount
+    if shelf is not None:
+        data["shelf"] = shelf
+    if p_type is not None:
+        data["type"] = p_type
+    if volume is not None:
+        data["volume"] = volume
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_file_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_GEN_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_gen_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_gen_endp(self, 
+                      alias: str = None,     # Name of endpoint. [R]
+                      port: str = None,      # Port number. [W]
+                      resource: int = None,  # Resource number. [W]
+                      shelf: int = 1,        # Shelf name/id. [R][D:1]
+                      p_type: str = None,    # Endpoint Type : gen_generic [W][D:gen_generic]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_gen_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_gen_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_GRE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_gre
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_gre(self, 
+                 local_lower_ip: str = None,   # The local lower-level IP to use.
+                 port: str = None,             # Name of the GRE to create, suggested to start with 'gre' [W]
+                 remote_lower_ip: str = None,  # The remote lower-level IP to use.
+                 report_timer: int = None,     # Report timer for this port, leave blank or use NA for defaults.
+                 resource: int = None,         # Resource number. [W]
+                 shelf: int = 1,               # Shelf number. [R][D:1]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_gre(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if local_lower_ip is not None:
+        data["local_lower_ip"] = local_lower_ip
+    if port is not None:
+        data["port"] = port
+    if remote_lower_ip is not None:
+        data["remote_lower_ip"] = remote_lower_ip
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_gre",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_group(self, 
+                   flags: str = None,       # Flags for this group, see above.
+                   flags_mask: str = None,  # Mask for flags that we care about, use 0xFFFFFFFF or leave blank
+                   # for all.
+                   name: str = None,        # The name of the test group. Must be unique across all groups. [R]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_L4_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_l4_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_l4_endp(self, 
+                     alias: str = None,              # Name of endpoint. [R]
+                     block_size: str = None,         # TFTP Block size, in bytes.
+                     dns_cache_timeout: str = None,  # In seconds, how long to cache DNS lookups. 0 means no
+                     # caching at all.
+                     http_auth_type: str = None,     # Bit-field for allowable http-authenticate methods.
+                     ip_addr: str = None,            # Local IP address, for binding to specific secondary IP.
+                     max_speed: str = None,          # In bits-per-second, can rate limit upload or download speed
+                     # of the URL contents. 0 means infinite.
+                     port: str = None,               # Port number. [W]
+                     proxy_auth_type: str = None,    # Bit-field for allowable proxy-authenticate methods.
+                     proxy_port: str = None,         # HTTP Proxy port if you are using a proxy.
+                     proxy_server: str = None,       # The name of our proxy server if using one.
+                     proxy_userpwd: str = None,      # The user-name and password for proxy authentication, format:
+                     # <tt>user:passwd</tt>.
+                     quiesce_after: str = None,      # Quiesce test after this many URLs have been processed.
+                     resource: int = None,           # Resource number. [W]
+                     shelf: int = 1,                 # Shelf name/id. [R][D:1]
+                     smtp_from: str = None,          # SMTP From address.
+                     ssl_cert_fname: str = None,     # Name of SSL Certs file.
+                     timeout: str = None,            # How long to wait for a connection, in milliseconds
+                     p_type: str = None,             # Endpoint Type : <tt>l4_generic</tt> [W]
+                     url: str = None,                # The URL, see syntax above. Can also be a local file.
+                     url_rate: str = None,           # How often should we process the URL(s), per 10
+                     # minutes.<ul><li>600: 1/s<li>1200: 2/s<li>1800: 3/s<li>2400:
+                     # 4/s</ul> [R][D:600]
+                     user_agent: str = None,         # User-Agent string. Leave blank for default. Also SMTP-TO:
+                     # &lt;a@b.com&gt;&lt;c@d.com&gt;...&lt;q@x.com&gt;
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_l4_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if block_size is not None:
+        data["block_size"] = block_size
+    if dns_cache_timeout is not None:
+        data["dns_cache_timeout"] = dns_cache_timeout
+    if http_auth_type is not None:
+        data["http_auth_type"] = http_auth_type
+    if ip_addr is not None:
+        data["ip_addr"] = ip_addr
+    if max_speed is not None:
+        data["max_speed"] = max_speed
+    if port is not None:
+        data["port"] = port
+    if proxy_auth_type is not None:
+        data["proxy_auth_type"] = proxy_auth_type
+    if proxy_port is not None:
+        data["proxy_port"] = proxy_port
+    if proxy_server is not None:
+        data["proxy_server"] = proxy_server
+    if proxy_userpwd is not None:
+        data["proxy_userpwd"] = proxy_userpwd
+    if quiesce_after is not None:
+        data["quiesce_after"] = quiesce_after
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if smtp_from is not None:
+        data["smtp_from"] = smtp_from
+    if ssl_cert_fname is not None:
+        data["ssl_cert_fname"] = ssl_cert_fname
+    if timeout is not None:
+        data["timeout"] = timeout
+    if p_type is not None:
+        data["type"] = p_type
+    if url is not None:
+        data["url"] = url
+    if url_rate is not None:
+        data["url_rate"] = url_rate
+    if user_agent is not None:
+        data["user_agent"] = user_agent
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_l4_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_MONITOR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_monitor
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_monitor(self, 
+                     aid: str = None,         # AID, may be used when sniffing on /AX radios.
+                     ap_name: str = None,     # Name for this Monitor interface, for example: moni0 [W]
+                     bssid: str = None,       # BSSID to use when sniffing on /AX radios, optional.
+                     flags: str = None,       # Flags for this monitor interface.
+                     flags_mask: str = None,  # Flags mask for this monitor interface.
+                     radio: str = None,       # Name of the physical radio interface, for example: wiphy0 [W]
+                     resource: int = None,    # Resource number. [W]
+                     shelf: int = 1,          # Shelf number. [R][D:1]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_monitor(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aid is not None:
+        data["aid"] = aid
+    if ap_name is not None:
+        data["ap_name"] = ap_name
+    if bssid is not None:
+        data["bssid"] = bssid
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if radio is not None:
+        data["radio"] = radio
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_monitor",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_MVLAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_mvlan
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_mvlan(self, 
+                   flags: str = None,         # 0x1: Create admin-down.
+                   index: str = None,         # Optional: The index of the VLAN, (the <b>4</b> in
+                   # <tt>eth0#4</tt>)
+                   mac: str = None,           # The MAC address, can also use parent-pattern in 5.3.8 and higher:
+                   # <tt>xx:xx:xx:*:*:xx</tt> [W]
+                   old_name: str = None,      # The temporary name, used for configuring un-discovered hardware.
+                   port: str = None,          # Port number of an existing Ethernet interface. [W]
+                   report_timer: int = None,  # Report timer for this port, leave blank or use NA for defaults.
+                   resource: int = None,      # Resource number. [W]
+                   shelf: int = 1,            # Shelf number. [R][D:1]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_mvlan(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if flags is not None:
+        data["flags"] = flags
+    if index is not None:
+        data["index"] = index
+    if mac is not None:
+        data["mac"] = mac
+    if old_name is not None:
+        data["old_name"] = old_name
+    if port is not None:
+        data["port"] = port
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_mvlan",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_PPP_LINK> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_ppp_link
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_ppp_link(self, 
+                      auth: str = None,                  # YES if you want to authenticate. Default is NO.
+                      channel_groups: str = None,        # List of channel groups, see above.
+                      p_debug: bool = False,             # YES for debug, otherwise debugging for the ppp connection
+                      # is off.
+                      down_time_max_ms: str = None,      # Maximum length of downtime (ms) for PPP link between runs,
+                      # or 0 for the link to be always up.
+                      down_time_min_ms: str = None,      # Minimum length of downtime (ms) for PPP link between runs,
+                      # or 0 for the link to be always up.
+                      dst_ip: str = None,                # Destination IP address for this PPP connection.
+                      extra_args: str = None,            # Extra arguments to be passed directly to the pppd server.
+                      holdoff: str = None,               # Seconds between attempt to bring link back up if it dies,
+                      # suggest 1.
+                      lcp_echo_failure: str = None,      # LCP echo failures before we determine links is dead,
+                      # suggest 5.
+                      lcp_echo_interval: str = None,     # Seconds between LCP echos, suggest 1.
+                      mlppp_descriptor: str = None,      # A unique key for use with multi-link PPP connections.
+                      persist: str = None,               # YES if you want to persist the connection. This is
+                      # suggested.
+                      pppoe_transport_port: str = None,  # Port number (or name) for underlying PPPoE transport.
+                      resource: int = None,              # Resource (machine) number. [W]
+                      run_time_max_ms: str = None,       # Maximum uptime (ms) for PPP link during an experiment, or
+                      # 0 for the link to be always up.
+                      run_time_min_ms: str = None,       # Minimum uptime (ms) for PPP link during an experiment, or
+                      # 0 for the link to be always up.
+                      shelf: int = 1,                    # Shelf name/id. [R]
+                      src_ip: str = None,                # Source IP address for this PPP connection.
+                      transport_type: str = None,        # What sort of transport this ppp link uses.
+                      tty_transport_device: str = None,  # TTY device for PPP links associated with TTYs.
+                      unit: str = None,                  # Unit number for the PPP link. ie, the 7 in ppp7. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_ppp_link(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if auth is not None:
+        data["auth"] = auth
+    if channel_groups is not None:
+        data["channel_groups"] = channel_groups
+    if p_debug is not None:
+        data["debug"] = p_debug
+    if down_time_max_ms is not None:
+        data["down_time_max_ms"] = down_time_max_ms
+    if down_time_min_ms is not None:
+        data["down_time_min_ms"] = down_time_min_ms
+    if dst_ip is not None:
+        data["dst_ip"] = dst_ip
+    if extra_args is not None:
+        data["extra_args"] = extra_args
+    if holdoff is not None:
+        data["holdoff"] = holdoff
+    if lcp_echo_failure is not None:
+        data["lcp_echo_failure"] = lcp_echo_failure
+    if lcp_echo_interval is not None:
+        data["lcp_echo_interval"] = lcp_echo_interval
+    if mlppp_descriptor is not None:
+        data["mlppp_descriptor"] = mlppp_descriptor
+    if persist is not None:
+        data["persist"] = persist
+    if pppoe_transport_port is not None:
+        data["pppoe_transport_port"] = pppoe_transport_port
+    if resource is not None:
+        data["resource"] = resource
+    if run_time_max_ms is not None:
+        data["run_time_max_ms"] = run_time_max_ms
+    if run_time_min_ms is not None:
+        data["run_time_min_ms"] = run_time_min_ms
+    if shelf is not None:
+        data["shelf"] = shelf
+    if src_ip is not None:
+        data["src_ip"] = src_ip
+    if transport_type is not None:
+        data["transport_type"] = transport_type
+    if tty_transport_device is not None:
+        data["tty_transport_device"] = tty_transport_device
+    if unit is not None:
+        data["unit"] = unit
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_ppp_link",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_profile(self, 
+                     alias_prefix: str = None,    # Port alias prefix, aka hostname prefix.
+                     antenna: str = None,         # Antenna count for this profile.
+                     bandwidth: str = None,       # 0 (auto), 20, 40, 80 or 160
+                     eap_id: str = None,          # EAP Identifier
+                     flags_mask: str = None,      # Specify what flags to set.
+                     freq: str = None,            # WiFi frequency to be used, 0 means default.
+                     instance_count: str = None,  # Number of devices (stations, vdevs, etc)
+                     mac_pattern: str = None,     # Optional MAC-Address pattern, for instance: xx:xx:xx:*:*:xx
+                     name: str = None,            # Profile Name. [R]
+                     passwd: str = None,          # WiFi Password to be used (AP Mode), [BLANK] means no password.
+                     profile_flags: str = None,   # Flags for this profile, see above.
+                     profile_type: str = None,    # Profile type: See above. [W]
+                     ssid: str = None,            # WiFi SSID to be used, [BLANK] means any.
+                     vid: str = None,             # Vlan-ID (only valid for vlan profiles).
+                     wifi_mode: str = None,       # WiFi Mode for this profile.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias_prefix is not None:
+        data["alias_prefix"] = alias_prefix
+    if antenna is not None:
+        data["antenna"] = antenna
+    if bandwidth is not None:
+        data["bandwidth"] = bandwidth
+    if eap_id is not None:
+        data["eap_id"] = eap_id
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if freq is not None:
+        data["freq"] = freq
+    if instance_count is not None:
+        data["instance_count"] = instance_count
+    if mac_pattern is not None:
+        data["mac_pattern"] = mac_pattern
+    if name is not None:
+        data["name"] = name
+    if passwd is not None:
+        data["passwd"] = passwd
+    if profile_flags is not None:
+        data["profile_flags"] = profile_flags
+    if profile_type is not None:
+        data["profile_type"] = profile_type
+    if ssid is not None:
+        data["ssid"] = ssid
+    if vid is not None:
+        data["vid"] = vid
+    if wifi_mode is not None:
+        data["wifi_mode"] = wifi_mode
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_PROFILE_NOTES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_profile_notes
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_profile_notes(self, 
+                           dut: str = None,   # Profile Name. [R]
+                           text: str = None,  # [BLANK] will erase all, any other text will be appended to
+                           # existing text. <tt escapearg='false'>Unescaped Value</tt>
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_profile_notes(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if dut is not None:
+        data["dut"] = dut
+    if text is not None:
+        data["text"] = text
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_profile_notes",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_RDD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_rdd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_rdd(self, 
+                 peer_ifname: str = None,   # The peer (other) RedirectDevice in this pair.
+                 port: str = None,          # Name of the Redirect Device to create. [W]
+                 report_timer: int = None,  # Report timer for this port, leave blank or use NA for defaults.
+                 resource: int = None,      # Resource number. [W]
+                 shelf: int = 1,            # Shelf number. [R][D:1]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_rdd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if peer_ifname is not None:
+        data["peer_ifname"] = peer_ifname
+    if port is not None:
+        data["port"] = port
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_rdd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_SEC_IP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_sec_ip
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_sec_ip(self, 
+                    ip_list: str = None,   # IP1/prefix,IP2/prefix,...IPZ/prefix. [W]
+                    port: str = None,      # Name of network device (Port) to which these IPs will be added.
+                    # [W]
+                    resource: int = None,  # Resource number. [W]
+                    shelf: int = 1,        # Shelf number. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_sec_ip(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ip_list is not None:
+        data["ip_list"] = ip_list
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_sec_ip",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_STA> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_sta
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_sta(self, 
+                 ampdu_density: str = None,  # 0-7, or 0xFF to not set.
+                 ampdu_factor: str = None,   # 0-3, or 0xFF to not set.
+                 ap: str = None,             # The Access Point BSSID this Virtual STA should be associated with
+                 flags: str = None,          # Flags for this interface (see above.) [W]
+                 flags_mask: str = None,     # If set, only these flags will be considered.
+                 ieee80211w: str = None,     # Management Frame Protection: 0: disabled, 1: optional, 2:
+                 # Required.
+                 key: str = None,            # Encryption key (WEP, WPA, WPA2, WPA3, etc) for this Virtual STA.
+                 # Prepend with 0x for ascii-hex input.
+                 mac: str = None,            # The MAC address, can also use parent-pattern in 5.3.8 and higher:
+                 # <tt>xx:xx:xx:*:*:xx</tt> [W]
+                 max_amsdu: str = None,      # 1 == enabled, 0 == disabled, 0xFF == do not set.
+                 mode: str = None,           # WiFi mode: <ul><li>0: AUTO, <li>1: 802.11a</li> <li>2: b</li>
+                 # <li>3: g</li> <li>4: abg</li> <li>5: abgn</li> <li>6: bgn</li>
+                 # <li>7: bg</li> <li>8: abgnAC</li> <li>9 anAC</li> <li>10
+                 # an</li><li>11 bgnAC</li><li>12 abgnAX</li><li>13 bgnAX</li><li>14
+                 # anAX</li><li>15 aAX</li></ul> [D:0]
+                 nickname: str = None,       # Nickname for this Virtual STA. (No longer used)
+                 radio: str = None,          # Name of the physical radio interface, for example: wiphy0 [W]
+                 rate: str = None,           # Max rate, see help above.
+                 resource: int = None,       # Resource number. [W]
+                 shelf: int = 1,             # Shelf number. [R][D:1]
+                 ssid: str = None,           # SSID for this Virtual STA. Use [BLANK] for empty SSID. Start with
+                 # <tt>0x</tt> for HEX interpretation. [W]
+                 sta_br_ip: str = None,      # IP Address for station bridging. Set to 0.0.0.0 to use MAC
+                 # bridging.
+                 sta_name: str = None,       # Name for this Virtual STA, for example: sta0 [W]
+                 wpa_cfg_file: str = None,   # WPA Supplicant config file.
+                 x_coord: str = None,        # Floating point number.
+                 y_coord: str = None,        # Floating point number.
+                 z_coord: str = None,        # Floating point number.
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_sta(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ampdu_density is not None:
+        data["ampdu_density"] = ampdu_density
+    if ampdu_factor is not None:
+        data["ampdu_factor"] = ampdu_factor
+    if ap is not None:
+        data["ap"] = ap
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if ieee80211w is not None:
+        data["ieee80211w"] = ieee80211w
+    if key is not None:
+        data["key"] = key
+    if mac is not None:
+        data["mac"] = mac
+    if max_amsdu is not None:
+        data["max_amsdu"] = max_amsdu
+    if mode is not None:
+        data["mode"] = mode
+    if nickname is not None:
+        data["nickname"] = nickname
+    if radio is not None:
+        data["radio"] = radio
+    if rate is not None:
+        data["rate"] = rate
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if ssid is not None:
+        data["ssid"] = ssid
+    if sta_br_ip is not None:
+        data["sta_br_ip"] = sta_br_ip
+    if sta_name is not None:
+        data["sta_name"] = sta_name
+    if wpa_cfg_file is not None:
+        data["wpa_cfg_file"] = wpa_cfg_file
+    if x_coord is not None:
+        data["x_coord"] = x_coord
+    if y_coord is not None:
+        data["y_coord"] = y_coord
+    if z_coord is not None:
+        data["z_coord"] = z_coord
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_sta",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_T1_SPAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_t1_span
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_t1_span(self, 
+                     buildout: str = None,       # Buildout, Integer, see above.
+                     coding: str = None,         # Coding: T1: ami or b8zs. E1: ami or hdb3
+                     cpu_id: str = None,         # CPU identifier (A, B, etc) for multiport Sangoma resources.
+                     first_channel: str = None,  # The first DS0 channel for this span.
+                     framing: str = None,        # Framing: T1: esf or d4. E1: cas or ccs.
+                     mtu: str = None,            # MTU for this span (used by in-band management, if at all).
+                     pci_bus: str = None,        # PCI Bus number, needed for Sangoma resources.
+                     pci_slot: str = None,       # PCI slot number, needed for Sangoma resources.
+                     resource: int = None,       # Resource number. [W]
+                     shelf: int = 1,             # Shelf name/id. [R][D:1]
+                     span_num: str = None,       # The span number. First span is 1, second is 2... [W]
+                     timing: str = None,         # Timing: 0 == do not use, 1 == primary, 2 == secondary..
+                     p_type: str = None,         # Currently supported types listed above. [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_t1_span(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if buildout is not None:
+        data["buildout"] = buildout
+    if coding is not None:
+        data["coding"] = coding
+    if cpu_id is not None:
+        data["cpu_id"] = cpu_id
+    if first_channel is not None:
+        data["first_channel"] = first_channel
+    if framing is not None:
+        data["framing"] = framing
+    if mtu is not None:
+        data["mtu"] = mtu
+    if pci_bus is not None:
+        data["pci_bus"] = pci_bus
+    if pci_slot is not None:
+        data["pci_slot"] = pci_slot
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span_num is not None:
+        data["span_num"] = span_num
+    if timing is not None:
+        data["timing"] = timing
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_t1_span",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_TEXT_BLOB> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_text_blob
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_text_blob(self, 
+                       name: str = None,  # Text name, for instance '2-AP-test-case' [R]
+                       text: str = None,  # [BLANK] will erase all, any other text will be appended to
+                       # existing text. <tt escapearg='false'>Unescaped Value</tt>
+                       p_type: str = None,  # Text type identifier stream, for instance 'cv-connectivity' [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_text_blob(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if text is not None:
+        data["text"] = text
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_text_blob",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_TGCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_tgcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_tgcx(self, 
+                  cxname: str = None,  # The name of the CX. [R]
+                  tgname: str = None,  # The name of the test group. [R]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_tgcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cxname is not None:
+        data["cxname"] = cxname
+    if tgname is not None:
+        data["tgname"] = tgname
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_tgcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_THRESHOLD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_threshold
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_threshold(self, 
+                       endp: str = None,         # Endpoint name or ID. [R]
+                       thresh_id: str = None,    # Threshold ID. If adding new threshold, use -1, otherwise use
+                       # correct ID. [W]
+                       thresh_max: str = None,   # Maximum acceptable value for this threshold.
+                       thresh_min: str = None,   # Minimum acceptable value for this threshold.
+                       thresh_type: str = None,  # Threshold type, integer, (see above).
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_threshold(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp is not None:
+        data["endp"] = endp
+    if thresh_id is not None:
+        data["thresh_id"] = thresh_id
+    if thresh_max is not None:
+        data["thresh_max"] = thresh_max
+    if thresh_min is not None:
+        data["thresh_min"] = thresh_min
+    if thresh_type is not None:
+        data["thresh_type"] = thresh_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_threshold",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_TM> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_tm
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_tm(self, 
+                name: str = None,  # The name of the test manager. Must be unique across test managers. [R]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_tm(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_tm",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_TRAFFIC_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_traffic_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_traffic_profile(self, 
+                             instance_count: str = None,              # Number of connections per device
+                             max_pdu: str = None,                     # Minimum PDU size
+                             max_speed: str = None,                   # Opposite-Direction Speed in bps.
+                             min_pdu: str = None,                     # Minimum PDU size
+                             min_speed: str = None,                   # Opposite-Direction Speed in bps.
+                             name: str = None,                        # Profile Name. [R]
+                             tos: str = None,                         # IP Type-of-Service
+                             traffic_profile_flags: str = None,       # Flags for this profile, none defined at this
+                             # point.
+                             traffic_profile_flags_mask: str = None,  # Specify what flags to set.
+                             p_type: str = None,                      # Profile type: See above. [W]
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_traffic_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if instance_count is not None:
+        data["instance_count"] = instance_count
+    if max_pdu is not None:
+        data["max_pdu"] = max_pdu
+    if max_speed is not None:
+        data["max_speed"] = max_speed
+    if min_pdu is not None:
+        data["min_pdu"] = min_pdu
+    if min_speed is not None:
+        data["min_speed"] = min_speed
+    if name is not None:
+        data["name"] = name
+    if tos is not None:
+        data["tos"] = tos
+    if traffic_profile_flags is not None:
+        data["traffic_profile_flags"] = traffic_profile_flags
+    if traffic_profile_flags_mask is not None:
+        data["traffic_profile_flags_mask"] = traffic_profile_flags_mask
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_traffic_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_TRAFFIC_PROFILE_NOTES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_traffic_profile_notes
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_traffic_profile_notes(self, 
+                                   dut: str = None,   # Profile Name. [R]
+                                   text: str = None,  # [BLANK] will erase all, any other text will be
+                                   # appended to existing text. <tt
+                                   # escapearg='false'>Unescaped Value</tt>
+                                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_traffic_profile_notes(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if dut is not None:
+        data["dut"] = dut
+    if text is not None:
+        data["text"] = text
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_traffic_profile_notes",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VAP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vap
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vap(self, 
+                 ap_name: str = None,      # Name for this Virtual AP, for example: vap0 [W]
+                 beacon: str = None,       # The beacon interval, in 1kus (1.024 ms), default 100, range:
+                 # 15..65535
+                 custom_cfg: str = None,   # Custom hostapd config file, if you want to craft your own config.
+                 dtim_period: str = None,  # DTIM period, range 1..255. Default 2.
+                 flags: str = None,        # Flags for this interface (see above.) [W]
+                 flags_mask: str = None,   # If set, only these flags will be considered.
+                 frag_thresh: str = None,  # UN-USED, Was Fragmentation threshold, which is now set with
+                 # set_wifi_radio, use NA [W]
+                 ieee80211w: str = None,   # Management Frame Protection: 0: disabled, 1: optional, 2: Required.
+                 key: str = None,          # Encryption key for this Virtual AP. Prepend with 0x for ascii-hex
+                 # representation.
+                 mac: str = None,          # The MAC address, can also use parent-pattern in 5.3.8 and higher:
+                 # <tt>xx:xx:xx:*:*:xx</tt>
+                 max_sta: str = None,      # Maximum number of Stations allowed to join this AP (1..2007)
+                 mode: str = None,         # WiFi mode: see table [W]
+                 radio: str = None,        # Name of the physical radio interface, for example: wiphy0 [W]
+                 rate: str = None,         # Max rate, see help for add_vsta
+                 resource: int = None,     # Resource number. [W]
+                 shelf: int = 1,           # Shelf number. [R][D:1]
+                 ssid: str = None,         # SSID for this Virtual AP. [W]
+                 x_coord: str = None,      # Floating point number.
+                 y_coord: str = None,      # Floating point number.
+                 z_coord: str = None,      # Floating point number.
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vap(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ap_name is not None:
+        data["ap_name"] = ap_name
+    if beacon is not None:
+        data["beacon"] = beacon
+    if custom_cfg is not None:
+        data["custom_cfg"] = custom_cfg
+    if dtim_period is not None:
+        data["dtim_period"] = dtim_period
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if frag_thresh is not None:
+        data["frag_thresh"] = frag_thresh
+    if ieee80211w is not None:
+        data["ieee80211w"] = ieee80211w
+    if key is not None:
+        data["key"] = key
+    if mac is not None:
+        data["mac"] = mac
+    if max_sta is not None:
+        data["max_sta"] = max_sta
+    if mode is not None:
+        data["mode"] = mode
+    if radio is not None:
+        data["radio"] = radio
+    if rate is not None:
+        data["rate"] = rate
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if ssid is not None:
+        data["ssid"] = ssid
+    if x_coord is not None:
+        data["x_coord"] = x_coord
+    if y_coord is not None:
+        data["y_coord"] = y_coord
+    if z_coord is not None:
+        data["z_coord"] = z_coord
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vap",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VENUE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_venue
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_venue(self, 
+                   description: str = None,  # User-supplied description, ie: <tt>Big City Ball Park</tt>;
+                   # 47-characters max.
+                   freq_24: str = None,      # Frequency list for 2.4Ghz band, see above.
+                   freq_5: str = None,       # Frequency list for 5Ghz band, see above.
+                   resource: int = None,     # Resource number. [W]
+                   shelf: int = 1,           # Shelf number. [R][D:1]
+                   venu_id: str = None,      # Number to uniquely identify this venue on this resource. [W]
+                   x1: str = None,           # Floating point coordinate for lower-left corner.
+                   x2: str = None,           # Floating point coordinate for upper-right corner.
+                   y1: str = None,           # Floating point coordinate for lower-left corner.
+                   y2: str = None,           # Floating point coordinate for upper-right corner.
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_venue(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if description is not None:
+        data["description"] = description
+    if freq_24 is not None:
+        data["freq_24"] = freq_24
+    if freq_5 is not None:
+        data["freq_5"] = freq_5
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if venu_id is not None:
+        data["venu_id"] = venu_id
+    if x1 is not None:
+        data["x1"] = x1
+    if x2 is not None:
+        data["x2"] = x2
+    if y1 is not None:
+        data["y1"] = y1
+    if y2 is not None:
+        data["y2"] = y2
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_venue",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VLAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vlan
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vlan(self, 
+                  old_name: str = None,      # The temporary name, used for configuring un-discovered hardware.
+                  port: str = None,          # Port number of an existing Ethernet interface. [W]
+                  report_timer: int = None,  # Report timer for this port, leave blank or use NA for defaults.
+                  resource: int = None,      # Resource number. [W]
+                  shelf: int = 1,            # Shelf number. [R][D:1]
+                  vid: str = None,           # The VLAN-ID for this 802.1Q VLAN interface. [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vlan(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if old_name is not None:
+        data["old_name"] = old_name
+    if port is not None:
+        data["port"] = port
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vid is not None:
+        data["vid"] = vid
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vlan",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VOIP_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_voip_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_voip_endp(self, 
+                       alias: str = None,           # Name of endpoint. [R]
+                       auth_user_name: str = None,  # Use this field for authentication user name. AUTO or blank
+                       # mean use phone number.
+                       display_name: str = None,    # User-Name to be displayed. Use AUTO to display phone number.
+                       gateway_port: str = None,    # IP Port for SIP gateway (defaults to 5060).
+                       ip_addr: str = None,         # Use this IP for local IP address. Useful when there are
+                       # multiple IPs on a port.
+                       peer_phone_num: str = None,  # Use AUTO to use phone number of peer endpoint, otherwise
+                       # specify a number: user[@host[:port]]
+                       phone_num: str = None,       # Phone number for Endpoint [W]
+                       port: str = None,            # Port number or name. [W]
+                       proxy_passwd: str = None,    # Password to be used when registering with proxy/gateway.
+                       resource: int = None,        # Resource number. [W]
+                       rtp_port: str = None,        # RTP port to use for send and receive.
+                       rx_sound_file: str = None,   # File name to save received PCM data to. Will be in WAV
+                       # format, or AUTO
+                       shelf: int = 1,              # Shelf name/id. [R][D:1]
+                       sip_gateway: str = None,     # SIP Gateway/Proxy Name, this is who to register with, or
+                       # AUTO
+                       tx_sound_file: str = None,   # File name containing the sound sample we will be playing.
+                       vad_max_timer: str = None,   # How often should we force a packet, even if VAD is on.
+                       vad_timer: str = None,       # How much silence (milliseconds) before VAD is enabled.
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_voip_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if auth_user_name is not None:
+        data["auth_user_name"] = auth_user_name
+    if display_name is not None:
+        data["display_name"] = display_name
+    if gateway_port is not None:
+        data["gateway_port"] = gateway_port
+    if ip_addr is not None:
+        data["ip_addr"] = ip_addr
+    if peer_phone_num is not None:
+        data["peer_phone_num"] = peer_phone_num
+    if phone_num is not None:
+        data["phone_num"] = phone_num
+    if port is not None:
+        data["port"] = port
+    if proxy_passwd is not None:
+        data["proxy_passwd"] = proxy_passwd
+    if resource is not None:
+        data["resource"] = resource
+    if rtp_port is not None:
+        data["rtp_port"] = rtp_port
+    if rx_sound_file is not None:
+        data["rx_sound_file"] = rx_sound_file
+    if shelf is not None:
+        data["shelf"] = shelf
+    if sip_gateway is not None:
+        data["sip_gateway"] = sip_gateway
+    if tx_sound_file is not None:
+        data["tx_sound_file"] = tx_sound_file
+    if vad_max_timer is not None:
+        data["vad_max_timer"] = vad_max_timer
+    if vad_timer is not None:
+        data["vad_timer"] = vad_timer
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_voip_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vr(self, 
+                alias: str = None,     # Name of virtual router. [R]
+                flags: str = None,     # Virtual router flags, see above for definitions.
+                height: str = None,    # Height to be used when drawn in the LANforge-GUI.
+                notes: str = None,     # Notes for this Virtual Router. Put in quotes if the notes include
+                # white-space.
+                resource: int = None,  # Resource number. [W]
+                shelf: int = 1,        # Shelf name/id. [R][D:1]
+                vr_id: str = None,     # Leave blank, use NA or 0xFFFF unless you are certain of the value you
+                # want to enter.
+                width: str = None,     # Width to be used when drawn in the LANforge-GUI.
+                x: str = None,         # X coordinate to be used when drawn in the LANforge-GUI.
+                y: str = None,         # Y coordinate to be used when drawn in the LANforge-GUI.
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if flags is not None:
+        data["flags"] = flags
+    if height is not None:
+        data["height"] = height
+    if notes is not None:
+        data["notes"] = notes
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vr_id is not None:
+        data["vr_id"] = vr_id
+    if width is not None:
+        data["width"] = width
+    if x is not None:
+        data["x"] = x
+    if y is not None:
+        data["y"] = y
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VR_BGP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vr_bgp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vr_bgp(self, 
+                    bgp_id: str = None,        # BGP Identifier: IPv4 Address [W]
+                    cluster_id: str = None,    # Cluster ID, IPv4 Address. Use NA if not clustering.
+                    confed_id: str = None,     # Confederation ID 1-65535. Use NA if not in a confederation.
+                    flags: str = None,         # Virtual router BGP flags, see above for definitions.
+                    half_life: str = None,     # Halflife in minutes for damping configuration.
+                    local_as: str = None,      # BGP Autonomous System number, 1-65535
+                    max_suppress: str = None,  # Maximum hold down time in minutes for damping configuration.
+                    resource: int = None,      # Resource number. [W]
+                    reuse: str = None,         # Route flag damping reuse threshold, in minutes.
+                    shelf: int = 1,            # Shelf name/id. [R][D:1]
+                    suppress: str = None,      # Route flag damping cutoff threshold, in minutes.
+                    vr_id: str = None,         # Name of virtual router. [R]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vr_bgp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if bgp_id is not None:
+        data["bgp_id"] = bgp_id
+    if cluster_id is not None:
+        data["cluster_id"] = cluster_id
+    if confed_id is not None:
+        data["confed_id"] = confed_id
+    if flags is not None:
+        data["flags"] = flags
+    if half_life is not None:
+        data["half_life"] = half_life
+    if local_as is not None:
+        data["local_as"] = local_as
+    if max_suppress is not None:
+        data["max_suppress"] = max_suppress
+    if resource is not None:
+        data["resource"] = resource
+    if reuse is not None:
+        data["reuse"] = reuse
+    if shelf is not None:
+        data["shelf"] = shelf
+    if suppress is not None:
+        data["suppress"] = suppress
+    if vr_id is not None:
+        data["vr_id"] = vr_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vr_bgp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VRCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vrcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vrcx(self, 
+                  dhcp_dns: str = None,         # IP Address of DNS server.
+                  dhcp_dns6: str = None,        # IPv6 Address of DNS server.
+                  dhcp_domain: str = None,      # DHCP Domain name to serve.
+                  dhcp_lease_time: str = None,  # DHCP Lease time (in seconds)
+                  dhcp_max: str = None,         # Minimum IP address range to serve.
+                  dhcp_max6: str = None,        # Minimum IPv6 address to serve.
+                  dhcp_min: str = None,         # Minimum IP address range to serve.
+                  dhcp_min6: str = None,        # Minimum IPv6 address to serve.
+                  flags: str = None,            # Flags, specify if subnets 0-7 are in use, see above for others.
+                  height: str = None,           # Height to be used when drawn in the LANforge-GUI.
+                  interface_cost: str = None,   # If using OSPF, this sets the cost for this link (1-65535).
+                  local_dev: str = None,        # Name of port A, the local network device pair. [W]
+                  local_dev_b: str = None,      # Name of port B for the local redirect device pair. [W]
+                  nexthop: str = None,          # The next-hop to use when routing packets out this interface.
+                  ospf_area: str = None,        # If using OSPF, this sets the OSPF area for this interface.
+                  # Default is 0.0.0.0.
+                  remote_dev: str = None,       # Name the remote network device. [W]
+                  remote_dev_b: str = None,     # Name of port B for the remote network device. [W]
+                  resource: int = None,         # Resource number. [W]
+                  rip_metric: str = None,       # If using RIP, this determines the RIP metric (cost), (1-15, 15
+                  # is infinite).
+                  shelf: int = 1,               # Shelf name/id. [R][D:1]
+                  subnets: str = None,          # Subnets associated with this link, format:
+                  # 1.1.1.1/24,1.1.2.1/16...
+                  vr_name: str = None,          # Virtual Router this endpoint belongs to. Use 'FREE_LIST' to add
+                  # a stand-alone endpoint. [R][D:FREE_LIST]
+                  vrrp_id: str = None,          # VRRP id, must be unique in this virtual router (1-255)
+                  vrrp_interval: str = None,    # VRRP broadcast message interval, in seconds (1-255)
+                  vrrp_ip: str = None,          # VRRP IPv4 address..ignored if not flagged for VRRP.
+                  vrrp_ip_prefix: str = None,   # Number of bits in subnet mask, ie 24 for 255.255.255.0
+                  vrrp_priority: str = None,    # VRRP Priority (1-255, higher is more priority.)
+                  wanlink: str = None,          # The name of the WanLink that connects the two B ports. [W]
+                  width: str = None,            # Width to be used when drawn in the LANforge-GUI.
+                  x: str = None,                # X coordinate to be used when drawn in the LANforge-GUI.
+                  y: str = None,                # Y coordinate to be used when drawn in the LANforge-GUI.
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vrcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if dhcp_dns is not None:
+        data["dhcp_dns"] = dhcp_dns
+    if dhcp_dns6 is not None:
+        data["dhcp_dns6"] = dhcp_dns6
+    if dhcp_domain is not None:
+        data["dhcp_domain"] = dhcp_domain
+    if dhcp_lease_time is not None:
+        data["dhcp_lease_time"] = dhcp_lease_time
+    if dhcp_max is not None:
+        data["dhcp_max"] = dhcp_max
+    if dhcp_max6 is not None:
+        data["dhcp_max6"] = dhcp_max6
+    if dhcp_min is not None:
+        data["dhcp_min"] = dhcp_min
+    if dhcp_min6 is not None:
+        data["dhcp_min6"] = dhcp_min6
+    if flags is not None:
+        data["flags"] = flags
+    if height is not None:
+        data["height"] = height
+    if interface_cost is not None:
+        data["interface_cost"] = interface_cost
+    if local_dev is not None:
+        data["local_dev"] = local_dev
+    if local_dev_b is not None:
+        data["local_dev_b"] = local_dev_b
+    if nexthop is not None:
+        data["nexthop"] = nexthop
+    if ospf_area is not None:
+        data["ospf_area"] = ospf_area
+    if remote_dev is not None:
+        data["remote_dev"] = remote_dev
+    if remote_dev_b is not None:
+        data["remote_dev_b"] = remote_dev_b
+    if resource is not None:
+        data["resource"] = resource
+    if rip_metric is not None:
+        data["rip_metric"] = rip_metric
+    if shelf is not None:
+        data["shelf"] = shelf
+    if subnets is not None:
+        data["subnets"] = subnets
+    if vr_name is not None:
+        data["vr_name"] = vr_name
+    if vrrp_id is not None:
+        data["vrrp_id"] = vrrp_id
+    if vrrp_interval is not None:
+        data["vrrp_interval"] = vrrp_interval
+    if vrrp_ip is not None:
+        data["vrrp_ip"] = vrrp_ip
+    if vrrp_ip_prefix is not None:
+        data["vrrp_ip_prefix"] = vrrp_ip_prefix
+    if vrrp_priority is not None:
+        data["vrrp_priority"] = vrrp_priority
+    if wanlink is not None:
+        data["wanlink"] = wanlink
+    if width is not None:
+        data["width"] = width
+    if x is not None:
+        data["x"] = x
+    if y is not None:
+        data["y"] = y
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vrcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_VRCX2> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_vrcx2
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_vrcx2(self, 
+                   local_dev: str = None,  # Name of port A for the connection. [W]
+                   nexthop6: str = None,   # The IPv6 next-hop to use when routing packets out this interface.
+                   resource: int = None,   # Resource number. [W]
+                   shelf: int = 1,         # Shelf name/id. [R][D:1]
+                   subnets6: str = None,   # IPv6 Subnets associated with this link, format:
+                   # aaaa:bbbb::0/64,cccc:dddd:eeee::0/64...
+                   vr_name: str = None,    # Virtual Router this endpoint belongs to. Use 'FREE_LIST' to add a
+                   # stand-alone endpoint. [W][D:FREE_LIST]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_vrcx2(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if local_dev is not None:
+        data["local_dev"] = local_dev
+    if nexthop6 is not None:
+        data["nexthop6"] = nexthop6
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if subnets6 is not None:
+        data["subnets6"] = subnets6
+    if vr_name is not None:
+        data["vr_name"] = vr_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_vrcx2",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADD_WL_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#add_wl_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_add_wl_endp(self, 
+                     alias: str = None,                  # Name of WanPath. [R]
+                     cpu_id: str = None,                 # The CPU/thread that this process should run on
+                     # (kernel-mode only).
+                     description: str = None,            # Description for this endpoint, put in single quotes if it
+                     # contains spaces.
+                     dest_ip: str = None,                # Selection filter: Destination IP.
+                     dest_ip_mask: str = None,           # Selection filter: Destination IP MASK.
+                     drop_every_xth_pkt: str = None,     # YES to periodically drop every Xth pkt, NO to drop packets
+                     # randomly.
+                     drop_freq: str = None,              # How often, out of 1,000,000 packets, should we
+                     # purposefully drop a packet. [W]
+                     dup_every_xth_pkt: str = None,      # YES to periodically duplicate every Xth pkt, NO to
+                     # duplicate packets randomly.
+                     dup_freq: str = None,               # How often, out of 1,000,000 packets, should we
+                     # purposefully duplicate a packet. [W]
+                     extra_buffer: str = None,           # The extra amount of bytes to buffer before dropping pkts,
+                     # in units of 1024, use -1 for AUTO. [D:-1]
+                     ignore_bandwidth: str = None,       # Should we ignore the bandwidth settings from the playback
+                     # file? YES, NO, or NA.
+                     ignore_dup: str = None,             # Should we ignore the Duplicate Packet settings from the
+                     # playback file? YES, NO, or NA.
+                     ignore_latency: str = None,         # Should we ignore the latency settings from the playback
+                     # file? YES, NO, or NA.
+                     ignore_loss: str = None,            # Should we ignore the packet-loss settings from the
+                     # playback file? YES, NO, or NA.
+                     jitter_freq: str = None,            # How often, out of 1,000,000 packets, should we apply
+                     # random jitter.
+                     latency: str = None,                # The base latency added to all packets, in milliseconds (or
+                     # add 'us' suffix for microseconds) [W]
+                     max_drop_amt: str = None,           # Maximum amount of packets to drop in a row. Default is 1.
+                     # [D:1]
+                     max_jitter: str = None,             # The maximum jitter, in milliseconds (or add 'us' suffix
+                     # for microseconds) [W]
+                     max_lateness: str = None,           # Maximum amount of un-intentional delay before pkt is
+                     # dropped. Default is AUTO
+                     max_rate: str = None,               # Maximum transmit rate (bps) for this WanLink.
+                     max_reorder_amt: str = None,        # Maximum amount of packets by which to reorder, Default is
+                     # 10. [D:10]
+                     min_drop_amt: str = None,           # Minimum amount of packets to drop in a row. Default is 1.
+                     # [D:1]
+                     min_reorder_amt: str = None,        # Minimum amount of packets by which to reorder, Default is
+                     # 1. [D:1]
+                     playback_capture: str = None,       # ON or OFF, should we play back a WAN capture file?
+                     playback_capture_file: str = None,  # Name of the WAN capture file to play back.
+                     playback_loop: str = None,          # Should we loop the playback file, YES or NO or NA.
+                     port: str = None,                   # Port number. [W]
+                     reorder_every_xth_pkt: str = None,  # YES to periodically reorder every Xth pkt, NO to reorder
+                     # packets randomly.
+                     reorder_freq: str = None,           # How often, out of 1,000,000 packets, should we make a
+                     # packet out of order. [W]
+                     resource: int = None,               # Resource number. [W]
+                     shelf: int = 1,                     # Shelf name/id. [R][D:1]
+                     source_ip: str = None,              # Selection filter: Source IP.
+                     source_ip_mask: str = None,         # Selection filter: Source IP MASK.
+                     speed: str = None,                  # The maximum speed this WanLink will accept (bps). [W]
+                     test_mgr: str = None,               # The name of the Test-Manager this WanPath is to use. Leave
+                     # blank for no restrictions.
+                     wanlink: str = None,                # Name of WanLink to which we are adding this WanPath. [R]
+                     wle_flags: str = None,              # WanLink Endpoint specific flags, see above.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_add_wl_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if cpu_id is not None:
+        data["cpu_id"] = cpu_id
+    if description is not None:
+        data["description"] = description
+    if dest_ip is not None:
+        data["dest_ip"] = dest_ip
+    if dest_ip_mask is not None:
+        data["dest_ip_mask"] = dest_ip_mask
+    if drop_every_xth_pkt is not None:
+        data["drop_every_xth_pkt"] = drop_every_xth_pkt
+    if drop_freq is not None:
+        data["drop_freq"] = drop_freq
+    if dup_every_xth_pkt is not None:
+        data["dup_every_xth_pkt"] = dup_every_xth_pkt
+    if dup_freq is not None:
+        data["dup_freq"] = dup_freq
+    if extra_buffer is not None:
+        data["extra_buffer"] = extra_buffer
+    if ignore_bandwidth is not None:
+        data["ignore_bandwidth"] = ignore_bandwidth
+    if ignore_dup is not None:
+        data["ignore_dup"] = ignore_dup
+    if ignore_latency is not None:
+        data["ignore_latency"] = ignore_latency
+    if ignore_loss is not None:
+        data["ignore_loss"] = ignore_loss
+    if jitter_freq is not None:
+        data["jitter_freq"] = jitter_freq
+    if latency is not None:
+        data["latency"] = latency
+    if max_drop_amt is not None:
+        data["max_drop_amt"] = max_drop_amt
+    if max_jitter is not None:
+        data["max_jitter"] = max_jitter
+    if max_lateness is not None:
+        data["max_lateness"] = max_lateness
+    if max_rate is not None:
+        data["max_rate"] = max_rate
+    if max_reorder_amt is not None:
+        data["max_reorder_amt"] = max_reorder_amt
+    if min_drop_amt is not None:
+        data["min_drop_amt"] = min_drop_amt
+    if min_reorder_amt is not None:
+        data["min_reorder_amt"] = min_reorder_amt
+    if playback_capture is not None:
+        data["playback_capture"] = playback_capture
+    if playback_capture_file is not None:
+        data["playback_capture_file"] = playback_capture_file
+    if playback_loop is not None:
+        data["playback_loop"] = playback_loop
+    if port is not None:
+        data["port"] = port
+    if reorder_every_xth_pkt is not None:
+        data["reorder_every_xth_pkt"] = reorder_every_xth_pkt
+    if reorder_freq is not None:
+        data["reorder_freq"] = reorder_freq
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if source_ip is not None:
+        data["source_ip"] = source_ip
+    if source_ip_mask is not None:
+        data["source_ip_mask"] = source_ip_mask
+    if speed is not None:
+        data["speed"] = speed
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if wanlink is not None:
+        data["wanlink"] = wanlink
+    if wle_flags is not None:
+        data["wle_flags"] = wle_flags
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/add_wl_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
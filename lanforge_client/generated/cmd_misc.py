@@ -0,0 +1,2571 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonCommand members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonCommand imports this module the first time one of
+    them is used: call them through LFJsonCommand, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+# flag and enum classes: name: (base, {member: value}); LFJsonCommand builds each class
+# the first time it is used
+ENUMS = {
+    # <CLI-JSON/C_SHOW_PORTS>
+    "CShowPortsProbeFlags": ("IntFlag", {
+        "BRIDGE": 0x8,             # 8 include bridges
+        "EASY_IP_INFO": 0x10,      # 16 Everything but gateway information, which is expensive to probe.
+        "ETHTOOL": 0x4,            # 4 include ethtool results
+        "GW": 0x20,                # 32 include gateway information
+        "GW_FORCE_REFRESH": 0x40,  # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
+        "MII": 0x2,                # 2 include MII
+        "WIFI": 0x1,               # 1 include wifi stations
+    }),
+    # <CLI-JSON/CLEAR_PORT_COUNTERS>
+    "ClearPortCountersExtra": ("Enum", {
+        "dhcp4_lease": "dhcp4_lease",  # Remove dhcp lease files for IPv4 DHCP
+        "dhcp6_lease": "dhcp6_lease",  # Remove dhcp lease files for IPv6 DHCP
+        "dhcp_leases": "dhcp_leases",  # Remove dhcp lease files for IPv4 and IPv6 DHCP
+    }),
+    # <CLI-JSON/DIAG>
+    "DiagType": ("Enum", {
+        "NA": "NA",                # everything (default)
+        "alerts": "alerts",        # alert messages
+        "clients": "clients",      # connected clients
+        "counters": "counters",    # endpoint counters
+        "endpoints": "endpoints",  # list of endpoints
+        "fds": "fds",              # file descriptors
+        "iobuffer": "iobuffer",    #
+        "license": "license",      # license contents
+        "shelf": "shelf",          #
+    }),
+    # <CLI-JSON/LOG_LEVEL>
+    "LogLevelLevel": ("IntFlag", {
+        "ALL": 0xffffffff,  # Log everything
+        "CUST1": 0x10000,   # Cust-1, latency info (65536)
+        "DB": 0x80,         # Database related logging (128)
+        "DBG": 0x20,        # debug (32)
+        "DBG2": 0x1000,     # very verbose logging (4096)
+        "DIS": 0x1,         # disasters (1)
+        "ERR": 0x2,         # errors (2)
+        "INF": 0x8,         # info (8)
+        "LIO": 0x2000,      # IO logging (8192)
+        "LL_PROF": 0x8000,  # Profiling information (32768)
+        "OUT1": 0x4000,     # Some std-out logging (16384)
+        "PARSE": 0x800,     # PARSE specific (2048)
+        "SCRIPT": 0x400,    # Scripting specific stuff (1024)
+        "SEC": 0x40,        # log security violations (64)
+        "TRC": 0x10,        # function trace (16)
+        "WRN": 0x4,         # warnings (4)
+        "XMT": 0x100,       # Output going to clients (256)
+    }),
+    # <CLI-JSON/NC_SHOW_PORTS>
+    "NcShowPortsProbeFlags": ("IntFlag", {
+        "BRIDGE": 0x8,             # 8 include bridges
+        "EASY_IP_INFO": 0x10,      # 16 Everything but gateway information, which is expensive to probe.
+        "ETHTOOL": 0x4,            # 4 include ethtool results
+        "GW": 0x20,                # 32 include gateway information
+        "GW_FORCE_REFRESH": 0x40,  # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
+        "MII": 0x2,                # 2 include MII
+        "WIFI": 0x1,               # 1 include wifi stations
+    }),
+    # <CLI-JSON/RESET_PORT>
+    "ResetPortPreIfdown": ("Enum", {
+        "P_IN": "P-IN",    # Only call the portal login (do not reset drivers/supplicant/dhcp)
+        "P_OUT": "P-OUT",  # Only call the portal logout (do not reset drivers/supplicant/dhcp)
+        "YES": "YES",      # (include logout) Call portal-bot.pl ... <b>--logout</b> before going down.
+    }),
+    # <CLI-JSON/SCAN_WIFI>
+    "ScanWifiExtra": ("Enum", {
+        "NA": "NA",                                    # (or left blank) the system does a full scan
+        "dump": "dump",                                # then only cached values are returned
+        "trigger_freq__freq_": "trigger freq [freq]",  # scan exactly those frequencies
+    }),
+    # <CLI-JSON/SNIFF_PORT>
+    "SniffPortFlags": ("IntFlag", {
+        "DUMPCAP": 0x2,        # Use command-line dumpcap, more efficient than tshark
+        "MATE_TERMINAL": 0x4,  # Launch tshark/dumpcap in mate-terminal
+        "MATE_XTERM": 0x8,     # Launch tshark/dumpcap in xterm
+        "TSHARK": 0x1,         # Use command-line tshark instead of wireshark
+    }),
+}
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/ADMIN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#admin
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_admin(self, 
+               arg1: str = None,  # Argument 1: xorp-port | scan-rslts-file | iface-name | iface-eid |
+               # rfgen-message | id
+               arg2: str = None,  # Argument 2: scan key | message | angle | dest-radio
+               arg3: str = None,  # Argument 3: noprobe | migrate-sta-mac-pattern
+               arg5: str = None,  # Argument 4: table-speed
+               cmd: str = None,   # Admin command:
+               # resync_clock|write_xorp_cfg|scan_complete|ifup_post_complete|flush_complete|req_migrate|rfgen|chamber|clean_logs
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_admin(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if arg1 is not None:
+        data["arg1"] = arg1
+    if arg2 is not None:
+        data["arg2"] = arg2
+    if arg3 is not None:
+        data["arg3"] = arg3
+    if arg5 is not None:
+        data["arg5"] = arg5
+    if cmd is not None:
+        data["cmd"] = cmd
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/admin",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/APPLY_VR_CFG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#apply_vr_cfg
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_apply_vr_cfg(self, 
+                      resource: int = None,  # The number of the resource in question, or 'ALL'. [W]
+                      shelf: int = 1,        # The number of the shelf in question, or 'ALL'. [R][D:ALL]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_apply_vr_cfg(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/apply_vr_cfg",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/BLINK_ATTENUATOR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#blink_attenuator
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_blink_attenuator(self, 
+                          resource: int = None,  # Resource number. [W]
+                          serno: str = None,     # Serial number for requested Attenuator, or 'all'. [W]
+                          shelf: int = 1,        # Shelf number, usually 1. [R][D:1]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_blink_attenuator(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if serno is not None:
+        data["serno"] = serno
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/blink_attenuator",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/C_SHOW_PORTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#c_show_ports
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_c_show_ports(self, 
+                      port: str = None,         # Port number, or 'all'. [W]
+                      probe_flags: str = None,  # See above, add them together for multiple probings. Leave
+                      # blank if you want stats only.
+                      resource: int = None,     # Resource number, or 'all'. [W]
+                      shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_c_show_ports(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if probe_flags is not None:
+        data["probe_flags"] = probe_flags
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/c_show_ports",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CANCEL_VR_CFG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#cancel_vr_cfg
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_cancel_vr_cfg(self, 
+                       resource: int = None,  # The number of the resource in question, or 'ALL'. [W]
+                       shelf: int = 1,        # The number of the shelf in question, or 'ALL'. [R][D:ALL]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_cancel_vr_cfg(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/cancel_vr_cfg",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_CD_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_cd_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_cd_counters(self, 
+                           cd_name: str = None,  # Name of Collision Domain, or 'all'. Null argument is same
+                           # as 'all'. [W][D:all]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_cd_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd_name is not None:
+        data["cd_name"] = cd_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_cd_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_CX_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_cx_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_cx_counters(self, 
+                           cx_name: str = None,  # Name of Cross Connect, or 'all'. Null argument is same as
+                           # 'all'. [W][D:all]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_cx_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_cx_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_ENDP_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_endp_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_endp_counters(self, 
+                             endp_name: str = None,     # Name of Endpoint, or 'all'. Null argument is same as
+                             # 'all'. [W][D:all]
+                             incr_seqno: str = None,    # Enter 'YES' if you want the target to increment the
+                             # cfg-seq-no.
+                             just_latency: str = None,  # Enter 'YES' if you only want to clear latency counters,
+                             # and see above for RXGAP.
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_endp_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if incr_seqno is not None:
+        data["incr_seqno"] = incr_seqno
+    if just_latency is not None:
+        data["just_latency"] = just_latency
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_endp_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_group(self, 
+                     name: str = None,  # The name of the test group. [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_PORT_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_port_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_port_counters(self, 
+                             extra: str = None,     # Clear something else instead: dhcp4_lease | dhcp6_lease |
+                             # dhcp_leases
+                             port: str = None,      # The number of the port in question, or 'ALL'. [W]
+                             resource: int = None,  # The number of the resource in question, or 'ALL'. [W]
+                             shelf: int = 1,        # The number of the shelf in question, or 'ALL'. [R][D:1]
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_port_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if extra is not None:
+        data["extra"] = extra
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_port_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_RESOURCE_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_resource_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_resource_counters(self, 
+                                 resource: int = None,  # The number of the resource in question, or 'ALL'. [W]
+                                 shelf: int = 1,        # The number of the shelf in question, or 'ALL'.
+                                 # [R][D:1]
+                                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_resource_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_resource_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CLEAR_WP_COUNTERS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#clear_wp_counters
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_clear_wp_counters(self, 
+                           endp_name: str = None,  # Name of WanLink Endpoint. [W]
+                           wp_name: str = None,    # Name of WanPath to clear.
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_clear_wp_counters(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if wp_name is not None:
+        data["wp_name"] = wp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/clear_wp_counters",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/CREATE_CLIENT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#create_client
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_create_client(self, 
+                       name: str = None,        # A single name with no white-spaces (15 characters or less) [W]
+                       password: str = None,    # Can be blank or 'NA' if no password is set, otherwise must be
+                       # the password. Use IGNORE for no change.
+                       super_user: str = None,  # 1 If you want this user to have Administrative powers, 0 or
+                       # blank otherwise.
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_create_client(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if password is not None:
+        data["password"] = password
+    if super_user is not None:
+        data["super_user"] = super_user
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/create_client",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/DIAG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#diag
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_diag(self, 
+              arg1: str = None,  # Optional: Endpoint name to diag.
+              p_type: str = None,  # Default (blank) is everything, options: alerts, license, counters, fds,
+              # clients, endpoints, shelf, iobuffer.
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_diag(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if arg1 is not None:
+        data["arg1"] = arg1
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/diag",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/DISCOVER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#discover
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_discover(self, 
+                  disconnect: str = None,  # Set to 'disconnect' to force disconnect to remote resource process.
+                  resource: int = None,    # Resource ID. Use if discovering Attenuators. [W]
+                  shelf: int = 1,          # Shelf-ID, only used if discovering Attenuators. [R][D:1]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_discover(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if disconnect is not None:
+        data["disconnect"] = disconnect
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/discover",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/DO_PESQ> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#do_pesq
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_do_pesq(self, 
+                 endp_name: str = None,         # Name of Endpoint. [W]
+                 result_file_name: str = None,  # The name of the file received by the endpoint. [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_do_pesq(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if result_file_name is not None:
+        data["result_file_name"] = result_file_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/do_pesq",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/FILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#file
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_file(self, 
+              card: int = None,      # Resource ID [W]
+              cmd: str = None,       # Only 'Download' supported for now, 'Upload' reserved for future use.
+              # [W][D:Download]
+              filename: str = None,  # File to transfer. [W]
+              shelf: int = 1,        # Shelf ID [R][D:1]
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_file(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if card is not None:
+        data["card"] = card
+    if cmd is not None:
+        data["cmd"] = cmd
+    if filename is not None:
+        data["filename"] = filename
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/file",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/FLASH_ATTENUATOR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#flash_attenuator
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_flash_attenuator(self, 
+                          filename: str = None,  # File to use when uploading to attenuator.
+                          resource: int = None,  # Resource number. [W]
+                          serno: str = None,     # Serial number for requested Attenuator, or 'all'. [W]
+                          shelf: int = 1,        # Shelf number, usually 1. [R][D:1]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_flash_attenuator(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if filename is not None:
+        data["filename"] = filename
+    if resource is not None:
+        data["resource"] = resource
+    if serno is not None:
+        data["serno"] = serno
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/flash_attenuator",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETAVGLATENCY> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getavglatency
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getavglatency(self, 
+                       aorb: str = None,  # For AtoB, enter 'B', for BtoA, enter 'A'.
+                       cx: str = None,    # Cross-connect or Test-Group name [W]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getavglatency(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getavglatency",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETINRXBPS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getinrxbps
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getinrxbps(self, 
+                    aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                    cx: str = None,    # Cross-connect or Test-Group name [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getinrxbps(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getinrxbps",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETINRXRATE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getinrxrate
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getinrxrate(self, 
+                     aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                     cx: str = None,    # Cross-connect or Test-Group name [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getinrxrate(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getinrxrate",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETINTXRATE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getintxrate
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getintxrate(self, 
+                     aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                     cx: str = None,    # Cross-connect or Test-Group name [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getintxrate(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getintxrate",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETIPADD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getipadd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getipadd(self, 
+                  aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                  cx: str = None,    # Cross-connect name [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getipadd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getipadd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETMAC> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getmac
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getmac(self, 
+                aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                cx: str = None,    # Cross-connect name [W]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getmac(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getmac",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETMASK> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getmask
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getmask(self, 
+                 aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                 cx: str = None,    # Cross-connect name
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getmask(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getmask",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETPKTDROPS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getpktdrops
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getpktdrops(self, 
+                     aorb: str = None,  # For AtoB, enter 'B', for BtoA, enter 'A'.
+                     cx: str = None,    # Cross-connect or Test-Group name [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getpktdrops(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getpktdrops",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETRXENDPERRPKTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getrxendperrpkts
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getrxendperrpkts(self, 
+                          aorb: str = None,  # For AtoB, enter 'B', for BtoA, enter 'A'.
+                          cx: str = None,    # Cross-connect or Test-Group name [W]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getrxendperrpkts(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getrxendperrpkts",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETRXPKTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getrxpkts
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getrxpkts(self, 
+                   aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                   cx: str = None,    # Cross-connect or Test-Group name [W]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getrxpkts(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getrxpkts",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETRXPORTERRPKTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#getrxporterrpkts
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_getrxporterrpkts(self, 
+                          aorb: str = None,  # For AtoB, enter 'B', for BtoA, enter 'A'.
+                          cx: str = None,    # Cross-connect name [W]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_getrxporterrpkts(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/getrxporterrpkts",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GETTXPKTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#gettxpkts
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_gettxpkts(self, 
+                   aorb: str = None,  # For endpoint a, enter 'A', for endpoint b, enter 'B'.
+                   cx: str = None,    # Cross-connect or Test-Group name [W]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_gettxpkts(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if aorb is not None:
+        data["aorb"] = aorb
+    if cx is not None:
+        data["cx"] = cx
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/gettxpkts",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/GOSSIP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#gossip
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_gossip(self, 
+                message: str = None,  # Message to show to others currently logged on. <tt
+                # escapearg='false'>Unescaped Value</tt> [W]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_gossip(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if message is not None:
+        data["message"] = message
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/gossip",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/HELP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#help
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_help(self, 
+              command: str = None,  # The command to get help for. Can be 'all', or blank.
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_help(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if command is not None:
+        data["command"] = command
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/help",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/INIT_WISER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#init_wiser
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_init_wiser(self, 
+                    file_name: str = None,   # The WISER file name for the desired emulation, or 'NA' for empty
+                    # string.
+                    node_count: str = None,  # The number of WISER nodes for the desired emulation, or 'NA' for
+                    # empty string.
+                    resource: int = None,    # The number of the resource in question. [W]
+                    shelf: int = 1,          # The number of the shelf in question. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_init_wiser(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if file_name is not None:
+        data["file_name"] = file_name
+    if node_count is not None:
+        data["node_count"] = node_count
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/init_wiser",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/LICENSES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#licenses
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_licenses(self, 
+                  popup: str = None,      # If 'popup', then cause a GUI popup msg, otherwise, just show text.
+                  show_file: str = None,  # If 'yes', then show the license file, not the parsed license
+                  # information.
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_licenses(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if popup is not None:
+        data["popup"] = popup
+    if show_file is not None:
+        data["show_file"] = show_file
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/licenses",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/LOAD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#load
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_load(self, 
+              action: str = None,          # Should be 'append' or 'overwrite'. [W]
+              clean_chambers: str = None,  # If yes, then Chambers will be cleaned up when overwrite is selected,
+              # otherwise they will be kept.
+              clean_dut: str = None,       # If yes, then DUT will be cleaned up when overwrite is selected,
+              # otherwise they will be kept.
+              clean_profiles: str = None,  # If yes, then clean all profiles when overwrite is selected, otherwise
+              # they will be kept.
+              name: str = None,            # The name of the database to load. (DFLT is the default) [W]
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_load(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if action is not None:
+        data["action"] = action
+    if clean_chambers is not None:
+        data["clean_chambers"] = clean_chambers
+    if clean_dut is not None:
+        data["clean_dut"] = clean_dut
+    if clean_profiles is not None:
+        data["clean_profiles"] = clean_profiles
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/load",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/LOG_LEVEL> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#log_level
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_log_level(self, 
+                   level: str = None,   # Integer corresponding to the logging flags. [W]
+                   target: str = None,  # Options: 'gnu' | [file-endp-name].
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_log_level(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if level is not None:
+        data["level"] = level
+    if target is not None:
+        data["target"] = target
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/log_level",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/LOG_MSG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#log_msg
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_log_msg(self, 
+                 message: str = None,  # Message to log. <tt escapearg='false'>Unescaped Value</tt> [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_log_msg(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if message is not None:
+        data["message"] = message
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/log_msg",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/LOGIN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#login
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_login(self, 
+               name: str = None,      # A single name with no white-spaces (15 characters or less) [W]
+               password: str = None,  # Can be blank or 'NA' if no password is set, otherwise must be the
+               # password.
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_login(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if password is not None:
+        data["password"] = password
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/login",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/MOTD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#motd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_motd(self, 
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_motd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/motd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_CD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_cd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_cd(self, 
+                    collision_domain: str = None,  # Name of the Collision Domain, or 'all'. [W]
+                    resource: int = None,          # Resource number, or 'all'. [W]
+                    shelf: int = 1,                # Name/id of the shelf, or 'all'. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_cd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if collision_domain is not None:
+        data["collision_domain"] = collision_domain
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_cd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_CHANNEL_GROUPS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_channel_groups
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_channel_groups(self, 
+                                channel_name: str = None,  # Name of the channel, or 'all'. [W]
+                                resource: int = None,      # Resource number, or 'all'. [W]
+                                shelf: int = 1,            # Name/id of the shelf, or 'all'. [R][D:1]
+                                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_channel_groups(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if channel_name is not None:
+        data["channel_name"] = channel_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_channel_groups",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_ENDPOINTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_endpoints
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_endpoints(self, 
+                           endpoint: str = None,  # Name of endpoint, or 'all'. [W]
+                           extra: str = None,     # See above.
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_endpoints(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if extra is not None:
+        data["extra"] = extra
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_endpoints",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_PESQ> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_pesq
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_pesq(self, 
+                      endpoint: str = None,  # Name of endpoint, or 'all'. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_pesq(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_pesq",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_PORTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_ports
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_ports(self, 
+                       port: str = None,         # Port number, or 'all'. [W]
+                       probe_flags: str = None,  # See above, add them together for multiple probings. Leave
+                       # blank if you want stats only.
+                       resource: int = None,     # Resource number, or 'all'. [W]
+                       shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_ports(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if probe_flags is not None:
+        data["probe_flags"] = probe_flags
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_ports",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_PPP_LINKS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_ppp_links
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_ppp_links(self, 
+                           link_num: str = None,  # Ppp-Link number of the span, or 'all'. [W]
+                           resource: int = None,  # Resource number, or 'all'. [W]
+                           shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_ppp_links(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if link_num is not None:
+        data["link_num"] = link_num
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_ppp_links",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_SPANS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_spans
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_spans(self, 
+                       resource: int = None,     # Resource number, or 'all'. [W]
+                       shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+                       span_number: str = None,  # Span-Number of the span, or 'all'. [W]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_spans(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span_number is not None:
+        data["span_number"] = span_number
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_spans",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_vr(self, 
+                    resource: int = None,  # Resource number, or 'all'. [W]
+                    router: str = None,    # Name of the Virtual Router, or 'all'. [W]
+                    shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if router is not None:
+        data["router"] = router
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NC_SHOW_VRCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#nc_show_vrcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_nc_show_vrcx(self, 
+                      cx_name: str = None,   # Name of the Virtual Router Connection, or 'all'. [W]
+                      resource: int = None,  # Resource number, or 'all'. [W]
+                      shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_nc_show_vrcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/nc_show_vrcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/NOTIFY_DHCP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#notify_dhcp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_notify_dhcp(self, 
+                     cmd: str = None,         # set/down/timeout/info: What does DHCP want us to do? [W]
+                     netmask: str = None,     # New subnet mask.
+                     new_dns: str = None,     # New DNS server(s) for use by this interface.
+                     new_ip: str = None,      # New IP address.
+                     new_ip6: str = None,     # New Global IPv6 address: ipv6/prefix
+                     new_mtu: str = None,     # New MTU.
+                     new_router: str = None,  # One or more default routers. LANforge will only use the first
+                     # one.
+                     port: str = None,        # Interface name. [W]
+                     reason: str = None,      # DHCP reason, informational mostly.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_notify_dhcp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cmd is not None:
+        data["cmd"] = cmd
+    if netmask is not None:
+        data["netmask"] = netmask
+    if new_dns is not None:
+        data["new_dns"] = new_dns
+    if new_ip is not None:
+        data["new_ip"] = new_ip
+    if new_ip6 is not None:
+        data["new_ip6"] = new_ip6
+    if new_mtu is not None:
+        data["new_mtu"] = new_mtu
+    if new_router is not None:
+        data["new_router"] = new_router
+    if port is not None:
+        data["port"] = port
+    if reason is not None:
+        data["reason"] = reason
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/notify_dhcp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/PORT_RESET_COMPLETED> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#port_reset_completed
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_port_reset_completed(self, 
+                              extra: str = None,  # IP for SECIP, blank for others.
+                              port: str = None,   # The port in question. [W]
+                              p_type: str = None,  # SUNOS, NORMAL, or SECIP..let us know what kind of reset
+                              # completed.
+                              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_port_reset_completed(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if extra is not None:
+        data["extra"] = extra
+    if port is not None:
+        data["port"] = port
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/port_reset_completed",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/PROBE_PORT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#probe_port
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_probe_port(self, 
+                    key: str = None,       # Unique identifier for this request. Usually left blank.<br/>
+                    port: str = None,      # Port number or name [W]
+                    resource: int = None,  # Resource number. [W]
+                    shelf: int = 1,        # Shelf number. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_probe_port(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if key is not None:
+        data["key"] = key
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/probe_port",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/PROBE_PORTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#probe_ports
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_probe_ports(self, 
+                     resource: int = None,  # Resource number, or 'all'. [W]
+                     shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_probe_ports(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/probe_ports",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/QUIESCE_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#quiesce_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_quiesce_endp(self, 
+                      endp_name: str = None,  # Name of the endpoint, or 'all'. [R]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_quiesce_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/quiesce_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/QUIESCE_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#quiesce_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_quiesce_group(self, 
+                       name: str = None,  # The name of the test group, or 'all' [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_quiesce_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/quiesce_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/QUIT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#quit
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_quit(self, 
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_quit(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/quit",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/REBOOT_OS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#reboot_os
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_reboot_os(self, 
+                   resource: int = None,  # Resource number, or ALL. [W]
+                   shelf: int = 1,        # Shelf number, or ALL. [R][D:1]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_reboot_os(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/reboot_os",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/REPORT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#report
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_report(self, 
+                reporting_on: str = None,   # Should we globally enable/disable reporting. (YES, NO or NA)
+                rpt_dir: str = None,        # Directory in which reports should be saved. [W]
+                save_endps: str = None,     # Should we save endpoint reports or not. (YES, NO or NA)
+                save_ports: str = None,     # Should we save Port reports or not. (YES, NO or NA)
+                save_resource: str = None,  # Should we save Resource reports or not. (YES, NO or NA)
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_report(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if reporting_on is not None:
+        data["reporting_on"] = reporting_on
+    if rpt_dir is not None:
+        data["rpt_dir"] = rpt_dir
+    if save_endps is not None:
+        data["save_endps"] = save_endps
+    if save_ports is not None:
+        data["save_ports"] = save_ports
+    if save_resource is not None:
+        data["save_resource"] = save_resource
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/report",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RESET_PORT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#reset_port
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_reset_port(self, 
+                    port: str = None,        # Port number to reset, or ALL. [W]
+                    pre_ifdown: str = None,  # See above. Leave blank or use NA if unsure.
+                    reset_ospf: str = None,  # If set to 'NO' or 'NA', then OSPF will not be updated. Otherwise,
+                    # it will be updated.
+                    resource: int = None,    # Resource number, or ALL. [W]
+                    shelf: int = 1,          # Shelf number, or ALL. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_reset_port(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if pre_ifdown is not None:
+        data["pre_ifdown"] = pre_ifdown
+    if reset_ospf is not None:
+        data["reset_ospf"] = reset_ospf
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/reset_port",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RESET_SERIAL_SPAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#reset_serial_span
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_reset_serial_span(self, 
+                           resource: int = None,  # Resource (machine) number. [W]
+                           shelf: int = 1,        # Shelf number [R][D:1]
+                           span: str = None,      # Serial-Span number to reset. [W]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_reset_serial_span(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span is not None:
+        data["span"] = span
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/reset_serial_span",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RPT_SCRIPT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rpt_script
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rpt_script(self, 
+                    endp: str = None,          # Endpoint name or ID. [W]
+                    flags: str = None,         # See above for description of the defined flags.
+                    group_action: str = None,  # All or Sequential.
+                    loop_count: str = None,    # How many times to loop before stopping (0 is infinite).
+                    name: str = None,          # Script name. [W]
+                    private: str = None,       # Private encoding for the particular script.
+                    p_type: str = None,        # One of: NONE, Script2544, ScriptHunt, ScriptWL
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rpt_script(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp is not None:
+        data["endp"] = endp
+    if flags is not None:
+        data["flags"] = flags
+    if group_action is not None:
+        data["group_action"] = group_action
+    if loop_count is not None:
+        data["loop_count"] = loop_count
+    if name is not None:
+        data["name"] = name
+    if private is not None:
+        data["private"] = private
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rpt_script",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SCAN_WIFI> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#scan_wifi
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_scan_wifi(self, 
+                   extra: str = None,     # Extra arguments to the scan script, see above.
+                   key: str = None,       # Unique identifier for this request. Usually left blank.
+                   port: str = None,      # Port number or name of the virtual interface. [W]
+                   resource: int = None,  # Resource number. [W]
+                   shelf: int = 1,        # Shelf number. [R][D:1]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_scan_wifi(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if extra is not None:
+        data["extra"] = extra
+    if key is not None:
+        data["key"] = key
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/scan_wifi",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHUTDOWN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#shutdown
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_shutdown(self, 
+                  chdir: str = None,      # Directory to cd to before dying. Only useful when using gprof to
+                  # debug, or 'NA' to ignore.
+                  really: str = None,     # Must be 'YES' for command to really work.
+                  serverctl: str = None,  # Enter 'YES' to do a ./serverctl.bash restart to restart all
+                  # LANforge processes.
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_shutdown(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chdir is not None:
+        data["chdir"] = chdir
+    if really is not None:
+        data["really"] = really
+    if serverctl is not None:
+        data["serverctl"] = serverctl
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/shutdown",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHUTDOWN_OS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#shutdown_os
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_shutdown_os(self, 
+                     resource: int = None,  # Resource number, or ALL. [W]
+                     shelf: int = 1,        # Shelf number, or ALL. [R][D:1]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_shutdown_os(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/shutdown_os",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHUTDOWN_RESOURCE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#shutdown_resource
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_shutdown_resource(self, 
+                           resource: int = None,  # Resource number, or ALL. [W]
+                           shelf: int = 1,        # Shelf number, or ALL. [R][D:1]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_shutdown_resource(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/shutdown_resource",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SNIFF_PORT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#sniff_port
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_sniff_port(self, 
+                    display: str = None,   # The DISPLAY option, for example: 192.168.1.5:0.0. Will guess if
+                    # left blank.
+                    duration: str = None,  # Duration for doing a capture (in seconds). Default is 5 minutes
+                    # for dumpcap/tshark, and forever for wireshark
+                    flags: str = None,     # Flags that control how the sniffing is done.
+                    outfile: str = None,   # Optional file location for saving a capture.
+                    port: str = None,      # The port we are trying to run the packet sniffer on. [R]
+                    resource: int = None,  # Resource number. [W]
+                    shelf: int = 1,        # Shelf number. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_sniff_port(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if display is not None:
+        data["display"] = display
+    if duration is not None:
+        data["duration"] = duration
+    if flags is not None:
+        data["flags"] = flags
+    if outfile is not None:
+        data["outfile"] = outfile
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/sniff_port",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/START_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#start_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_start_endp(self, 
+                    endp_name: str = None,  # Name of the cross-connect, or 'all'. [R]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_start_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/start_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/START_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#start_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_start_group(self, 
+                     name: str = None,  # The name of the test group. [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_start_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/start_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/START_PPP_LINK> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#start_ppp_link
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_start_ppp_link(self, 
+                        resource: int = None,  # Resource number that holds this PppLink. [W]
+                        shelf: int = 1,        # Name/id of the shelf. [R][D:1]
+                        unit_num: str = None,  # Unit-Number for the PppLink to be started. [R]
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_start_ppp_link(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if unit_num is not None:
+        data["unit_num"] = unit_num
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/start_ppp_link",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/STOP_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#stop_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_stop_endp(self, 
+                   endp_name: str = None,  # Name of the endpoint, or 'all'. [R]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_stop_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/stop_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/STOP_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#stop_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_stop_group(self, 
+                    name: str = None,  # The name of the test group, or 'all' [R]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_stop_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/stop_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/STOP_PPP_LINK> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#stop_ppp_link
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_stop_ppp_link(self, 
+                       resource: int = None,  # Resource number that holds this PppLink. [W]
+                       shelf: int = 1,        # Name/id of the shelf. [R][D:1]
+                       unit_num: str = None,  # Unit-Number for the PppLink to be stopped. [W]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_stop_ppp_link(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if unit_num is not None:
+        data["unit_num"] = unit_num
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/stop_ppp_link",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/TAIL> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#tail
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_tail(self, 
+              cmd: str = None,       # Command: start, stop, results
+              key: str = None,       # File-name that we should be tailing.
+              message: str = None,   # The contents to display (for results only) <tt
+              # escapearg='false'>Unescaped Value</tt>
+              resource: int = None,  # Resource that holds the file. [W]
+              shelf: int = 1,        # Shelf that holds the resource that holds the file. [R][D:1]
+              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_tail(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cmd is not None:
+        data["cmd"] = cmd
+    if key is not None:
+        data["key"] = key
+    if message is not None:
+        data["message"] = message
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/tail",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/TM_REGISTER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#tm_register
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_tm_register(self, 
+                     client_name: str = None,  # Name of client to be registered. (dflt is current client) [W]
+                     test_mgr: str = None,     # Name of test manager (can be all.) [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_tm_register(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if client_name is not None:
+        data["client_name"] = client_name
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/tm_register",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/TM_UNREGISTER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#tm_unregister
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_tm_unregister(self, 
+                       client_name: str = None,  # Name of client to be un-registered. (dflt is current client)
+                       # [W]
+                       test_mgr: str = None,     # Name of test manager (can be all.) [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_tm_unregister(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if client_name is not None:
+        data["client_name"] = client_name
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/tm_unregister",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/VERSION> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#version
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_version(self, 
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_version(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/version",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/WHO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#who
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_who(self, 
+             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_who(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/who",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/WIFI_CLI_CMD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#wifi_cli_cmd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_wifi_cli_cmd(self, 
+                      port: str = None,         # Name of the WiFi station or AP interface to which this command
+                      # will be directed. [R]
+                      resource: int = None,     # Resource number. [W]
+                      shelf: int = 1,           # Shelf number. [R][D:1]
+                      wpa_cli_cmd: str = None,  # Command to pass to wpa_cli or hostap_cli. This must be
+                      # single-quoted. [R]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_wifi_cli_cmd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if wpa_cli_cmd is not None:
+        data["wpa_cli_cmd"] = wpa_cli_cmd
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/wifi_cli_cmd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/WIFI_EVENT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#wifi_event
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_wifi_event(self, 
+                    device: str = None,  # Interface or PHY in most cases. [R]
+                    event: str = None,   # What happened. [R]
+                    msg: str = None,     # Entire event in human readable form.
+                    status: str = None,  # Status on what happened.
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_wifi_event(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if device is not None:
+        data["device"] = device
+    if event is not None:
+        data["event"] = event
+    if msg is not None:
+        data["msg"] = msg
+    if status is not None:
+        data["status"] = status
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/wifi_event",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/WISER_RESET> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#wiser_reset
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_wiser_reset(self, 
+                     resource: int = None,  # Resource number, or ALL. [W]
+                     shelf: int = 1,        # Shelf number, or ALL. [R][D:1]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_wiser_reset(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/wiser_reset",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/WRITE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#write
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_write(self, 
+               db_name: str = None,  # The name the backup shall be saved as (blank means dflt)
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_write(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if db_name is not None:
+        data["db_name"] = db_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/write",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
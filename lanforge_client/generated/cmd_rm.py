@@ -0,0 +1,884 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonCommand members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonCommand imports this module the first time one of
+    them is used: call them through LFJsonCommand, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_ATTENUATOR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_attenuator
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_attenuator(self, 
+                       resource: int = None,  # Resource number [W]
+                       serno: str = None,     # Serial number for requested Attenuator. [W]
+                       shelf: int = 1,        # Shelf number, usually 1 [R][D:1]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_attenuator(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if serno is not None:
+        data["serno"] = serno
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_attenuator",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_cd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_cd(self, 
+               cd: str = None,  # Name of Collision Domain. [W]
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_cd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd is not None:
+        data["cd"] = cd
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_cd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CD_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_cd_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_cd_endp(self, 
+                    cd: str = None,    # Name of Collision Domain. [W]
+                    endp: str = None,  # Endpoint name/id. [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_cd_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd is not None:
+        data["cd"] = cd
+    if endp is not None:
+        data["endp"] = endp
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_cd_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CD_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_cd_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_cd_vr(self, 
+                  cd: str = None,    # Name of Collision Domain. [W]
+                  endp: str = None,  # Virtual-Router name/id. [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_cd_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cd is not None:
+        data["cd"] = cd
+    if endp is not None:
+        data["endp"] = endp
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_cd_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CHAMBER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_chamber
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_chamber(self, 
+                    chamber: str = None,  # Chamber name, or 'ALL' [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_chamber(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chamber is not None:
+        data["chamber"] = chamber
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_chamber",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CHAMBER_PATH> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_chamber_path
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_chamber_path(self, 
+                         chamber: str = None,  # Chamber Name. [W]
+                         path: str = None,     # Path Name, use 'ALL' to delete all paths. [W]
+                         debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_chamber_path(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chamber is not None:
+        data["chamber"] = chamber
+    if path is not None:
+        data["path"] = path
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_chamber_path",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CHANNEL_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_channel_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_channel_group(self, 
+                          channel_name: str = None,  # Name of the channel, or 'all'. [W]
+                          resource: int = None,      # Resource number, or 'all'. [W]
+                          shelf: int = 1,            # Name/id of the shelf, or 'all'. [R][D:1]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_channel_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if channel_name is not None:
+        data["channel_name"] = channel_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_channel_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CLIENT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_client
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_client(self, 
+                   client_name: str = None,      # Name of the client profile you wish to remove. [W]
+                   client_password: str = None,  # Client password. Not required if we are super-user.
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_client(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if client_name is not None:
+        data["client_name"] = client_name
+    if client_password is not None:
+        data["client_password"] = client_password
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_client",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_CX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_cx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_cx(self, 
+               cx_name: str = None,   # Name of the cross-connect, or 'all'. [W]
+               test_mgr: str = None,  # Name of test-mgr, or 'all'. [W]
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_cx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_cx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_DB> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_db
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_db(self, 
+               db_name: str = None,  # Name of the database to delete. [W]
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_db(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if db_name is not None:
+        data["db_name"] = db_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_db",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_DUT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_dut
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_dut(self, 
+                shelf: int = 1,  # DUT name, or 'ALL' [W]
+                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_dut(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_dut",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_endp(self, 
+                 endp_name: str = None,  # Name of the endpoint, or 'YES_ALL'. [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_EVENT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_event
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_event(self, 
+                  event_id: str = None,  # Numeric event-id, or 'all' [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_event(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if event_id is not None:
+        data["event_id"] = event_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_event",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_group(self, 
+                  name: str = None,  # The name of the test group. [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_PPP_LINK> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_ppp_link
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_ppp_link(self, 
+                     resource: int = None,  # Resource number that holds this PppLink. [W]
+                     shelf: int = 1,        # Name/id of the shelf. [R][D:1]
+                     unit_num: str = None,  # Unit-Number for the PppLink to be deleted. [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_ppp_link(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if unit_num is not None:
+        data["unit_num"] = unit_num
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_ppp_link",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_profile(self, 
+                    name: str = None,  # Profile name, or 'ALL' [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_RESOURCE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_resource
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_resource(self, 
+                     resource: int = None,  # Resource number. [W]
+                     shelf: int = 1,        # Shelf number. [R][D:1]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_resource(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_resource",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_RFGEN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_rfgen
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_rfgen(self, 
+                  resource: int = None,  # Resource number [W]
+                  shelf: int = 1,        # Shelf number, usually 1 [R][D:1]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_rfgen(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_rfgen",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_SEC_IP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_sec_ip
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_sec_ip(self, 
+                   ip_list: str = None,   # IP1/prefix,IP2/prefix,...IPZ/prefix, or ALL [W]
+                   port: str = None,      # Name of network device (Port) from which these IPs will be removed.
+                   # [W]
+                   resource: int = None,  # Resource number. [W]
+                   shelf: int = 1,        # Shelf number. [R][D:1]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_sec_ip(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ip_list is not None:
+        data["ip_list"] = ip_list
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_sec_ip",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_SPAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_span
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_span(self, 
+                 resource: int = None,  # Resource number, or 'all'. [W]
+                 shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                 span_num: str = None,  # Span-Number of the channel, or 'all'. [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_span(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span_num is not None:
+        data["span_num"] = span_num
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_span",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_TEST_MGR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_test_mgr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_test_mgr(self, 
+                     test_mgr: str = None,  # Name of the test manager to be removed. [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_test_mgr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_test_mgr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_TEXT_BLOB> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_text_blob
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_text_blob(self, 
+                      name: str = None,  # Text Blob Name, or 'ALL' [W]
+                      p_type: str = None,  # Text Blob type, or 'ALL' [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_text_blob(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_text_blob",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_TGCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_tgcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_tgcx(self, 
+                 cxname: str = None,  # The name of the CX. [W]
+                 tgname: str = None,  # The name of the test group. [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_tgcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cxname is not None:
+        data["cxname"] = cxname
+    if tgname is not None:
+        data["tgname"] = tgname
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_tgcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_THRESHOLD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_threshold
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_threshold(self, 
+                      endp: str = None,       # Endpoint name or ID. [W]
+                      thresh_id: str = None,  # Threshold ID to remove. Use 'all' to remove all. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_threshold(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp is not None:
+        data["endp"] = endp
+    if thresh_id is not None:
+        data["thresh_id"] = thresh_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_threshold",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_TRAFFIC_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_traffic_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_traffic_profile(self, 
+                            name: str = None,  # Profile name, or 'ALL' [W]
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_traffic_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_traffic_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_VENUE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_venue
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_venue(self, 
+                  resource: int = None,  # Resource number, or 'ALL' [W]
+                  shelf: int = 1,        # Shelf number. [R][D:1]
+                  venu_id: str = None,   # Number to uniquely identify this venue on this resource, or 'ALL'
+                  # [W]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_venue(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if venu_id is not None:
+        data["venu_id"] = venu_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_venue",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_VLAN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_vlan
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_vlan(self, 
+                 port: str = None,      # Port number or name of the virtual interface. [W]
+                 resource: int = None,  # Resource number. [W]
+                 shelf: int = 1,        # Shelf number. [R][D:1]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_vlan(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_vlan",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_vr(self, 
+               resource: int = None,     # Resource number, or 'all'. [W]
+               router_name: str = None,  # Virtual Router name, or 'all'. [W]
+               shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if router_name is not None:
+        data["router_name"] = router_name
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_VRCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_vrcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_vrcx(self, 
+                 connection_name: str = None,  # Virtual Router Connection name, or 'all'. [W]
+                 resource: int = None,         # Resource number, or 'all'. [W]
+                 shelf: int = 1,               # Name/id of the shelf, or 'all'. [R][D:1]
+                 vr_id: str = None,            # If not removing from the free-list, then supply the
+                 # virtual-router name/ID here. Leave blank or use NA for free-list.
+                 vrcx_only: str = None,        # If we should NOT delete underlying auto-created objects, enter
+                 # 'vrcx_only' here, otherwise leave blank or use NA.
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_vrcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if connection_name is not None:
+        data["connection_name"] = connection_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vr_id is not None:
+        data["vr_id"] = vr_id
+    if vrcx_only is not None:
+        data["vrcx_only"] = vrcx_only
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_vrcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/RM_WANPATH> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#rm_wanpath
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_rm_wanpath(self, 
+                    endp_name: str = None,  # Name of the endpoint. [W]
+                    wp_name: str = None,    # Name of the wanpath. [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_rm_wanpath(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if wp_name is not None:
+        data["wp_name"] = wp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/rm_wanpath",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
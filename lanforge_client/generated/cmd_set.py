@@ -0,0 +1,2873 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonCommand members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonCommand imports this module the first time one of
+    them is used: call them through LFJsonCommand, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+# flag and enum classes: name: (base, {member: value}); LFJsonCommand builds each class
+# the first time it is used
+ENUMS = {
+    # <CLI-JSON/SET_ARM_INFO>
+    "SetArmInfoArmFlags": ("IntFlag", {
+        "random_payload": 0x10000,  # Use random payload sizes instead of linear increase
+        "rel_tstamp": 0x400,        # Use Relative Timestamps. This will increase performance
+        "slow_start": 0x2000,       # Use slow-start logic. This ramps up
+        "udp_checksum": 0x4000,     # Use UDP Checksums.
+        "use_gw_mac": 0x1000,       # Use default gateway's MAC for destination MAC.
+        "use_tcp": 0x8000,          # Use TCP instead of UDP protocol. (Note this is NOT stateful TCP!)
+    }),
+    # <CLI-JSON/SET_ATTENUATOR>
+    "SetAttenuatorMode": ("Enum", {
+        "p_0": "0",  # Normal
+        "p_1": "1",  # Pulse mode (API Tech 4205A modules directly connected via USB only)
+    }),
+    # <CLI-JSON/SET_CX_STATE>
+    "SetCxStateCxState": ("Enum", {
+        "DELETED": "DELETED",  # Deletes the CX(s).
+        "QUIESCE": "QUIESCE",  # Stop transmitting and gracefully stop cross-connect.
+        "RUNNING": "RUNNING",  # Sets the CX(s) in the running state.
+        "STOPPED": "STOPPED",  # Sets the CX(s) in the stopped state.
+        "SWITCH": "SWITCH",    # Sets the CX(s) in the running state, stopping any conflicting tests.
+    }),
+    # <CLI-JSON/SET_ENDP_FILE>
+    "SetEndpFilePlayback": ("Enum", {
+        "OFF": "OFF",  # off
+        "ON": "ON",    # on
+    }),
+    # <CLI-JSON/SET_ENDP_FLAG>
+    "SetEndpFlagFlag": ("Enum", {
+        "AutoHelper": "AutoHelper",                        # Automatically run on helper process
+        "ClearPortOnStart": "ClearPortOnStart",            # clear stats on start
+        "DoChecksum": "DoChecksum",                        # Enable checksumming
+        "EnableConcurrentSrcIP": "EnableConcurrentSrcIP",  # Concurrent source IPs?
+        "EnableLinearSrcIP": "EnableLinearSrcIP",          # linearized source IPs
+        "EnableLinearSrcIPPort": "EnableLinearSrcIPPort",  # linearized IP ports
+        "EnableRndSrcIP": "EnableRndSrcIP",                # randomize source IP
+        "KernelMode": "KernelMode",                        # Enable kernel mode
+        "QuiesceAfterDuration": "QuiesceAfterDuration",    # quiesce after time period
+        "QuiesceAfterRange": "QuiesceAfterRange",          # quiesce after range of bytes
+        "Unmanaged": "Unmanaged",                          # Set endpoint unmanaged
+        "UseAutoNAT": "UseAutoNAT",                        # NAT friendly behavior
+    }),
+    # <CLI-JSON/SET_ENDP_PAYLOAD>
+    "SetEndpPayloadPayloadType": ("Enum", {
+        "PRBS_11_8_10": "PRBS_11_8_10",  # PRBS (see above)
+        "PRBS_15_0_14": "PRBS_15_0_14",  # PRBS (see above)
+        "PRBS_4_0_3": "PRBS_4_0_3",      # Use linear feedback shift register to generate pseudo random sequence.
+        "PRBS_7_0_6": "PRBS_7_0_6",      # PRBS (see above)
+        "custom": "custom",              # Enter your own payload with the set_endp_payload
+        "decreasing": "decreasing",      # bytes start at FF and decrease, wrapping if needed.
+        "increasing": "increasing",      # bytes start at 00 and increase, wrapping if needed.
+        "ones": "ones",                  # Payload is all ones (FF).
+        "random": "random",              # generate a new random payload each time sent.
+        "random_fixed": "random_fixed",  # means generate one random payload, and send it over and over again.
+        "zeros": "zeros",                # Payload is all zeros (00).
+    }),
+    # <CLI-JSON/SET_ENDP_TOS>
+    "SetEndpTosTos": ("Enum", {
+        "LOWCOST": "LOWCOST",          #
+        "LOWDELAY": "LOWDELAY",        #
+        "RELIABILITY": "RELIABILITY",  #
+        "THROUGHPUT": "THROUGHPUT",    #
+    }),
+    # <CLI-JSON/SET_EVENT_INTEREST>
+    "SetEventInterestEiFlags": ("IntFlag", {
+        "CLEAR": 0x0,  # will clear interest
+        "SET": 0x1,    # set interest flag
+    }),
+    "SetEventInterestEvents1": ("IntFlag", {
+        "BAD_TOS": 0x400000,                   # Endpoint has bad ToS values configured.
+        "Bad_MAC": 0x100000,                   # Invalid MAC address configured.
+        "Cleared": 0x2000,                     # Counters were cleared for some entity.
+        "Connect": 0x100,                      # WiFi interface connected to AP.
+        "Custom": 0x4,                         # Custom event (generated by USER in GUI or CLI).
+        "DHCP_Fail": 0x8000,                   # DHCP Failed, maybe out of leases?
+        "DHCP_Timeout": 0x10000,               # Timed out talking to DHCP server.
+        "DHCP4_Error": 0x20000,                # DHCP gave out duplicated IP address.
+        "DHCP6_Error": 0x40000,                # DHCPv6 gave out duplicated IPv6 address.
+        "Disconnect": 0x80,                    # WiFi interface disconnected from AP.
+        "Endp_Started": 0x40,                  # Endpoint was started.
+        "Endp_Stopped": 0x20,                  # Endpoint stopped for some reason.
+        "Link_Down": 0x1,                      # Notify when Interface Link goes DOWN.
+        "Link_Errors": 0x4000,                 # Port shows low-level link errors.
+        "Link_Up": 0x2,                        # Notify when Interface Link goes UP.
+        "Login": 0x400,                        # CLI/GUI user connected to LANforge.
+        "Logout": 0x200,                       # CLI/GUI user disconnected from LANforge.
+        "Migrated": 0x200000,                  # Port (station network interface) migrated.
+        "NO_RX_SINCE": 0x800000,               # Endpoint threshold alert.
+        "NO_RX_SINCE_CLEARED": 0x1000000,      # Endpoint threshold alert cleared.
+        "RX_BPS_OOR_1M": 0x20000000,           # Endpoint threshold alert.
+        "RX_BPS_OOR_1M_CLEARED": 0x40000000,   # Endpoint threshold alert cleared.
+        "RX_BPS_OOR_30S": 0x8000000,           # Endpoint threshold alert.
+        "RX_BPS_OOR_30S_CLEARED": 0x10000000,  # Endpoint threshold alert cleared.
+        "RX_BPS_OOR_3S": 0x2000000,            # Endpoint threshold alert.
+        "RX_BPS_OOR_3S_CLEARED": 0x4000000,    # Endpoint threshold alert cleared.
+        "Resource_Down": 0x8,                  # Resource has crashed, rebooted, etc.
+        "Resource_Up": 0x10,                   # Resource has connected to manager.
+        "Start_Reports": 0x1000,               # Start saving report data files (CSV).
+        "Stop_Reports": 0x800,                 # Stop saving report data files (CSV).
+        "TX_BPS_OOR_3S": 0x80000000,           # Endpoint threshold alert.
+        "WiFi_Config": 0x80000,                # WiFi Configuration Error.
+    }),
+    "SetEventInterestEvents2": ("IntFlag", {
+        "FW_CRASH": 0x800,                # Firmware for entity has crashed.
+        "FW_FAIL": 0x1000,                # Firmware failed powerup, may require reboot.
+        "IFDOWN_FAIL": 0x8000,            # IFDOWN-PRE Script (ifup --logout) returned error code.
+        "IFDOWN_OK": 0x10000,             # IFDOWN-PRE Script (ifup --logout) completed successfully.
+        "IFUP_FAIL": 0x2000,              # IFUP-POST Script returned error code.
+        "IFUP_OK": 0x4000,                # IFUP-POST Script completed successfully.
+        "RX_DROP_OOR_1M": 0x200,          # Endpoint threshold alert.
+        "RX_DROP_OOR_1M_CLEARED": 0x400,  # Endpoint threshold alert cleared.
+        "RX_DROP_OOR_3S": 0x80,           # Endpoint threshold alert.
+        "RX_DROP_OOR_3S_CLEARED": 0x100,  # Endpoint threshold alert cleared.
+        "RX_LAT_OOR": 0x20,               # Endpoint threshold alert.
+        "RX_LAT_OOR_CLEARED": 0x40,       # Endpoint threshold alert cleared.
+        "TX_BPS_OOR_1M": 0x8,             # Endpoint threshold alert.
+        "TX_BPS_OOR_1M_CLEARED": 0x10,    # Endpoint threshold alert cleared.
+        "TX_BPS_OOR_30S": 0x2,            # Endpoint threshold alert.
+        "TX_BPS_OOR_30S_CLEARED": 0x4,    # Endpoint threshold alert cleared.
+        "TX_BPS_OOR_3S_CLEARED": 0x1,     # Endpoint threshold alert cleared.
+    }),
+    # <CLI-JSON/SET_EVENT_PRIORITY>
+    "SetEventPriorityEvent": ("Enum", {
+        "Bad_MAC": 20,        # Invalid MAC address configured.
+        "Cleared": 13,        # Counters were cleared for some entity.
+        "Connect": 8,         # WiFi interface connected to AP.
+        "Custom": 2,          # Custom event (generated by USER in GUI or CLI).
+        "DHCP_Fail": 15,      # DHCP Failed, maybe out of leases?
+        "DHCP_Timeout": 16,   # Timed out talking to DHCP server.
+        "DHCP4_Error": 17,    # DHCP gave out duplicated IP address.
+        "DHCP6_Error": 18,    # DHCPv6 gave out duplicated IPv6 address.
+        "Disconnect": 7,      # WiFi interface disconnected from AP.
+        "Endp_Started": 6,    # Endpoint was started.
+        "Endp_Stopped": 5,    # Endpoint stopped for some reason.
+        "Link_Down": 0,       # Notify when Interface Link goes UP.
+        "Link_Errors": 14,    # Port shows low-level link errors.
+        "Link_Up": 1,         # Notify when Interface Link goes DOWN.
+        "Login": 10,          # CLI/GUI user connected to LANforge.
+        "Logout": 9,          # CLI/GUI user disconnected from LANforge.
+        "Migrated": 21,       # Port (station network interface) migrated.
+        "Resource_Down": 3,   # Resource has crashed, rebooted, etc.
+        "Resource_Up": 4,     # Resource has connected to manager.
+        "Start_Reports": 12,  # Start saving report data files (CSV).
+        "Stop_Reports": 11,   # Stop saving report data files (CSV).
+        "WiFi_Config": 19,    # WiFi Configuration Error.
+    }),
+    "SetEventPriorityPriority": ("Enum", {
+        "AUTO": "AUTO",          # Let event creator decide the priority.
+        "CRITICAL": "CRITICAL",  #
+        "DEBUG": "DEBUG",        #
+        "FATAL": "FATAL",        #
+        "INFO": "INFO",          #
+        "WARNING": "WARNING",    #
+    }),
+    # <CLI-JSON/SET_FLAG>
+    "SetFlagFlag": ("Enum", {
+        "brief": "brief",                            # Request more abbreviated output to various commands.
+        "prompt_newlines": "prompt_newlines",        # Add a newline after every prompt. Can help with scripts
+        "push_all_rpts": "push_all_rpts",            # If enabled, server will send port, endpoint, and other
+        "push_endp_rpts": "push_endp_rpts",          # If enabled, server will send endpoint reports without
+        "request_keyed_text": "request_keyed_text",  # Normally most keyed-text events are only sent to the GUI
+        "stream_events": "stream_events",            # Normally the CLI will not show Events (as seen in the
+    }),
+    # <CLI-JSON/SET_POLL_MODE>
+    "SetPollModeMode": ("Enum", {
+        "polling": "polling",  #
+        "push": "push",        #
+    }),
+    # <CLI-JSON/SET_PORT>
+    "SetPortCmdFlags": ("IntFlag", {
+        "abort_if_scripts": 0x400,  # Forceably abort all ifup/down scripts on this Port.
+        "force_MII_probe": 0x4,     # Force MII probe
+        "from_dhcp": 0x200,         # Settings come from DHCP client.
+        "from_user": 0x80,          # from_user (Required to change Mgt Port config
+        "new_gw_probe": 0x20,       # Force new GW probe
+        "new_gw_probe_dev": 0x40,   # Force new GW probe for ONLY this interface
+        "no_hw_probe": 0x8,         # Don&apos;t probe hardware
+        "probe_wifi": 0x10,         # Probe WIFI
+        "reset_transceiver": 0x1,   # Reset transciever
+        "restart_link_neg": 0x2,    # Restart link negotiation
+        "skip_port_bounce": 0x100,  # skip-port-bounce (Don&apos;t ifdown/up
+        "use_pre_ifdown": 0x800,    # Call pre-ifdown script before bringing interface down.
+    }),
+    "SetPortCurrentFlags": ("IntFlag", {
+        "adv_100bt_fd": 0x800000,                # advert-100bt-FD
+        "adv_100bt_hd": 0x400000,                # advert-100bt-HD
+        "adv_10bt_fd": 0x200000,                 # advert-10bt-FD
+        "adv_10bt_hd": 0x100000,                 # advert-10bt-HD
+        "adv_10g_fd": 0x800000000,               # advert-10G-FD
+        "adv_2_5g_fd": 0x400000000,              # advert-2.5G-FD
+        "adv_5g_fd": 0x400000000000000,          # Advertise 5Gbps link speed.
+        "adv_flow_ctl": 0x8000000,               # advert-flow-control
+        "auto_neg": 0x100,                       # auto-negotiate
+        "aux_mgt": 0x800000000000,               # Enable Auxillary-Management flag for this port.
+        "fixed_100bt_fd": 0x10,                  # Fixed-100bt-FD
+        "fixed_100bt_hd": 0x8,                   # Fixed-100bt-HD
+        "fixed_10bt_fd": 0x4,                    # Fixed-10bt-FD
+        "fixed_10bt_hd": 0x2,                    # Fixed-10bt-HD (half duplex)
+        "ftp_enabled": 0x400000000000,           # Enable FTP (vsftpd) service for this port.
+        "gro_enabled": 0x4000000000,             # GRO-Enabled
+        "gso_enabled": 0x10000000000,            # GSO-Enabled
+        "http_enabled": 0x200000000000,          # Enable HTTP (nginx) service for this port.
+        "if_down": 0x1,                          # Interface Down
+        "ignore_dhcp": 0x2000000000000,          # Don&apos;t set DHCP acquired IP on interface,
+        "ipsec_client": 0x40000000000000,        # Enable client IPSEC xfrm on this port.
+        "ipsec_concentrator": 0x80000000000000,  # Enable concentrator (upstream) IPSEC xfrm on this port.
+        "lro_enabled": 0x2000000000,             # LRO-Enabled
+        "no_dhcp_rel": 0x80000000000,            # No-DHCP-Release
+        "no_dhcp_restart": 0x1000000000000,      # Disable restart of DHCP on link connect (ie, wifi).
+        "no_ifup_post": 0x4000000000000,         # Skip ifup-post script if we can detect that we
+        "promisc": 0x10000000,                   # PROMISC
+        "radius_enabled": 0x20000000000000,      # Enable RADIUS service (using hostapd as radius server)
+        "rxfcs": 0x40000000000,                  # RXFCS
+        "service_dns": 0x100000000000000,        # Enable DNS (dnsmasq) service on this port.
+        "staged_ifup": 0x100000000000,           # Staged-IFUP
+        "tso_enabled": 0x1000000000,             # TSO-Enabled
+        "ufo_enabled": 0x8000000000,             # UFO-Enabled
+        "use_dhcp": 0x80000000,                  # USE-DHCP
+        "use_dhcpv6": 0x20000000000,             # USE-DHCPv6
+    }),
+    "SetPortDhcpClientId": ("Enum", {
+        "NA": "NA",                 # Do not change from current value.
+        "NONE": "NONE",             # Do not use dhcp client ID.
+        "p_string_": "[string]",    # Use the string for the client ID.
+        "p__DEVNAME": "__DEVNAME",  # Use the interface&apos;s name as the client ID.
+        "p__MAC": "__MAC",          # Use interface&apos;s MAC address for the client ID.
+    }),
+    "SetPortDhcpHostname": ("Enum", {
+        "NA": "NA",                 # Do not change from current value.
+        "NONE": "NONE",             # Do not use dhcp Hostname
+        "p_string_": "[string]",    # Use the string for the Hostname.
+        "p__ALIAS__": "__ALIAS__",  # Use alias if set, or EID behaviour if alias is not set..
+        "p__EID__": "__EID__",      # Use hostname 'CT-[resource-id].[port-name]'
+    }),
+    "SetPortDhcpVendorId": ("Enum", {
+        "NA": "NA",               # Do not change from current value.
+        "NONE": "NONE",           # Do not use dhcp vendor ID
+        "p_string_": "[string]",  # Use the string for the vendor ID.
+    }),
+    "SetPortFlags2": ("IntFlag", {
+        "bypass_disconnect": 0x200,  # Logically disconnect the cable (link-down)
+        "bypass_enabled": 0x10,      # Enable Bypass Device
+        "bypass_power_down": 0x80,   # Should bypass be on when we shutdown or loose power?
+        "bypass_power_on": 0x100,    # Should bypass be on when we first power up?
+        "supports_bypass": 0x2,      # Support Bypass Devices
+        "use_stp": 0x1,              # Use Spanning Tree Protocol
+    }),
+    "SetPortInterest": ("IntFlag", {
+        "alias": 0x1000,                # Port alias
+        "aux_mgt": 0x20000000,          # Enable/disable Auxillary-Management for a port
+        "bridge": 0x10000,              # BRIDGE
+        "bypass": 0x40000,              # Bypass
+        "command_flags": 0x1,           # apply command flags
+        "cpu_mask": 0x100000,           # CPU Mask, useful for pinning process to CPU core
+        "current_flags": 0x2,           # apply current flags
+        "dhcp": 0x4000,                 # including client-id.
+        "dhcp_rls": 0x4000000,          # DHCP release
+        "dhcpv6": 0x1000000,            # Use DHCPv6
+        "gen_offload": 0x80000,         # Generic offload flags, everything but LRO
+        "ifdown": 0x800000,             # Down interface
+        "interal_use_1": 0x800,         # (INTERNAL USE)
+        "ip_Mask": 0x8,                 # IP mask
+        "ip_address": 0x4,              # IP address
+        "ip_gateway": 0x10,             # IP gateway
+        "ipv6_addrs": 0x20000,          # IPv6 Address
+        "link_speed": 0x80,             # Link speed
+        "lro_offload": 0x200000,        # LRO (Must be disabled when used in Wanlink,
+        "mac_address": 0x20,            # MAC address
+        "mtu": 0x100,                   # MTU
+        "no_apply_dhcp": 0x80000000,    # Enable/disable NO-APPLY-DHCP flag for a port
+        "no_dhcp_conn": 0x40000000,     # Enable/disable NO-DHCP-ON-CONNECT flag for a port
+        "promisc_mode": 0x400,          # PROMISC mode
+        "rpt_timer": 0x8000,            # Report Timer
+        "rx_all": 0x2000,               # Rx-ALL
+        "rxfcs": 0x2000000,             # RXFCS
+        "skip_ifup_roam": 0x100000000,  # Enable/disable SKIP-IFUP-ON-ROAM flag for a port
+        "sta_br_id": 0x400000,          # WiFi Bridge identifier. 0 means no bridging.
+        "supported_flags": 0x40,        # apply supported flags
+        "svc_ftpd": 0x10000000,         # Enable/disable FTP Service for a port
+        "svc_httpd": 0x8000000,         # Enable/disable HTTP Service for a port
+        "tx_queue_length": 0x200,       # TX Queue Length
+    }),
+    # <CLI-JSON/SET_RESOURCE>
+    "SetResourceResourceFlags": ("Enum", {
+        "skip_load_db_on_start": 1,  # Should we skip loading the DB on start?
+    }),
+    # <CLI-JSON/SET_RFGEN>
+    "SetRfgenRfgenFlags": ("IntFlag", {
+        "one_burst": 0x8,  # Run for about 1 second and stop. Uses 5-sec sweep time for single pulse train.
+        "running": 0x2,    # Should we start the RF Generator or not?
+    }),
+    # <CLI-JSON/SET_SCRIPT>
+    "SetScriptFlags": ("IntFlag", {
+        "SCR_COMPLETED": 0x80,           # Set automatically by LANforge.
+        "SCR_HIDE_CONSTRAINTS": 0x2000,  # Hide constraints messages.
+        "SCR_HIDE_CSV": 0x20,            # Don't print the CSV data in the report.
+        "SCR_HIDE_HUNT": 0x800,          # Hide the individual hunt steps..just show results.
+        "SCR_HIDE_ITER_DETAILS": 0x8,    # Hide iteration detail reports.
+        "SCR_HIDE_LAT": 0x1000,          # Hide latency distribution reports.
+        "SCR_HIDE_LEGEND": 0x10,         # Don't print the legend in the report.
+        "SCR_LOOP": 0x100,               # Loop script until manually stopped.
+        "SCR_NO_KEYED_RPT": 0x2,         # Script should NOT send reports to the CLI/GUI.
+        "SCR_RUN_ON_MGR": 0x40,          # Set automatically by LANforge.
+        "SCR_SHOW_ATTENUATION": 0x4000,  # Show attenuation packet stats.
+        "SCR_SHOW_DUPS": 0x200,          # Report duplicate packets.
+        "SCR_SHOW_GOLDEN_3P": 0x20000,   # Add 'golden' third-party AP graph for comparison (where available).
+        "SCR_SHOW_GOLDEN_LF": 0x10000,   # Add 'golden' LANforge graph for comparison (where available).
+        "SCR_SHOW_OOO": 0x400,           # Report out-of-order packets.
+        "SCR_STOPPED": 0x1,              # Script should NOT have any affect on the endpoint.
+        "SCR_SYMMETRIC": 0x4,            # This script should apply settings to the peer endpoing as well.
+        "SCR_USE_MSS": 0x8000,           # When setting packet size, set TCP MSS instead if endpoint supports
+    }),
+    "SetScriptType": ("Enum", {
+        "NONE": "NONE",                # Delete any existing script.
+        "Script2544": "Script2544",    # For RFC 2544 type testing.
+        "ScriptAtten": "ScriptAtten",  # For Attenuators only.
+        "ScriptHunt": "ScriptHunt",    # Hunt for maximum speed with constraints.
+        "ScriptWL": "ScriptWL",        # For iterating through WanLink settings
+    }),
+    # <CLI-JSON/SET_WANLINK_PCAP>
+    "SetWanlinkPcapCapture": ("Enum", {
+        "OFF": "OFF",  # stop capturing
+        "ON": "ON",    # start capturing
+    }),
+    # <CLI-JSON/SET_WANPATH_CORRUPTION>
+    "SetWanpathCorruptionFlags": ("IntFlag", {
+        "BIT_FLIP": 0x4,          # Flip a random bit in a byte.
+        "BIT_TRANSPOSE": 0x8,     # Transpose two side-by-side bits in a byte.
+        "DO_CHAIN_ON_HIT": 0x10,  # Do next corruption if this corruption is applied.
+        "OVERWRITE_FIXED": 0x2,   # Write a fixed value to a byte.
+        "OVERWRITE_RANDOM": 0x1,  # Write a random value to a byte.
+        "RECALC_CSUMS": 0x20,     # Attempt to re-calculate UDP and TCP checksums.
+    }),
+    # <CLI-JSON/SET_WANPATH_RUNNING>
+    "SetWanpathRunningRunning": ("Enum", {
+        "AS_PARENT": "AS_PARENT",  # then it will be started and stopped as the parent WanLink is.
+        "RUNNING": "RUNNING",      # then it will be running at all times
+        "STOPPED": "STOPPED",      # then it will not be running at any time.
+    }),
+    # <CLI-JSON/SET_WIFI_CORRUPTIONS>
+    "SetWifiCorruptionsCorruptFlags": ("IntFlag", {
+        "MSG_TYPE_DEAUTH": 0x2,               # de-authentication message
+        "MSG_TYPE_EAPOL": 0x1,                # Any EAPOL message
+        "MSG_TYPE_EAPOL_1_OF_2": 0x40,        # EAPOL message 1/2
+        "MSG_TYPE_EAPOL_1_OF_4": 0x4,         # EAPOL message 1/4
+        "MSG_TYPE_EAPOL_2_OF_2": 0x80,        # EAPOL message 2/2
+        "MSG_TYPE_EAPOL_2_OF_4": 0x8,         # EAPOL message 2/4
+        "MSG_TYPE_EAPOL_3_OF_4": 0x10,        # EAPOL message 3/4
+        "MSG_TYPE_EAPOL_4_OF_4": 0x20,        # EAPOL message 4/4
+        "MSG_TYPE_EAPOL_ASSOC": 0x200,        # EAP Association
+        "MSG_TYPE_EAPOL_KEY_REQ": 0x100,      # EAP Key Request (not sure if this works properly)
+        "MST_TYPE_EAPOL_ID_REQ": 0x400,       # EAP Identity request
+        "MST_TYPE_EAPOL_ID_RESP": 0x800,      # EAP Identity response
+        "MST_TYPE_EAPOL_OTHER_REQ": 0x1000,   # EAP Requests that do not match other things.
+        "MST_TYPE_EAPOL_OTHER_RESP": 0x2000,  # EAP Responses that do not match other things.
+    }),
+    # <CLI-JSON/SET_WIFI_RADIO>
+    "SetWifiRadioFlags": ("IntFlag", {
+        "ct_sta_mode": 0x40000,    # Enable CT-STA mode if radio supports it. Efficiently replaces sw-crypt in
+        "firmware_cfg": 0x80000,   # Apply firmware config.
+        "hw_sim": 0x1,             # Create hw-sim virtual radio if radio does not already exist.
+        "ignore_radar": 0x100000,  # Ignore RADAR events reported by firmware.
+        "no_scan_share": 0x40,     # Disable sharing scan results.
+        "no_sw_crypt": 0x20000,    # Disable software-crypt for this radio. Disables some virtual-station
+        "use_syslog": 0x20000000,  # Put supplicant logs in syslog instead of a file.
+        "verbose": 0x10000,        # Verbose-Debug: Increase debug info in wpa-supplicant and hostapd logs.
+    }),
+    "SetWifiRadioMode": ("Enum", {
+        "p_802_11a": 1,  # 802.11a
+        "AUTO": 0,       # 802.11g
+        "aAX": 15,       # 802.11a-AX (6E disables /n and /ac)
+        "abg": 4,        # 802.11abg
+        "abgn": 5,       # 802.11abgn
+        "abgnAC": 8,     # 802.11abgn-AC
+        "abgnAX": 12,    # 802.11abgn-AX
+        "an": 10,        # 802.11an
+        "anAC": 9,       # 802.11an-AC
+        "anAX": 14,      # 802.11an-AX
+        "b": 2,          # 802.11b
+        "bg": 7,         # 802.11bg
+        "bgn": 6,        # 802.11bgn
+        "bgnAC": 11,     # 802.11bgn-AC
+        "bgnAX": 13,     # 802.11bgn-AX
+        "g": 3,          # 802.11g
+    }),
+    # <CLI-JSON/SET_WL_CORRUPTION>
+    "SetWlCorruptionFlags": ("IntFlag", {
+        "BIT_FLIP": 0x4,          # Flip a random bit in a byte.
+        "BIT_TRANSPOSE": 0x8,     # Transpose two side-by-side bits in a byte.
+        "DO_CHAIN_ON_HIT": 0x10,  # Do next corruption if this corruption is applied.
+        "OVERWRITE_FIXED": 0x2,   # Write a fixed value to a byte.
+        "OVERWRITE_RANDOM": 0x1,  # Write a random value to a byte.
+        "RECALC_CSUMS": 0x20,     # Attempt to re-calculate UDP and TCP checksums.
+    }),
+    # <CLI-JSON/SET_WL_QDISC>
+    "SetWlQdiscQdisc": ("Enum", {
+        "FIFO": "FIFO",                                    # is the default queuing discipline, no arguments
+        "WRR__queue_queue_____": "WRR,[queue,queue,...]",  # Weighted Round Robbin is also available
+    }),
+}
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ARM_INFO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_arm_info
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_arm_info(self, 
+                      arm_flags: str = None,      # Armageddon-related flags, see above for details.
+                      burst: str = None,          # Burst amount, can significantly improve throughput with some
+                      # modern drivers, similar to 'multi_pkts', and uses the
+                      # 'xmit_more' linux skb option.
+                      dst_mac: str = None,        # The destination MAC address.
+                      dst_mac_count: str = None,  # How many destination MACs to iterate through.
+                      ip_dst_max: str = None,     # Maximum destination IP address to use.
+                      ip_dst_min: str = None,     # Minimum destination IP address to use.
+                      ip_src_max: str = None,     # Maximum source IP address to use.
+                      ip_src_min: str = None,     # Minimum source IP address to use.
+                      max_pkt_size: str = None,   # Maximum packet size, including all Ethernet headers (but not
+                      # CRC).
+                      min_pkt_size: str = None,   # Minimum packet size, including all Ethernet headers (but not
+                      # CRC).
+                      multi_pkts: str = None,     # The number of identical packets to send before creating a new
+                      # one.
+                      name: str = None,           # Name of the Endpoint we are setting. [R]
+                      pkts_to_send: str = None,   # The number of packets to send. Set to zero for infinite.
+                      src_mac: str = None,        # The source MAC address.
+                      src_mac_count: str = None,  # How many source MACs to iterate through.
+                      udp_dst_max: str = None,    # Minimum destination UDP port.
+                      udp_dst_min: str = None,    # Minimum destination UDP port.
+                      udp_src_max: str = None,    # Maximum source UDP port.
+                      udp_src_min: str = None,    # Minimum source UDP port.
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_arm_info(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if arm_flags is not None:
+        data["arm_flags"] = arm_flags
+    if burst is not None:
+        data["burst"] = burst
+    if dst_mac is not None:
+        data["dst_mac"] = dst_mac
+    if dst_mac_count is not None:
+        data["dst_mac_count"] = dst_mac_count
+    if ip_dst_max is not None:
+        data["ip_dst_max"] = ip_dst_max
+    if ip_dst_min is not None:
+        data["ip_dst_min"] = ip_dst_min
+    if ip_src_max is not None:
+        data["ip_src_max"] = ip_src_max
+    if ip_src_min is not None:
+        data["ip_src_min"] = ip_src_min
+    if max_pkt_size is not None:
+        data["max_pkt_size"] = max_pkt_size
+    if min_pkt_size is not None:
+        data["min_pkt_size"] = min_pkt_size
+    if multi_pkts is not None:
+        data["multi_pkts"] = multi_pkts
+    if name is not None:
+        data["name"] = name
+    if pkts_to_send is not None:
+        data["pkts_to_send"] = pkts_to_send
+    if src_mac is not None:
+        data["src_mac"] = src_mac
+    if src_mac_count is not None:
+        data["src_mac_count"] = src_mac_count
+    if udp_dst_max is not None:
+        data["udp_dst_max"] = udp_dst_max
+    if udp_dst_min is not None:
+        data["udp_dst_min"] = udp_dst_min
+    if udp_src_max is not None:
+        data["udp_src_max"] = udp_src_max
+    if udp_src_min is not None:
+        data["udp_src_min"] = udp_src_min
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_arm_info",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ATTENUATOR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_attenuator
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_attenuator(self, 
+                        atten_idx: str = None,          # Attenuator index, or 'all'. [W]
+                        mode: str = None,               # 0 == normal attenuator, 1 == pulse mode (API Tech 4205A
+                        # modules directly connected via USB only)
+                        pulse_count: str = None,        # Number of pulses (0-255)
+                        pulse_interval_ms: str = None,  # Time between pulses, in mili-seconds (0-60000).
+                        pulse_time_ms: str = None,      # Time interval between pulse groups in miliseconds
+                        # (1-60000)
+                        pulse_width_us5: str = None,    # Pulse width in units of 1/2 micro second. So, if you want
+                        # 1.5us, use value 3 (0-60000)
+                        resource: int = None,           # Resource number. [W]
+                        serno: str = None,              # Serial number for requested Attenuator, or 'all'. [W]
+                        shelf: int = 1,                 # Shelf number, usually 1. [R][D:1]
+                        val: str = None,                # Requested attenution in 1/10ths of dB (ddB). [W]
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_attenuator(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if atten_idx is not None:
+        data["atten_idx"] = atten_idx
+    if mode is not None:
+        data["mode"] = mode
+    if pulse_count is not None:
+        data["pulse_count"] = pulse_count
+    if pulse_interval_ms is not None:
+        data["pulse_interval_ms"] = pulse_interval_ms
+    if pulse_time_ms is not None:
+        data["pulse_time_ms"] = pulse_time_ms
+    if pulse_width_us5 is not None:
+        data["pulse_width_us5"] = pulse_width_us5
+    if resource is not None:
+        data["resource"] = resource
+    if serno is not None:
+        data["serno"] = serno
+    if shelf is not None:
+        data["shelf"] = shelf
+    if val is not None:
+        data["val"] = val
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_attenuator",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_CHAMBER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_chamber
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_chamber(self, 
+                     chamber: str = None,       # Chamber name [W]
+                     cur_rotation: str = None,  # Primarily used to store the last known rotation for turntables
+                     # that do not report absolute position.
+                     position: str = None,      # Absolute position in degrees.
+                     speed_rpm: str = None,     # Speed in rpm (floating point number is accepted
+                     tilt: str = None,          # Absolute tilt in degrees.
+                     turntable: str = None,     # Turn-table address, for instance: 192.168.1.22:3001
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_chamber(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if chamber is not None:
+        data["chamber"] = chamber
+    if cur_rotation is not None:
+        data["cur_rotation"] = cur_rotation
+    if position is not None:
+        data["position"] = position
+    if speed_rpm is not None:
+        data["speed_rpm"] = speed_rpm
+    if tilt is not None:
+        data["tilt"] = tilt
+    if turntable is not None:
+        data["turntable"] = turntable
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_chamber",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_CX_REPORT_TIMER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_cx_report_timer
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_cx_report_timer(self, 
+                             cx_name: str = None,       # Name of cross-connect, or 'all'. [W]
+                             cxonly: str = None,        # If you want to set the timer for ONLY the CX, and not
+                             milliseconds: str = None,  # Report timer length in milliseconds.
+                             # [W,250-60000][D:5000]
+                             test_mgr: str = None,      # Name of the test manager, or 'all'. [W]
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_cx_report_timer(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if cxonly is not None:
+        data["cxonly"] = cxonly
+    if milliseconds is not None:
+        data["milliseconds"] = milliseconds
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_cx_report_timer",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_CX_STATE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_cx_state
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_cx_state(self, 
+                      cx_name: str = None,   # Name of the cross-connect, or 'all'. [W]
+                      cx_state: str = None,  # One of: RUNNING, SWITCH, QUIESCE, STOPPED, or DELETED. [W]
+                      test_mgr: str = None,  # Name of the test-manager, or 'all'. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_cx_state(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if cx_state is not None:
+        data["cx_state"] = cx_state
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_cx_state",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_ADDR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_addr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_addr(self, 
+                       ip: str = None,        # The IP Address. Used for TCP/IP and UDP/IP protocols.
+                       mac: str = None,       # The MAC address. Only needed for LANforge protocol Endpoints.
+                       max_port: str = None,  # The Maximum IP Port. Used for TCP/IP and UDP/IP protocols.
+                       min_port: str = None,  # The Minimum IP Port. Used for TCP/IP and UDP/IP protocols.
+                       name: str = None,      # The name of the endpoint we are configuring. [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_addr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ip is not None:
+        data["ip"] = ip
+    if mac is not None:
+        data["mac"] = mac
+    if max_port is not None:
+        data["max_port"] = max_port
+    if min_port is not None:
+        data["min_port"] = min_port
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_addr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_DETAILS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_details
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_details(self, 
+                          conn_timeout: str = None,      # For TCP, the max time in miliseconds to wait for
+                          # connection to establish.
+                          dst_mac: str = None,           # Destination MAC address, used for custom Ethernet
+                          # replays.
+                          max_conn_timer: str = None,    # The maximum duration (in ms) this connection should run
+                          # before re-establishing.
+                          max_ip_port: str = None,       # The maximum IP Port value. (The value for min ip port is
+                          # set through the add_endp/ip_port parameter.) If greater
+                          # than min, each connection will use a random value
+                          # between min and max.
+                          max_reconn_pause: str = None,  # The maximum time between re-connects, in ms.
+                          mcast_src_ip: str = None,      # Multicast source address (used in SSM mode, multicast
+                          # endpoints only)
+                          mcast_src_port: str = None,    # Multicast source address (used in SSM mode, multicast
+                          # endpoints only)
+                          min_conn_timer: str = None,    # The minimum duration (in ms) this connection should run
+                          # before re-establishing.
+                          min_reconn_pause: str = None,  # The minimum time between re-connects, in ms.
+                          name: str = None,              # The name of the endpoint we are configuring. [R]
+                          pkts_to_send: str = None,      # Number of packets to send before stopping. 0 means
+                          # infinite.
+                          rcvbuf_size: str = None,       # The receive buffer (window) size. Zero for AUTO
+                          sndbuf_size: str = None,       # The sending buffer (window) size. Zero for AUTO
+                          tcp_delack_segs: str = None,   # NA: No longer supported.
+                          tcp_max_delack: str = None,    # NA: No longer supported.
+                          tcp_min_delack: str = None,    # NA: No longer supported.
+                          tcp_mss: str = None,           # TCP Maximum Segment Size, affects packet size on the
+                          # wire (88 - 32767).
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_details(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if conn_timeout is not None:
+        data["conn_timeout"] = conn_timeout
+    if dst_mac is not None:
+        data["dst_mac"] = dst_mac
+    if max_conn_timer is not None:
+        data["max_conn_timer"] = max_conn_timer
+    if max_ip_port is not None:
+        data["max_ip_port"] = max_ip_port
+    if max_reconn_pause is not None:
+        data["max_reconn_pause"] = max_reconn_pause
+    if mcast_src_ip is not None:
+        data["mcast_src_ip"] = mcast_src_ip
+    if mcast_src_port is not None:
+        data["mcast_src_port"] = mcast_src_port
+    if min_conn_timer is not None:
+        data["min_conn_timer"] = min_conn_timer
+    if min_reconn_pause is not None:
+        data["min_reconn_pause"] = min_reconn_pause
+    if name is not None:
+        data["name"] = name
+    if pkts_to_send is not None:
+        data["pkts_to_send"] = pkts_to_send
+    if rcvbuf_size is not None:
+        data["rcvbuf_size"] = rcvbuf_size
+    if sndbuf_size is not None:
+        data["sndbuf_size"] = sndbuf_size
+    if tcp_delack_segs is not None:
+        data["tcp_delack_segs"] = tcp_delack_segs
+    if tcp_max_delack is not None:
+        data["tcp_max_delack"] = tcp_max_delack
+    if tcp_min_delack is not None:
+        data["tcp_min_delack"] = tcp_min_delack
+    if tcp_mss is not None:
+        data["tcp_mss"] = tcp_mss
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_details",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_FILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_file
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_file(self, 
+                       file: str = None,      # The file name to read the playback packets from.
+                       name: str = None,      # The name of the endpoint we are configuring. [R]
+                       playback: str = None,  # Should we playback the capture or not? ON or OFF. [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_file(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if file is not None:
+        data["file"] = file
+    if name is not None:
+        data["name"] = name
+    if playback is not None:
+        data["playback"] = playback
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_file",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_FLAG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_flag
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_flag(self, 
+                       flag: str = None,  # The name of the flag. [R]
+                       name: str = None,  # The name of the endpoint we are configuring. [R]
+                       val: str = None,   # Either 1 (for on), or 0 (for off). [R,0-1]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_flag(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if flag is not None:
+        data["flag"] = flag
+    if name is not None:
+        data["name"] = name
+    if val is not None:
+        data["val"] = val
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_flag",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_PAYLOAD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_payload
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_payload(self, 
+                          name: str = None,          # The name of the endpoint we are configuring. [R]
+                          payload: str = None,       # For custom payloads, enter the payload in hex, up to 2048
+                          # bytes. <tt escapearg='false'>Unescaped Value</tt>
+                          payload_type: str = None,  # The payload type. See help for add_endp. [W][D:increasing]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_payload(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if payload is not None:
+        data["payload"] = payload
+    if payload_type is not None:
+        data["payload_type"] = payload_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_payload",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_PLD_BOUNDS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_pld_bounds
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_pld_bounds(self, 
+                             is_random: str = None,     # YES if random, anything else for NO.
+                             max_pld_size: str = None,  # The maximum payload size, in bytes.
+                             min_pld_size: str = None,  # The minimum payload size, in bytes.
+                             name: str = None,          # The name of the endpoint we are configuring. [R]
+                             use_checksum: str = None,  # YES if use checksum on payload, anything else for NO.
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_pld_bounds(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if is_random is not None:
+        data["is_random"] = is_random
+    if max_pld_size is not None:
+        data["max_pld_size"] = max_pld_size
+    if min_pld_size is not None:
+        data["min_pld_size"] = min_pld_size
+    if name is not None:
+        data["name"] = name
+    if use_checksum is not None:
+        data["use_checksum"] = use_checksum
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_pld_bounds",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_PROXY> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_proxy
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_proxy(self, 
+                        enabled: str = None,        # YES or NO to enable or disable proxying.
+                        endp_name: str = None,      # Name of endpoint. [W]
+                        proxy_ip: str = None,       # Proxy IP Address.
+                        proxy_ip_port: str = None,  # Proxy IP Port.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_proxy(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if enabled is not None:
+        data["enabled"] = enabled
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if proxy_ip is not None:
+        data["proxy_ip"] = proxy_ip
+    if proxy_ip_port is not None:
+        data["proxy_ip_port"] = proxy_ip_port
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_proxy",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_QUIESCE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_quiesce
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_quiesce(self, 
+                          name: str = None,     # The name of the endpoint we are configuring. [R]
+                          quiesce: str = None,  # The number of seconds to quiesce this endpoint when told to
+                          # quiesce. [R]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_quiesce(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if quiesce is not None:
+        data["quiesce"] = quiesce
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_quiesce",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_REPORT_TIMER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_report_timer
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_report_timer(self, 
+                               endp_name: str = None,     # Name of endpoint. [R]
+                               milliseconds: str = None,  # Report timer length in milliseconds.
+                               # [W,250-60000][D:5000]
+                               debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_report_timer(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp_name is not None:
+        data["endp_name"] = endp_name
+    if milliseconds is not None:
+        data["milliseconds"] = milliseconds
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_report_timer",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_TOS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_tos
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_tos(self, 
+                      name: str = None,      # The name of the endpoint we are configuring. [R]
+                      priority: str = None,  # The socket priority, can be any positive number.
+                      tos: str = None,       # The Type of Service, can be HEX, see above.
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_tos(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if priority is not None:
+        data["priority"] = priority
+    if tos is not None:
+        data["tos"] = tos
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_tos",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_ENDP_TX_BOUNDS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_endp_tx_bounds
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_endp_tx_bounds(self, 
+                            is_bursty: str = None,    # YES if bursty, anything else for NO.
+                            max_tx_rate: str = None,  # The maximum transmit rate, in bits per second (bps).
+                            min_tx_rate: str = None,  # The minimum transmit rate, in bits per second (bps).
+                            name: str = None,         # The name of the endpoint we are configuring. [R]
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_endp_tx_bounds(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if is_bursty is not None:
+        data["is_bursty"] = is_bursty
+    if max_tx_rate is not None:
+        data["max_tx_rate"] = max_tx_rate
+    if min_tx_rate is not None:
+        data["min_tx_rate"] = min_tx_rate
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_endp_tx_bounds",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_EVENT_INTEREST> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_event_interest
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_event_interest(self, 
+                            ei_flags: str = None,   # Event Interest flags, see above. [W]
+                            event_cnt: str = None,  # Maximum number of events to store.
+                            events1: str = None,    # See description for possible values.
+                            events2: str = None,    # See description for possible values.
+                            events3: str = None,    # See description for possible values.
+                            events4: str = None,    # See description for possible values.
+                            var1: str = None,       # Currently un-used.
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_event_interest(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ei_flags is not None:
+        data["ei_flags"] = ei_flags
+    if event_cnt is not None:
+        data["event_cnt"] = event_cnt
+    if events1 is not None:
+        data["events1"] = events1
+    if events2 is not None:
+        data["events2"] = events2
+    if events3 is not None:
+        data["events3"] = events3
+    if events4 is not None:
+        data["events4"] = events4
+    if var1 is not None:
+        data["var1"] = var1
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_event_interest",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_EVENT_PRIORITY> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_event_priority
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_event_priority(self, 
+                            event: str = None,     # Number or name for the event, see above. [R,0-21]
+                            priority: str = None,  # Number or name for the priority. [R,0-5]
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_event_priority(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if event is not None:
+        data["event"] = event
+    if priority is not None:
+        data["priority"] = priority
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_event_priority",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_FE_INFO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_fe_info
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_fe_info(self, 
+                     directory: str = None,            # The directory to read/write in. Absolute path suggested.
+                     io_direction: str = None,         # Should we be reading or writing: options: read, write
+                     max_file_size: str = None,        # The maximum file size, in bytes.
+                     max_rw_sz: str = None,            # Maximum read/write size, in bytes.
+                     min_file_size: str = None,        # The minimum file size, in bytes.
+                     min_rw_sz: str = None,            # Minimum read/write size, in bytes.
+                     name: str = None,                 # The name of the file endpoint we are configuring. [R]
+                     num_files: str = None,            # Number of files to create when writing.
+                     prefix: str = None,               # The prefix of the file(s) to read/write.
+                     quiesce_after_files: str = None,  # If non-zero, quiesce test after this many files have been
+                     # read/written.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_fe_info(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if directory is not None:
+        data["directory"] = directory
+    if io_direction is not None:
+        data["io_direction"] = io_direction
+    if max_file_size is not None:
+        data["max_file_size"] = max_file_size
+    if max_rw_sz is not None:
+        data["max_rw_sz"] = max_rw_sz
+    if min_file_size is not None:
+        data["min_file_size"] = min_file_size
+    if min_rw_sz is not None:
+        data["min_rw_sz"] = min_rw_sz
+    if name is not None:
+        data["name"] = name
+    if num_files is not None:
+        data["num_files"] = num_files
+    if prefix is not None:
+        data["prefix"] = prefix
+    if quiesce_after_files is not None:
+        data["quiesce_after_files"] = quiesce_after_files
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_fe_info",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_FLAG> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_flag
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_flag(self, 
+                  client: str = None,  # Specify the user, if it is not the current user. Requires admin
+                  # privileges.
+                  flag: str = None,    # The name of the flag. [R]
+                  val: str = None,     # Either 1 (for on), or 0 (for off). [R,0-1]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_flag(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if client is not None:
+        data["client"] = client
+    if flag is not None:
+        data["flag"] = flag
+    if val is not None:
+        data["val"] = val
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_flag",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_GEN_CMD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_gen_cmd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_gen_cmd(self, 
+                     command: str = None,  # The rest of the command line arguments. <tt
+                     # escapearg='false'>Unescaped Value</tt> [R]
+                     name: str = None,     # The name of the file endpoint we are configuring. [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_gen_cmd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if command is not None:
+        data["command"] = command
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_gen_cmd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_GPS_INFO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_gps_info
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_gps_info(self, 
+                      altitude: str = None,   # Altitude, assumes units are Meters.
+                      ew: str = None,         # East or west (Longitude).
+                      lattitude: str = None,  # The lattitude, as read from a GPS device.
+                      longitude: str = None,  # The longitude, as ready from a GPS device.
+                      ns: str = None,         # North or South (Latitude).
+                      resource: int = None,   # Resource number for the port to be modified. [W]
+                      shelf: int = 1,         # Shelf number for the port to be modified, or SELF. [R][D:1]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_gps_info(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if altitude is not None:
+        data["altitude"] = altitude
+    if ew is not None:
+        data["ew"] = ew
+    if lattitude is not None:
+        data["lattitude"] = lattitude
+    if longitude is not None:
+        data["longitude"] = longitude
+    if ns is not None:
+        data["ns"] = ns
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_gps_info",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_IFUP_SCRIPT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_ifup_script
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_ifup_script(self, 
+                         flags: str = None,             # Currently un-defined, use NA
+                         port: str = None,              # WiFi interface name or number. [W]
+                         post_ifup_script: str = None,  # Script name with optional args, will run after interface
+                         # comes up and gets IP.
+                         resource: int = None,          # Resource number. [W]
+                         shelf: int = 1,                # Shelf number. [R][D:1]
+                         debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_ifup_script(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if flags is not None:
+        data["flags"] = flags
+    if port is not None:
+        data["port"] = port
+    if post_ifup_script is not None:
+        data["post_ifup_script"] = post_ifup_script
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_ifup_script",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_LICENSE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_license
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_license(self, 
+                     licenses: str = None,  # License keys all appended into a single line. <tt
+                     # escapearg='false'>Unescaped Value</tt> [W]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_license(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if licenses is not None:
+        data["licenses"] = licenses
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_license",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_MC_ENDP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_mc_endp
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_mc_endp(self, 
+                     mcast_dest_port: str = None,  # Multicast destination IP Port, for example: 55000
+                     mcast_group: str = None,      # Multicast group IP, ie: 224.1.1.2 IPv6 supported as well.
+                     name: str = None,             # The name of the endpoint we are configuring. [R]
+                     rcv_mcast: str = None,        # Should we attempt to receive? Values: Yes or No
+                     ttl: str = None,              # Time to live for the multicast packets generated.
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_mc_endp(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if mcast_dest_port is not None:
+        data["mcast_dest_port"] = mcast_dest_port
+    if mcast_group is not None:
+        data["mcast_group"] = mcast_group
+    if name is not None:
+        data["name"] = name
+    if rcv_mcast is not None:
+        data["rcv_mcast"] = rcv_mcast
+    if ttl is not None:
+        data["ttl"] = ttl
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_mc_endp",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_PASSWORD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_password
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_password(self, 
+                      client: str = None,        # Specify the client. If left blank, will use current client.
+                      new_password: str = None,  # New password, or 'NA' for blank password. [W]
+                      old_password: str = None,  # Old password, or 'NA' for blank password. [W]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_password(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if client is not None:
+        data["client"] = client
+    if new_password is not None:
+        data["new_password"] = new_password
+    if old_password is not None:
+        data["old_password"] = old_password
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_password",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_POLL_MODE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_poll_mode
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_poll_mode(self, 
+                       mode: str = None,  # 'polling' or 'push'. [R]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_poll_mode(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if mode is not None:
+        data["mode"] = mode
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_poll_mode",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_PORT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_port
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_port(self, 
+                  alias: str = None,                # A user-defined name for this interface. Can be BLANK or NA.
+                  br_aging_time: str = None,        # MAC aging time, in seconds, 32-bit number (or peer IP for
+                  # GRE).
+                  br_forwarding_delay: str = None,  # How long to wait until the bridge will start forwarding
+                  # packets.
+                  br_hello_time: str = None,        # How often does the bridge send out STP hello packets.
+                  br_max_age: str = None,           # How long until STP considers a non-responsive bridge dead.
+                  br_port_cost: str = None,         # STP Port cost for a port (this applies only to NON-BRIDGE
+                  # interfaces).
+                  br_port_priority: str = None,     # STP Port priority for a port (this applies only to NON-BRIDGE
+                  # interfaces).
+                  br_priority: str = None,          # Bridge priority, 16-bit number.
+                  bypass_wdt: str = None,           # Watch Dog Timer (in seconds) for this port. Zero (0) to
+                  # disable.
+                  cmd_flags: str = None,            # Command Flags: See above, or NA.
+                  cpu_mask: str = None,             # CPU Mask for CPUs that should service this interface. Zero is
+                  # don't set (let OS make the decision). This value will be
+                  # applied to the proper /proc/irq/[irq-num]/smp_affinity file by
+                  # the pin_irq.pl script.
+                  current_flags: str = None,        # See above, or NA.
+                  current_flags_msk: str = None,    # This sets 'interest' for flags 'Enable RADIUS service' and
+                  # higher. See above, or NA.
+                  dhcp_client_id: str = None,       # Optional string of up to 63 bytes in length to be passed to
+                  # the dhclient process. See above.
+                  dhcp_hostname: str = None,        # Optional string of up to 63 bytes in length to be passed to
+                  # the dhclient process. Option 12, see above.
+                  dhcp_vendor_id: str = None,       # Optional string of up to 63 bytes in length to be passed to
+                  # the dhclient process. See above.
+                  dns_servers: str = None,          # DNS servers for use by traffic on this port, comma-separated
+                  # list, BLANK means zero-length string.
+                  flags2: str = None,               # Bridge &amp; other flags, see above.
+                  gateway: str = None,              # IP address of the gateway device - used for IP routing, or NA.
+                  interest: str = None,             # Which things are we really interested in setting. Can
+                  # over-ride defaults based on the other arguments.
+                  ip_addr: str = None,              # IP address for the port, or NA.
+                  ipsec_concentrator: str = None,   # IP Address of IPSec concentrator.
+                  ipsec_local_id: str = None,       # Local Identifier for this IPSec tunnel.
+                  ipsec_passwd: str = None,         # Password for IPSec, for pubkey, use: pubkey:[pem-file-name],
+                  # for instance: pubkey:station.pem
+                  ipsec_remote_id: str = None,      # Remote Identifier for this IPSec tunnel.
+                  ipv6_addr_global: str = None,     # Global scoped IPv6 address.
+                  ipv6_addr_link: str = None,       # Link scoped IPv6 address.
+                  ipv6_dflt_gw: str = None,         # IPv6 default gateway.
+                  mac: str = None,                  # MAC address to set this port to, or leave blank to not set it,
+                  # or NA.
+                  mtu: str = None,                  # Maximum Transmit Unit (MTU) for this interface. Can be blank
+                  # or NA.
+                  netmask: str = None,              # Netmask which this port should use, or NA.
+                  port: str = None,                 # Port number for the port to be modified. [W]
+                  report_timer: int = None,         # How often, in milliseconds, should we poll stats on this
+                  # interface?
+                  resource: int = None,             # Resource number for the port to be modified. [W]
+                  shelf: int = 1,                   # Shelf number for the port to be modified. [R][D:1]
+                  sta_br_id: str = None,            # WiFi STAtion bridge ID. Zero means none.
+                  tx_queue_len: str = None,         # Transmit Queue Length for this interface. Can be blank or NA.
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_port(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if br_aging_time is not None:
+        data["br_aging_time"] = br_aging_time
+    if br_forwarding_delay is not None:
+        data["br_forwarding_delay"] = br_forwarding_delay
+    if br_hello_time is not None:
+        data["br_hello_time"] = br_hello_time
+    if br_max_age is not None:
+        data["br_max_age"] = br_max_age
+    if br_port_cost is not None:
+        data["br_port_cost"] = br_port_cost
+    if br_port_priority is not None:
+        data["br_port_priority"] = br_port_priority
+    if br_priority is not None:
+        data["br_priority"] = br_priority
+    if bypass_wdt is not None:
+        data["bypass_wdt"] = bypass_wdt
+    if cmd_flags is not None:
+        data["cmd_flags"] = cmd_flags
+    if cpu_mask is not None:
+        data["cpu_mask"] = cpu_mask
+    if current_flags is not None:
+        data["current_flags"] = current_flags
+    if current_flags_msk is not None:
+        data["current_flags_msk"] = current_flags_msk
+    if dhcp_client_id is not None:
+        data["dhcp_client_id"] = dhcp_client_id
+    if dhcp_hostname is not None:
+        data["dhcp_hostname"] = dhcp_hostname
+    if dhcp_vendor_id is not None:
+        data["dhcp_vendor_id"] = dhcp_vendor_id
+    if dns_servers is not None:
+        data["dns_servers"] = dns_servers
+    if flags2 is not None:
+        data["flags2"] = flags2
+    if gateway is not None:
+        data["gateway"] = gateway
+    if interest is not None:
+        data["interest"] = interest
+    if ip_addr is not None:
+        data["ip_addr"] = ip_addr
+    if ipsec_concentrator is not None:
+        data["ipsec_concentrator"] = ipsec_concentrator
+    if ipsec_local_id is not None:
+        data["ipsec_local_id"] = ipsec_local_id
+    if ipsec_passwd is not None:
+        data["ipsec_passwd"] = ipsec_passwd
+    if ipsec_remote_id is not None:
+        data["ipsec_remote_id"] = ipsec_remote_id
+    if ipv6_addr_global is not None:
+        data["ipv6_addr_global"] = ipv6_addr_global
+    if ipv6_addr_link is not None:
+        data["ipv6_addr_link"] = ipv6_addr_link
+    if ipv6_dflt_gw is not None:
+        data["ipv6_dflt_gw"] = ipv6_dflt_gw
+    if mac is not None:
+        data["mac"] = mac
+    if mtu is not None:
+        data["mtu"] = mtu
+    if netmask is not None:
+        data["netmask"] = netmask
+    if port is not None:
+        data["port"] = port
+    if report_timer is not None:
+        data["report_timer"] = report_timer
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if sta_br_id is not None:
+        data["sta_br_id"] = sta_br_id
+    if tx_queue_len is not None:
+        data["tx_queue_len"] = tx_queue_len
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_port",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_PORT_ALIAS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_port_alias
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_port_alias(self, 
+                        alias: str = None,     # New alias to assign to this virtual interface. [W]
+                        port: str = None,      # Physical Port identifier that owns the virtual interface. [R]
+                        resource: int = None,  # Resource number for the port to be modified. [W]
+                        shelf: int = 1,        # Shelf number for the port to be modified. [R][D:1]
+                        vport: str = None,     # Virtual port identifier. MAC for MAC-VLANs, VLAN-ID for 802.1Q
+                        # vlans.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_port_alias(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if alias is not None:
+        data["alias"] = alias
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vport is not None:
+        data["vport"] = vport
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_port_alias",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_PPP_LINK_STATE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_ppp_link_state
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_ppp_link_state(self, 
+                            link: str = None,       # Unit Number of the PPP Link, or 'all'. [W]
+                            ppp_state: str = None,  # One of: RUNNING, STOPPED, or DELETED. [R]
+                            resource: int = None,   # Number of the Resource, or 'all'. [W]
+                            shelf: int = 1,         # Name of the Shelf, or 'all'. [R][D:1]
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_ppp_link_state(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if link is not None:
+        data["link"] = link
+    if ppp_state is not None:
+        data["ppp_state"] = ppp_state
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_ppp_link_state",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_RESOURCE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_resource
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_resource(self, 
+                      device_profiles: str = None,      # List of profiles, see above
+                      max_helper_count: str = None,     # Maximum number of helper traffic generation processes. 0
+                      # means CPU-core-count (AUTO).
+                      max_staged_bringup: str = None,   # Maximum amount of interfaces attempting to come up at
+                      # once. Default is 50
+                      max_station_bringup: str = None,  # Maximum amount of stations to bring up per radio per tick.
+                      # Default is 12.
+                      max_trying_ifup: str = None,      # Maximum amount of interfaces running the network config
+                      # 'ifup' logic. Default is 15
+                      resource: int = None,             # Number of the Resource, or <tt>all</tt>. [W]
+                      resource_flags: str = None,       # System wide flags, often requires a reboot for changes to
+                      # take effect.
+                      resource_flags_mask: str = None,  # What flags to change. If unset, default is all.
+                      shelf: int = 1,                   # Name of the Shelf, or <tt>all</tt>. [R][D:1]
+                      top_left_x: str = None,           # X Location for Chamber View.
+                      top_left_y: str = None,           # X Location for Chamber View.
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_resource(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if device_profiles is not None:
+        data["device_profiles"] = device_profiles
+    if max_helper_count is not None:
+        data["max_helper_count"] = max_helper_count
+    if max_staged_bringup is not None:
+        data["max_staged_bringup"] = max_staged_bringup
+    if max_station_bringup is not None:
+        data["max_station_bringup"] = max_station_bringup
+    if max_trying_ifup is not None:
+        data["max_trying_ifup"] = max_trying_ifup
+    if resource is not None:
+        data["resource"] = resource
+    if resource_flags is not None:
+        data["resource_flags"] = resource_flags
+    if resource_flags_mask is not None:
+        data["resource_flags_mask"] = resource_flags_mask
+    if shelf is not None:
+        data["shelf"] = shelf
+    if top_left_x is not None:
+        data["top_left_x"] = top_left_x
+    if top_left_y is not None:
+        data["top_left_y"] = top_left_y
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_resource",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_RFGEN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_rfgen
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_rfgen(self, 
+                   bb_gain: str = None,            # RX Gain, 0 - 62 in 2dB steps
+                   freq_khz: str = None,           # Center frequency in Khz
+                   gain: str = None,               # Main TX/RX Amp, 0 or 14 (dB), default is 14
+                   p_id: str = None,               # RF Generator ID, not used at this time, enter 'NA' or 0.
+                   # [D:NA]
+                   if_gain: str = None,            # Fine-tune TX/RX Gain, 0 - 40 dB
+                   pulse_count: str = None,        # Number of pulses (0-255)
+                   pulse_interval_us: str = None,  # Time between pulses, in micro-seconds.
+                   pulse_width_us: str = None,     # Requested pulse width, units are in micro-seconds.
+                   resource: int = None,           # Resource number. [W]
+                   rfgen_flags: str = None,        # RF Generator flags, see above.
+                   rfgen_flags_mask: str = None,   # Mask of what flags to set, see above.
+                   shelf: int = 1,                 # Shelf number, usually 1. [R][D:1]
+                   sweep_time_ms: str = None,      # Time interval between pulse groups in miliseconds
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_rfgen(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if bb_gain is not None:
+        data["bb_gain"] = bb_gain
+    if freq_khz is not None:
+        data["freq_khz"] = freq_khz
+    if gain is not None:
+        data["gain"] = gain
+    if p_id is not None:
+        data["id"] = p_id
+    if if_gain is not None:
+        data["if_gain"] = if_gain
+    if pulse_count is not None:
+        data["pulse_count"] = pulse_count
+    if pulse_interval_us is not None:
+        data["pulse_interval_us"] = pulse_interval_us
+    if pulse_width_us is not None:
+        data["pulse_width_us"] = pulse_width_us
+    if resource is not None:
+        data["resource"] = resource
+    if rfgen_flags is not None:
+        data["rfgen_flags"] = rfgen_flags
+    if rfgen_flags_mask is not None:
+        data["rfgen_flags_mask"] = rfgen_flags_mask
+    if shelf is not None:
+        data["shelf"] = shelf
+    if sweep_time_ms is not None:
+        data["sweep_time_ms"] = sweep_time_ms
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_rfgen",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_SCRIPT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_script
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_script(self, 
+                    endp: str = None,          # Endpoint, Test Group or Attenuator name or ID. [R]
+                    flags: str = None,         # See above for description of the defined flags.
+                    group_action: str = None,  # How to handle group script operations: ALL, Sequential
+                    loop_count: str = None,    # How many times to loop before stopping (0 is infinite).
+                    name: str = None,          # Script name. [W]
+                    private: str = None,       # Private encoding for the particular script.
+                    p_type: str = None,        # One of: NONE, Script2544, ScriptHunt, ScriptWL, ScriptAtten
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_script(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endp is not None:
+        data["endp"] = endp
+    if flags is not None:
+        data["flags"] = flags
+    if group_action is not None:
+        data["group_action"] = group_action
+    if loop_count is not None:
+        data["loop_count"] = loop_count
+    if name is not None:
+        data["name"] = name
+    if private is not None:
+        data["private"] = private
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_script",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_SEC_IP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_sec_ip
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_sec_ip(self, 
+                    ip_list: str = None,   # IP1/prefix,IP2/prefix,...IPZ/prefix. [W]
+                    port: str = None,      # Name of network device (Port) to which these IPs will be added.
+                    # [R]
+                    resource: int = None,  # Resource number. [W]
+                    shelf: int = 1,        # Shelf number. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_sec_ip(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if ip_list is not None:
+        data["ip_list"] = ip_list
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_sec_ip",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_VOIP_INFO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_voip_info
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_voip_info(self, 
+                       codec: str = None,                # Codec to use for the voice stream, supported values:
+                       # G711U, G711A, SPEEX, g726-16, g726-24, g726-32, g726-40,
+                       # g729a.
+                       first_call_delay: str = None,     # How long to wait before making first call, in seconds.
+                       jitter_buffer_sz: str = None,     # The size of the jitter buffer in packets. Default value
+                       # is 8.
+                       local_sip_port: str = None,       # Local SIP UDP port. Default is min-rtp-port + 2.
+                       loop_call_count: str = None,      # How many calls to make, zero means infinite.
+                       loop_wavefile_count: str = None,  # How many times to play the wave file, zero means
+                       # infinite.
+                       max_call_duration: str = None,    # How long should the call be, in seconds.
+                       max_inter_call_gap: str = None,   # Maximum time to wait between calls, in seconds.
+                       messaging_protocol: str = None,   # Messaging protocol, supported values: SIP.
+                       min_call_duration: str = None,    # How long should the call be, in seconds.
+                       min_inter_call_gap: str = None,   # Minimum time to wait between calls, in seconds.
+                       name: str = None,                 # The name of the endpoint we are configuring. [R]
+                       pesq_server_ip: str = None,       # LANforge PESQ server IP address.
+                       pesq_server_passwd: str = None,   # LANforge PESQ server password. Default is to use no
+                       # authentication (blank entry).
+                       pesq_server_port: str = None,     # LANforge PESQ server port, default is 3998.
+                       reg_expire_timer: str = None,     # SIP Registration expire timer, in seconds.
+                       ringing_timer: str = None,        # How long (milliseconds) to wait in the ringing state
+                       # before flagging call as no-answer.
+                       sound_dev: str = None,            # Which sound device should we play sound to. (see
+                       # set_endp_flags).
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_voip_info(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if codec is not None:
+        data["codec"] = codec
+    if first_call_delay is not None:
+        data["first_call_delay"] = first_call_delay
+    if jitter_buffer_sz is not None:
+        data["jitter_buffer_sz"] = jitter_buffer_sz
+    if local_sip_port is not None:
+        data["local_sip_port"] = local_sip_port
+    if loop_call_count is not None:
+        data["loop_call_count"] = loop_call_count
+    if loop_wavefile_count is not None:
+        data["loop_wavefile_count"] = loop_wavefile_count
+    if max_call_duration is not None:
+        data["max_call_duration"] = max_call_duration
+    if max_inter_call_gap is not None:
+        data["max_inter_call_gap"] = max_inter_call_gap
+    if messaging_protocol is not None:
+        data["messaging_protocol"] = messaging_protocol
+    if min_call_duration is not None:
+        data["min_call_duration"] = min_call_duration
+    if min_inter_call_gap is not None:
+        data["min_inter_call_gap"] = min_inter_call_gap
+    if name is not None:
+        data["name"] = name
+    if pesq_server_ip is not None:
+        data["pesq_server_ip"] = pesq_server_ip
+    if pesq_server_passwd is not None:
+        data["pesq_server_passwd"] = pesq_server_passwd
+    if pesq_server_port is not None:
+        data["pesq_server_port"] = pesq_server_port
+    if reg_expire_timer is not None:
+        data["reg_expire_timer"] = reg_expire_timer
+    if ringing_timer is not None:
+        data["ringing_timer"] = ringing_timer
+    if sound_dev is not None:
+        data["sound_dev"] = sound_dev
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_voip_info",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_VRCX_COST> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_vrcx_cost
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_vrcx_cost(self, 
+                       interface_cost: str = None,  # If using OSPF, this sets the cost for this link (1-65535).
+                       local_dev: str = None,       # Name of port A for the local redirect device pair.
+                       local_dev_b: str = None,     # Name of port B for the local redirect device pair.
+                       remote_dev: str = None,      # Name of port B for the remote redirect device pair.
+                       remote_dev_b: str = None,    # Name of port B for the remote redirect device pair.
+                       resource: int = None,        # Resource number. [W]
+                       shelf: int = 1,              # Shelf name/id. [R][D:1]
+                       vr_name: str = None,         # Virtual Router this endpoint belongs to. Use 'FREE_LIST' to
+                       # add a stand-alone endpoint. [W][D:FREE_LIST]
+                       wanlink: str = None,         # The name of the WanLink that connects the two B ports.
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_vrcx_cost(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if interface_cost is not None:
+        data["interface_cost"] = interface_cost
+    if local_dev is not None:
+        data["local_dev"] = local_dev
+    if local_dev_b is not None:
+        data["local_dev_b"] = local_dev_b
+    if remote_dev is not None:
+        data["remote_dev"] = remote_dev
+    if remote_dev_b is not None:
+        data["remote_dev_b"] = remote_dev_b
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if vr_name is not None:
+        data["vr_name"] = vr_name
+    if wanlink is not None:
+        data["wanlink"] = wanlink
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_vrcx_cost",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WANLINK_INFO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wanlink_info
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wanlink_info(self, 
+                          drop_freq: str = None,              # How often, out of 1,000,000 packets, should we
+                          # purposefully drop a packet.
+                          dup_freq: str = None,               # How often, out of 1,000,000 packets, should we
+                          # purposefully duplicate a packet.
+                          extra_buffer: str = None,           # The extra amount of bytes to buffer before dropping
+                          # pkts, in units of 1024. Use -1 for AUTO.
+                          jitter_freq: str = None,            # How often, out of 1,000,000 packets, should we apply
+                          # jitter.
+                          latency: str = None,                # The base latency added to all packets, in
+                          # milliseconds (or add 'us' suffix for microseconds
+                          max_drop_amt: str = None,           # Maximum amount of packets to drop in a row. Default
+                          # is 1.
+                          max_jitter: str = None,             # The maximum jitter, in milliseconds (or ad 'us'
+                          # suffix for microseconds)
+                          max_lateness: str = None,           # Maximum amount of un-intentional delay before pkt is
+                          # dropped. Default is AUTO
+                          max_reorder_amt: str = None,        # Maximum amount of packets by which to reorder,
+                          # Default is 10.
+                          min_drop_amt: str = None,           # Minimum amount of packets to drop in a row. Default
+                          # is 1.
+                          min_reorder_amt: str = None,        # Minimum amount of packets by which to reorder,
+                          # Default is 1.
+                          name: str = None,                   # The name of the endpoint we are configuring. [R]
+                          playback_capture_file: str = None,  # Name of the WAN capture file to play back.
+                          reorder_freq: str = None,           # How often, out of 1,000,000 packets, should we make a
+                          # packet out of order.
+                          speed: str = None,                  # The maximum speed of traffic this endpoint will
+                          # accept (bps).
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wanlink_info(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if drop_freq is not None:
+        data["drop_freq"] = drop_freq
+    if dup_freq is not None:
+        data["dup_freq"] = dup_freq
+    if extra_buffer is not None:
+        data["extra_buffer"] = extra_buffer
+    if jitter_freq is not None:
+        data["jitter_freq"] = jitter_freq
+    if latency is not None:
+        data["latency"] = latency
+    if max_drop_amt is not None:
+        data["max_drop_amt"] = max_drop_amt
+    if max_jitter is not None:
+        data["max_jitter"] = max_jitter
+    if max_lateness is not None:
+        data["max_lateness"] = max_lateness
+    if max_reorder_amt is not None:
+        data["max_reorder_amt"] = max_reorder_amt
+    if min_drop_amt is not None:
+        data["min_drop_amt"] = min_drop_amt
+    if min_reorder_amt is not None:
+        data["min_reorder_amt"] = min_reorder_amt
+    if name is not None:
+        data["name"] = name
+    if playback_capture_file is not None:
+        data["playback_capture_file"] = playback_capture_file
+    if reorder_freq is not None:
+        data["reorder_freq"] = reorder_freq
+    if speed is not None:
+        data["speed"] = speed
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wanlink_info",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WANLINK_PCAP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wanlink_pcap
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wanlink_pcap(self, 
+                          capture: str = None,    # Should we capture or not? ON or OFF. [R]
+                          directory: str = None,  # The directory name in which packet capture files will be
+                          # written.
+                          name: str = None,       # The name of the endpoint we are configuring. [R]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wanlink_pcap(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if capture is not None:
+        data["capture"] = capture
+    if directory is not None:
+        data["directory"] = directory
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wanlink_pcap",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WANPATH_CORRUPTION> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wanpath_corruption
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wanpath_corruption(self, 
+                                byte: str = None,        # The byte to use for OVERWRITE_FIXED (or NA).
+                                flags: str = None,       # The flags for this corruption.
+                                index: str = None,       # The corruption to modify (0-5). [R,0-5]
+                                max_offset: str = None,  # The maximum offset from start of Ethernet packet for
+                                # the byte to be modified.
+                                min_offset: str = None,  # The minimum offset from start of Ethernet packet for
+                                # the byte to be modified.
+                                name: str = None,        # WanLink name [R]
+                                path: str = None,        # WanPath name [R]
+                                rate: str = None,        # Specifies how often, per million, this corruption
+                                # should be applied.
+                                debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wanpath_corruption(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if byte is not None:
+        data["byte"] = byte
+    if flags is not None:
+        data["flags"] = flags
+    if index is not None:
+        data["index"] = index
+    if max_offset is not None:
+        data["max_offset"] = max_offset
+    if min_offset is not None:
+        data["min_offset"] = min_offset
+    if name is not None:
+        data["name"] = name
+    if path is not None:
+        data["path"] = path
+    if rate is not None:
+        data["rate"] = rate
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wanpath_corruption",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WANPATH_FILTER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wanpath_filter
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wanpath_filter(self, 
+                            defer_flush: str = None,  # Enter 'YES' if you do NOT want this flushed to the
+                            # remote.
+                            dst_filter: str = None,   # The destination MAC or IP/Mask, 'NA' for PCAP.
+                            filter_type: str = None,  # The filter type, one of: MAC, IP, PCAP.
+                            passive: str = None,      # Enter 'YES' if you do NOT want to use this filter
+                            # currently.
+                            reverse: str = None,      # If you want the logic reversed, use 'ON', otherwise set
+                            # to 'OFF'
+                            src_filter: str = None,   # The source MAC or IP/Mask. For PCAP, this is the only
+                            # filter.
+                            wl_name: str = None,      # The name of the WanLink endpoint we are configuring. [R]
+                            wp_name: str = None,      # The name of the WanPath we are configuring. [R]
+                            debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wanpath_filter(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if defer_flush is not None:
+        data["defer_flush"] = defer_flush
+    if dst_filter is not None:
+        data["dst_filter"] = dst_filter
+    if filter_type is not None:
+        data["filter_type"] = filter_type
+    if passive is not None:
+        data["passive"] = passive
+    if reverse is not None:
+        data["reverse"] = reverse
+    if src_filter is not None:
+        data["src_filter"] = src_filter
+    if wl_name is not None:
+        data["wl_name"] = wl_name
+    if wp_name is not None:
+        data["wp_name"] = wp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wanpath_filter",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WANPATH_RUNNING> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wanpath_running
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wanpath_running(self, 
+                             running: str = None,  # The state, one of: AS_PARENT, RUNNING, STOPPED. [R]
+                             wl_name: str = None,  # The name of the WanLink endpoint we are configuring. [R]
+                             wp_name: str = None,  # The name of the WanPath we are configuring. [R]
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wanpath_running(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if running is not None:
+        data["running"] = running
+    if wl_name is not None:
+        data["wl_name"] = wl_name
+    if wp_name is not None:
+        data["wp_name"] = wp_name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wanpath_running",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_CORRUPTIONS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_corruptions
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_corruptions(self, 
+                              corrupt_flags: str = None,    # Specify packet types to corrupt (see flags above).
+                              corrupt_per_mil: str = None,  # Per-million: Station to randomly corrupt selected
+                              # message types by this amount.
+                              delay_flags: str = None,      # Specify packet types to delay (see flags above).
+                              delay_max: str = None,        # miliseconds: Station to randomly delay processing
+                              # received messages, max time
+                              delay_min: str = None,        # miliseconds: Station to randomly delay processing
+                              # received messages, min time
+                              dup_flags: str = None,        # Specify packet types to duplicate (see flags above).
+                              dup_per_65535: str = None,    # Percentage, represented as x per 65535 of packets we
+                              # should duplicate.
+                              ignore_flags: str = None,     # Specify packet types to ignore (see flags above).
+                              ignore_per_mil: str = None,   # Per-million: Station to randomly ignore selected
+                              # message types by this amount.
+                              port: str = None,             # WiFi interface name or number. [W]
+                              req_flush: str = None,        # Set to 1 if you wish to flush changes to kernel now.
+                              resource: int = None,         # Resource number. [W]
+                              shelf: int = 1,               # Shelf number. [R][D:1]
+                              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_corruptions(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if corrupt_flags is not None:
+        data["corrupt_flags"] = corrupt_flags
+    if corrupt_per_mil is not None:
+        data["corrupt_per_mil"] = corrupt_per_mil
+    if delay_flags is not None:
+        data["delay_flags"] = delay_flags
+    if delay_max is not None:
+        data["delay_max"] = delay_max
+    if delay_min is not None:
+        data["delay_min"] = delay_min
+    if dup_flags is not None:
+        data["dup_flags"] = dup_flags
+    if dup_per_65535 is not None:
+        data["dup_per_65535"] = dup_per_65535
+    if ignore_flags is not None:
+        data["ignore_flags"] = ignore_flags
+    if ignore_per_mil is not None:
+        data["ignore_per_mil"] = ignore_per_mil
+    if port is not None:
+        data["port"] = port
+    if req_flush is not None:
+        data["req_flush"] = req_flush
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_corruptions",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_CUSTOM> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_custom
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_custom(self, 
+                         port: str = None,      # WiFi interface name or number. [W]
+                         resource: int = None,  # Resource number. [W]
+                         shelf: int = 1,        # Shelf number. [R][D:1]
+                         text: str = None,      # [BLANK] will erase all, any other text will be appended to
+                         # existing text.
+                         p_type: str = None,    # NA for now, may specify specific locations later. [D:NA]
+                         debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_custom(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if text is not None:
+        data["text"] = text
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_custom",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_EXTRA> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_extra
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_extra(self, 
+                        anonymous_identity: str = None,  # Anonymous identity string for EAP.
+                        anqp_3gpp_cell_net: str = None,  # 802.11u 3GCPP Cellular Network Info, VAP only.
+                        ca_cert: str = None,             # CA-CERT file name.
+                        client_cert: str = None,         # 802.11u Client cert file: /etc/wpa_supplicant/ca.pem
+                        domain: str = None,              # 802.11u domain: mytelco.com
+                        eap: str = None,                 # EAP method: MD5, MSCHAPV2, OTP, GTC, TLS, PEAP, TTLS.
+                        group: str = None,               # Group cyphers: CCMP, TKIP, WEP104, WEP40, or combination.
+                        hessid: str = None,              # 802.11u HESSID (MAC address format) (or peer for WDS
+                        # stations).
+                        identity: str = None,            # EAP Identity string.
+                        imsi: str = None,                # 802.11u IMSI: 310026-000000000
+                        ipaddr_type_avail: str = None,   # 802.11u network type available, integer, VAP only.
+                        key: str = None,                 # WEP key0. This should be entered in ascii-hex. Use this
+                        # only for WEP.
+                        key_mgmt: str = None,            # Key management: WPA-PSK, WPA-EAP, IEEE8021X, NONE,
+                        # WPA-PSK-SHA256, WPA-EAP-SHA256 or combo.
+                        milenage: str = None,            # 802.11u milenage:
+                        # 90dca4eda45b53cf0f12d7c9c3bc6a89:cb9cccc4b9258e6dca4760379fb82
+                        network_auth_type: str = None,   # 802.11u network authentication type, VAP only.
+                        network_type: str = None,        # 802.11u network type, integer, VAP only.
+                        pac_file: str = None,            # EAP-FAST PAC-File name. (For AP, this field is the RADIUS
+                        # secret password)
+                        pairwise: str = None,            # Pairwise ciphers: CCMP, TKIP, NONE, or combination.
+                        password: str = None,            # EAP Password string.
+                        phase1: str = None,              # Outer-authentication, ie TLS tunnel parameters.
+                        phase2: str = None,              # Inner authentication with TLS tunnel.
+                        pin: str = None,                 # EAP-SIM pin string. (For AP, this field is HS20 Operating
+                        # Class)
+                        pk_passwd: str = None,           # EAP private key password. (For AP, this field is HS20
+                        # connection capability)
+                        port: str = None,                # WiFi interface name or number. [W]
+                        private_key: str = None,         # EAP private key certificate file name. (For AP, this
+                        # field is HS20 WAN Metrics)
+                        psk: str = None,                 # WPA(2) pre-shared key. If unsure, use this field for any
+                        # password entry. Prepend with 0x for ascii-hex
+                        # representation.
+                        realm: str = None,               # 802.11u realm: mytelco.com
+                        resource: int = None,            # Resource number. [W]
+                        roaming_consortium: str = None,  # 802.11u roaming consortium: 223344 (15 characters max)
+                        shelf: int = 1,                  # Shelf number. [R][D:1]
+                        venue_group: str = None,         # 802.11u Venue Group, integer. VAP only.
+                        venue_type: str = None,          # 802.11u Venue Type, integer. VAP only.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_extra(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if anonymous_identity is not None:
+        data["anonymous_identity"] = anonymous_identity
+    if anqp_3gpp_cell_net is not None:
+        data["anqp_3gpp_cell_net"] = anqp_3gpp_cell_net
+    if ca_cert is not None:
+        data["ca_cert"] = ca_cert
+    if client_cert is not None:
+        data["client_cert"] = client_cert
+    if domain is not None:
+        data["domain"] = domain
+    if eap is not None:
+        data["eap"] = eap
+    if group is not None:
+        data["group"] = group
+    if hessid is not None:
+        data["hessid"] = hessid
+    if identity is not None:
+        data["identity"] = identity
+    if imsi is not None:
+        data["imsi"] = imsi
+    if ipaddr_type_avail is not None:
+        data["ipaddr_type_avail"] = ipaddr_type_avail
+    if key is not None:
+        data["key"] = key
+    if key_mgmt is not None:
+        data["key_mgmt"] = key_mgmt
+    if milenage is not None:
+        data["milenage"] = milenage
+    if network_auth_type is not None:
+        data["network_auth_type"] = network_auth_type
+    if network_type is not None:
+        data["network_type"] = network_type
+    if pac_file is not None:
+        data["pac_file"] = pac_file
+    if pairwise is not None:
+        data["pairwise"] = pairwise
+    if password is not None:
+        data["password"] = password
+    if phase1 is not None:
+        data["phase1"] = phase1
+    if phase2 is not None:
+        data["phase2"] = phase2
+    if pin is not None:
+        data["pin"] = pin
+    if pk_passwd is not None:
+        data["pk_passwd"] = pk_passwd
+    if port is not None:
+        data["port"] = port
+    if private_key is not None:
+        data["private_key"] = private_key
+    if psk is not None:
+        data["psk"] = psk
+    if realm is not None:
+        data["realm"] = realm
+    if resource is not None:
+        data["resource"] = resource
+    if roaming_consortium is not None:
+        data["roaming_consortium"] = roaming_consortium
+    if shelf is not None:
+        data["shelf"] = shelf
+    if venue_group is not None:
+        data["venue_group"] = venue_group
+    if venue_type is not None:
+        data["venue_type"] = venue_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_extra",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_EXTRA2> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_extra2
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_extra2(self, 
+                         corrupt_gtk_rekey_mic: str = None,  # Per-million: AP corrupts GTK Rekey MIC.
+                         freq_24: str = None,                # Frequency list for 2.4Ghz band, see above.
+                         freq_5: str = None,                 # Frequency list for 5Ghz band, see above.
+                         ignore_assoc: str = None,           # Per-million: AP ignore assoc request percentage.
+                         ignore_auth: str = None,            # Per-million: AP ignore auth request percentage.
+                         ignore_probe: str = None,           # Per-million: AP ignore probe percentage.
+                         ignore_reassoc: str = None,         # Per-million: AP ignore re-assoc request percentage.
+                         ocsp: str = None,                   # OCSP settings: 0=disabled, 1=try, but to not require
+                         # response, 2=require valid OCSP stapling response.
+                         port: str = None,                   # WiFi interface name or number. [W]
+                         post_ifup_script: str = None,       # Script name with optional args, will run after
+                         # interface comes up and gets IP.
+                         radius_ip: str = None,              # RADIUS server IP Address (AP Only)
+                         radius_port: str = None,            # RADIUS server IP Port (AP Only)
+                         req_flush: str = None,              # Set to 1 if you wish to flush changes to kernel now.
+                         resource: int = None,               # Resource number. [W]
+                         sae_pwe: str = None,                # Set SAE-PWE, 0 == hunting-and-pecking, 1 ==
+                         # hash-to-element, 2 allow both.
+                         shelf: int = 1,                     # Shelf number. [R][D:1]
+                         venue_id: str = None,               # Venue-ID for this wifi device. VAP in same venue will
+                         # share neigh reports as appropriate.
+                         debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_extra2(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if corrupt_gtk_rekey_mic is not None:
+        data["corrupt_gtk_rekey_mic"] = corrupt_gtk_rekey_mic
+    if freq_24 is not None:
+        data["freq_24"] = freq_24
+    if freq_5 is not None:
+        data["freq_5"] = freq_5
+    if ignore_assoc is not None:
+        data["ignore_assoc"] = ignore_assoc
+    if ignore_auth is not None:
+        data["ignore_auth"] = ignore_auth
+    if ignore_probe is not None:
+        data["ignore_probe"] = ignore_probe
+    if ignore_reassoc is not None:
+        data["ignore_reassoc"] = ignore_reassoc
+    if ocsp is not None:
+        data["ocsp"] = ocsp
+    if port is not None:
+        data["port"] = port
+    if post_ifup_script is not None:
+        data["post_ifup_script"] = post_ifup_script
+    if radius_ip is not None:
+        data["radius_ip"] = radius_ip
+    if radius_port is not None:
+        data["radius_port"] = radius_port
+    if req_flush is not None:
+        data["req_flush"] = req_flush
+    if resource is not None:
+        data["resource"] = resource
+    if sae_pwe is not None:
+        data["sae_pwe"] = sae_pwe
+    if shelf is not None:
+        data["shelf"] = shelf
+    if venue_id is not None:
+        data["venue_id"] = venue_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_extra2",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_RADIO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_radio
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_radio(self, 
+                        active_peer_count: str = None,   # Number of locally-cached peer objects for this radio.
+                        ampdu_factor: str = None,        # ax200/ax210 only, currently. Requires module reload. OS
+                        # Default: 0xFF
+                        antenna: str = None,             # Antenna configuration: 0 Diversity/All, 1 Fixed-A (1x1),
+                        # 4 AB (2x2), 7 ABC (3x3), 8 ABCD (4x4), 9 8x8
+                        channel: str = None,             # Channel number for this radio device. Frequency takes
+                        # precedence if both are set to non-default values.
+                        const_tx: str = None,            # RF Pattern Generator , encoded as a single 32-bit
+                        # integer. See above.
+                        country: str = None,             # Country number for this radio device.
+                        flags: str = None,               # Flags for this interface (see above.)
+                        flags_mask: str = None,          # If set, only these flags will be considered.
+                        frag_thresh: str = None,         # Fragmentation Threshold (256 - 2346, 2346 == disabled).
+                        frequency: str = None,           # Frequency for this radio. <tt>0xFFFF, AUTO or
+                        # DEFAULT</tt> means ANY.
+                        fwname: str = None,              # Firmware name (for example: firmware-5.bin)
+                        fwver: str = None,               # Firmware API version (for example, 5 if firmware is based
+                        # on firmware-5.bin
+                        mac: str = None,                 # Used to identify when name cannot be trusted (2.6.34+
+                        # kernels).
+                        max_amsdu: str = None,           # Maximum number of frames per AMSDU that may be
+                        # transmitted. See above.
+                        mode: str = None,                # WiFi mode, see table
+                        peer_count: str = None,          # Number of peer objects for this radio.
+                        pref_ap: str = None,             # Preferred AP BSSID for all station vdevs on this radio.
+                        pulse2_interval_us: str = None,  # Pause between pattern burst for RF noise generator.
+                        pulse_interval: str = None,      # RF Pattern generator: interval between pulses in usecs.
+                        pulse_width: str = None,         # RF Pattern generator: pulse width in usecs.
+                        radio: str = None,               # Name of the physical radio interface, for example: wiphy0
+                        # [W]
+                        rate: str = None,                # No longer used, specify the rate on the virtual
+                        # station(s) instead.
+                        rate_ctrl_count: str = None,     # Number of rate-ctrl objects for this radio.
+                        resource: int = None,            # Resource number. [W]
+                        rts: str = None,                 # The RTS Threshold for this radio (off, or 1-2347).
+                        shelf: int = 1,                  # Shelf number. [R][D:1]
+                        skid_limit: str = None,          # Firmware hash-table Skid Limit for this radio.
+                        stations_count: str = None,      # Number of stations supported by this radio.
+                        tids_count: str = None,          # TIDs count for this radio.
+                        tx_pulses: str = None,           # Number of pattern pulses per burst for RF noise
+                        # generator.
+                        txdesc_count: str = None,        # Transmit descriptor count for this radio.
+                        txpower: str = None,             # The transmit power setting for this radio. (AUTO for
+                        # system defaults)
+                        vdev_count: str = None,          # Configure radio vdev count.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_radio(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if active_peer_count is not None:
+        data["active_peer_count"] = active_peer_count
+    if ampdu_factor is not None:
+        data["ampdu_factor"] = ampdu_factor
+    if antenna is not None:
+        data["antenna"] = antenna
+    if channel is not None:
+        data["channel"] = channel
+    if const_tx is not None:
+        data["const_tx"] = const_tx
+    if country is not None:
+        data["country"] = country
+    if flags is not None:
+        data["flags"] = flags
+    if flags_mask is not None:
+        data["flags_mask"] = flags_mask
+    if frag_thresh is not None:
+        data["frag_thresh"] = frag_thresh
+    if frequency is not None:
+        data["frequency"] = frequency
+    if fwname is not None:
+        data["fwname"] = fwname
+    if fwver is not None:
+        data["fwver"] = fwver
+    if mac is not None:
+        data["mac"] = mac
+    if max_amsdu is not None:
+        data["max_amsdu"] = max_amsdu
+    if mode is not None:
+        data["mode"] = mode
+    if peer_count is not None:
+        data["peer_count"] = peer_count
+    if pref_ap is not None:
+        data["pref_ap"] = pref_ap
+    if pulse2_interval_us is not None:
+        data["pulse2_interval_us"] = pulse2_interval_us
+    if pulse_interval is not None:
+        data["pulse_interval"] = pulse_interval
+    if pulse_width is not None:
+        data["pulse_width"] = pulse_width
+    if radio is not None:
+        data["radio"] = radio
+    if rate is not None:
+        data["rate"] = rate
+    if rate_ctrl_count is not None:
+        data["rate_ctrl_count"] = rate_ctrl_count
+    if resource is not None:
+        data["resource"] = resource
+    if rts is not None:
+        data["rts"] = rts
+    if shelf is not None:
+        data["shelf"] = shelf
+    if skid_limit is not None:
+        data["skid_limit"] = skid_limit
+    if stations_count is not None:
+        data["stations_count"] = stations_count
+    if tids_count is not None:
+        data["tids_count"] = tids_count
+    if tx_pulses is not None:
+        data["tx_pulses"] = tx_pulses
+    if txdesc_count is not None:
+        data["txdesc_count"] = txdesc_count
+    if txpower is not None:
+        data["txpower"] = txpower
+    if vdev_count is not None:
+        data["vdev_count"] = vdev_count
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_radio",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WIFI_TXO> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wifi_txo
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wifi_txo(self, 
+                      port: str = None,         # WiFi interface name or number. [W]
+                      resource: int = None,     # Resource number. [W]
+                      shelf: int = 1,           # Shelf number. [R][D:1]
+                      txo_bw: str = None,       # Configure bandwidth: 0 == 20, 1 == 40, 2 == 80, 3 == 160, 4 ==
+                      # 80+80.
+                      txo_enable: str = None,   # Set to 1 if you wish to enable transmit override, 0 to
+                      # disable.
+                      txo_mcs: str = None,      # Configure the MCS (0-3 for CCK, 0-7 for OFDM, 0-7 for HT, 0-9
+                      # for VHT, 0-11 for HE
+                      txo_nss: str = None,      # Configure number of spatial streams (0 == nss1, 1 == nss2,
+                      # ...).
+                      txo_pream: str = None,    # Select rate preamble: 0 == OFDM, 1 == CCK, 2 == HT, 3 == VHT,
+                      # 4 == HE_SU.
+                      txo_retries: str = None,  # Configure number of retries. 0 or 1 means no retries).
+                      txo_sgi: str = None,      # Should rates be sent with short-guard-interval or not?
+                      txo_txpower: str = None,  # Configure TX power in db. Use 255 for system defaults. See
+                      # notes above.
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wifi_txo(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if txo_bw is not None:
+        data["txo_bw"] = txo_bw
+    if txo_enable is not None:
+        data["txo_enable"] = txo_enable
+    if txo_mcs is not None:
+        data["txo_mcs"] = txo_mcs
+    if txo_nss is not None:
+        data["txo_nss"] = txo_nss
+    if txo_pream is not None:
+        data["txo_pream"] = txo_pream
+    if txo_retries is not None:
+        data["txo_retries"] = txo_retries
+    if txo_sgi is not None:
+        data["txo_sgi"] = txo_sgi
+    if txo_txpower is not None:
+        data["txo_txpower"] = txo_txpower
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wifi_txo",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WL_CORRUPTION> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wl_corruption
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wl_corruption(self, 
+                           byte: str = None,        # The byte to use for OVERWRITE_FIXED (or NA).
+                           flags: str = None,       # The flags for this corruption.
+                           index: str = None,       # The corruption to modify (0-5). [R,0-5]
+                           max_offset: str = None,  # The maximum offset from start of Ethernet packet for the
+                           # byte to be modified.
+                           min_offset: str = None,  # The minimum offset from start of Ethernet packet for the
+                           # byte to be modified.
+                           name: str = None,        # WanLink name [R]
+                           rate: str = None,        # Specifies how often, per million, this corruption should
+                           # be applied.
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wl_corruption(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if byte is not None:
+        data["byte"] = byte
+    if flags is not None:
+        data["flags"] = flags
+    if index is not None:
+        data["index"] = index
+    if max_offset is not None:
+        data["max_offset"] = max_offset
+    if min_offset is not None:
+        data["min_offset"] = min_offset
+    if name is not None:
+        data["name"] = name
+    if rate is not None:
+        data["rate"] = rate
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wl_corruption",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SET_WL_QDISC> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#set_wl_qdisc
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_set_wl_qdisc(self, 
+                      name: str = None,   # WanLink name [R]
+                      qdisc: str = None,  # FIFO, WRR,a,b,c,d,e,f,g etc [R]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_set_wl_qdisc(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if qdisc is not None:
+        data["qdisc"] = qdisc
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/set_wl_qdisc",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
@@ -0,0 +1,1029 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonCommand members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonCommand imports this module the first time one of
+    them is used: call them through LFJsonCommand, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+# flag and enum classes: name: (base, {member: value}); LFJsonCommand builds each class
+# the first time it is used
+ENUMS = {
+    # <CLI-JSON/SHOW_ALERTS>
+    "ShowAlertsType": ("Enum", {
+        "All": "All",                          #
+        "CX": "CX",                            #
+        "Card": "Card",                        #
+        "Channel_Group": "Channel_Group",      #
+        "CollisionDomain": "CollisionDomain",  #
+        "Endp": "Endp",                        #
+        "PESQ": "PESQ",                        #
+        "PPP_Link": "PPP_Link",                #
+        "Port": "Port",                        #
+        "Shelf": "Shelf",                      #
+        "Span": "Span",                        #
+        "Test_Mgr": "Test_Mgr",                #
+    }),
+    # <CLI-JSON/SHOW_EVENTS>
+    "ShowEventsType": ("Enum", {
+        "All": "All",                          #
+        "CX": "CX",                            #
+        "Card": "Card",                        #
+        "Channel_Group": "Channel_Group",      #
+        "CollisionDomain": "CollisionDomain",  #
+        "Endp": "Endp",                        #
+        "PESQ": "PESQ",                        #
+        "PPP_Link": "PPP_Link",                #
+        "Port": "Port",                        #
+        "Shelf": "Shelf",                      #
+        "Span": "Span",                        #
+        "Test_Mgr": "Test_Mgr",                #
+    }),
+}
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_ALERTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_alerts
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_alerts(self, 
+                     card: int = None,   # Alert resource filter.
+                     endp: str = None,   # Alert endpoint filter.
+                     extra: str = None,  # Extra filter, currently ignored.
+                     port: str = None,   # Alert port filter (can be port name or number).
+                     shelf: int = 1,     # Alert shelf filter.
+                     p_type: str = None,  # Alert type filter. [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_alerts(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if card is not None:
+        data["card"] = card
+    if endp is not None:
+        data["endp"] = endp
+    if extra is not None:
+        data["extra"] = extra
+    if port is not None:
+        data["port"] = port
+    if shelf is not None:
+        data["shelf"] = shelf
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_alerts",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_ATTENUATORS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_attenuators
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_attenuators(self, 
+                          resource: int = None,  # Resource number, or 'all'. [W]
+                          serno: str = None,     # Serial number for requested Attenuator, or 'all'. [W]
+                          shelf: int = 1,        # Shelf number or alias, can be 'all'. [R][D:1]
+                          debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_attenuators(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if serno is not None:
+        data["serno"] = serno
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_attenuators",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_cd
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_cd(self, 
+                 collision_domain: str = None,  # Name of the Collision Domain, or 'all'. [W]
+                 resource: int = None,          # Resource number, or 'all'. [W]
+                 shelf: int = 1,                # Name/id of the shelf, or 'all'. [R][D:1]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_cd(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if collision_domain is not None:
+        data["collision_domain"] = collision_domain
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_cd",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CHAMBER> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_chamber
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_chamber(self, 
+                      name: str = None,  # Chamber Name or 'ALL'. [W][D:ALL]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_chamber(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_chamber",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CHANNEL_GROUPS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_channel_groups
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_channel_groups(self, 
+                             channel_name: str = None,  # Name of the channel, or 'all'. [W]
+                             resource: int = None,      # Resource number, or 'all'. [W]
+                             shelf: int = 1,            # Name/id of the shelf, or 'all'. [R][D:1]
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_channel_groups(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if channel_name is not None:
+        data["channel_name"] = channel_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_channel_groups",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CLIENTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_clients
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_clients(self, 
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_clients(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/show_clients",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_cx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_cx(self, 
+                 cross_connect: str = None,  # Specify cross-connect to act on, or 'all'. [W]
+                 test_mgr: str = None,       # Specify test-mgr to act on, or 'all'. [R]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_cx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cross_connect is not None:
+        data["cross_connect"] = cross_connect
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_cx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_CXE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_cxe
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_cxe(self, 
+                  cross_connect: str = None,  # Specify cross-connect to show, or 'all'. [W]
+                  test_mgr: str = None,       # Specify test-mgr to use, or 'all'. [R]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_cxe(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cross_connect is not None:
+        data["cross_connect"] = cross_connect
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_cxe",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_DBS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_dbs
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_dbs(self, 
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_dbs(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/show_dbs",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_DUT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_dut
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_dut(self, 
+                  name: str = None,  # DUT Name or 'ALL'. [W][D:ALL]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_dut(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_dut",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_ENDP_PAYLOAD> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_endp_payload
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_endp_payload(self, 
+                           max_bytes: str = None,  # The max number of payload bytes to print out, default is
+                           # 128. [R][D:128]
+                           name: str = None,       # The name of the endpoint we are configuring. [R]
+                           debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_endp_payload(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if max_bytes is not None:
+        data["max_bytes"] = max_bytes
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_endp_payload",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_ENDPOINTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_endpoints
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_endpoints(self, 
+                        endpoint: str = None,  # Name of endpoint, or 'all'. [R]
+                        extra: str = None,     # See above.
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_endpoints(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if extra is not None:
+        data["extra"] = extra
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_endpoints",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_ERR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_err
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_err(self, 
+                  message: str = None,  # Message to show to others currently logged on. <tt
+                  # escapearg='false'>Unescaped Value</tt> [R]
+                  debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_err(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if message is not None:
+        data["message"] = message
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_err",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_EVENT_INTEREST> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_event_interest
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_event_interest(self, 
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_event_interest(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    response = self.json_post(url="/cli-json/show_event_interest",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_EVENTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_events
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_events(self, 
+                     card: int = None,   # Event resource filter.
+                     endp: str = None,   # Event endpoint filter.
+                     extra: str = None,  # Extra filter, currently ignored.
+                     port: str = None,   # Event port filter (can be port name or number).
+                     shelf: int = 1,     # Event shelf filter.
+                     p_type: str = None,  # Event type filter. [R]
+                     debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_events(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if card is not None:
+        data["card"] = card
+    if endp is not None:
+        data["endp"] = endp
+    if extra is not None:
+        data["extra"] = extra
+    if port is not None:
+        data["port"] = port
+    if shelf is not None:
+        data["shelf"] = shelf
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_events",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_FILES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_files
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_files(self, 
+                    dir_flags: str = None,  # Determines format of listing, see above.
+                    directory: str = None,  # The sub-directory in which to list.
+                    p_filter: str = None,   # An optional filter, as used by the 'ls' command.
+                    key: str = None,        # A special key, can be used for scripting.
+                    resource: int = None,   # The machine to search in. [W]
+                    shelf: int = 1,         # The virtual shelf to search in. Use 0 for manager machine.
+                    # [R,0-1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_files(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if dir_flags is not None:
+        data["dir_flags"] = dir_flags
+    if directory is not None:
+        data["directory"] = directory
+    if p_filter is not None:
+        data["filter"] = p_filter
+    if key is not None:
+        data["key"] = key
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_files",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_GROUP> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_group
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_group(self, 
+                    group: str = None,  # Can be name of test group. Use 'all' or leave blank for all groups.
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_group(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if group is not None:
+        data["group"] = group
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_group",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_PESQ> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_pesq
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_pesq(self, 
+                   endpoint: str = None,  # Name of endpoint, or 'all'. [R]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_pesq(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_pesq",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_PORTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_ports
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_ports(self, 
+                    port: str = None,         # Port number, or 'all'. [W]
+                    probe_flags: str = None,  # See above, add them together for multiple probings. Leave blank
+                    # if you want stats only.
+                    resource: int = None,     # Resource number, or 'all'. [W]
+                    shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_ports(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if port is not None:
+        data["port"] = port
+    if probe_flags is not None:
+        data["probe_flags"] = probe_flags
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_ports",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_PPP_LINKS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_ppp_links
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_ppp_links(self, 
+                        link_num: str = None,  # Ppp-Link number of the span, or 'all'. [W]
+                        resource: int = None,  # Resource number, or 'all'. [W]
+                        shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_ppp_links(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if link_num is not None:
+        data["link_num"] = link_num
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_ppp_links",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_profile(self, 
+                      name: str = None,  # Profile Name or 'ALL'. [R]
+                      debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_RESOURCES> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_resources
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_resources(self, 
+                        resource: int = None,  # Resource number, or 'all'. [W]
+                        shelf: int = 1,        # Shelf number or alias, can be 'all'. [R][D:1]
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_resources(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_resources",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_RFGEN> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_rfgen
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_rfgen(self, 
+                    resource: int = None,  # Resource number, or 'all'. [W]
+                    shelf: int = 1,        # Shelf number or alias, can be 'all'. [R][D:1]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_rfgen(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_rfgen",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_RT> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_rt
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_rt(self, 
+                 key: str = None,             # Unique identifier for this request. Usually left blank.
+                 resource: int = None,        # Resource number. [W]
+                 shelf: int = 1,              # Shelf number. [R][D:1]
+                 virtual_router: str = None,  # Name of the virtual router. [W]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_rt(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if key is not None:
+        data["key"] = key
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if virtual_router is not None:
+        data["virtual_router"] = virtual_router
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_rt",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_SCRIPT_RESULTS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_script_results
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_script_results(self, 
+                             endpoint: str = None,  # Name of endpoint, test-group, or 'all'. [R]
+                             key: str = None,       # Optional 'key' to be used in keyed-text message result.
+                             debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_script_results(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if key is not None:
+        data["key"] = key
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_script_results",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_SPANS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_spans
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_spans(self, 
+                    resource: int = None,     # Resource number, or 'all'. [W]
+                    shelf: int = 1,           # Name/id of the shelf, or 'all'. [R][D:1]
+                    span_number: str = None,  # Span-Number of the span, or 'all'. [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_spans(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if span_number is not None:
+        data["span_number"] = span_number
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_spans",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_TEXT_BLOB> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_text_blob
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_text_blob(self, 
+                        brief: str = None,  # Set to 'brief' for a brief listing of all text blobs.
+                        name: str = None,   # Text Blob Name or 'ALL'. [R]
+                        p_type: str = None,  # Text Blob type or 'ALL'. [R]
+                        debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_text_blob(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if brief is not None:
+        data["brief"] = brief
+    if name is not None:
+        data["name"] = name
+    if p_type is not None:
+        data["type"] = p_type
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_text_blob",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_TM> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_tm
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_tm(self, 
+                 test_mgr: str = None,  # Can be name of test manager, or 'all'. [R]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_tm(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if test_mgr is not None:
+        data["test_mgr"] = test_mgr
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_tm",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_TRAFFIC_PROFILE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_traffic_profile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_traffic_profile(self, 
+                              name: str = None,  # Profile Name or 'ALL'. [R]
+                              debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_traffic_profile(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_traffic_profile",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_VENUE> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_venue
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_venue(self, 
+                    resource: int = None,  # Resource number, or 'ALL' [W]
+                    shelf: int = 1,        # Shelf number. [R][D:1]
+                    venu_id: str = None,   # Number to uniquely identify this venue on this resource, or 'ALL'
+                    # [W]
+                    debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_venue(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if venu_id is not None:
+        data["venu_id"] = venu_id
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_venue",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_VR> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_vr
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_vr(self, 
+                 resource: int = None,  # Resource number, or 'all'. [W]
+                 router: str = None,    # Name of the Virtual Router, or 'all'. [W]
+                 shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                 debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_vr(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if resource is not None:
+        data["resource"] = resource
+    if router is not None:
+        data["router"] = router
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_vr",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_VRCX> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_vrcx
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_vrcx(self, 
+                   cx_name: str = None,   # Name of the Virtual Router Connection, or 'all'. [W]
+                   resource: int = None,  # Resource number, or 'all'. [W]
+                   shelf: int = 1,        # Name/id of the shelf, or 'all'. [R][D:1]
+                   debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_vrcx(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if cx_name is not None:
+        data["cx_name"] = cx_name
+    if resource is not None:
+        data["resource"] = resource
+    if shelf is not None:
+        data["shelf"] = shelf
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_vrcx",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CLI-JSON/SHOW_WANPATHS> type requests
+
+    https://www.candelatech.com/lfcli_ug.php#show_wanpaths
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def post_show_wanpaths(self, 
+                       endpoint: str = None,  # Name of endpoint, or 'all'. [W]
+                       wanpath: str = None,   # Name of wanpath, or 'all'. [W]
+                       debug=False):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Example Usage: 
+            result = post_show_wanpaths(param=value ...)
+            pprint.pprint( result )
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    debug |= self.debug_on
+    data = {}
+    if endpoint is not None:
+        data["endpoint"] = endpoint
+    if wanpath is not None:
+        data["wanpath"] = wanpath
+    if len(data) < 1:
+        raise ValueError(__name__+": no parameters to submit")
+    response = self.json_post(url="/cli-json/show_wanpaths",
+                              post_data=data,
+                              die_on_error=self.die_on_error,
+                              debug=debug)
+    return response
@@ -0,0 +1,976 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonQuery members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonQuery imports this module the first time one of
+    them is used: call them through LFJsonQuery, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CX> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /cx/
+    /cx/$cx_id
+
+When requesting specific column names, they need to be URL encoded:
+    avg+rtt, bps+rx+a, bps+rx+b, drop+pkts+a, drop+pkts+b, eid, endpoints+%28a%C2%A0%E2%86%94%C2%A0b%29, 
+    entity+id, name, pkt+rx+a, pkt+rx+b, rpt+timer, rx+drop+%25+a, rx+drop+%25+b, 
+    state, type
+Example URL: /cx?fields=avg+rtt,bps+rx+a
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_cx(eid_list=['1.234', '1.344'],
+                              requested_col_names=['entity id'], 
+                              debug=True)
+
+The record returned will have these members: 
+{
+    'avg rtt':                            # Average Round-Trip-Time (latency) for this connection (ms).
+    'bps rx a':                           # Endpoint A's real receive rate (bps).
+    'bps rx b':                           # Endpoint B's real receive rate (bps).
+    'drop pkts a':                        # The number of packets Endpoint B sent minus the number Endpoint A
+                                          # received.This number is not 100% correct as long as packets are in
+                                          # flight.After a Quiesce of the test, the number should be perfectly
+                                          # accurate.
+    'drop pkts b':                        # The number of packets Endpoint A sent minus the number Endpoint B
+                                          # received.This number is not 100% correct as long as packets are in
+                                          # flight.After a Quiesce of the test, the number should be perfectly
+                                          # accurate.
+    'eid':                                # Cross Connect's Name.
+    'endpoints (a&nbsp;&#x2194;&nbsp;b)': # Endpoints that make up this Cross Connect.
+    'entity id':                          # Cross Connect's Name.
+    'name':                               # Cross Connect's Name.
+    'pkt rx a':                           # Endpoint A's Packets Recieved.
+    'pkt rx b':                           # Endpoint B's Packets Recieved.
+    'rpt timer':                          # Cross Connect's Report Timer (milliseconds).This is how often the GUI
+                                          # will ask for updates from the LANforge processes.If the GUI is sluggish,
+                                          # increasing the report timers may help.
+    'rx drop % a':                        # Endpoint A percentage packet loss.Calculated using the number of PDUs
+                                          # Endpoint B sent minus the number Endpoint A received.This number is not
+                                          # 100% correct as long as packets are in flight.After a Quiesce of the
+                                          # test, the number should be perfectly accurate.
+    'rx drop % b':                        # Endpoint B percentage packet loss.Calculated using the number of PDUs
+                                          # Endpoint A sent minus the number Endpoint B received.This number is not
+                                          # 100% correct as long as packets are in flight.After a Quiesce of the
+                                          # test, the number should be perfectly accurate.
+    'state':                              # Current State of the connection.UninitializedHas not yet been
+                                          # started/stopped.InitializingBeing set up.StartingStarting the
+                                          # test.RunningTest is actively running.StoppedTest has been
+                                          # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                                          # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                                          # phantom, probably due to non-existent interface or resource.WAITINGWill
+                                          # restart as soon as resources are available.PHANTOMTest is stopped, and
+                                          # is phantom, probably due to non-existent interface or resource.
+    'type':                               # Cross-Connect type.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_cx(self, 
+           eid_list: list = None,
+           requested_col_names: list = None,
+           wait_sec: float = 0.01,
+           timeout_sec: float = 5.0,
+           errors_warnings: list = None,
+           debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/cx"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <ENDP> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /endp/
+    /endp/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    1st+rx, a%2Fb, bursty, crc+fail, cwnd, cx+active, cx+estab, cx+estab%2Fs, cx+to, 
+    delay, destination+addr, dropped, dup+pkts, eid, elapsed, entity+id, jitter, 
+    max+pdu, max+rate, min+pdu, min+rate, mng, name, ooo+pkts, pattern, pdu%2Fs+rx, 
+    pdu%2Fs+tx, pps+rx+ll, pps+tx+ll, rcv+buf, replays, run, rx+ber, rx+bytes, 
+    rx+drop+%25, rx+dup+%25, rx+ooo+%25, rx+pdus, rx+pkts+ll, rx+rate, rx+rate+%281%C2%A0min%29, 
+    rx+rate+%28last%29, rx+rate+ll, rx+wrong+dev, script, send+buf, source+addr, 
+    tcp+mss, tcp+rtx, tx+bytes, tx+pdus, tx+pkts+ll, tx+rate, tx+rate+%281%C2%A0min%29, 
+    tx+rate+%28last%29, tx+rate+ll        # hidden columns:
+    drop-count-5m, latency-5m, rt-latency-5m, rx-silence-5m
+Example URL: /endp?fields=1st+rx,a%2Fb
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_endp(eid_list=['1.234', '1.344'],
+                                requested_col_names=['entity id'], 
+                                debug=True)
+
+The record returned will have these members: 
+{
+    '1st rx':               # Miliseconds between starting the endpoint and receiving the first
+                            # packet.Note that LANforge UDP connections (not including multicast) will
+                            # wait 20msbefore sending first frame to make sure receiver has adequate
+                            # time to start.
+    'a/b':                  # Display side (A or B) for the endpoint.
+    'bursty':               # Is the transmit rate bursty or not?
+    'crc fail':             # Total packets received with a bad payload CRC.
+    'cwnd':                 # Sender's TCP Current Window Size.  In units of Maximum Segment Size.
+    'cx active':            # Total number of active connections for this endpoint.
+    'cx estab':             # Total times the connection between the endpoints has been established.
+    'cx estab/s':           # Connections established per second, averaged over the last 30 seconds.
+    'cx to':                # Number of TCP connection attemtps timed out by LANforge.
+    'delay':                # Average latency in milliseconds for packets received by this endpoint.
+    'destination addr':     # Destination Address (MAC, ip/port, VoIP destination).
+    'dropped':              # Total dropped packets, as identified by gaps in packet sequence numbers.
+    'dup pkts':             # Total duplicate packets received.  Only an estimate, but never less than
+                            # this value.
+    'eid':                  # Entity ID
+    'elapsed':              # Amount of time (seconds) this endpoint has been running (or ran.)
+    'entity id':            # Entity ID
+    'jitter':               # Exponential decaying average jitter calculated per RFC3393(old_jitter *
+                            # 15/16 + new_jitter * 1/16)
+    'max pdu':              # The maximum write size.For Ethernet protocols, this is the entire
+                            # Ethernet frame. For UDP, it is the UDP payload size, and for TCP, it
+                            # just means the maximum amount of data that is written per socket
+                            # write.In all cases, the packets on the wire will not exceed theport's
+                            # MTU + Ethernet-Header-Size (typically 1514 for Ethernet)
+    'max rate':             # Maximum desired transmit rate, in bits per second (bps).
+    'min pdu':              # The minimum write size.For Ethernet protocols, this is the entire
+                            # Ethernet frame. For UDP, it is the UDP payload size, and for TCP, it
+                            # just means the maximum amount of data that is written per socket
+                            # write.In all cases, the packets on the wire will not exceed theport's
+                            # MTU + Ethernet-Header-Size (typically 1514 for Ethernet)
+    'min rate':             # Minimum desired transmit rate, in bits per second (bps).
+    'mng':                  # Is the Endpoint managed or not?
+    'name':                 # Endpoint's Name.
+    'ooo pkts':             # Total out of order packets received.  Only an estimate, but never less
+                            # than this value.
+    'pattern':              # Pattern of bytes this endpoint transmits.
+    'pdu/s rx':             # Received PDU per second.This counts the protocol reads, such as UDP
+                            # PDUs.
+    'pdu/s tx':             # Transmitted PDU per second.This counts the protocol writes, such as UDP
+                            # PDUs.
+    'pps rx ll':            # Estimated total received packets per second (on the wire).For TCP, this
+                            # is an estimate.UDP and Ethernet protocols should be quite accurate on
+                            # normal networks.
+    'pps tx ll':            # Estimated total transmitted packets per second (on the wire).For TCP,
+                            # this is an estimate.UDP and Ethernet protocols should be quite accurate
+                            # on normal networks.
+    'rcv buf':              # Configured/Actual values for receiving buffer size (bytes).
+    'replays':              # Total number of files replayed.
+    'run':                  # Is the Endpoint is Running or not.
+    'rx ber':               # Received bit-errors.  These are only calculated in the LANforge payload
+                            # portion starting 28 bytes into the UDP or TCP payload.  In addition, the
+                            # bit-errors are only checked when LANforge CRCis enabled and detected to
+                            # be invalid.  If the 28-byte header is corrupted, LANforge will not
+                            # detectit, and may also give false positives for other packet errors.
+                            # Bit-Errors are only calculated forcertain payload patterns:  Increasing,
+                            # Decreasing, Zeros, Ones, and the PRBS patterns. 
+    'rx bytes':             # Total received bytes count.
+    'rx drop %':            # Percentage of packets that should have been received by Endpoint, but
+                            # were not, as calculated by the Cross-Connect.
+    'rx dup %':             # Percentage of duplicate packets, as detected by sequence numbers.
+    'rx ooo %':             # Percentage of packets received out of order, as detected by sequence
+                            # numbers.
+    'rx pdus':              # Total received PDU count.This counts the protocol reads, such as UDP
+                            # PDUs (aka goodput).
+    'rx pkts ll':           # Estimated total received packet count (on the wire).For TCP, this is an
+                            # estimate.UDP and Ethernet protocols should be quite accurate on normal
+                            # networks.
+    'rx rate':              # Real receive rate (bps) for this run.This includes only the protocol
+                            # payload (goodput).
+    'rx rate (1&nbsp;min)': # Real receive rate (bps) over the last minute.This includes only the
+                            # protocol payload (goodput).
+    'rx rate (last)':       # Real receive rate (bps) over the last report interval.This includes only
+                            # the protocol payload (goodput).
+    'rx rate ll':           # Estimated low-level receive rate (bps) over the last minute.This
+                            # includes any Ethernet, IP, TCP, UDP or similar headers.
+    'rx wrong dev':         # Total packets received on the wrong device (port).
+    'script':               # Endpoint script state.
+    'send buf':             # Configured/Actual values for sending buffer size (bytes).
+    'source addr':          # 
+    'tcp mss':              # Sender's TCP-MSS (max segment size) setting.This cooresponds to the
+                            # TCP_MAXSEGS socket option,and TCP-MSS plus 54 is the maximum packet size
+                            # on the wirefor Ethernet frames.This is a good option to efficiently
+                            # limit TCP packet size.
+    'tcp rtx':              # Total packets retransmitted by the TCP stack for this connection.These
+                            # were likely dropped or corrupted in transit.
+    'tx bytes':             # Total transmitted bytes count.
+    'tx pdus':              # Total transmitted PDU count.This counts the protocol writes, such as UDP
+                            # PDUs (aka goodput).
+    'tx pkts ll':           # Estimated total transmitted packet count (on the wire).For TCP, this is
+                            # an estimate.UDP and Ethernet protocols should be quite accurate on
+                            # normal networks.
+    'tx rate':              # Real transmit rate (bps) for this run.This includes only the protocol
+                            # payload (goodput).
+    'tx rate (1&nbsp;min)': # Real transmit rate (bps) over the last minute.This includes only the
+                            # protocol payload (goodput).
+    'tx rate (last)':       # Real transmit rate (bps) over the last report interval.This includes
+                            # only the protocol payload (goodput).
+    'tx rate ll':           # Estimated low-level transmit rate (bps) over the last minute.This
+                            # includes any Ethernet, IP, TCP, UDP or similar headers.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_endp(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/endp"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoint")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <FILEIO> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /fileio/
+    /fileio/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    buf-rd, buf-wr, bytes-rd, bytes-wr, crc+fail, eid, entity+id, files+%23, files-read, 
+    files-wr, io+fail, max-file-sz, max-rd-bps, max-rw-sz, max-wr-bps, min-file-sz, 
+    min-rd-bps, min-rw-sz, min-wr-bps, name, read-bps, rpt+timer, rx-bps-20s, 
+    status, tx-bps-20s, type, write-bps
+Example URL: /fileio?fields=buf-rd,buf-wr
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_fileio(eid_list=['1.234', '1.344'],
+                                  requested_col_names=['entity id'], 
+                                  debug=True)
+
+The record returned will have these members: 
+{
+    'buf-rd':      # Buffer reads.  When doing CRC, it takes two reads per 'packet', because
+                   # we first read the header, then the payload.  Non-CRC reads ignore the
+                   # header.
+    'buf-wr':      # Buffer writes.
+    'bytes-rd':    # Bytes read.
+    'bytes-wr':    # Bytes written.
+    'crc fail':    # 32-bit CRC Errors detected upon READ.
+    'eid':         # Entity ID
+    'entity id':   # Entity ID
+    'files #':     # Number of files to write.
+    'files-read':  # Files read.
+    'files-wr':    # Files written.
+    'io fail':     # Amount of time in miliseconds this test has been experiencing IO
+                   # failures.
+    'max-file-sz': # Maximum configured file size (bytes).
+    'max-rd-bps':  # Maximum configured read rate (bps).
+    'max-rw-sz':   # Maximum configured size for each call to read(2) or write(2) (bytes).
+    'max-wr-bps':  # Maximum configured write rate (bps).
+    'min-file-sz': # Minimum configured file size (bytes).
+    'min-rd-bps':  # Minimum configured read rate (bps).
+    'min-rw-sz':   # Minimum configured size for each call to read(2) or write(2) (bytes).
+    'min-wr-bps':  # Minimum configured write rate (bps).
+    'name':        # File Endpoint's Name.
+    'read-bps':    # File read rate for this endpoint over the duration of the test.
+    'rpt timer':   # Report Timer (milliseconds).This is how often the GUI will ask for
+                   # updates from the LANforge processes.If the GUI is sluggish, increasing
+                   # the report timers may help.
+    'rx-bps-20s':  # File read rate for this endpoint over the last 20 seconds.
+    'status':      # Current State of the connection.UninitializedHas not yet been
+                   # started/stopped.InitializingBeing set up.StartingStarting the
+                   # test.RunningTest is actively running.StoppedTest has been
+                   # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                   # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                   # phantom, probably due to non-existent interface or resource.WAITINGWill
+                   # restart as soon as resources are available.PHANTOMTest is stopped, and
+                   # is phantom, probably due to non-existent interface or resource.
+    'tx-bps-20s':  # File write rate for this endpoint over the last 20 seconds.
+    'type':        # The specific type of this File Endpoint.
+    'write-bps':   # File write rate for this endpoint over the duration of the test.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_fileio(self, 
+               eid_list: list = None,
+               requested_col_names: list = None,
+               wait_sec: float = 0.01,
+               timeout_sec: float = 5.0,
+               errors_warnings: list = None,
+               debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/fileio"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoint")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <GENERIC> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /generic/
+    /generic/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    bps+rx, bps+tx, command, dropped, eid, elapsed, entity+id, last+results, 
+    name, pdu%2Fs+rx, pdu%2Fs+tx, rpt+timer, rpt%23, rx+bytes, rx+pkts, status, tx+bytes, 
+    tx+pkts, type
+Example URL: /generic?fields=bps+rx,bps+tx
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_generic(eid_list=['1.234', '1.344'],
+                                   requested_col_names=['entity id'], 
+                                   debug=True)
+
+The record returned will have these members: 
+{
+    'bps rx':       # Receive rate reported by this endpoint.
+    'bps tx':       # Transmit rate reported by this endpoint.
+    'command':      # The command that this endpoint executes.
+    'dropped':      # Dropped PDUs reported by this endpoint.
+    'eid':          # Entity ID
+    'elapsed':      # Amount of time (seconds) this endpoint has been running (or ran.)
+    'entity id':    # Entity ID
+    'last results': # Latest output from the Generic Endpoint.
+    'name':         # Endpoint's Name.
+    'pdu/s rx':     # Received packets-per-second reported by this endpoint.
+    'pdu/s tx':     # Transmitted packets-per-second reported by this endpoint.
+    'rpt timer':    # Report Timer (milliseconds).This is how often the GUI will ask for
+                    # updates from the LANforge processes.If the GUI is sluggish, increasing
+                    # the report timers may help.
+    'rpt#':         # The N_th report that we have received. (Some cmds will produce only one
+                    # report, others will produce continuous reports.)
+    'rx bytes':     # Received bytes reported by this endpoint.
+    'rx pkts':      # Received PDUs reported by this endpoint.
+    'status':       # Current State of the connection.UninitializedHas not yet been
+                    # started/stopped.InitializingBeing set up.StartingStarting the
+                    # test.RunningTest is actively running.StoppedTest has been
+                    # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                    # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                    # phantom, probably due to non-existent interface or resource.WAITINGWill
+                    # restart as soon as resources are available.PHANTOMTest is stopped, and
+                    # is phantom, probably due to non-existent interface or resource.
+    'tx bytes':     # Transmitted bytes reported by this endpoint.
+    'tx pkts':      # Transmitted PDUs reported by this endpoint.
+    'type':         # The specific type of this Generic Endpoint.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_generic(self, 
+                eid_list: list = None,
+                requested_col_names: list = None,
+                wait_sec: float = 0.01,
+                timeout_sec: float = 5.0,
+                errors_warnings: list = None,
+                debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/generic"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoints")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <LAYER4> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /layer4/
+    /layer4/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    %21conn, acc.+denied, bad-proto, bad-url, bytes-rd, bytes-wr, dns-avg, dns-max, 
+    dns-min, eid, elapsed, entity+id, fb-avg, fb-max, fb-min, ftp-host, ftp-port, 
+    ftp-stor, http-p, http-r, http-t, login-denied, name, nf+%284xx%29, other-err, 
+    read, redir, rpt+timer, rslv-h, rslv-p, rx+rate, rx+rate+%281%C2%A0min%29, status, 
+    timeout, total-err, total-urls, tx+rate, tx+rate+%281%C2%A0min%29, type, uc-avg, 
+    uc-max, uc-min, urls%2Fs, write        # hidden columns:
+    rpt-time
+Example URL: /layer4?fields=%21conn,acc.+denied
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_layer4(eid_list=['1.234', '1.344'],
+                                  requested_col_names=['entity id'], 
+                                  debug=True)
+
+The record returned will have these members: 
+{
+    '!conn':                # Could not establish connection.
+    'acc. denied':          # Access Access Denied Error.This could be password, user-name,
+                            # file-permissions or other error.
+    'bad-proto':            # Bad protocol.
+    'bad-url':              # Bad URL format.
+    'bytes-rd':             # Bytes read.
+    'bytes-wr':             # Bytes written.
+    'dns-avg':              # Average time in milliseconds to complete resolving the DNS lookupfor the
+                            # last 100 requests.
+    'dns-max':              # Maximum time in milliseconds to complete resolving the DNS lookupfor
+                            # requests made in the last 30 seconds.
+    'dns-min':              # Minimum time in milliseconds to complete resolving the DNS lookupfor
+                            # requests made in the last 30 seconds.
+    'eid':                  # EID
+    'elapsed':              # Amount of time (seconds) this endpoint has been running (or ran.)
+    'entity id':            # Entity ID
+    'fb-avg':               # Average time in milliseconds for receiving the first byte of the URLfor
+                            # the last 100 requests.
+    'fb-max':               # Maximum time in milliseconds for receiving the first byte of the URLfor
+                            # requests made in the last 30 seconds.
+    'fb-min':               # Minimum time in milliseconds for receiving the first byte of the URLfor
+                            # requests made in the last 30 seconds.
+    'ftp-host':             # FTP HOST Error
+    'ftp-port':             # FTP PORT Error.
+    'ftp-stor':             # FTP STOR Error.
+    'http-p':               # HTTP Post error.
+    'http-r':               # HTTP RANGE error.
+    'http-t':               # HTTP PORT Error.
+    'login-denied':         # Login attempt was denied.Probable cause is user-name or password errors.
+    'name':                 # Endpoint's Name.
+    'nf (4xx)':             # File not found.For HTTP, an HTTP 4XX error was returned.  This is only
+                            # counted when the endpoint has 'Enable 4XX' selected.Includes 403
+                            # permission denied and 404 not found errors.For other protocols, it
+                            # should be returned any time a file is not found.
+    'other-err':            # Error not otherwise specified.  The actual error code may be found
+                            # inl4helper logs.  Contact support if you see these errors:we would like
+                            # to account for all possible errors.
+    'read':                 # Error attempting to read file or URL.
+    'redir':                # Noticed redirect loop!
+    'rpt timer':            # Cross Connect's Report Timer (milliseconds).This is how often the GUI
+                            # will ask for updates from the LANforge processes.If the GUI is sluggish,
+                            # increasing the report timers may help.
+    'rslv-h':               # Couldn't resolve host.
+    'rslv-p':               # Couldn't resolve Proxy.
+    'rx rate':              # Payload receive rate (bps).
+    'rx rate (1&nbsp;min)': # Payload receive rate over the last minute (bps).
+    'status':               # Current State of the connection.UninitializedHas not yet been
+                            # started/stopped.InitializingBeing set up.StartingStarting the
+                            # test.RunningTest is actively running.StoppedTest has been
+                            # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                            # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                            # phantom, probably due to non-existent interface or resource.WAITINGWill
+                            # restart as soon as resources are available.PHANTOMTest is stopped, and
+                            # is phantom, probably due to non-existent interface or resource.
+    'timeout':              # Operation timed out.
+    'total-err':            # Total Errors.
+    'total-urls':           # URLs processed.
+    'tx rate':              # Payload transmit rate (bps).
+    'tx rate (1&nbsp;min)': # Payload transmit rate over the last minute (bps).
+    'type':                 # The specific type of this Layer 4-7 Endpoint.
+    'uc-avg':               # Average time in milliseconds to complete processing of the URLfor the
+                            # last 100 requests.
+    'uc-max':               # Maximum time in milliseconds to complete processing of the URLfor
+                            # requests made in the last 30 seconds.
+    'uc-min':               # Minimum time in milliseconds to complete processing of the URLfor
+                            # requests made in the last 30 seconds.
+    'urls/s':               # URLs processed per second over the last minute.
+    'write':                # Error attempting to write file or URL.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_layer4(self, 
+               eid_list: list = None,
+               requested_col_names: list = None,
+               wait_sec: float = 0.01,
+               timeout_sec: float = 5.0,
+               errors_warnings: list = None,
+               debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/layer4"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoint")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <TEST-GROUP> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /test-group/
+    /test-group/$id
+    /test-groups/
+    /test-groups/$id
+
+When requesting specific column names, they need to be URL encoded:
+    cross+connects, entity+id, name, run, script
+Example URL: /test-group?fields=cross+connects,entity+id
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_test_group(eid_list=['1.234', '1.344'],
+                                      requested_col_names=['entity id'], 
+                                      debug=True)
+
+The record returned will have these members: 
+{
+    'cross connects': # List of Test Manager's Cross-Connects.
+    'entity id':      # Entity ID
+    'name':           # Test Group's Name.
+    'run':            # Is Test Group running or not.
+    'script':         # Endpoint script state.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_test_group(self, 
+                   eid_list: list = None,
+                   requested_col_names: list = None,
+                   wait_sec: float = 0.01,
+                   timeout_sec: float = 5.0,
+                   errors_warnings: list = None,
+                   debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/test-group"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="groups",
+                               plural_key="groups")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <VOIP> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /voip-endp/
+    /voip-endp/$endp_id
+    /voip-ep/
+    /voip-ep/$endp_id
+    /voip/
+    /voip/$cx_id
+    /voip_endp/
+    /voip_endp/$endp_id
+    /voip_ep/
+    /voip_ep/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    bps+rx+a, bps+rx+b, delay+a+%E2%86%90+b, delay+a+%E2%86%92+b, eid, endpoints+%28a%C2%A0%E2%86%94%C2%A0b%29, 
+    entity+id, jitter+a+%E2%86%90+b, jitter+a+%E2%86%92+b, name, pkt+tx+a%C2%A0%E2%86%90%C2%A0b, 
+    pkt+tx+a%C2%A0%E2%86%92%C2%A0b, rpt+timer, rx+drop+%25+a, rx+drop+%25+b, state, 
+    type
+Example URL: /voip?fields=bps+rx+a,bps+rx+b
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_voip(eid_list=['1.234', '1.344'],
+                                requested_col_names=['entity id'], 
+                                debug=True)
+
+The record returned will have these members: 
+{
+    'bps rx a':                           # Endpoint B's real transmit rate (bps).Measured at the CX Type layer.
+    'bps rx b':                           # Endpoint A's real transmit rate (bps).Measured at the CX Type layer.
+    'delay a &#x2190; b':                 # Average Latency in milliseconds for traffic from Endpoint B to Endpoint
+                                          # A
+    'delay a &#x2192; b':                 # Average Latency in milliseconds for traffic from Endpoint A to Endpoint
+                                          # B
+    'eid':                                # Entity ID
+    'endpoints (a&nbsp;&#x2194;&nbsp;b)': # Endpoints that make up this Cross Connect.
+    'entity id':                          # Entity ID
+    'jitter a &#x2190; b':                # Average Jitter in milliseconds for traffic from Endpoint B to Endpoint A
+    'jitter a &#x2192; b':                # Average Jitter in milliseconds for traffic from Endpoint A to Endpoint B
+    'name':                               # Cross Connect's Name.
+    'pkt tx a&nbsp;&#x2190;&nbsp;b':      # Endpoint B's Packets Transmitted.
+    'pkt tx a&nbsp;&#x2192;&nbsp;b':      # Endpoint A's Packets Transmitted.
+    'rpt timer':                          # Cross Connect's Report Timer (milliseconds).This is how often the GUI
+                                          # will ask for updates from the LANforge processes.If the GUI is sluggish,
+                                          # increasing the report timers may help.
+    'rx drop % a':                        # Endpoint A percentage packet loss.Calculated using the number of PDUs
+                                          # Endpoint B sent minus the number Endpoint A received.This number is not
+                                          # 100% correct as long as packets are in flight.After a Quiesce of the
+                                          # test, the number should be perfectly accurate.
+    'rx drop % b':                        # Endpoint B percentage packet loss.Calculated using the number of PDUs
+                                          # Endpoint A sent minus the number Endpoint B received.This number is not
+                                          # 100% correct as long as packets are in flight.After a Quiesce of the
+                                          # test, the number should be perfectly accurate.
+    'state':                              # Current State of the connection.UninitializedHas not yet been
+                                          # started/stopped.InitializingBeing set up.StartingStarting the
+                                          # test.RunningTest is actively running.StoppedTest has been
+                                          # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                                          # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                                          # phantom, probably due to non-existent interface or resource.WAITINGWill
+                                          # restart as soon as resources are available.PHANTOMTest is stopped, and
+                                          # is phantom, probably due to non-existent interface or resource.
+    'type':                               # Cross-Connect type.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_voip(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/voip"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="connection",
+                               plural_key="connections")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <VOIP-ENDP> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /voip-endp/
+    /voip-endp/$endp_id
+
+When requesting specific column names, they need to be URL encoded:
+    calls+answered, calls+attempted, calls+completed, calls+failed, cf+404, cf+408, 
+    cf+busy, cf+canceled, delay, destination+addr, dropped, dup+pkts, eid, elapsed, 
+    entity+id, jb+cur, jb+over, jb+silence, jb+under, jitter, mng, name, ooo+pkts, 
+    pesq, pesq+bklg, pesq%23, reg+state, rst, rtp+rtt, run, rx+bytes, rx+pkts, 
+    source+addr, state, tx+bytes, tx+pkts, vad+pkts
+Example URL: /voip-endp?fields=calls+answered,calls+attempted
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_voip_endp(eid_list=['1.234', '1.344'],
+                                     requested_col_names=['entity id'], 
+                                     debug=True)
+
+The record returned will have these members: 
+{
+    'calls answered':   # Number of calls that where the remote answered
+    'calls attempted':  # Number of calls that have been attempted
+    'calls completed':  # Number of calls that have been successfully completed
+    'calls failed':     # Number of calls that did not succeed for any reason.
+    'cf 404':           # Number of calls failed for '404': callee not found.
+    'cf 408':           # Number of calls failed for '408': callee did not answer.
+    'cf busy':          # Number of calls failed because callee is busy.
+    'cf canceled':      # Number of calls failed because they were canceled.
+    'delay':            # Average latency in milliseconds for packets received by this endpoint.
+    'destination addr': # Destination Address (MAC, ip/port, VoIP destination).
+    'dropped':          # Total dropped packets, as identified by gaps in RTP sequence numbers
+                        # (pre jitter buffer).
+    'dup pkts':         # Total duplicate packets, as identified by RTP sequence numbers (pre
+                        # jitter buffer).
+    'eid':              # Entity ID
+    'elapsed':          # Amount of time (seconds) this endpoint has been running (or ran.)
+    'entity id':        # Entity ID
+    'jb cur':           # Current number of packets in the jitter buffer waiting to be played /
+                        # Jitter Buffer Size.
+    'jb over':          # Total times the jitter buffer was given more packets than it could hold.
+    'jb silence':       # Silence is played when there is no valid voice packet, due to drop, or
+                        # reorder/jitter/latency out of range of the jitter buffer.
+    'jb under':         # Total times the reader asked for a packet to play but the jitter buffer
+                        # was empty.
+    'jitter':           # Average interpacket variation, calculated per RFC 1889 A.8.
+    'mng':              # Is the Endpoint managed or not?
+    'name':             # Endpoint's Name.
+    'ooo pkts':         # Total out-of-order packets, as identified by RTP sequence numbers (pre
+                        # jitter buffer).
+    'pesq':             # PESQ Report score for the PESQ report number (PESQ#).
+    'pesq bklg':        # PESQ server call processing backlog.
+    'pesq#':            # The pesq-report-number to which the PESQ value cooresponds.
+    'reg state':        # Current State of the Endpoint.
+    'rst':              # How many times has the endpoint been restarted due to abnormal
+                        # termination.
+    'rtp rtt':          # Round trip latency as reported by RTCP
+    'run':              # Is the Endpoint is Running or not.
+    'rx bytes':         # Total received bytes count.
+    'rx pkts':          # Total received packet count.
+    'source addr':      # Source Address (MAC, ip/port, VoIP source).
+    'state':            # Phone registration state
+    'tx bytes':         # Total transmitted bytes count.
+    'tx pkts':          # Total transmitted packet count.
+    'vad pkts':         # Total VAD (Silence Suppression) packets suppressed before transmit.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_voip_endp(self, 
+                  eid_list: list = None,
+                  requested_col_names: list = None,
+                  wait_sec: float = 0.01,
+                  timeout_sec: float = 5.0,
+                  errors_warnings: list = None,
+                  debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/voip-endp"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoints")
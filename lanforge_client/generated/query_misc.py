@@ -0,0 +1,955 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonQuery members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonQuery imports this module the first time one of
+    them is used: call them through LFJsonQuery, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <ALERTS> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /alerts/
+    /alerts/$event_id
+    /alerts/before/$event_id
+    /alerts/between/$start_event_id/$end_event_id
+    /alerts/last/$event_count
+    /alerts/since/$event_id
+
+When requesting specific column names, they need to be URL encoded:
+    eid, entity+id, event, event+description, id, name, priority, time-stamp, 
+    type
+Example URL: /alerts?fields=eid,entity+id
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_alerts(eid_list=['1.234', '1.344'],
+                                  requested_col_names=['entity id'], 
+                                  debug=True)
+
+The record returned will have these members: 
+{
+    'eid':               # Time at which this event was created.This uses the clock on the source
+                         # machine.
+    'entity id':         # Entity IdentifierExact format depends on the
+                         # type.(shelf.resource.port.endpoint.extra)
+    'event':             # Event Type
+    'event description': # Text description for this event.
+    'id':                # Unique ID for this event.
+    'name':              # Name of the entity associated with this event.
+    'priority':          # Event priority.
+    'time-stamp':        # Time at which this event was created.This uses the clock on the source
+                         # machine.
+    'type':              # Entity type.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_alerts(self, 
+               eid_list: list = None,
+               requested_col_names: list = None,
+               wait_sec: float = 0.01,
+               timeout_sec: float = 5.0,
+               errors_warnings: list = None,
+               debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/alerts"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="alert",
+                               plural_key="alerts")
+
+
+"""
+    Below are 7 methods defined by LFClient URL Responders
+"""
+def alerts_since(self,
+                 event_id: int = None,
+                 debug : bool = False,
+                 wait_sec : float = None,
+                 request_timeout_sec : float = None,
+                 max_timeout_sec : float = None,
+                 errors_warnings : list = None):
+    """
+    Select alerts since an alert ID
+    :param event_id: earliest to start at
+    """
+    response = self.json_get(url="/alerts/alerts_since/{event_id}".format(event_id=event_id),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def alerts_last_events(self,
+                       event_count: int = None,
+                       debug : bool = False,
+                       wait_sec : float = None,
+                       request_timeout_sec : float = None,
+                       max_timeout_sec : float = None,
+                       errors_warnings : list = None):
+    """
+    Select last event_count alerts
+    :param event_count: number since end to select
+    """
+    response = self.json_get(url="/alerts/last/{event_count}".format(event_count=event_count),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def alerts_before(self,
+                  event_id: int = None,
+                  debug : bool = False,
+                  wait_sec : float = None,
+                  request_timeout_sec : float = None,
+                  max_timeout_sec : float = None,
+                  errors_warnings : list = None):
+    """
+    Select first alerts before alert_id
+    :param event_id: id to stop selecting at
+    """
+    response = self.json_get(url="/alerts/before/{event_id}".format(event_id=event_id),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def events_between(self,
+                   start_event_id: int = None,
+                   end_event_id: int = None,
+                   debug : bool = False,
+                   wait_sec : float = None,
+                   request_timeout_sec : float = None,
+                   max_timeout_sec : float = None,
+                   errors_warnings : list = None):
+    """
+    Select events between start and end IDs, inclusive
+    :param start_event_id: start selection at this id
+    :param end_event_id: end selection at this id
+    """
+    response = self.json_get(url="/events/between/{start_event_id}/{end_event_id}".format(start_event_id=start_event_id, end_event_id=end_event_id),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def events_get_event(self,
+                     event_id: int = None,
+                     debug : bool = False,
+                     wait_sec : float = None,
+                     request_timeout_sec : float = None,
+                     max_timeout_sec : float = None,
+                     errors_warnings : list = None):
+    """
+    Query an event by id
+    :param event_id: id to select
+    """
+    response = self.json_get(url="/events/{event_id}".format(event_id=event_id),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def events_last_events(self,
+                       event_count: int = None,
+                       debug : bool = False,
+                       wait_sec : float = None,
+                       request_timeout_sec : float = None,
+                       max_timeout_sec : float = None,
+                       errors_warnings : list = None):
+    """
+    Select last event_count events
+    :param event_count: number since end to select
+    """
+    response = self.json_get(url="/events/last/{event_count}".format(event_count=event_count),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+def events_since(self,
+                 event_id: int = None,
+                 debug : bool = False,
+                 wait_sec : float = None,
+                 request_timeout_sec : float = None,
+                 max_timeout_sec : float = None,
+                 errors_warnings : list = None):
+    """
+    Select events since an id
+    :param event_id: event id to start at
+    """
+    response = self.json_get(url="/events/since/{event_id}".format(event_id=event_id),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="event",
+                               plural_key="events")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CONTROL> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /control/$command
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_control(eid_list=['1.234', '1.344'],
+                                   debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_control(self, 
+                eid_list: list = None,
+                requested_col_names: list = None,
+                wait_sec: float = 0.01,
+                timeout_sec: float = 5.0,
+                errors_warnings: list = None,
+                debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/control"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <ENDSESSION> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /endsession
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_endsession(eid_list=['1.234', '1.344'],
+                                      debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_endsession(self, 
+                   eid_list: list = None,
+                   requested_col_names: list = None,
+                   wait_sec: float = 0.01,
+                   timeout_sec: float = 5.0,
+                   errors_warnings: list = None,
+                   debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/endsession"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <EVENTS> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /events/
+    /events/$event_id
+    /events/before/$event_id
+    /events/between/$start_event_id/$end_event_id
+    /events/last/$event_count
+    /events/since/$event_id
+
+When requesting specific column names, they need to be URL encoded:
+    eid, entity+id, event, event+description, id, name, priority, time-stamp, 
+    type
+Example URL: /events?fields=eid,entity+id
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_events(eid_list=['1.234', '1.344'],
+                                  requested_col_names=['entity id'], 
+                                  debug=True)
+
+The record returned will have these members: 
+{
+    'eid':               # Time at which this event was created.This uses the clock on the source
+                         # machine.
+    'entity id':         # Entity IdentifierExact format depends on the
+                         # type.(shelf.resource.port.endpoint.extra)
+    'event':             # Event Type
+    'event description': # Text description for this event.
+    'id':                # Unique ID for this event.
+    'name':              # Name of the entity associated with this event.
+    'priority':          # Event priority.
+    'time-stamp':        # Time at which this event was created.This uses the clock on the source
+                         # machine.
+    'type':              # Entity type.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_events(self, 
+               eid_list: list = None,
+               requested_col_names: list = None,
+               wait_sec: float = 0.01,
+               timeout_sec: float = 5.0,
+               errors_warnings: list = None,
+               debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/events"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="alert",
+                               plural_key="alerts")
+
+
+"""
+    Below are 7 methods defined by LFClient URL Responders
+"""
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <GUI-CLI> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /gui-cli/
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_gui_cli(eid_list=['1.234', '1.344'],
+                                   debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_gui_cli(self, 
+                eid_list: list = None,
+                requested_col_names: list = None,
+                wait_sec: float = 0.01,
+                timeout_sec: float = 5.0,
+                errors_warnings: list = None,
+                debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/gui-cli"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <NEWSESSION> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /newsession
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_newsession(eid_list=['1.234', '1.344'],
+                                      debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_newsession(self, 
+                   eid_list: list = None,
+                   requested_col_names: list = None,
+                   wait_sec: float = 0.01,
+                   timeout_sec: float = 5.0,
+                   errors_warnings: list = None,
+                   debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/newsession"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <QUIT> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /quit
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_quit(eid_list=['1.234', '1.344'],
+                                debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_quit(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/quit"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <STATUS-MSG> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /status-msg/
+    /status-msg/$session
+    /status-msg/$session/$id
+    /status-msg/$session/$id/ws-msg,...
+    /status-msg/$session/all
+    /status-msg/$session/this
+    /status-msg/sessions
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_status_msg(eid_list=['1.234', '1.344'],
+                                      debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_status_msg(self, 
+                   eid_list: list = None,
+                   requested_col_names: list = None,
+                   wait_sec: float = 0.01,
+                   timeout_sec: float = 5.0,
+                   errors_warnings: list = None,
+                   debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/status-msg"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="sessions/messages",
+                               plural_key="sessions/messages")
+
+
+"""
+    Below are 3 methods defined by LFClient URL Responders
+"""
+def status_msg_new_session(self,
+                           session : str = None,
+                           debug : bool = False,
+                           wait_sec : float = None,
+                           request_timeout_sec : float = None,
+                           max_timeout_sec : float = None,
+                           errors_warnings : list = None):
+    """
+    Add a status message
+    :param [R]session: session ID [R]
+    """
+    response = self.json_put(url="/status-msg/{session}".format(session=session),
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=request_timeout_sec,
+                             max_timeout_sec=max_timeout_sec,
+                             errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return response
+
+
+def status_msg_delete_session(self,
+                              session : str = None,
+                              debug : bool = False,
+                              wait_sec : float = None,
+                              request_timeout_sec : float = None,
+                              max_timeout_sec : float = None,
+                              errors_warnings : list = None):
+    """
+    Delete a status-msg session
+    :param session: id to delete
+    """
+    response = self.json_delete(url="/status-msg/{session}".format(session=session),
+                                debug=debug,
+                                wait_sec=wait_sec,
+                                request_timeout_sec=request_timeout_sec,
+                                max_timeout_sec=max_timeout_sec,
+                                errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return response
+
+
+def status_msg_delete_message(self,
+                              session : str = None,
+                              key : str = None,
+                              debug : bool = False,
+                              wait_sec : float = None,
+                              request_timeout_sec : float = None,
+                              max_timeout_sec : float = None,
+                              errors_warnings : list = None):
+    """
+    Delete a status message
+    :param session: session ID
+    :param key: item ID
+    """
+    response = self.json_delete(url="/status-msg/{session}/{key}".format(session=session, key=key),
+                                debug=debug,
+                                wait_sec=wait_sec,
+                                request_timeout_sec=request_timeout_sec,
+                                max_timeout_sec=max_timeout_sec,
+                                errors_warnings=errors_warnings)
+    if not response:
+        return None
+    return response
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <TEXT> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /text/
+    /text/$group
+    /text/$group/$class
+    /text/$group/$class/$key
+
+When requesting specific column names, they need to be URL encoded:
+    eid, name, text, type
+Example URL: /text?fields=eid,name
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_text(eid_list=['1.234', '1.344'],
+                                requested_col_names=['text'], 
+                                debug=True)
+
+The record returned will have these members: 
+{
+    'eid':  # -
+    'name': # -
+    'text': # -
+    'type': # -
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_text(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/text"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="record",
+                               plural_key="records")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <WS-MSG> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /ws-msg/
+    /ws-msg/$sessionid
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_ws_msg(eid_list=['1.234', '1.344'],
+                                  debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_ws_msg(self, 
+               eid_list: list = None,
+               requested_col_names: list = None,
+               wait_sec: float = 0.01,
+               timeout_sec: float = 5.0,
+               errors_warnings: list = None,
+               debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/ws-msg"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
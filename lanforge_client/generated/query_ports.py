@@ -0,0 +1,1402 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Auto generated LFJsonQuery members, split out of lanforge_api.py by
+    lanforge_api_split.py. LFJsonQuery imports this module the first time one of
+    them is used: call them through LFJsonQuery, do not edit them here.
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <ATTENUATOR> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /attenuator/
+    /attenuator/$shelf_id
+    /attenuator/$shelf_id/$resource_id
+    /attenuator/$shelf_id/$resource_id/$port_id
+    /attenuators/
+    /attenuators/$shelf_id
+    /attenuators/$shelf_id/$resource_id
+    /attenuators/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    entity+id, module+1, module+2, module+3, module+4, module+5, module+6, module+7, 
+    module+8, name, script, state, temperature
+Example URL: /attenuator?fields=entity+id,module+1
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_attenuator(eid_list=['1.234', '1.344'],
+                                      requested_col_names=['entity id'], 
+                                      debug=True)
+
+The record returned will have these members: 
+{
+    'entity id':   # Entity ID
+    'module 1':    # Reported attenuator dB settings.
+    'module 2':    # Reported attenuator dB settings.
+    'module 3':    # Reported attenuator dB settings.
+    'module 4':    # Reported attenuator dB settings.
+    'module 5':    # Reported attenuator dB settings.
+    'module 6':    # Reported attenuator dB settings.
+    'module 7':    # Reported attenuator dB settings.
+    'module 8':    # Reported attenuator dB settings.
+    'name':        # Attenuator module identifier (shelf . resource . serial-num).
+    'script':      # Attenuator script state.
+    'state':       # Attenuator state.
+    'temperature': # Temperature in degres Farenheight reported in Attenuator unit.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_attenuator(self, 
+                   eid_list: list = None,
+                   requested_col_names: list = None,
+                   wait_sec: float = 0.01,
+                   timeout_sec: float = 5.0,
+                   errors_warnings: list = None,
+                   debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/attenuator"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="attenuator",
+                               plural_key="attenuators")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <CHAMBER> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /chamber/
+    /chamber/$chamber_name
+
+When requesting specific column names, they need to be URL encoded:
+    chamber, chamber+connections, chamber+resources, chamber+type, duts, entity+id, 
+    flags, hide, isolation, marked, open, reported+rotation+%28deg%29, reported+rpm, 
+    reported+tilt+%28deg%29, resource, rotation+%28deg%29, rpm, smas, tilt+%28deg%29, turntable, 
+    turntable+type, virtual
+Example URL: /chamber?fields=chamber,chamber+connections
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_chamber(eid_list=['1.234', '1.344'],
+                                   requested_col_names=['entity id'], 
+                                   debug=True)
+
+The record returned will have these members: 
+{
+    'chamber':                 # -
+    'chamber connections':     # -
+    'chamber resources':       # -
+    'chamber type':            # -
+    'duts':                    # -
+    'entity id':               # -
+    'flags':                   # -
+    'hide':                    # -
+    'isolation':               # -
+    'marked':                  # -
+    'open':                    # -
+    'reported rotation (deg)': # -
+    'reported rpm ':           # -
+    'reported tilt (deg)':     # -
+    'resource':                # -
+    'rotation (deg)':          # -
+    'rpm':                     # -
+    'smas':                    # -
+    'tilt (deg)':              # -
+    'turntable':               # -
+    'turntable type':          # -
+    'virtual':                 # -
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_chamber(self, 
+                eid_list: list = None,
+                requested_col_names: list = None,
+                wait_sec: float = 0.01,
+                timeout_sec: float = 5.0,
+                errors_warnings: list = None,
+                debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/chamber"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="chamber",
+                               plural_key="chambers")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <DUT> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /dut/
+    /dut/$name
+
+When requesting specific column names, they need to be URL encoded:
+    api+version, bssid-1, bssid-2, bssid-3, bssid-4, bssid-5, bssid-6, bssid-7, 
+    bssid-8, dut, eap-id, entity+id, hw+info, image+file, lan, mgt+ip, model+number, 
+    notes, num+ant+radio+1, num+ant+radio+2, num+ant+radio+3, password-1, password-2, 
+    password-3, password-4, password-5, password-6, password-7, password-8, serial+number, 
+    serial+port, ssid-1, ssid-2, ssid-3, ssid-4, ssid-5, ssid-6, ssid-7, ssid-8, 
+    sw+info, wan
+Example URL: /dut?fields=api+version,bssid-1
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_dut(eid_list=['1.234', '1.344'],
+                               requested_col_names=['entity id'], 
+                               debug=True)
+
+The record returned will have these members: 
+{
+    'api version':     # API Version
+    'bssid-1':         # WiFi BSSID for DUT.
+    'bssid-2':         # WiFi BSSID for DUT.
+    'bssid-3':         # WiFi BSSID for DUT.
+    'bssid-4':         # WiFi BSSID for DUT.
+    'bssid-5':         # WiFi BSSID for DUT.
+    'bssid-6':         # WiFi BSSID for DUT.
+    'bssid-7':         # WiFi BSSID for DUT.
+    'bssid-8':         # WiFi BSSID for DUT.
+    'dut':             # Devices Under Test
+    'eap-id':          # EAP Identifier, only used when one of the EAP options are selected.
+    'entity id':       # Entity ID
+    'hw info':         # DUT Hardware Info
+    'image file':      # Image file name. Relative paths assume directory /home/lanforge. Fully
+                       # qualified pathnames begin with a slash (eg
+                       # /usr/lib/share/icons/icon.png).File format should be PNG, JPG or BMP.
+    'lan':             # IP/Mask for LAN port (192.168.2.1/24).
+    'mgt ip':          # DUT Management IP address.
+    'model number':    # DUT model number or product name
+    'notes':           # Notes
+    'num ant radio 1': # Antenna count for DUT radio(s).
+    'num ant radio 2': # Antenna count for DUT radio(s).
+    'num ant radio 3': # Antenna count for DUT radio(s).
+    'password-1':      # WiFi Password needed to connect to DUT.
+    'password-2':      # WiFi Password needed to connect to DUT.
+    'password-3':      # WiFi Password needed to connect to DUT.
+    'password-4':      # WiFi Password needed to connect to DUT.
+    'password-5':      # WiFi Password needed to connect to DUT.
+    'password-6':      # WiFi Password needed to connect to DUT.
+    'password-7':      # WiFi Password needed to connect to DUT.
+    'password-8':      # WiFi Password needed to connect to DUT.
+    'serial number':   # DUT Identifier (serial-number, or similar)
+    'serial port':     # Resource and name of LANforge serial port that connects to this DUT.
+                       # (1.1.ttyS0). Does not need to belong to lan_port or wan_port resource.
+    'ssid-1':          # WiFi SSID advertised by DUT.
+    'ssid-2':          # WiFi SSID advertised by DUT.
+    'ssid-3':          # WiFi SSID advertised by DUT.
+    'ssid-4':          # WiFi SSID advertised by DUT.
+    'ssid-5':          # WiFi SSID advertised by DUT.
+    'ssid-6':          # WiFi SSID advertised by DUT.
+    'ssid-7':          # WiFi SSID advertised by DUT.
+    'ssid-8':          # WiFi SSID advertised by DUT.
+    'sw info':         # DUT Software Info
+    'wan':             # IP/Mask for WAN port (192.168.3.2/24).
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_dut(self, 
+            eid_list: list = None,
+            requested_col_names: list = None,
+            wait_sec: float = 0.01,
+            timeout_sec: float = 5.0,
+            errors_warnings: list = None,
+            debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/dut"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="dut",
+                               plural_key="duts")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <PORT> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /port/
+    /port/$shelf_id
+    /port/$shelf_id/$resource_id
+    /port/$shelf_id/$resource_id/$port_id
+    /portprobe/
+    /portprobe/$shelf_id/$resource_id/$port_id
+    /ports/
+    /ports/$shelf_id
+    /ports/$shelf_id/$resource_id
+    /ports/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    4way+time+%28us%29, activity, alias, anqp+time+%28us%29, ap, beacon, bps+rx, bps+rx+ll, 
+    bps+tx, bps+tx+ll, bytes+rx+ll, bytes+tx+ll, channel, collisions, connections, 
+    crypt, cx+ago, cx+time+%28us%29, device, dhcp+%28ms%29, down, entity+id, gateway+ip, 
+    ip, ipv6+address, ipv6+gateway, key%2Fphrase, login-fail, login-ok, logout-fail, 
+    logout-ok, mac, mask, misc, mode, mtu, no+cx+%28us%29, noise, parent+dev, phantom, 
+    port, port+type, pps+rx, pps+tx, qlen, reset, retry+failed, rx+bytes, rx+crc, 
+    rx+drop, rx+errors, rx+fifo, rx+frame, rx+length, rx+miss, rx+over, rx+pkts, 
+    rx-rate, sec, signal, ssid, status, time-stamp, tx+abort, tx+bytes, tx+crr, 
+    tx+errors, tx+fifo, tx+hb, tx+pkts, tx+wind, tx-failed+%25, tx-rate, wifi+retries, 
+          # hidden columns:
+    beacon_rx_signal, port_cur_flags_h, port_cur_flags_l, port_supported_flags_h, 
+    port_supported_flags_l, resource, rx_multicast, tx_dropped
+Example URL: /port?fields=4way+time+%28us%29,activity
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_port(eid_list=['1.234', '1.344'],
+                                requested_col_names=['entity id'], 
+                                debug=True)
+
+The record returned will have these members: 
+{
+    '4way time (us)': # TIme (in micro-seconds) it took to complete the last WiFi 4-way
+                      # authentication.
+    'activity':       # Percent of the channel that is utilized over the last minute.This
+                      # includes locally generated traffic as well as anyother systems active on
+                      # this channel.This is a per-radio value.
+    'alias':          # User-specified alias for this Port.
+    'anqp time (us)': # Time (in micro-seconds) it took to complete the last WiFi ANQP
+                      # request/response session.
+    'ap':             # BSSID of AP for connected stations.
+    'beacon':         # Number of Wireless beacons from Cell or AP that have been missed.
+    'bps rx':         # Average bits per second received for the last 30 seconds.
+    'bps rx ll':      # Bits per second received, including low-level framing (Ethernet Only).
+    'bps tx':         # Average bits per second transmitted for the last 30 seconds.
+    'bps tx ll':      # Bits per second transmitted, including low-level framing (Ethernet
+                      # Only).
+    'bytes rx ll':    # Bytes received, including low-level framing (Ethernet Only).
+    'bytes tx ll':    # Bytes transmitted, including low-level framing (Ethernet Only).
+    'channel':        # Channel at the device is currently on, if known.
+    'collisions':     # Total number of collisions reported by this Interface.For WiFi devices,
+                      # this is number of re-transmit attempts.
+    'connections':    # Number of wireless connections completed.
+    'crypt':          # Number of Wireless packets dropped due to inability to decrypt.
+    'cx ago':         # How long ago was the last WiFi connection attempt started?This relates
+                      # only to the network interface, not any higher level protocol traffic
+                      # upon it.
+    'cx time (us)':   # Time (in micro-seconds) it took to complete the last WiFi connection to
+                      # the AP.
+    'device':         # Ethernet device name, as seen by the kernel.
+    'dhcp (ms)':      # Time (in miliseconds) it took to acquire DHCP lease,or to time out while
+                      # trying to acquire lease.
+    'down':           # The interface is configured DOWN.  It must be configured UP to be in
+                      # active use.
+    'entity id':      # Entity ID
+    'gateway ip':     # Default Router/Gateway IP for the Interface.
+    'ip':             # IP Address of the Interface.
+    'ipv6 address':   # IPv6 Address for this interface.  If global-scope address exists, it
+                      # will be displayed,otherwise link-local will be displayed.
+    'ipv6 gateway':   # IPv6 default gateway.
+    'key/phrase':     # WEP Key or WPA Phrase (if enabled).
+    'login-fail':     # The 'ifup-post' script reported failure.  This is usually used for WiFi
+                      # portallogins, but may be customized by the user for other needs.
+    'login-ok':       # The 'ifup-post' script reported OK.  This is usually used for WiFi
+                      # portallogins, but may be customized by the user for other needs.
+    'logout-fail':    # The 'ifup-post --logout' script reported failure.  This is usually used
+                      # for WiFi portallogouts, but may be customized by the user for other
+                      # needs.
+    'logout-ok':      # The 'ifup-post --logout' script reported OK.  This is usually used for
+                      # WiFi portallogouts, but may be customized by the user for other needs.
+    'mac':            # Ethernet MAC address of the Interface.
+    'mask':           # IP Mask of the Interface.
+    'misc':           # Number of Wireless packets dropped on receive due to unspecified
+                      # reasons.
+    'mode':           # Wireless radio mode (802.11a/b/g).
+    'mtu':            # MTU (Maximum Transmit Unit) size, in bytes.
+    'no cx (us)':     # How long was the WiFi disconnect duration for the last disconnection?
+    'noise':          # Wireless noise level.
+    'parent dev':     # Parent device or port of this port. Blank if this device is not a child
+                      # of another device or port.
+    'phantom':        # Is the port PHANTOM (no hardware found) or not.
+    'port':           # Entity ID
+    'port type':      # Ports can be Ethernet, Radio, vAP, vSTA, Redirect, or Bridges
+    'pps rx':         # Average packets per second received for the last 30 seconds.
+    'pps tx':         # Average packets per second transmitted for the last 30 seconds.
+    'qlen':           # "Transmit Queue Length for this Interface.
+    'reset':          # Current Reset-State.
+    'retry failed':   # Number of Wireless packets that the interface failed to send due to
+                      # excessive retries.
+    'rx bytes':       # Total number of bytes received by this Interface.
+    'rx crc':         # Total number of packets dropped because of a bad CRC/FCS.
+    'rx drop':        # Total number of dropped packets on recieve.  Usually means driver/kernel
+                      # is being over-worked.
+    'rx errors':      # Total number of all types of Receive Errors.
+    'rx fifo':        # Total number of packets dropped because driver/kernel queues are full.
+    'rx frame':       # Total number of packets dropped because of framing errors at the
+                      # physical layer.
+    'rx length':      # Total number of packets dropped because their length was invalid.
+    'rx miss':        # Total number of packets dropped because of a missed interrupt.
+    'rx over':        # Total number of packets dropped because of framing errors at the
+                      # physical layer.
+    'rx pkts':        # Total number of packets received by this Interface.
+    'rx-rate':        # Reported network device RX link speed.
+    'sec':            # Number of secondary IP addresses configured or detected.
+    'signal':         # Wireless signal strength (RSSI).
+    'ssid':           # WiFi SSID identifier.Use [BLANK] for empty SSID, which means use any
+                      # available SSID when associating.
+    'status':         # Wireless link status.
+    'time-stamp':     # Time-Stamp
+    'tx abort':       # Total packets dropped on transmit because of driver abort.
+    'tx bytes':       # Total number of bytes sent by this Interface.
+    'tx crr':         # Total packets dropped on transmit because of carrier error.
+    'tx errors':      # Total number of all types of Transmit Errors.
+    'tx fifo':        # Total packets dropped on transmit because outgoing queue was full.
+    'tx hb':          # Total packets dropped on transmit because of transceiver heartbeat
+                      # errors.
+    'tx pkts':        # Total number of packets sent by this Interface.
+    'tx wind':        # Total number dropped on transmit because of Out-of-Window collision.
+    'tx-failed %':    # Percentage of transmitted Wireless packets that were not ACKed.They
+                      # might have succeeded on retry.
+    'tx-rate':        # Reported network device TX link speed.
+    'wifi retries':   # Number of Wireless packets that the wifi radio retried.One packet may be
+                      # tried multiple times and each try would be counted in this stat.Not all
+                      # radios can properly report this statistic.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_port(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/port"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="interface",
+                               plural_key="interfaces")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <PROBE> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /probe/
+    /probe/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    entity+id, probe+results
+Example URL: /probe?fields=entity+id,probe+results
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_probe(eid_list=['1.234', '1.344'],
+                                 requested_col_names=['probe results'], 
+                                 debug=True)
+
+The record returned will have these members: 
+{
+    'entity id':     # Entity ID
+    'probe results': # Probe the low level information about the port.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_probe(self, 
+              eid_list: list = None,
+              requested_col_names: list = None,
+              wait_sec: float = 0.01,
+              timeout_sec: float = 5.0,
+              errors_warnings: list = None,
+              debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/probe"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="probe-results",
+                               plural_key="probe-results")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <RADIOSTATUS> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /radiostatus/
+    /radiostatus/$eid
+    /radiostatus/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    _links, antenna, ap, capabilities, channel, country, driver, entity+id, firmware+version, 
+    frag, frequency, max_sta, max_vap, max_vifs, monitors_down, monitors_up, 
+    phantom, port, resource, rts, stations_down, stations_up, tx-power, vaps_down, 
+    vaps_up, verbose+debug
+Example URL: /radiostatus?fields=_links,antenna
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_radiostatus(eid_list=['1.234', '1.344'],
+                                       requested_col_names=['firmware version'], 
+                                       debug=True)
+
+The record returned will have these members: 
+{
+    '_links':           # -
+    'antenna':          # -
+    'ap':               # -
+    'capabilities':     # -
+    'channel':          # -
+    'country':          # -
+    'driver':           # -
+    'entity id':        # -
+    'firmware version': # -
+    'frag':             # -
+    'frequency':        # -
+    'max_sta':          # -
+    'max_vap':          # -
+    'max_vifs':         # -
+    'monitors_down':    # -
+    'monitors_up':      # -
+    'phantom':          # -
+    'port':             # -
+    'resource':         # -
+    'rts':              # -
+    'stations_down':    # -
+    'stations_up':      # -
+    'tx-power':         # -
+    'vaps_down':        # -
+    'vaps_up':          # -
+    'verbose debug':    # -
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_radiostatus(self, 
+                    eid_list: list = None,
+                    requested_col_names: list = None,
+                    wait_sec: float = 0.01,
+                    timeout_sec: float = 5.0,
+                    errors_warnings: list = None,
+                    debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/radiostatus"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="radio",
+                               plural_key="radios")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <RESOURCE> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /resource/
+    /resource/$shelf_id
+    /resource/$shelf_id/$resource_id
+
+When requesting specific column names, they need to be URL encoded:
+    bps-rx-3s, bps-tx-3s, cli-port, cpu, ctrl-ip, ctrl-port, eid, entity+id, 
+    free+mem, free+swap, gps, hostname, hw+version, load, max+if-up, max+staged, 
+    mem, phantom, ports, rx+bytes, shelf, sta+up, sw+version, swap, tx+bytes, 
+          # hidden columns:
+    timestamp
+Example URL: /resource?fields=bps-rx-3s,bps-tx-3s
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_resource(eid_list=['1.234', '1.344'],
+                                    requested_col_names=['entity id'], 
+                                    debug=True)
+
+The record returned will have these members: 
+{
+    'bps-rx-3s':  # Rate in bits-per-second that the manager issending management data to
+                  # the resource, averaged over the last 3 seconds.This is TCP payload data,
+                  # and does not count the IP and Ethernet overhead.
+    'bps-tx-3s':  # Rate in bits-per-second that the manager isreceiving management data
+                  # from the resource, averaged over the last 3 seconds.This is TCP payload
+                  # data, and does not count the IP and Ethernet overhead.
+    'cli-port':   # Text (telnet) interface IP Port.
+    'cpu':        # CPU information for the machine.
+    'ctrl-ip':    # IP Address of the Control Interface.
+    'ctrl-port':  # Binary interface IP Port.
+    'eid':        # Resource EID (Shelf.Resource).
+    'entity id':  # Entity ID
+    'free mem':   # Free Memory (Kbytes) in the machine.  If this is too low, performance
+                  # will be degraded.
+    'free swap':  # Free Swap (Kbytes) in the machine.  If this is too low, performance will
+                  # be degraded.
+    'gps':        # GPS Info for this machine, if GPS is attached.
+    'hostname':   # The name for this resource, as reported by the resource.
+    'hw version': # Hardware version on the machine.
+    'load':       # Unix process load..
+    'max if-up':  # Max number of interface-config scripts try to run at once.
+    'max staged': # Max number of interfaces the system will try to bringup at once.
+    'mem':        # Total memory (Kbytes) on the machine.
+    'phantom':    # Is the resource PHANTOM (undiscovered) or not.
+    'ports':      # All real and phantom ports on this machine.
+    'rx bytes':   # Total management TCP payload bytes received from the manager process by
+                  # this resource.
+    'shelf':      # Number of shelf that this resource belongs to.
+    'sta up':     # Max number of stations to bring up per radio per 0.25s tick.
+    'sw version': # LANforge Software version running on the machine.
+    'swap':       # Total swap space (Kbytes) on the machine.
+    'tx bytes':   # Total management TCP payload bytes sent from this resource to the
+                  # manager process.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_resource(self, 
+                 eid_list: list = None,
+                 requested_col_names: list = None,
+                 wait_sec: float = 0.01,
+                 timeout_sec: float = 5.0,
+                 errors_warnings: list = None,
+                 debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/resource"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="resource",
+                               plural_key="resources")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <SCAN> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /scan-results/
+    /scan-results/$shelf_id/$resource_id/$port_id
+    /scan-results/$shelf_id/$resource_id/$port_id/$bssid
+    /scan/
+    /scan/$shelf_id/$resource_id/$port_id
+    /scan/$shelf_id/$resource_id/$port_id/$bssid
+    /scanresults/
+    /scanresults/$shelf_id/$resource_id/$port_id
+    /scanresults/$shelf_id/$resource_id/$port_id/$bssid
+
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_scan(eid_list=['1.234', '1.344'],
+                                debug=True)
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_scan(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/scan"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="scan-results",
+                               plural_key="scan-results")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <STATIONS> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /stations/
+    /stations/$mac
+
+When requesting specific column names, they need to be URL encoded:
+    ap, auth-for, capabilities, entity+id, idle, roam-duration, rx+bytes, rx+pkts, 
+    rx+rate, signal, station+bssid, tx+bytes, tx+pkts, tx+rate, tx+retries, tx-failed, 
+  
+Example URL: /stations?fields=ap,auth-for
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_stations(eid_list=['1.234', '1.344'],
+                                    requested_col_names=['entity id'], 
+                                    debug=True)
+
+The record returned will have these members: 
+{
+    'ap':            # The Port that owns this station.
+    'auth-for':      # Duration in seconds this station has been authenticated.
+    'capabilities':  # Station's negotiated capabilities.
+    'entity id':     # Entity ID
+    'idle':          # Miliseconds since this station last received a frame from the peer.
+    'roam-duration': # The difference between the authenticate-time on the new APand the last
+                     # frame received on old AP, in milliseconds.It is not always possible to
+                     # compute this accurately,especially if traffic is not flowing during the
+                     # roam.
+    'rx bytes':      # RX Byte counter for this station.
+    'rx pkts':       # RX Packets counter for this station.
+    'rx rate':       # Station last received encoding rate.
+    'signal':        # Station signal quality.
+    'station bssid': # Station's MAC address (BSSID).
+    'tx bytes':      # TX Byte counter for this station.
+    'tx pkts':       # TX Packets counter for this station.
+    'tx rate':       # Station transmit encoding rate.
+    'tx retries':    # TX Retries counter for this station.This counts retries at the driver
+                     # level.Retries made by the WiFi hardware and/or firmware is not counted.
+    'tx-failed':     # TX Failed counter for this station.This counts TX failures at the driver
+                     # level.The hardware and/or firmware may have made several failed attempts
+                     # that are not included in this counter.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_stations(self, 
+                 eid_list: list = None,
+                 requested_col_names: list = None,
+                 wait_sec: float = 0.01,
+                 timeout_sec: float = 5.0,
+                 errors_warnings: list = None,
+                 debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/stations"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="station",
+                               plural_key="stations")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <VR> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /vr-cx/
+    /vr-cx/$shelf_id/$resource_id/$port_id
+    /vr/
+    /vr/$shelf_id/$resource_id
+    /vrcx/
+    /vrcx/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    active+ipv6+router, bgp+4byte+as, bgp+damping, bgp+peers, cluster+id, collision+domain+id, 
+    confederation+id, damping+half+life, damping+max+suppress, damping+reuse, 
+    damping+suppress, entity+id, height, ipv6+radv, is+bgp+reflector, local+as, 
+    multicast+routing, name, netsmith-state, notes, pad, ripv2, router+connections, 
+    router+id, router+id, use+confederation, use+existing+cfg, use+ospf, use+rip+dft+route, 
+    using+bgp, using+olsr, width, x, xorp+sha, y
+Example URL: /vr?fields=active+ipv6+router,bgp+4byte+as
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_vr(eid_list=['1.234', '1.344'],
+                              requested_col_names=['netsmith-state'], 
+                              debug=True)
+
+The record returned will have these members: 
+{
+    'active ipv6 router':   # -
+    'bgp 4byte as':         # -
+    'bgp damping':          # lc_key > lc_col_name-
+    'bgp peers':            # -
+    'cluster id':           # -
+    'collision domain id':  # -
+    'confederation id':     # -
+    'damping half life':    # -
+    'damping max suppress': # -
+    'damping reuse':        # -
+    'damping suppress':     # -
+    'entity id':            # Entity ID
+    'height':               # -
+    'ipv6 radv':            # -
+    'is bgp reflector':     # -
+    'local as':             # -
+    'multicast routing':    # -
+    'name':                 # Name
+    'netsmith-state':       # -
+    'notes':                # -
+    'pad':                  # -
+    'ripv2':                # -
+    'router connections':   # -
+    'router id':            # -
+    'router id':            # -
+    'use confederation ':   # -
+    'use existing cfg':     # -
+    'use ospf':             # -
+    'use rip dft route':    # -
+    'using bgp':            # -
+    'using olsr':           # -
+    'width':                # -
+    'x':                    # -
+    'xorp sha':             # -
+    'y':                    # -
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_vr(self, 
+           eid_list: list = None,
+           requested_col_names: list = None,
+           wait_sec: float = 0.01,
+           timeout_sec: float = 5.0,
+           errors_warnings: list = None,
+           debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/vr"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="virtual-routers",
+                               plural_key="virtual-routers")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <VRCX> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /vrcx/
+    /vrcx/$shelf_id/$resource_id/$port_id
+
+When requesting specific column names, they need to be URL encoded:
+    entity+id, height, interface+cost, local-a, local-b, netsmith-state, remote-a, 
+    remote-b, resource, rip+metric, vrrp+id, vrrp+interval, vrrp+ip, vrrp+ip-prefix, 
+    vrrp+priority, wan+link, width, x, y
+Example URL: /vrcx?fields=entity+id,height
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_vrcx(eid_list=['1.234', '1.344'],
+                                requested_col_names=['netsmith-state'], 
+                                debug=True)
+
+The record returned will have these members: 
+{
+    'entity id':      # -
+    'height':         # -
+    'interface cost': # -
+    'local-a':        # -
+    'local-b':        # -
+    'netsmith-state': # -
+    'remote-a':       # -
+    'remote-b':       # -
+    'resource':       # -
+    'rip metric':     # -
+    'vrrp id':        # -
+    'vrrp interval':  # -
+    'vrrp ip':        # -
+    'vrrp ip-prefix': # -
+    'vrrp priority':  # -
+    'wan link':       # -
+    'width':          # -
+    'x':              # -
+    'y':              # -
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_vrcx(self, 
+             eid_list: list = None,
+             requested_col_names: list = None,
+             wait_sec: float = 0.01,
+             timeout_sec: float = 5.0,
+             errors_warnings: list = None,
+             debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/vrcx"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="router-connections",
+                               plural_key="router-connections")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <WL> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /wl-endp/
+    /wl-endp/$wl_ep_id
+    /wl-ep/
+    /wl-ep/$wl_ep_id
+    /wl/
+    /wl/$wl_id
+    /wl_endp/
+    /wl_endp/$wl_ep_id
+    /wl_ep/
+    /wl_ep/$wl_ep_id
+    /wlendp/$wl_ep_id
+
+When requesting specific column names, they need to be URL encoded:
+    bps+rx+a, bps+rx+b, eid, endpoints+%28a%C2%A0%E2%86%94%C2%A0b%29, entity+id, k-m, 
+    name, pkt+tx+a%C2%A0%E2%86%90%C2%A0b, pkt+tx+a%C2%A0%E2%86%92%C2%A0b, rpt+timer, 
+    state
+Example URL: /wl?fields=bps+rx+a,bps+rx+b
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_wl(eid_list=['1.234', '1.344'],
+                              requested_col_names=['entity id'], 
+                              debug=True)
+
+The record returned will have these members: 
+{
+    'bps rx a':                           # Endpoint B's Max transmit rate (bps).
+    'bps rx b':                           # Endpoint A's Max transmit rate (bps).
+    'eid':                                # Entity ID
+    'endpoints (a&nbsp;&#x2194;&nbsp;b)': # Endpoints that make up this WanLink.
+    'entity id':                          # Entity ID
+    'k-m':                                # Whether the WanLink is Kernel-Mode or not.
+    'name':                               # WanLink's Name.
+    'pkt tx a&nbsp;&#x2190;&nbsp;b':      # Packets received on endpoint B and transmitted out endpoint A.
+    'pkt tx a&nbsp;&#x2192;&nbsp;b':      # Packets received on endpoint A and transmitted out endpoint B.
+    'rpt timer':                          # Cross Connect's Report Timer (milliseconds).This is how often the GUI
+                                          # will ask for updates from the LANforge processes.If the GUI is sluggish,
+                                          # increasing the report timers may help.
+    'state':                              # Current State of the connection.UninitializedHas not yet been
+                                          # started/stopped.InitializingBeing set up.StartingStarting the
+                                          # test.RunningTest is actively running.StoppedTest has been
+                                          # stopped.QuiesceTest will gracefully stop soon.HW-BYPASSTest is in
+                                          # hardware-bypass mode (WanLinks only)FTM_WAITTest wants to run, but is
+                                          # phantom, probably due to non-existent interface or resource.WAITINGWill
+                                          # restart as soon as resources are available.PHANTOMTest is stopped, and
+                                          # is phantom, probably due to non-existent interface or resource.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_wl(self, 
+           eid_list: list = None,
+           requested_col_names: list = None,
+           wait_sec: float = 0.01,
+           timeout_sec: float = 5.0,
+           errors_warnings: list = None,
+           debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/wl"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="",
+                               plural_key="")
+
+
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Notes for <WL-ENDP> type requests
+
+If you need to call the URL directly,
+request one of these URLs:
+    /wl-endp/
+    /wl-endp/$wl_ep_id
+
+When requesting specific column names, they need to be URL encoded:
+    buffer, corrupt+1, corrupt+2, corrupt+3, corrupt+4, corrupt+5, corrupt+6, 
+    delay, dropfreq+%25, dropped, dup+pkts, dupfreq+%25, eid, elapsed, extrabuf, 
+    failed-late, jitfreq+%25, max+rate, maxjitter, maxlate, name, ooo+pkts, qdisc, 
+    reordfrq+%25, run, rx+bytes, rx+pkts, script, serdelay, tx+bytes, tx+drop+%25, 
+    tx+pkts, tx+rate, tx-failed, wps
+Example URL: /wl-endp?fields=buffer,corrupt+1
+
+Example py-json call (it knows the URL):
+    record = LFJsonGet.get_wl_endp(eid_list=['1.234', '1.344'],
+                                   requested_col_names=['eid'], 
+                                   debug=True)
+
+The record returned will have these members: 
+{
+    'buffer':      # Maximum size of receive buffer, in bytes.This is the sum of the amount
+                   # needed for the transit buffers (delay * bandwidth)plus the WanLink
+                   # "Backlog Buffer:" queue size which handles bursts.
+    'corrupt 1':   # Counters for how many times this corruption has been applied.
+    'corrupt 2':   # Counters for how many times this corruption has been applied.
+    'corrupt 3':   # Counters for how many times this corruption has been applied.
+    'corrupt 4':   # Counters for how many times this corruption has been applied.
+    'corrupt 5':   # Counters for how many times this corruption has been applied.
+    'corrupt 6':   # Counters for how many times this corruption has been applied.
+    'delay':       # Base induced latency on received packets, in microseconds.
+    'dropfreq %':  # Frequency out of 1,000,000 to drop a received packet.Select a preset
+                   # value or enter your own.
+    'dropped':     # Total dropped packets on receive.This does not include the tx-failed
+                   # counters.
+    'dup pkts':    # Total duplicate packets generated.
+    'dupfreq %':   # Frequency out of 1,000,000 to duplicate a received packet.Select a
+                   # preset value or enter your own.
+    'eid':         # Entity ID
+    'elapsed':     # Amount of time (seconds) this endpoint has been running (or ran.)
+    'extrabuf':    # Size of "Backlog Buffer:" setting in WanLink configuration in bytes.
+    'failed-late': # Total amount of received packets that could not be transmitted out the
+                   # peer becausethe emulator was overloaded and could not transmit within
+                   # the specified 'lateness'
+    'jitfreq %':   # Frequency out of 1,000,000 that packets should have jitter applied to
+                   # them.Select a preset value or enter your own.
+    'max rate':    # Max transmit rate (bps) for this Endpoint.
+    'maxjitter':   # Maximum additional delay, in microseconds.  See Jitter-Frequency as
+                   # well.
+    'maxlate':     # The maximum lateness in milliseconds allowed before packets will be
+                   # dropped on transmit.If lateness is configured to be automatic, this
+                   # variable will change based onconfigured bandwidth and backlog buffer,
+                   # but will not go below 10ms.
+    'name':        # Endpoint's Name.
+    'ooo pkts':    # Total out of order packets generated.
+    'qdisc':       # Queueing discipline (FIFO, WRR, etc).
+    'reordfrq %':  # Frequency out of 1,000,000 to re-order a received packet.Select a preset
+                   # value or enter your own.
+    'run':         # Is the Endpoint is Running or not.
+    'rx bytes':    # Total received bytes count.
+    'rx pkts':     # Total received packet count.
+    'script':      # Endpoint script state.
+    'serdelay':    # Additional serialization delay for a 1514 byte packet at the configured
+                   # speed (microseconds).
+    'tx bytes':    # Total transmitted bytes count.
+    'tx drop %':   # Packet drop percentage over the last 1 minute.
+    'tx pkts':     # Packets received on the peer interface and transmitted out this
+                   # endpoint's interface.
+    'tx rate':     # The average speed over the last 30 seconds at which we are
+                   # transmittingout the peer interface.This can be thought of as the actual
+                   # transfer rate for packets entering the interfaceassociated with this
+                   # Endpoint.
+    'tx-failed':   # Total amount of received packets that could not be transmitted out the
+                   # peer.This includes any tx-failed-late packets.
+    'wps':         # Enable/Disable showing of WanPaths for individual endpoints.
+}
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+def get_wl_endp(self, 
+                eid_list: list = None,
+                requested_col_names: list = None,
+                wait_sec: float = 0.01,
+                timeout_sec: float = 5.0,
+                errors_warnings: list = None,
+                debug: bool = False):
+    """
+    :param eid_list: list of entity IDs to query for
+    :param requested_col_names: list of column names to return
+    :param wait_sec: duration to wait between retries if no response or response is HTTP 404
+    :param timeout_sec: duration in which to keep querying before returning
+    :param errors_warnings: optional list to extend with errors and warnings from response
+    :param debug: print diagnostic info if true
+    :return: dictionary of results
+    """
+    debug |= self.debug_on
+    url = "/wl-endp"
+    if (eid_list is None) or (len(eid_list) < 1):
+        raise ValueError("no entity id in request")
+    trimmed_fields = []
+    if isinstance(requested_col_names, str):
+        if not requested_col_names.strip():
+            raise ValueError("column name cannot be blank")
+        trimmed_fields.append(requested_col_names.strip())
+    if isinstance(requested_col_names, list):
+        for field in requested_col_names:
+            if not field.strip():
+                raise ValueError("column names cannot be blank")
+            field = field.strip()
+            if field.find(" ") > -1:
+                raise ValueError("field should be URL encoded: [%s]" % field)
+            trimmed_fields.append(field)
+    url += self.create_port_eid_url(eid_list=eid_list)
+
+    if len(trimmed_fields) > 0:
+        url += "?fields=%s" % (",".join(trimmed_fields))
+
+    response = self.json_get(url=url,
+                             debug=debug,
+                             wait_sec=wait_sec,
+                             request_timeout_sec=timeout_sec,
+                             max_timeout_sec=timeout_sec,
+                             errors_warnings=errors_warnings)
+    if response is None:
+        return None
+    return self.extract_values(response=response,
+                               singular_key="endpoint",
+                               plural_key="endpoint")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+    Splits the auto generated members of LFJsonCommand and LFJsonQuery out of a
+    generated lanforge_api.py into the lanforge_client/generated package, one module
+    per family of commands or URLs, and writes the index lanforge_api.py loads them by.
+
+    Methods are copied unchanged as module functions. Flag and enum classes become
+    tables of member name to value in ENUMS; lanforge_api.py builds each class the
+    first time it is used. Everything after the '# Auto generated methods follow:'
+    line of each class is split; members before it stay hand written in lanforge_api.py.
+
+    Run it on the output of JsonApiPythonGenerator whenever that is updated:
+        ./lanforge_api_split.py --source /tmp/lanforge_api.py --dest generated --compile
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import argparse
+import ast
+import os
+import py_compile
+import re
+import sys
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+MARKER = "# Auto generated methods follow:"
+
+# first word of the CLI command to module, others go to cmd_misc
+COMMAND_FAMILIES = {
+    "add": "cmd_add",
+    "rm": "cmd_rm",
+    "set": "cmd_set",
+    "show": "cmd_show",
+}
+COMMAND_DEFAULT = "cmd_misc"
+
+# URL of the 'Notes for <URL> type requests' section to module, others go to query_misc
+QUERY_FAMILIES = {
+    "ATTENUATOR": "query_ports",
+    "CHAMBER": "query_ports",
+    "DUT": "query_ports",
+    "PORT": "query_ports",
+    "PROBE": "query_ports",
+    "RADIOSTATUS": "query_ports",
+    "RESOURCE": "query_ports",
+    "SCAN": "query_ports",
+    "STATIONS": "query_ports",
+    "VR": "query_ports",
+    "VRCX": "query_ports",
+    "WL": "query_ports",
+    "WL-ENDP": "query_ports",
+    "CX": "query_cx",
+    "ENDP": "query_cx",
+    "FILEIO": "query_cx",
+    "GENERIC": "query_cx",
+    "LAYER4": "query_cx",
+    "TEST-GROUP": "query_cx",
+    "VOIP": "query_cx",
+    "VOIP-ENDP": "query_cx",
+}
+QUERY_DEFAULT = "query_misc"
+
+NOTES_RE = re.compile(r"Notes for <([^>]+)> type requests")
+
+BANNER = "----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"
+
+
+def command_family(section):
+    # CLI-JSON/ADD_BGP_PEER -> cmd_add
+    command = section.split("/")[-1].lower()
+    return COMMAND_FAMILIES.get(command.split("_")[0], COMMAND_DEFAULT)
+
+
+def query_family(section):
+    return QUERY_FAMILIES.get(section, QUERY_DEFAULT)
+
+
+def dedent(lines, width=4):
+    return [line[width:] if line.startswith(" " * width) else line.lstrip() for line in lines]
+
+
+def enum_table(node, lines):
+    """
+    :return: source lines of one ENUMS entry, keeping the comment of each member
+    """
+    rows = []
+    for member in node.body:
+        if isinstance(member, ast.Expr):
+            continue
+        if isinstance(member, ast.FunctionDef) and member.name == "valueof":
+            continue
+        if not (isinstance(member, ast.Assign) and len(member.targets) == 1
+                and isinstance(member.targets[0], ast.Name)):
+            raise ValueError("%s: cannot tabulate %s" % (node.name, ast.dump(member)))
+        ast.literal_eval(member.value)
+        line = lines[member.lineno - 1]
+        value = line[member.value.col_offset:member.value.end_col_offset]
+        comment = line[member.value.end_col_offset:].strip()
+        rows.append(('"%s": %s,' % (member.targets[0].id, value), comment))
+    width = max([len(text) for text, _comment in rows] + [0])
+    base = node.bases[0].id
+    out = ['    "%s": ("%s", {' % (node.name, base)]
+    for text, comment in rows:
+        out.append(("        %-*s  %s" % (width, text, comment)).rstrip() if comment else "        " + text)
+    out.append("    }),")
+    return out
+
+
+def split_class(class_node, lines, family_of):
+    """
+    :return: dict of module name to {'enums': [lines], 'code': [lines], 'members': [names]}
+    """
+    marker_line = None
+    for number in range(class_node.lineno, class_node.end_lineno + 1):
+        if lines[number - 1].strip().startswith(MARKER):
+            marker_line = number
+            break
+    if marker_line is None:
+        raise ValueError("%s has no '%s' line" % (class_node.name, MARKER))
+    modules = {}
+    family = family_of("")
+    section = ""
+    for node in class_node.body:
+        if node.lineno <= marker_line:
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, str):
+            found = NOTES_RE.search(node.value.value)
+            if found:
+                section = found.group(1)
+                family = family_of(section)
+        module = modules.setdefault(family, {"enums": [], "code": [], "members": [], "section": None})
+        source = lines[node.lineno - 1:node.end_lineno]
+        if isinstance(node, ast.ClassDef):
+            if module["section"] != section:
+                module["enums"].append("    # <%s>" % section)
+                module["section"] = section
+            module["enums"].extend(enum_table(node, lines))
+            module["members"].append(node.name)
+        elif isinstance(node, ast.FunctionDef):
+            module["code"].extend(dedent(source) + ["", ""])
+            module["members"].append(node.name)
+        elif isinstance(node, ast.Expr):
+            module["code"].extend(dedent(source))
+        else:
+            raise ValueError("%s: unexpected %s at line %s" % (class_node.name, type(node).__name__, node.lineno))
+    return modules
+
+
+def module_source(class_name, module_name, module):
+    out = ['"""' + BANNER,
+           "    Auto generated %s members, split out of lanforge_api.py by" % class_name,
+           "    lanforge_api_split.py. %s imports this module the first time one of" % class_name,
+           "    them is used: call them through %s, do not edit them here." % class_name,
+           BANNER + '"""',
+           ""]
+    if module["enums"]:
+        out += ["# flag and enum classes: name: (base, {member: value}); %s builds each class" % class_name,
+                "# the first time it is used",
+                "ENUMS = {"] + module["enums"] + ["}", "", ""]
+    out += module["code"]
+    while out and not out[-1]:
+        out.pop()
+    return "\n".join(out) + "\n"
+
+
+def index_source(families):
+    out = ['"""' + BANNER,
+           "    Modules of the auto generated LFJsonCommand and LFJsonQuery members, written",
+           "    by lanforge_api_split.py, and the members each one defines. LFJsonCommand and",
+           "    LFJsonQuery look members up here and import their module on first use.",
+           BANNER + '"""',
+           ""]
+    for variable, modules in families:
+        out.append("%s = {" % variable)
+        for module_name in sorted(modules):
+            out.append('    "%s": (' % module_name)
+            out += ['        "%s",' % member for member in modules[module_name]["members"]]
+            out.append("    ),")
+        out += ["}", ""]
+    return "\n".join(out)
+
+
+def split(source_path=None, dest_dir=None, compile_modules=False):
+    with open(source_path) as source_file:
+        text = source_file.read()
+    lines = text.split("\n")
+    tree = ast.parse(text)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    families = []
+    written = []
+    os.makedirs(dest_dir, exist_ok=True)
+    for class_name, variable, family_of in (("LFJsonCommand", "COMMAND_FAMILIES", command_family),
+                                            ("LFJsonQuery", "QUERY_FAMILIES", query_family)):
+        modules = split_class(classes[class_name], lines, family_of)
+        if not modules:
+            raise ValueError("%s has no generated members after '%s', is %s already split?"
+                             % (class_name, MARKER, source_path))
+        families.append((variable, modules))
+        for module_name, module in modules.items():
+            path = os.path.join(dest_dir, module_name + ".py")
+            with open(path, "w") as module_file:
+                module_file.write(module_source(class_name, module_name, module))
+            written.append(path)
+            print("%-24s %4d members" % (path, len(module["members"])))
+    path = os.path.join(dest_dir, "__init__.py")
+    with open(path, "w") as index_file:
+        index_file.write(index_source(families))
+    written.append(path)
+    if compile_modules:
+        for path in written:
+            py_compile.compile(path, doraise=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lanforge_api_split.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--source', required=True, help='generated lanforge_api.py with every member in it')
+    parser.add_argument('--dest', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated"),
+                        help='package directory to write, default lanforge_client/generated')
+    parser.add_argument('--compile', action='store_true', help='also write the .pyc files')
+    args = parser.parse_args()
+    split(source_path=args.source, dest_dir=args.dest, compile_modules=args.compile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    LANforge JSON API for asyncio
+
+    AsyncLFSession wraps an LFSession so that the auto-generated post_* and get_*
+    methods of LFJsonCommand and LFJsonQuery can be awaited. Calls are handed to a
+    worker pool that is the same size as the session connection pool, so any number
+    of coroutines can be outstanding while at most connection_pool_size requests
+    are on the wire, each over a persistent connection.
+
+    EXAMPLE PYTHON USAGE:
+    ----- ----- ----- 8< ----- ----- ----- 8< ----- ----- -----
+    async def main():
+        async with AsyncLFSession(lfclient_url="http://localhost:8080",
+                                  connection_pool_size=16) as session:
+            lf_query = session.get_query()
+            ports, endps = await asyncio.gather(
+                lf_query.get_port(eid_list=['1.1.list']),
+                lf_query.get_endp(eid_list=['list']))
+            pprint(ports)
+
+    asyncio.run(main())
+    ----- ----- ----- 8< ----- ----- ----- 8< ----- ----- -----
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import sys
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit()
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+import threading
+from .lanforge_api import BaseSession, LFJsonCommand, LFJsonQuery, LFRetryPolicy, LFSession
+
+
+class AsyncLFJsonRequest:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Presents the public methods of a blocking request instance as coroutines.
+        Attributes that are not methods are passed through unchanged.
+        Each call runs on its own copy of the request instance with empty error and
+        warning lists, so concurrent calls do not clear or mix each other's errors.
+        They are added to the lists of the wrapped instance when the call returns.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    # methods that read or change the error and warning lists of the wrapped instance
+    Shared_State_Methods: tuple = ("add_error",
+                                   "add_warning",
+                                   "get_errors",
+                                   "get_warnings",
+                                   "clear_warnings_errors")
+
+    def __init__(self,
+                 request_obj=None,
+                 session_obj: 'AsyncLFSession' = None):
+        if request_obj is None:
+            raise ValueError("AsyncLFJsonRequest requires request_obj")
+        if session_obj is None:
+            raise ValueError("AsyncLFJsonRequest requires session_obj")
+        self.request_instance = request_obj
+        self.session_instance = session_obj
+        self.messages_lock = threading.Lock()
+
+    def call_request_method(self, method_name_: str = None, *args, **kwargs):
+        """
+        Call a method of the wrapped request instance on a copy of it that has its
+        own error and warning lists.
+        :param method_name_: method name
+        :return: the return value of the method
+        """
+        request_obj = copy.copy(self.request_instance)
+        request_obj.error_list = []
+        request_obj.warnings = []
+        try:
+            return getattr(request_obj, method_name_)(*args, **kwargs)
+        finally:
+            with self.messages_lock:
+                self.request_instance.error_list.extend(request_obj.error_list)
+                self.request_instance.warnings.extend(request_obj.warnings)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.request_instance, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        if name in self.Shared_State_Methods:
+            @functools.wraps(attr)
+            async def coroutine_method(*args, **kwargs):
+                return await self.session_instance.run_in_executor(attr, *args, **kwargs)
+        else:
+            @functools.wraps(attr)
+            async def coroutine_method(*args, **kwargs):
+                return await self.session_instance.run_in_executor(self.call_request_method,
+                                                                   name, *args, **kwargs)
+
+        # cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, coroutine_method)
+        return coroutine_method
+
+    def __dir__(self):
+        return sorted(set(dir(type(self)))
+                      | set(self.__dict__.keys())
+                      | set(dir(self.request_instance)))
+
+
+class AsyncLFJsonCommand(AsyncLFJsonRequest):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Awaitable LFJsonCommand: every post_* method returns a coroutine.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+    def __init__(self,
+                 command_obj: LFJsonCommand = None,
+                 session_obj: 'AsyncLFSession' = None):
+        super().__init__(request_obj=command_obj,
+                         session_obj=session_obj)
+
+
+class AsyncLFJsonQuery(AsyncLFJsonRequest):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Awaitable LFJsonQuery: every get_* method returns a coroutine.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+    def __init__(self,
+                 query_obj: LFJsonQuery = None,
+                 session_obj: 'AsyncLFSession' = None):
+        super().__init__(request_obj=query_obj,
+                         session_obj=session_obj)
+
+
+class AsyncLFSession:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        asyncio counterpart of LFSession. The session id is requested when the
+        session is entered with 'async with' or when start() is awaited.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+    def __init__(self, lfclient_url: str = 'http://localhost:8080',
+                 debug: bool = False,
+                 proxy_map: dict = None,
+                 connection_timeout_sec: float = None,
+                 stream_errors: bool = True,
+                 stream_warnings: bool = False,
+                 require_session: bool = False,
+                 exit_on_error: bool = False,
+                 connection_pool_size: int = BaseSession.Default_Connection_Pool_Size,
+                 retry_policy: LFRetryPolicy = None):
+        """
+        Parameters match LFSession.
+        :param connection_pool_size: number of persistent HTTP connections, and the
+        number of requests that can be in flight at the same time
+        """
+        self.session_args: dict = {
+            "lfclient_url": lfclient_url,
+            "debug": debug,
+            "proxy_map": proxy_map,
+            "connection_timeout_sec": connection_timeout_sec,
+            "stream_errors": stream_errors,
+            "stream_warnings": stream_warnings,
+            "require_session": require_session,
+            "exit_on_error": exit_on_error,
+            "connection_pool_size": connection_pool_size,
+            "retry_policy": retry_policy,
+        }
+        self.executor = ThreadPoolExecutor(max_workers=connection_pool_size,
+                                           thread_name_prefix="lf_async")
+        self.session_instance: LFSession
+        self.session_instance = None
+        self.command_instance: AsyncLFJsonCommand
+        self.command_instance = None
+        self.query_instance: AsyncLFJsonQuery
+        self.query_instance = None
+
+    async def __aenter__(self) -> 'AsyncLFSession':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.close()
+
+    async def run_in_executor(self, method=None, *args, **kwargs):
+        """
+        Run a blocking method on the session worker pool.
+        :param method: callable to run
+        :return: the return value of method
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor,
+                                          functools.partial(method, *args, **kwargs))
+
+    async def start(self) -> bool:
+        """
+        Create the underlying LFSession and request a session id from the GUI.
+        :return: True if a session id was established
+        """
+        if self.session_instance:
+            return self.session_instance.session_connection_check
+        self.session_instance = await self.run_in_executor(LFSession, **self.session_args)
+        self.command_instance = AsyncLFJsonCommand(command_obj=self.session_instance.get_command(),
+                                                   session_obj=self)
+        self.query_instance = AsyncLFJsonQuery(query_obj=self.session_instance.get_query(),
+                                               session_obj=self)
+        return self.session_instance.session_connection_check
+
+    async def close(self):
+        """
+        End the GUI session and release connections and worker threads.
+        """
+        if self.session_instance and self.session_instance.session_connection_check:
+            await self.run_in_executor(BaseSession.end_session,
+                                       command_obj=self.session_instance.command_instance,
+                                       session_id_=self.session_instance.session_id)
+            # keep __del__ from ending the session a second time
+            self.session_instance.session_connection_check = False
+        if self.session_instance and self.session_instance.connection_pool:
+            self.session_instance.connection_pool.close()
+        self.executor.shutdown(wait=False)
+
+    def get_command(self) -> AsyncLFJsonCommand:
+        """
+        :return: awaitable LFJsonCommand; start() must have been awaited
+        """
+        if not self.command_instance:
+            raise ValueError("AsyncLFSession.get_command: await start() first")
+        return self.command_instance
+
+    def get_query(self) -> AsyncLFJsonQuery:
+        """
+        :return: awaitable LFJsonQuery; start() must have been awaited
+        """
+        if not self.query_instance:
+            raise ValueError("AsyncLFSession.get_query: await start() first")
+        return self.query_instance
+
+    def get_session(self) -> LFSession:
+        """
+        :return: the blocking LFSession this session wraps
+        """
+        return self.session_instance
+
+    def get_session_id(self) -> str:
+        if not self.session_instance:
+            return None
+        return self.session_instance.get_session_id()
+
+    def get_connection_pool_stats(self) -> dict:
+        if not self.session_instance:
+            return {}
+        return self.session_instance.get_connection_pool_stats()
+
+    def get_retry_stats(self) -> dict:
+        if not self.session_instance:
+            return {}
+        return self.session_instance.get_retry_stats()
@@ -47,6 +47,8 @@ logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 lf_report = importlib.import_module("py-scripts.lf_report")
 lf_kpi_csv = importlib.import_module("py-scripts.lf_kpi_csv")
+port_probe = importlib.import_module("py-json.port_probe")
+station_cx_session = importlib.import_module("py-json.station_cx_session")
 
 
 EPILOG = '''\
@@ -227,16 +229,16 @@ Tx Power                             : Input from command line (1-8)
 Allowed Per Path                     : Read from the Controller
 Cabling Pathloss                     : Input from command line, best if verified prior to testing
 Antenna Gain                         : Input from command line, if AP cannot detect antenna connection
-Beacon RSSI (beacon_sig)             : From Lanforge probe, command ./lf_portmod.pl with cli parameter probe_port 1 (~line 1183, ~line 1209)
-Combined RSSI User (sig)             : From Lanforge probe, command ./lf_portmod.pl with cli parameter probe_port 1 (~line 1183, ~line 1193)
-RSSI 1, RSSI 2, RSSI 3, RSSI 4       : (~line 1160)
-    ants[q] (antX) read from Lanforge probe, command ./lf_portmod.pl with cli parameter probe_port 1
+Beacon RSSI (beacon_sig)             : From Lanforge probe, /probe 'beacon signal avg' read by StationCxSession.probe()
+Combined RSSI User (sig)             : From Lanforge probe, /probe 'signal' read by StationCxSession.probe()
+RSSI 1, RSSI 2, RSSI 3, RSSI 4       :
+    ants[q] (antX) per chain values of the Lanforge probe 'signal'
 
 Ant 1, Ant 2, Ant 3, Ant 4 : ()
-    Starting Value for antX read from lanforge probe, using command ./lf_portmod.pl with cli parameter porbe_port 1
+    Starting Value for antX read from lanforge probe 'signal'
 
-    _noise_bear (_noise_i) = from Lanforge returning NOISE from command (!line 1070) lf_portmod.pl reading --show_port
-    "AP, IP, Mode, NSS, Bandwith, Channel, Signal, NOISE, Status, RX-Rate
+    _noise_bear (_noise_i) = noise column of the station in /port, read by StationCxSession.port_status()
+    NSS and Bandwidth from the probe rx bitrate (tx bitrate when rx was legacy)
 
     rssi_adj (only used if --adjust_nf and _noise_bare != None) (~line 1263)  _noise_i(_noise_bear) - nf_at_calibration (fixed value of -105)
 
@@ -373,6 +375,8 @@ def main():
     parser.add_argument("--band", type=str, help="band testing --band 6g", choices=["5g", "24g", "6g", "dual_band_5g", "dual_band_6g"])
     parser.add_argument("--module", type=str, help="[controller configuration] series module (cc_module_9800_3504.py)  --module cc_module_9800_3504 ", required=True)
     parser.add_argument("--timeout", type=str, help="[controller configuration] controller command timeout --timeout 3 ", default=3)
+    parser.add_argument("--persistent_session", action='store_true',
+                        help="[controller configuration] 9800: log in to the controller once and keep the session open between commands")
 
     # AP configuration
     parser.add_argument("-a", "--ap", type=str, help="[AP configuration] select AP  ", required=True)
@@ -405,6 +409,7 @@ def main():
 
     # traffic generation configuration (LANforge)
     parser.add_argument("--lfmgr", type=str, help="[traffic generation configuration (LANforge)] LANforge Manager IP address --lfmgr 192.168.100.178", required=True)
+    parser.add_argument("--lfmgr_port", type=int, help="[traffic generation configuration (LANforge)] LANforge GUI JSON API port --lfmgr_port 8080", default=8080)
     parser.add_argument("--upstream_port", type=str, help="[traffic generation configuration (LANforge)] LANforge upsteram-port to use (eth1, etc)  --upstream_port eth2", required=True)
     parser.add_argument("--lfresource", type=str, help="[traffic generation configuration (LANforge)] LANforge resource ID for the station --lfresource 1")
     parser.add_argument("--lfresource2", type=str, help="[traffic generation configuration (LANforge)] LANforge resource ID for the upstream port system ")
@@ -654,7 +659,8 @@ def main():
         ap_band_slot_6g=args.ap_band_slot_6g,
         port=args.port,
         band=args.band,
-        timeout=args.timeout)
+        timeout=args.timeout,
+        persistent_session=args.persistent_session)
     cs.wlan = args.wlan
     cs.wlanID = args.wlanID
     cs.wlanSSID = args.wlanSSID
@@ -961,37 +967,23 @@ def main():
                                 "--first_sta", args.station, "--ieee80211w", args.ieee80211w, "--wifi_mode", args.wifi_mode, "--action", "add"], timeout=20, capture_output=False)
         sleep(3)
 
-    # Find LANforge station parent radio
-    parent = None
-    logg.info("portmod command: ./lf_portmod.pl --manager {lfmgr} --card {lfresource} --port_name {lfstation} --show_port Parent/Peer".format(
-        lfmgr=lfmgr, lfresource=lfresource, lfstation=lfstation))
-    port_stats = subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                 "--show_port", "Parent/Peer"], capture_output=True)
-    pss = port_stats.stdout.decode('utf-8', 'ignore')
-    for line in pss.splitlines():
-        m = re.search('Parent/Peer:\\s+(.*)', line)
-        if (m is not None):
-            parent = m.group(1)
-
-    # Create downstream connection
-    # First, delete any old one
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                    "--cmd", "rm_cx all c-udp-power"], capture_output=False)
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                    "--cmd", "rm_endp c-udp-power-A"], capture_output=False)
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource2, "--action", "do_cmd",
-                    "--cmd", "rm_endp c-udp-power-B"], capture_output=False)
-
-    # Now, create the new connection
-
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource2, "--action", "create_endp", "--port_name", upstream_port,
-                    "--endp_type", "lf_udp", "--endp_name", "c-udp-power-B", "--speed", "1000000", "--report_timer", "1000"], capture_output=False)
+    # LANforge station, radio and traffic connection, all over one JSON API session
+    lf_station = station_cx_session.StationCxSession(lfmgr=lfmgr,
+                                                     lfmgr_port=args.lfmgr_port,
+                                                     resource=lfresource,
+                                                     station=lfstation,
+                                                     upstream_resource=lfresource2,
+                                                     upstream_port=upstream_port,
+                                                     cx_name="c-udp-power",
+                                                     report_timer_ms=1000)
 
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "create_endp", "--port_name", lfstation,
-                    "--endp_type", "lf_udp", "--endp_name", "c-udp-power-A", "--speed", "0", "--report_timer", "1000"], capture_output=False)
+    # Find LANforge station parent radio
+    parent = lf_station.port_parent()
+    logg.info("station {lfstation} parent radio: {parent}".format(lfstation=lfstation, parent=parent))
 
-    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "create_cx", "--cx_name", "c-udp-power",
-                    "--cx_endps", "c-udp-power-A,c-udp-power-B", "--report_timer", "1000", "--endp_type", "lf_udp", "--port_name", lfstation, "--speed", "1000000"], capture_output=False)
+    # Create downstream connection, c-udp-power-B on the upstream port sends 1Mbps to c-udp-power-A on the station
+    # any old one is deleted first
+    lf_station.create_cx(upstream_bps=1000000, station_bps=0)
 
     # Old
     # subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "create_cx", "--cx_name", "c-udp-power",
@@ -1207,10 +1199,8 @@ def main():
                         antset = 7
                     if (ni == 4):
                         antset = 8
-                    set_cmd = "set_wifi_radio 1 %s %s NA NA NA NA NA NA NA NA NA %s" % (lfresource, parent, antset)
-                    logg.info("Setting LANforge radio to %s NSS with command: %s" % (ni, set_cmd))
-                    subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", parent,
-                                    "--cli_cmd", set_cmd], capture_output=True)
+                    logg.info("Setting LANforge radio %s to %s NSS with antenna %s" % (parent, ni, antset))
+                    lf_station.set_radio_antenna(radio=parent, antenna=antset)
                 # tx power 1 is the highest power ,  2 power is 1/2 of 1 power etc till power 8 the lowest.
                 # 6E 20Mhz tx power 1 - 6
                 # 6E 40Mhz tx power 1 - 7
@@ -1235,12 +1225,10 @@ def main():
 
                     # Stop traffic , if traffic was running ,  this is on the lanforge side.  Commands that start with lf_ are directed
                     # towards the lanforge
-                    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                                    "--cmd", "set_cx_state all c-udp-power STOPPED"], capture_output=True)
+                    lf_station.set_cx_state("STOPPED")
 
                     # Down station
-                    port_stats = subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                                 "--set_ifstate", "down"])
+                    lf_station.set_station_up(False)
                     cs.show_ap_summary()
 
                     # when both 5g (slot 1) is enabled and dual-band 5g (slot 2) is enabled .
@@ -1687,8 +1675,7 @@ def main():
                         logg.info("3504 test_parameters cc_ch: read : {}".format(cc_ch))
 
                     # Up station
-                    subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                    "--set_ifstate", "up"])
+                    lf_station.set_station_up(True)
 
                     i = 0
                     wait_ip_print = False
@@ -1703,26 +1690,14 @@ def main():
 
                     # Wait untill LANforge station connects
                     while True:
-                        port_stats = subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                                     "--show_port", "AP,IP,Mode,NSS,Bandwidth,Channel,Signal,Noise,Status,RX-Rate"], capture_output=True, check=True)
-                        pss = port_stats.stdout.decode('utf-8', 'ignore')
-
-                        _status = None
-                        _ip = None
-
-                        for line in pss.splitlines():
-                            m = re.search('Status:\\s+(.*)', line)
-                            if (m is not None):
-                                _status = m.group(1)
-                            m = re.search('IP:\\s+(.*)', line)
-                            if (m is not None):
-                                _ip = m.group(1)
+                        port_status = lf_station.port_status()
+                        _associated, _has_ip = lf_station.is_associated(port_status)
 
                         if (i % 3) == 0 :
-                            logg.info("IP %s  Status %s" % (_ip, _status))
+                            logg.info("IP %s  AP %s" % (port_status.get('ip'), port_status.get('ap')))
 
-                        if (_status == "Authorized"):
-                            if ((_ip is not None) and (_ip != "0.0.0.0")):
+                        if (_associated):
+                            if (_has_ip):
                                 logg.info("Station is associated with IP address.")
                                 break
                             else:
@@ -1764,8 +1739,7 @@ def main():
                             pss = cs.show_ap_dot11_24gz_summary()
                         logg.info(pss)
                     # Start traffic
-                    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                                    "--cmd", "set_cx_state all c-udp-power RUNNING"], capture_output=True, check=False)
+                    lf_station.set_cx_state("RUNNING")
 
                     # Wait configured number of seconds more seconds
                     logg.info("Waiting {} seconds to let traffic run for a bit, Channel {} NSS {} BW {} TX-Power {}".format(args.duration, ch, n, bw, tx))
@@ -1811,52 +1785,36 @@ def main():
                     sig = None
                     pf = 1
                     ants = []
+                    probe = None
                     while True:
                         time.sleep(1)
-                        port_stats = subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                                     "--cli_cmd", "probe_port 1 %s %s" % (lfresource, lfstation)], capture_output=True, check=True)
-                        pss = port_stats.stdout.decode('utf-8', 'ignore')
-                        # for debug: print the output of lf_portmod.pl and the command used
-                        logg.info("######## lf_portmod ######### ")
-                        logg.info(pss)
-                        logg.info("######## lf_portmod  END ######### ")
+                        probe, probe_text = lf_station.probe()
+                        # for debug: print the probe results and the station probed
+                        logg.info("######## probe_port {} ######### ".format(lf_station.station_eid))
+                        logg.info(probe_text)
+                        logg.info("######## probe_port  END ######### ")
 
                         if (args.show_lf_portmod):
-                            logg.info("./lf_portmod.pl --manager {} --card {} --port_name {} --cli_cmd probe_port 1 {} {}".format(lfmgr,
-                                                                                                                                  lfresource, lfstation, lfresource, lfstation))
-                            logg.info(pss)
+                            logg.info("probe_port 1 {} {}".format(lfresource, lfstation))
+                            logg.info(probe_text)
 
                         foundit = False
-                        for line in pss.splitlines():
-                            # logg.info("probe-line: %s"%(line))
-                            # TODO switch to signal avg
-                            # m = re.search('signal avg:\\s+(\\S+)\\s+\\[(.*)\\]\\s+dBm', line)
-                            m = re.search('signal:\\s+(\\S+)\\s+\\[(.*)\\]\\s+dBm', line)
-                            # print("m singal avg : {}".format(m))
-                            # AX210 needs to look at signal
-                            if (m is None):
-                                m = re.search('signal:\\s+(\\S+)\\s+\\[(.*)\\]\\s+dBm', line)
-                                # print("m signal: {}".format(m))
-                            if (m is not None):
-                                logg.info("search: signal: resulted in m = {}".format(m))
-                                sig = m.group(1)
-                                ants = m.group(2).split()
-                                q = 0
-                                for a in ants:
-                                    ants[q] = ants[q].replace(",", "", 1)
-                                    q += 1
-
-                                logg.info("sig: %s  ants: %s ants-len: %s n: %s" % (sig, m.group(2), len(ants), n))
-
-                                if (len(ants) == int(n)):
-                                    foundit = True
-                                else:
-                                    logg.info("Looking for %s spatial streams, signal avg reported fewer: %s" % (n, m.group(1)))
-                            m = re.search('beacon signal avg:\\s+(\\S+)\\s+dBm', line)
-                            if (m is not None):
-                                logg.info("search: beacon signal avg: resulted in m = {}".format(m))
-                                beacon_sig = m.group(1)
-                                logg.info("beacon_sig: %s " % (beacon_sig))
+                        # TODO switch to signal avg
+                        # AX210 needs to look at signal
+                        # signal is combined then per chain: '-36 [-38, -40]'
+                        signal = probe.signals.get('signal', '')
+                        if ('[' in signal):
+                            sig = signal.split()[0]
+                            ants = [a.strip() for a in signal[signal.index('[') + 1:signal.rindex(']')].replace(",", " ").split()]
+                            logg.info("sig: %s  ants: %s ants-len: %s n: %s" % (sig, ants, len(ants), n))
+
+                            if (len(ants) == int(n)):
+                                foundit = True
+                            else:
+                                logg.info("Looking for %s spatial streams, signal avg reported fewer: %s" % (n, sig))
+                        if (probe.signals.get('beacon signal avg')):
+                            beacon_sig = probe.signals['beacon signal avg'].split()[0]
+                            logg.info("beacon_sig: %s " % (beacon_sig))
 
                         if (foundit):
                             break
@@ -1871,27 +1829,16 @@ def main():
                                 ants.append("")
                             break
 
-                    endp_stats = subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--endp_vals", "rx_bps",
-                                                 "--cx_name", "c-udp-power"], capture_output=True, check=True)
-
-                    pss = endp_stats.stdout.decode('utf-8', 'ignore')
-                    logg.info(pss)
-
-                    for line in pss.splitlines():
-                        # logg.info("probe-line: %s"%(line))From Lanforge probe, command
-                        # ./lf_portmod.pl with cli parameter probe_port 1 (about line 1150)
-                        m = re.search('Rx Bytes:\\s+(\\d+)', line)
-                        if (m is not None):
-                            logg.info("Rx Bytes: result {}".format(m))
-                            rx_bytes = int(m.group(1))
-                            if (rx_bytes == 0):
-                                err = "ERROR:  No bytes received by data connection, test results may not be valid."
-                                e_tot += err
-                                e_tot += "  "
+                    endp_rx_bytes = lf_station.endp_rx_bytes()
+                    logg.info("endpoint rx bytes: {}".format(endp_rx_bytes))
+                    # downstream traffic, c-udp-power-A on the station is the receiving end
+                    if (endp_rx_bytes.get(lf_station.endp_a) == 0):
+                        err = "ERROR:  No bytes received by data connection, test results may not be valid."
+                        e_tot += err
+                        e_tot += "  "
 
                     # Stop traffic
-                    subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                                    "--cmd", "set_cx_state all c-udp-power STOPPED"], capture_output=True, check=True)
+                    lf_station.set_cx_state("STOPPED")
 
                     antstr = ""
                     for x in range(4):
@@ -1903,53 +1850,33 @@ def main():
                         antstr += "\t"
 
                     logg.info("antenna dBm {antstr}".format(antstr=antstr))
-                    port_stats = subprocess.run(["./lf_portmod.pl", "--manager", lfmgr, "--card", lfresource, "--port_name", lfstation,
-                                                 "--show_port", "AP,IP,Mode,NSS,Bandwidth,Channel,Signal,Noise,Status,RX-Rate"], capture_output=True, check=True)
-                    pss = port_stats.stdout.decode('utf-8', 'ignore')
-                    logg.info(pss)
-
-                    _ap = None
+                    port_status = lf_station.port_status()
+                    logg.info("station port: {}".format(port_status))
+
+                    _ap = port_status.get('ap')
+                    _ch = port_status.get('channel')
+                    _mode = port_status.get('mode')
+                    _noise = port_status.get('noise')
+                    _noise_bare = _noise
+                    _rxrate = port_status.get('rx-rate')
+                    # the port table has no NSS or bandwidth columns, take them from the
+                    # bitrate the station last received at, or transmitted at if rx was legacy;
+                    # kept as strings, like the --nss and --bandwidth values they are compared to
                     _bw = None
-                    _ch = None
-                    _mode = None
                     _nss = None
-                    _noise = None
-                    _rxrate = None
-                    _noise_bare = None
-
-                    for line in pss.splitlines():
-                        m = re.search('AP:\\s+(.*)', line)
-                        if (m is not None):
-                            _ap = m.group(1)
-                            logg.info("AP: {}".format(m))
-                        m = re.search('Bandwidth:\\s+(.*)Mhz', line)
-                        if (m is not None):
-                            _bw = m.group(1)
-                            logg.info("Bandwidth: {}".format(m))
-                        m = re.search('Channel:\\s+(.*)', line)
-                        if (m is not None):
-                            _ch = m.group(1)
-                            logg.info("Channel: {}".format(m))
-                        m = re.search('Mode:\\s+(.*)', line)
-                        if (m is not None):
-                            _mode = m.group(1)
-                            logg.info("Mode: {}".format(m))
-                        m = re.search('NSS:\\s+(.*)', line)
-                        if (m is not None):
-                            _nss = m.group(1)
-                            logg.info("NSS: {}".format(m))
-                        m = re.search('Noise:\\s+(.*)', line)
-                        if (m is not None):
-                            _noise = m.group(1)
-                            logg.info("Noise: {}".format(m))
-                        m = re.search('Noise:\\s+(.*)dBm', line)
-                        if (m is not None):
-                            _noise_bare = m.group(1)
-                            logg.info("Noise Bare: {}".format(m))
-                        m = re.search('RX-Rate:\\s+(.*)', line)
-                        if (m is not None):
-                            _rxrate = m.group(1)
-                            logg.info("RX-Rate: {}".format(m))
+                    for bitrate in (probe.rx, probe.tx):
+                        if (bitrate is not None and bitrate.mcs is not None):
+                            if (bitrate.mhz is not None):
+                                _bw = str(bitrate.mhz)
+                            _nss = bitrate.nss if bitrate.nss is not None else port_probe.nss_from_ht_mcs(bitrate.mcs)
+                            if (_nss is not None):
+                                _nss = str(_nss)
+                            break
+                    if (_nss is None):
+                        logg.error("ERROR:  Station probe reported no HT/VHT/HE rate, using configured NSS: %s for the per-path check" % (n))
+                        _nss = n
+                    logg.info("AP: {} Bandwidth: {} Channel: {} Mode: {} NSS: {} Noise: {} RX-Rate: {}".format(
+                        _ap, _bw, _ch, _mode, _nss, _noise, _rxrate))
 
                     # ath10k radios now take noise-floor into account, so adjust_nf
                     # should remain set to false when using those radios.  Possibly other
@@ -2562,12 +2489,7 @@ def main():
     if(args.no_cleanup_station is False):
         # Remove LANforge traffic connection
         logg.info("Remove LANforge traffic connections")
-        subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                        "--cmd", "set_cx_state all c-udp-power DELETED"], capture_output=False)
-        subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                        "--cmd", "rm_endp c-udp-power-A"], capture_output=False)
-        subprocess.run(["./lf_firemod.pl", "--manager", lfmgr, "--resource", lfresource, "--action", "do_cmd",
-                        "--cmd", "rm_endp c-udp-power-B"], capture_output=False)
+        lf_station.delete_cx()
 
         logg.info("--no_cleanup_station set False,  Deleting all stations on radio {}".format(args.radio))
         subprocess.run(["./lf_associate_ap.pl", "--mgr", lfmgr, "--action", "del_all_phy", "--port_del", args.radio], timeout=20, capture_output=False)
@@ -2743,6 +2665,7 @@ def main():
 
     # close the workbook 
     close_workbook(workbook)
+    cs.close_session()
 
     # TODO fix csv output
     # report.set_table_dataframe_from_csv_sep_tab(full_outfile)
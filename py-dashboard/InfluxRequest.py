@@ -8,7 +8,6 @@ import sys
 import os
 
 import pandas as pd
-from influxdb_client import WritePrecision
 
 if sys.version_info[0] != 3:
     print("This script requires Python 3")
@@ -24,9 +23,18 @@ import json
 import influxdb_client
 from influxdb_client.client.write_api import SYNCHRONOUS
 import time
+import atexit
+import calendar
+import logging
+import math
+import numbers
+import threading
+from collections import deque
 
 import datetime
 
+logger = logging.getLogger(__name__)
+
 def influx_add_parser_args(parser):
     parser.add_argument('--influx_host', help='Hostname for the Influx database', default=None)
     parser.add_argument('--influx_port', help='IP Port for the Influx database', default=8086)
@@ -36,6 +44,181 @@ def influx_add_parser_args(parser):
     parser.add_argument('--influx_tag', action='append', nargs=2,
                         help='--influx_tag <key> <val>   Can add more than one of these.', default=[])
 
+
+def influx_time_ns(when=None):
+    # datetime, isoformat string or nanoseconds to nanoseconds, naive times are UTC
+    if when is None:
+        return time.time_ns()
+    if isinstance(when, numbers.Integral):
+        return int(when)
+    if not isinstance(when, datetime.datetime):
+        when = datetime.datetime.fromisoformat(str(when))
+    if when.tzinfo is not None:
+        when = when.astimezone(datetime.timezone.utc)
+    return calendar.timegm(when.timetuple()) * 1000000000 + when.microsecond * 1000
+
+
+def _escape_key(text):
+    return str(text).replace('\n', ' ').replace(',', '\\,').replace('=', '\\=').replace(' ', '\\ ')
+
+
+def influx_line(measurement, value, tags=None, time_ns=None, field='value'):
+    """
+    One point in influx line protocol, as influxdb_client.Point writes it.
+    :return: the line, or None for a value influx cannot store (None, NaN, inf)
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        field_value = 'true' if value else 'false'
+    elif isinstance(value, numbers.Integral):
+        field_value = '%di' % value
+    elif isinstance(value, numbers.Real):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        field_value = repr(float(value))
+    else:
+        field_value = '"%s"' % str(value).replace('\\', '\\\\').replace('"', '\\"')
+    line = str(measurement).replace('\n', ' ').replace(',', '\\,').replace(' ', '\\ ')
+    if tags:
+        for tag_key, tag_value in sorted(tags.items()):
+            # influx rejects empty tag values
+            if tag_value is None or tag_value == '' or (isinstance(tag_value, float) and math.isnan(tag_value)):
+                continue
+            line += ',%s=%s' % (_escape_key(tag_key), _escape_key(tag_value))
+    line += ' %s=%s' % (_escape_key(field), field_value)
+    if time_ns is not None:
+        line += ' %d' % time_ns
+    return line
+
+
+class InfluxBatchWriter:
+    """
+    Buffers line protocol and posts it to the influx v2 write API from a background
+    thread, batch_size lines per request or whatever is buffered every flush_interval
+    seconds. When max_buffer lines are waiting the oldest are dropped, so a slow or
+    down influx server does not grow the test's memory. close() writes what is left
+    and runs at exit.
+    """
+    def __init__(self,
+                 url="http://localhost:8086",
+                 org=None,
+                 bucket=None,
+                 token=None,
+                 batch_size=5000,
+                 flush_interval=1.0,
+                 max_buffer=100000,
+                 timeout=10):
+        self.write_url = url + "/api/v2/write"
+        self.org = org
+        self.bucket = bucket
+        self.token = token
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.timeout = timeout
+        self.lines = deque()
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.closed = False
+        self.thread = None
+        self.points_written = 0
+        self.points_dropped = 0
+        self.batches_written = 0
+        self.write_errors = 0
+        atexit.register(self.close)
+
+    def write_lines(self, lines):
+        with self.condition:
+            if self.closed:
+                self.points_dropped += len(lines)
+                return
+            for line in lines:
+                if len(self.lines) >= self.max_buffer:
+                    self.lines.popleft()
+                    self.points_dropped += 1
+                self.lines.append(line)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="influx-writer", daemon=True)
+                self.thread.start()
+            if len(self.lines) >= self.batch_size:
+                self.condition.notify_all()
+
+    def take_batch(self):
+        # caller holds the condition
+        batch = [self.lines.popleft() for _line in range(min(self.batch_size, len(self.lines)))]
+        self.in_flight += len(batch)
+        return batch
+
+    def run(self):
+        while True:
+            with self.condition:
+                if len(self.lines) < self.batch_size and not self.closed:
+                    self.condition.wait(self.flush_interval)
+                if self.closed and not self.lines:
+                    return
+                batch = self.take_batch()
+            if batch:
+                self.post(batch)
+
+    def post(self, batch):
+        written = False
+        try:
+            response = requests.post(self.write_url,
+                                     params={'org': self.org, 'bucket': self.bucket, 'precision': 'ns'},
+                                     data="\n".join(batch).encode('utf-8'),
+                                     headers={'Authorization': 'Token %s' % self.token,
+                                              'Content-Type': 'text/plain; charset=utf-8'},
+                                     timeout=self.timeout)
+            written = response.status_code in (200, 204)
+            if not written:
+                logger.warning("influx write of {lines} lines failed: {status} {text}".format(
+                    lines=len(batch), status=response.status_code, text=response.text[:200]))
+        except requests.RequestException as e:
+            logger.warning("influx write of {lines} lines failed: {error}".format(lines=len(batch), error=e))
+        with self.condition:
+            self.in_flight -= len(batch)
+            if written:
+                self.points_written += len(batch)
+                self.batches_written += 1
+            else:
+                self.points_dropped += len(batch)
+                self.write_errors += 1
+            self.condition.notify_all()
+
+    def flush(self):
+        """
+        Write everything buffered and wait for batches the background thread is posting.
+        """
+        while True:
+            with self.condition:
+                batch = self.take_batch()
+                if not batch:
+                    while self.in_flight:
+                        self.condition.wait()
+                    return
+            self.post(batch)
+
+    def close(self):
+        self.flush()
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(self.timeout)
+            self.thread = None
+
+    def get_stats(self):
+        with self.condition:
+            return {
+                "points_written": self.points_written,
+                "points_dropped": self.points_dropped,
+                "points_buffered": len(self.lines) + self.in_flight,
+                "batches_written": self.batches_written,
+                "write_errors": self.write_errors,
+            }
+
+
 class RecordInflux():
     def __init__(self,
                  _influx_host="localhost",
@@ -44,7 +227,10 @@ class RecordInflux():
                  _influx_token=None,
                  _influx_bucket=None,
                  _debug_on=False,
-                 _exit_on_fail=False):
+                 _exit_on_fail=False,
+                 _batch_size=5000,
+                 _flush_interval=1.0,
+                 _max_buffer=100000):
         self.influx_host = _influx_host
         self.influx_port = _influx_port
         self.influx_org = _influx_org
@@ -56,36 +242,73 @@ class RecordInflux():
                                                      org=self.influx_org,
                                                      debug=_debug_on)
         self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
+        # points are buffered and posted in batches, see InfluxBatchWriter
+        self.writer = InfluxBatchWriter(url=self.url,
+                                        org=self.influx_org,
+                                        bucket=self.influx_bucket,
+                                        token=self.influx_token,
+                                        batch_size=_batch_size,
+                                        flush_interval=_flush_interval,
+                                        max_buffer=_max_buffer)
 
     def post_to_influx(self, key, value, tags, time):
-        p = influxdb_client.Point(key)
-        for tag_key, tag_value in tags.items():
-            p.tag(tag_key, tag_value)
-            print(tag_key, tag_value)
-        p.time(datetime.datetime.strptime(time, '%Y-%m-%dT%H:%M:%S.%f').utcnow(), WritePrecision.NS)
-        p.field("value", value)
-        self.write_api.write(bucket=self.influx_bucket, org=self.influx_org, record=p)
+        """
+        Queue one point, measurement key with field value, at time (isoformat, UTC).
+        """
+        line = influx_line(key, value, tags, influx_time_ns(time))
+        if line is None:
+            logger.info("not posting {key}: {value}".format(key=key, value=value))
+            return
+        self.writer.write_lines([line])
+
+    def post_dataframe(self, df, measurement_column, value_column, tag_columns=None, time_column=None):
+        """
+        Queue one point per row of df.
+        :param tag_columns: dict of df column to influx tag name, columns missing from df are skipped
+        :param time_column: column of nanosecond timestamps, now when None
+        """
+        tag_columns = {column: tag for column, tag in (tag_columns or {}).items() if column in df.columns}
+        now_ns = influx_time_ns()
+        lines = []
+        for row in df.to_dict('records'):
+            tags = {tag: row[column] for column, tag in tag_columns.items()}
+            time_ns = now_ns if time_column is None else int(row[time_column])
+            line = influx_line(row[measurement_column], row[value_column], tags, time_ns)
+            if line is not None:
+                lines.append(line)
+        self.writer.write_lines(lines)
+
+    def post_port_snapshot(self, station, interface, tags, time=None):
+        """
+        Queue one point per /port column of station, measurement station-column.
+        """
+        time_ns = influx_time_ns(time)
+        lines = [influx_line("%s-%s" % (station, key), value, tags, time_ns) for key, value in interface.items()]
+        self.writer.write_lines([line for line in lines if line is not None])
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
+
+    def get_stats(self):
+        return self.writer.get_stats()
 
     def csv_to_influx(self, csv):
         df = pd.read_csv(csv, sep='\t')
-        df['Date'] = [datetime.datetime.utcfromtimestamp(int(date) / 1000).isoformat() for date in df['Date']]
-        items = list(df.reset_index().transpose().to_dict().values())
+        # kpi.csv Date is milliseconds since the epoch
+        df['Date'] = df['Date'].astype('int64') * 1000000
         influx_variables = ['script', 'short-description', 'test_details', 'Graph-Group',
                             'DUT-HW-version', 'DUT-SW-version', 'DUT-Serial-Num', 'testbed', 'Test Tag', 'Units']
         csv_variables = ['test-id', 'short-description', 'test details', 'Graph-Group',
                          'dut-hw-version', 'dut-sw-version', 'dut-serial-num', 'test-rig', 'test-tag', 'Units']
         csv_vs_influx = dict(zip(csv_variables, influx_variables))
-        columns = list(df.columns)
-        for item in items:
-            tags = dict()
-            short_description = item['short-description']
-            numeric_score = item['numeric-score']
-            date = item['Date']
-            for variable in csv_variables:
-                if variable in columns:
-                    influx_variable = csv_vs_influx[variable]
-                    tags[influx_variable] = item[variable]
-            self.post_to_influx(short_description, numeric_score, tags, date)
+        self.post_dataframe(df,
+                            measurement_column='short-description',
+                            value_column='numeric-score',
+                            tag_columns=csv_vs_influx,
+                            time_column='Date')
 
 
     def set_bucket(self, b):
@@ -113,8 +336,8 @@ class RecordInflux():
 
                 current_time = str(datetime.datetime.utcnow().isoformat())
 
-                # Poke everything into influx db
-                for key in response['interface'].keys():
-                    self.post_to_influx("%s-%s" % (station, key), response['interface'][key], tags, current_time)
+                # Poke everything into influx db, the writer posts it in batches
+                self.post_port_snapshot(station, response['interface'], tags, current_time)
 
             time.sleep(monitor_interval)
+        self.flush()
@@ -454,92 +454,226 @@ def find_port_eids(resource_id=1, base_url="http://localhost:8080", port_names=(
     return port_eids
 
 
-def waitUntilPortsAdminDown(resource_id=1, base_url="http://localhost:8080", port_list=()):
-    return wait_until_ports_admin_down(resource_id=resource_id, base_url=base_url, port_list=port_list)
+class PortWaitResult:
+    """
+    Outcome of the wait_until_ports_* functions. Evaluates True when every port
+    reached the desired state, so existing 'if not wait_until_...' checks keep working.
+    pending lists the ports, as they were passed in, that never got there.
+    """
 
+    def __init__(self, completed=False, pending=None, elapsed_sec=0.0, polls=0, requests=0):
+        self.completed = completed
+        self.pending = pending if pending else []
+        self.elapsed_sec = elapsed_sec
+        self.polls = polls
+        self.requests = requests
 
-def wait_until_ports_admin_down(resource_id=1, base_url="http://localhost:8080", debug_=False, port_list=(), timeout_sec=360):
-    print("Waiting until ports appear admin-down...")
-    port_url = "/port/1"
-    for _ in range(0, timeout_sec):
-        up_stations = []
-        for port_name in port_list:
-            uri = "%s/%s/%s?fields=device,down" % (port_url, resource_id, port_name)
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug_)
-            json_response = lf_r.get_as_json()
-            if json_response is None:
-                if debug_:
-                    print("port %s disappeared" % port_name)
-                continue
-            if "interface" in json_response:
-                json_response = json_response['interface']
-            if json_response['down'] == "false":
-                up_stations.append(port_name)
-        if len(up_stations) == 0:
-            return True
-        sleep(1)
+    def __bool__(self):
+        return self.completed
 
-    return False
+    def __repr__(self):
+        return "PortWaitResult(completed=%s, pending=%s, elapsed_sec=%.1f, polls=%s, requests=%s)" % (
+            self.completed, self.pending, self.elapsed_sec, self.polls, self.requests)
 
 
-def waitUntilPortsAdminUp(resource_id=0, base_url="http://localhost:8080", port_list=()):
-    return wait_until_ports_admin_up(resource_id=resource_id, base_url=base_url, port_list=port_list)
+# most port names a single grouped /port query will carry
+PORT_QUERY_CHUNK = 256
 
 
-def wait_until_ports_admin_up(resource_id=0, base_url="http://localhost:8080", port_list=(), debug_=False, timeout=300):
-    if debug_:
-        print("Waiting until %s ports appear admin-up..." % (len(port_list)))
-    down_stations = port_list.copy()
-    port_url = "/port"
-    loops = 0
-
-    # url = /%s/%s?fields=device,down" % (resource_id, port_name)
-    for _ in range(0, timeout):
-        down_stations = []
-        for port_name in port_list:
-            eid = name_to_eid(port_name)
-            rid = resource_id
-            if rid == 0:  # TODO: this allows user to pass in resource_id, but probably should remove resource_id entirely.
-                rid = eid[1]  # use resource-id from the eid instead.
-            uri = "%s/%s/%s/%s?fields=device,down" % (port_url, eid[0], rid, eid[2])
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug_)
-            json_response = lf_r.get_as_json()
+def group_ports_by_resource(port_list=(), resource_id=0):
+    """
+    Group port EIDs for grouped /port/shelf/resource/a,b,c queries.
+    :param port_list: port EIDs or names
+    :param resource_id: when non-zero, use this resource for every port
+    :return: dict of (shelf, resource) to dict of port name to the EID as passed in
+    """
+    ports_by_resource = {}
+    for port_eid in port_list:
+        eid = name_to_eid(port_eid)
+        rid = resource_id if resource_id else eid[1]
+        ports_by_resource.setdefault((eid[0], rid), {})[eid[2]] = port_eid
+    return ports_by_resource
 
-            if debug_:
-                print("uri: %s response:\n%s" % (uri, json_response))
 
+def query_ports_by_resource(base_url="http://localhost:8080", ports_by_resource=None, fields=(), debug=False,
+                            json_get=None):
+    """
+    Fetch port records with one GET per resource, PORT_QUERY_CHUNK names at a time.
+    :param base_url: LANforge GUI url
+    :param ports_by_resource: as returned by group_ports_by_resource()
+    :param fields: port columns to request; alias is always added. When empty, the
+    GUI's default port columns are returned, as for a plain /port/1/1/sta0000 query
+    :param debug: print requests
+    :param json_get: optional function(uri) -> dict used instead of a plain LFRequest,
+    for callers that need their own proxy settings
+    :return: (dict of EID as passed in to its port record, number of requests made).
+    Ports the GUI did not return are absent from the dict.
+    """
+    field_list = list(fields)
+    if field_list and ("alias" not in field_list):
+        field_list.append("alias")
+    records = {}
+    num_requests = 0
+    for (shelf, resource), names in ports_by_resource.items():
+        name_list = list(names.keys())
+        for i in range(0, len(name_list), PORT_QUERY_CHUNK):
+            chunk = name_list[i:i + PORT_QUERY_CHUNK]
+            uri = "/port/%s/%s/%s" % (shelf, resource, ",".join(chunk))
+            if field_list:
+                uri += "?fields=%s" % ",".join(field_list)
+            if json_get:
+                json_response = json_get(uri)
+            else:
+                json_response = LFRequest.LFRequest(base_url, uri, debug_=debug).get_as_json()
+            num_requests += 1
             if json_response is None:
-                if debug_:
-                    print("port response is None for port name: %s" % port_name)
-                down_stations.append(port_name)
                 continue
-
             if "interface" in json_response:
-                json_response = json_response['interface']
+                port_records = [json_response["interface"]]
             else:
-                if debug_:
-                    print("interface not found in json response:")
-                    pprint(json_response)
-                down_stations.append(port_name)
-                continue
+                port_records = list_to_alias_map(json_response, from_element="interfaces").values()
+            for record in port_records:
+                alias = record.get("alias")
+                if alias in names:
+                    records[names[alias]] = record
+    return records, num_requests
+
+
+def wait_for_port_state(base_url="http://localhost:8080",
+                        port_list=(),
+                        fields=(),
+                        is_ready=None,
+                        resource_id=0,
+                        timeout_sec=300,
+                        min_poll_sec=0.25,
+                        max_poll_sec=2.0,
+                        on_pending=None,
+                        debug=False,
+                        tracker=None):
+    """
+    Poll grouped port queries until is_ready(record) holds for every port.
+    The poll interval starts at min_poll_sec, doubles up to max_poll_sec while no
+    port changes state, and drops back to min_poll_sec when some port does.
+    :param base_url: LANforge GUI url
+    :param port_list: port EIDs or names
+    :param fields: port columns is_ready() looks at
+    :param is_ready: function(record) -> bool; record is None when the port was not returned
+    :param resource_id: when non-zero, use this resource for every port
+    :param timeout_sec: give up after this many seconds
+    :param min_poll_sec: shortest pause between polls
+    :param max_poll_sec: longest pause between polls
+    :param on_pending: optional function(pending EIDs, records) called after each poll
+    :param debug: print requests
+    :param tracker: optional lf_state_tracker.StateTracker; when given it waits on
+    websocket events instead of polling
+    :return: PortWaitResult
+    """
+    if tracker is not None:
+        return tracker.wait_for("port",
+                                port_list,
+                                is_ready=is_ready,
+                                fields=fields,
+                                resource_id=resource_id,
+                                timeout_sec=timeout_sec,
+                                on_pending=on_pending)
+    started = time.monotonic()
+    ports_by_resource = group_ports_by_resource(port_list, resource_id=resource_id)
+    pending = list(port_list)
+    poll_sec = min_poll_sec
+    polls = 0
+    num_requests = 0
+    while True:
+        records, made = query_ports_by_resource(base_url=base_url,
+                                                ports_by_resource=ports_by_resource,
+                                                fields=fields,
+                                                debug=debug)
+        polls += 1
+        num_requests += made
+        still_pending = [port for port in pending if not is_ready(records.get(port))]
+        if not still_pending:
+            return PortWaitResult(completed=True,
+                                  elapsed_sec=time.monotonic() - started,
+                                  polls=polls,
+                                  requests=num_requests)
+        if on_pending:
+            on_pending(still_pending, records)
+        if len(still_pending) < len(pending):
+            poll_sec = min_poll_sec
+        else:
+            poll_sec = min(max_poll_sec, poll_sec * 2)
+        pending = still_pending
+        # only ask about ports that are not there yet
+        ports_by_resource = group_ports_by_resource(pending, resource_id=resource_id)
+        if (time.monotonic() - started + poll_sec) > timeout_sec:
+            return PortWaitResult(completed=False,
+                                  pending=pending,
+                                  elapsed_sec=time.monotonic() - started,
+                                  polls=polls,
+                                  requests=num_requests)
+        sleep(poll_sec)
 
-            if json_response['down']:  # This is a boolean object, not a string
-                if debug_:
-                    logger.info("waiting for port: %s to go admin up." % port_name)
-                down_stations.append(port_name)
-            else:
-                if debug_:
-                    logger.debug("port %s is admin up" % port_name)
 
-        if len(down_stations) > 0:
-            sleep(1)
-        else:
-            return True
+def is_port_down(record=None):
+    # the down column is a JSON boolean, older GUIs sent a string
+    return str(record.get("down")).lower() == "true"
 
-        loops += 1
 
-    logger.warning("Not all ports went admin up within %s+ seconds" % timeout)
-    return False
+def waitUntilPortsAdminDown(resource_id=1, base_url="http://localhost:8080", port_list=()):
+    return wait_until_ports_admin_down(resource_id=resource_id, base_url=base_url, port_list=port_list)
+
+
+def wait_until_ports_admin_down(resource_id=1, base_url="http://localhost:8080", debug_=False, port_list=(), timeout_sec=360,
+                                tracker=None):
+    """
+    Wait until ports are admin down. Ports that disappeared count as down.
+    :return: PortWaitResult, True when every port is down
+    """
+    print("Waiting until ports appear admin-down...")
+    result = wait_for_port_state(base_url=base_url,
+                                 port_list=port_list,
+                                 fields=("device", "down"),
+                                 is_ready=lambda record: (record is None) or is_port_down(record),
+                                 resource_id=resource_id,
+                                 timeout_sec=timeout_sec,
+                                 max_poll_sec=1.0,
+                                 debug=debug_,
+                                 tracker=tracker)
+    if not result and debug_:
+        print("ports still admin up: %s" % result.pending)
+    return result
+
+
+def waitUntilPortsAdminUp(resource_id=0, base_url="http://localhost:8080", port_list=()):
+    return wait_until_ports_admin_up(resource_id=resource_id, base_url=base_url, port_list=port_list)
+
+
+def wait_until_ports_admin_up(resource_id=0, base_url="http://localhost:8080", port_list=(), debug_=False, timeout=300,
+                              tracker=None):
+    """
+    Wait until ports exist and are admin up.
+    :param resource_id: when non-zero, overrides the resource of every port in port_list
+    :return: PortWaitResult, True when every port is up
+    """
+    if debug_:
+        print("Waiting until %s ports appear admin-up..." % (len(port_list)))
+
+    def log_pending(pending, records):
+        if debug_:
+            logger.info("waiting for %s ports to go admin up: %s" % (len(pending), pending))
+
+    result = wait_for_port_state(base_url=base_url,
+                                 port_list=port_list,
+                                 fields=("device", "down"),
+                                 is_ready=lambda record: (record is not None) and not is_port_down(record),
+                                 resource_id=resource_id,
+                                 timeout_sec=timeout,
+                                 max_poll_sec=1.0,
+                                 on_pending=log_pending,
+                                 debug=debug_,
+                                 tracker=tracker)
+    if not result:
+        logger.warning("Not all ports went admin up within %s+ seconds, still down: %s" % (timeout, result.pending))
+    return result
 
 def speed_to_int(speed):
     # Parse speed into a number.  Initial implementation is for ping output, but
@@ -699,7 +833,7 @@ def name_to_eid(eid_input, non_port=False):
     return rv
 
 
-def wait_until_ports_appear(base_url="http://localhost:8080", port_list=(), debug=False, timeout=300):
+def wait_until_ports_appear(base_url="http://localhost:8080", port_list=(), debug=False, timeout=300, tracker=None):
     """
     Wait until ports are found and non phantom, or if timeout expires.
     Returns True if all are found and non phantom, returns False if timeout expires first.
@@ -707,63 +841,55 @@ def wait_until_ports_appear(base_url="http://localhost:8080", port_list=(), debu
     :param base_url:
     :param port_list: list or str. Pass a list of multiple port EIDs, or a single EID string.
     :param debug:
-    :return:
+    :param tracker: optional lf_state_tracker.StateTracker, see wait_for_port_state()
+    :return: PortWaitResult, which is True when every port appeared
     """
-    if debug:
-        logger.debug("Waiting until ports appear...")
-        existing_stations = LFRequest.LFRequest(base_url, '/ports', debug_=debug)
-        # logger.debug('existing ports')
-        # logger.debug(pprint.pformat(existing_stations)) # useless
-    port_url = "/port/1"
     show_url = "/cli-json/show_ports"
-    found_stations = set()
     if base_url.endswith('/'):
-        port_url = port_url[1:]
         show_url = show_url[1:]
     if type(port_list) is not list:
         port_list = [port_list]
     if debug:
+        logger.debug("Waiting until ports appear...")
         current_ports = LFRequest.LFRequest(base_url, '/ports', debug_=debug).get_as_json()
         logger.debug("LFUtils:wait_until_ports_appear, full port listing: %s" % pprint.pformat(current_ports))
         for port in current_ports['interfaces']:
             if list(port.values())[0]['phantom']:
                 logger.debug("LFUtils:waittimeout_until_ports_appear: %s is phantom" % list(port.values())[0]['alias'])
-    for attempt in range(0, int(timeout / 2)):
-        found_stations = set()
-        for port_eid in port_list:
+
+    # probe no more often than the old two second polling loop did
+    probe_sec = 2.0
+    last_probe = None
+
+    def probe_missing(pending, records):
+        nonlocal last_probe
+        if (last_probe is not None) and (time.monotonic() - last_probe < probe_sec):
+            return
+        last_probe = time.monotonic()
+        # ask the manager to report ports the GUI does not know about yet
+        for port_eid in pending:
+            if port_eid in records:
+                continue
             eid = name_to_eid(port_eid)
-            shelf = eid[0]
-            resource_id = eid[1]
-            port_name = eid[2]
-            # TODO:  If port_name happens to be a number, especialy '1', then the request below
-            # gets a list instead of a single item...and see a few lines down.
-            uri = "%s/%s/%s" % (port_url, resource_id, port_name)
-            #print("port-eid: %s uri: %s" % (port_eid, uri))
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug)
-            json_response = lf_r.get_as_json()
-            if json_response is not None:
-                #pprint.pprint(json_response)
-                # TODO:  If a list was (accidentally) requested, this code below will blow up.
-                # This can currently happen if someone manages to name a port 1.1.vap0, ie using
-                # an EID as a name.
-                # TODO:  Fix name_to_eid to somehow detect this and deal with it.
-                if not json_response['interface']['phantom']:
-                    found_stations.add("%s.%s.%s" % (shelf, resource_id, port_name))
-            else:
-                lf_r = LFRequest.LFRequest(base_url, show_url, debug_=debug)
-                lf_r.addPostData({"shelf": shelf, "resource": resource_id, "port": port_name, "probe_flags": 5})
-                lf_r.jsonPost()
-        if len(found_stations) < len(port_list):
-            sleep(2)
-            logger.info('Found %s out of %s ports in %s out of %s tries in wait_until_ports_appear' % (len(found_stations), len(port_list), attempt, timeout/2))
-        else:
-            logger.info('All %s ports appeared' % len(found_stations))
-            return True
-    if debug:
-        logger.debug("These ports appeared: " + ", ".join(found_stations))
-        logger.debug("These ports did not appear: " + ",".join(set(port_list) - set(found_stations)))
-        logger.debug(pprint.pformat(LFRequest.LFRequest("%s/ports" % base_url)))
-    return False
+            lf_r = LFRequest.LFRequest(base_url, show_url, debug_=debug)
+            lf_r.addPostData({"shelf": eid[0], "resource": eid[1], "port": eid[2], "probe_flags": 5})
+            lf_r.jsonPost()
+        logger.info('Found %s out of %s ports in wait_until_ports_appear'
+                    % (len(port_list) - len(pending), len(port_list)))
+
+    result = wait_for_port_state(base_url=base_url,
+                                 port_list=port_list,
+                                 fields=("phantom",),
+                                 is_ready=lambda record: (record is not None) and not record.get("phantom"),
+                                 timeout_sec=timeout,
+                                 on_pending=probe_missing,
+                                 debug=debug,
+                                 tracker=tracker)
+    if result:
+        logger.info('All %s ports appeared' % len(port_list))
+    elif debug:
+        logger.debug("These ports did not appear: " + ",".join(result.pending))
+    return result
 
 
 def wait_until_endps(base_url="http://localhost:8080", endp_list=(), debug=False, timeout=360):
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Short lived cache of GUI responses for LFCliBase.json_get, for helpers that read
+the same /cx/list, /endp/list or /port/1/list several times within a test step.
+
+Responses are kept per URL path and field set, so /port/1/list?fields=alias,ip and
+/port/1/list?fields=ip,alias share an entry, for ttl_sec and at most max_entries of
+them, dropping the least recently used first. Only entity URLs are kept: /port,
+/endp, /cx and the like, see ENTITY_URLS. A /cli-json/ command drops the entries of
+the entity types it changes, see COMMAND_ENTITIES; any other post, put or delete
+drops every entry. Each hit returns a new copy of the response.
+
+    realm = Realm(lfclient_host="192.168.100.178")
+    realm.enable_json_cache(ttl_sec=1.0)
+    ...
+    logger.info(realm.get_json_cache().get_stats())
+"""
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+# entity type to the first segment of the URLs that list it
+ENTITY_URLS = {
+    "port": ("port", "ports", "stations", "radiostatus", "wifi-stats", "probe"),
+    "endp": ("endp", "endpoints", "generic", "layer4", "fileio", "voip-endp", "wl-endp"),
+    "cx": ("cx", "voip", "wl", "test-group"),
+    "resource": ("resource",),
+    "vr": ("vr", "vrcx"),
+}
+
+# /cli-json/ command pattern to the entity types it changes; the first match counts.
+# Commands that match none drop every entry.
+COMMAND_ENTITIES = (
+    (re.compile(r"(^|_)vr"), ("vr", "port")),
+    (re.compile(r"endp|gen_cmd|fe_info|voip_info|arm_info|wanlink|wanpath|(^|_)wl_"), ("endp", "cx")),
+    (re.compile(r"(^|_)(cx|cxe|tgcx|group)(_|$)"), ("cx", "endp")),
+    (re.compile(r"(^|_)(port|ports|sta|vap|vlan|mvlan|monitor|br|bond|gre|rdd|sec_ip|wifi|ifup|dhcp)(_|$)"),
+     ("port",)),
+    (re.compile(r"resource|reboot|shutdown"), ("resource", "port")),
+    # reads and notes that change no entity
+    (re.compile(r"^(show_|get|help$|version$|who$|log_msg$|gossip$|add_event$|add_text_blob$|add_dut_notes$)"),
+     ()),
+)
+
+
+def command_entities(command):
+    """
+    :param command: cli-json command name, like set_port
+    :return: tuple of entity types the command changes, None when that is not known
+    """
+    for pattern, entities in COMMAND_ENTITIES:
+        if pattern.search(command):
+            return entities
+    return None
+
+
+class JsonCache:
+    def __init__(self,
+                 ttl_sec=1.0,
+                 max_entries=256,
+                 ttl_by_url=None):
+        """
+        :param ttl_sec: seconds a response is reused
+        :param max_entries: most responses kept
+        :param ttl_by_url: optional dict of first URL segment to ttl_sec, like {"port": 0.5};
+        0 stops that URL being cached
+        """
+        self.max_entries = max_entries
+        self.ttl_by_url = {url: ttl_sec for urls in ENTITY_URLS.values() for url in urls}
+        if ttl_by_url:
+            self.ttl_by_url.update(ttl_by_url)
+        # key to (expires_at, first URL segment, response as json text)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def url_key(url):
+        """
+        :return: (first URL segment, key): the key ignores the order of fields and
+        other query parameters and a trailing /
+        """
+        parts = urlsplit(url)
+        path = "/" + parts.path.strip("/")
+        fields = ()
+        params = []
+        for name, value in parse_qsl(parts.query, keep_blank_values=True):
+            if name == "fields":
+                fields = tuple(sorted(set(fields) | set(value.split(","))))
+            else:
+                params.append((name, value))
+        return path.split("/")[1], (path, fields, tuple(sorted(params)))
+
+    def get(self, url):
+        """
+        :return: a copy of the cached response for url, None when there is none
+        """
+        segment, key = self.url_key(url)
+        if not self.ttl_by_url.get(segment):
+            return None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self.entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(entry[2])
+
+    def put(self, url, response):
+        segment, key = self.url_key(url)
+        ttl_sec = self.ttl_by_url.get(segment)
+        if (not ttl_sec) or (response is None):
+            return
+        text = json.dumps(response)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl_sec, segment, text)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, entities=None):
+        """
+        :param entities: entity types, keys of ENTITY_URLS, whose responses are dropped;
+        None drops every response
+        """
+        with self.lock:
+            if entities is None:
+                dropped = list(self.entries)
+            else:
+                urls = set(url for entity in entities for url in ENTITY_URLS[entity])
+                dropped = [key for key, entry in self.entries.items() if entry[1] in urls]
+            for key in dropped:
+                del self.entries[key]
+            self.invalidations += len(dropped)
+
+    def invalidate_post(self, url):
+        """
+        Drop the responses a post to url may have changed.
+        """
+        path = urlsplit(url).path.strip("/").split("/")
+        if (len(path) == 2) and (path[0] == "cli-json"):
+            self.invalidate(command_entities(path[1].lower()))
+        else:
+            self.invalidate()
+
+    def get_stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self.entries),
+            }
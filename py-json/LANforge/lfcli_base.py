@@ -13,6 +13,7 @@ import argparse
 import re
 import logging
 import math
+import contextlib
 
 if sys.version_info[0] != 3:
     print("This script requires Python 3")
@@ -23,12 +24,18 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
 debug_printer = pprint.PrettyPrinter(indent=2)
 LFRequest = importlib.import_module("py-json.LANforge.LFRequest")
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+json_cache = importlib.import_module("py-json.LANforge.json_cache")
 Logg = importlib.import_module("lanforge_client.logg")
 logger = logging.getLogger(__name__)
 
-if os.environ.get("LF_USE_AUTOGEN") == 1:
-    lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
-    LFSession = lanforge_api.LFSession
+
+def __getattr__(name):
+    # lanforge_api is large, it is imported when lfcli_base.LFSession is first used
+    if name in ("lanforge_api", "LFSession"):
+        lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+        globals().update(lanforge_api=lanforge_api, LFSession=lanforge_api.LFSession)
+        return globals()[name]
+    raise AttributeError("module {module} has no attribute {name}".format(module=__name__, name=name))
 
 
 class LFCliBase:
@@ -76,6 +83,12 @@ class LFCliBase:
         self.suppress_related_commands = None
         self.finish = self.SHOULD_RUN
         self.thread_map = {}
+        # lanforge_client session, created on first use by get_lf_session()
+        self.lf_session = None
+        # LFJsonCommandBatch collecting json_post calls inside json_post_batch()
+        self.json_batch = None
+        # json_cache.JsonCache of json_get responses, set by enable_json_cache()
+        self.json_cache = None
 
         if len(_capture_signal_list) > 0:
             for zignal in _capture_signal_list:
@@ -249,6 +262,11 @@ class LFCliBase:
                 _data['suppress_postexec_cli'] = True
                 _data['suppress_postexec_method'] = True
 
+            if self.json_batch is not None:
+                # json_post_batch() drops cached responses again when the batch is sent
+                self.invalidate_json_cache(_req_url)
+                return self.json_batch.json_post(url=_req_url, post_data=_data, debug=debug_)
+
             lf_r.addPostData(_data)
             if debug_:
                 logger.debug(debug_printer.pformat(_data))
@@ -266,8 +284,48 @@ class LFCliBase:
                 logger.debug(traceback.format_exception(Exception, x, x.__traceback__, chain=True))
             if self.exit_on_error:
                 exit(1)
+        self.invalidate_json_cache(_req_url)
         return json_response
 
+    def get_lf_session(self):
+        """
+        Creates a lanforge_client LFSession to the same LANforge GUI the first time
+        it is called. The session keeps persistent connections to the GUI.
+        :return: lanforge_client.lanforge_api.LFSession
+        """
+        if self.lf_session is None:
+            lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+            self.lf_session = lanforge_api.LFSession(lfclient_url=self.lfclient_url,
+                                                     proxy_map=self.proxy if self.proxy else None,
+                                                     debug=self.debug,
+                                                     exit_on_error=self.exit_on_error)
+        return self.lf_session
+
+    @contextlib.contextmanager
+    def json_post_batch(self, chunk_size=None):
+        """
+        Queue the json_post calls made inside this block and submit them in
+        concurrent chunks when it exits. json_post returns an LFJsonBatchItem
+        instead of a response while the block is active:
+
+            with self.local_realm.json_post_batch(chunk_size=64) as batch:
+                for data in endp_list:
+                    self.local_realm.json_post("/cli-json/add_endp", data)
+            for item in batch.get_failed():
+                logger.error("%s failed: %s" % (item.post_data, item.errors))
+
+        :param chunk_size: number of commands sent concurrently before waiting
+        :return: lanforge_client.lanforge_api.LFJsonCommandBatch
+        """
+        batch = self.get_lf_session().get_command().batch(chunk_size=chunk_size)
+        self.json_batch = batch
+        try:
+            with batch:
+                yield batch
+        finally:
+            self.json_batch = None
+            self.invalidate_json_cache()
+
     def json_put(self, _req_url, _data, debug_=False, response_json_list_=None):
         """
         Send a PUT request. This is presently used for data sent to /status-msg for
@@ -304,15 +362,71 @@ class LFCliBase:
                 logger.debug(traceback.format_exception(Exception, x, x.__traceback__, chain=True))
             if self.exit_on_error:
                 exit(1)
+        self.invalidate_json_cache()
         return json_response
 
-    def json_get(self, _req_url, debug_=None):
+    def enable_json_cache(self, ttl_sec=1.0, max_entries=256, ttl_by_url=None):
+        """
+        Reuse json_get responses of /port, /endp, /cx and other entity URLs for
+        ttl_sec. json_post to a /cli-json/ command drops the responses of the entity
+        types it changes; see py-json/LANforge/json_cache.py. Profiles whose
+        local_realm has a cache share it.
+        :param ttl_sec: seconds a response is reused
+        :param max_entries: most responses kept, least recently used are dropped first
+        :param ttl_by_url: optional dict of first URL segment to ttl_sec, like {"port": 0.5}
+        :return: json_cache.JsonCache
+        """
+        self.json_cache = json_cache.JsonCache(ttl_sec=ttl_sec,
+                                               max_entries=max_entries,
+                                               ttl_by_url=ttl_by_url)
+        return self.json_cache
+
+    def disable_json_cache(self):
+        self.json_cache = None
+
+    def get_json_cache(self):
+        """
+        :return: the json_cache.JsonCache of this object or of its local_realm, None when
+        neither has one
+        """
+        if self.json_cache is not None:
+            return self.json_cache
+        local_realm = getattr(self, "local_realm", None)
+        if (local_realm is not None) and (local_realm is not self):
+            return getattr(local_realm, "json_cache", None)
+        return None
+
+    def invalidate_json_cache(self, _req_url=None):
+        """
+        Drop cached responses a request to _req_url may have changed, all of them when
+        _req_url is None.
+        """
+        cache = self.get_json_cache()
+        if cache is None:
+            return
+        if _req_url is None:
+            cache.invalidate()
+        else:
+            cache.invalidate_post(_req_url)
+
+    def json_get(self, _req_url, debug_=None, use_cache=True):
+        """
+        :param use_cache: False always asks the GUI; the response is still cached for
+        later calls
+        """
         # if debug_:
         #     print("json_get: "+_req_url)
         #     print("json_get: proxies:")
         #     pprint.pprint(self.proxy)
         if debug_ is None:
             debug_ = self.debug
+        cache = self.get_json_cache()
+        if (cache is not None) and use_cache:
+            json_response = cache.get(_req_url)
+            if json_response is not None:
+                if debug_:
+                    logger.debug("json_get: cached response for {_req_url}".format(_req_url=_req_url))
+                return json_response
         json_response = None
         try:
             lf_r = LFRequest.LFRequest(url=self.lfclient_url,
@@ -338,6 +452,8 @@ class LFCliBase:
             if self.exit_on_error:
                 sys.exit(1)
 
+        if cache is not None:
+            cache.put(_req_url, json_response)
         return json_response
 
     def json_delete(self, _req_url, debug_=False):
@@ -353,6 +469,7 @@ class LFCliBase:
                                        debug_=debug_,
                                        die_on_error_=self.exit_on_error)
             json_response = lf_r.json_delete(debug=debug_, die_on_error_=False)
+            self.invalidate_json_cache()
             logger.info(json_response)
             # logger.debug(debug_printer.pformat(json_response))
             if (json_response is None) and debug_:
@@ -1,7 +1,90 @@
 #!/usr/bin/env pythonn3
 
+import time
 import pandas as pd
 
+# rows read from the CSV at a time when converting it to another format
+CSV_CHUNK_ROWS = 50000
+
+
+class DataFrameCSVWriter:
+    """
+    Appends DataFrames to a CSV file as they are produced, so a long monitor run
+    keeps a bounded number of rows in memory and loses at most one flush interval
+    of data if it is interrupted. The header comes from the first DataFrame; later
+    DataFrames are written with the same columns in the same order.
+    """
+
+    def __init__(self, save_path=None, flush_interval_sec=10.0, max_buffered_rows=10000):
+        if save_path is None:
+            raise ValueError("DataFrameCSVWriter requires save_path")
+        self.save_path = save_path
+        self.flush_interval_sec = flush_interval_sec
+        self.max_buffered_rows = max_buffered_rows
+        self.columns = None
+        self.rows_written = 0
+        self.buffered = []
+        self.buffered_rows = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, dataframe=None):
+        if dataframe is None or dataframe.empty:
+            return
+        if self.columns is None:
+            self.columns = list(dataframe.columns)
+        self.buffered.append(dataframe)
+        self.buffered_rows += dataframe.shape[0]
+        if (self.buffered_rows >= self.max_buffered_rows) \
+                or (time.monotonic() - self.last_flush >= self.flush_interval_sec):
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.buffered:
+            return
+        dataframe = pd.concat(self.buffered).reindex(columns=self.columns)
+        # the first flush replaces any earlier file of the same name
+        dataframe.to_csv(self.save_path,
+                         mode='a' if self.rows_written else 'w',
+                         header=not self.rows_written,
+                         index=False)
+        self.rows_written += dataframe.shape[0]
+        self.buffered = []
+        self.buffered_rows = 0
+
+    def close(self):
+        self.flush()
+
+
+def csv_to_file(output_f=None, save_path=None, chunksize=CSV_CHUNK_ROWS):
+    """
+    Convert a CSV file written by DataFrameCSVWriter to output_f, next to it.
+    parquet is converted chunksize rows at a time; the other formats read the CSV
+    at once. hdf is one write: chunks read on their own infer their own dtypes and
+    string widths, which a table appended to chunk by chunk does not accept. Any
+    earlier file of the same name is replaced.
+    """
+    output_f = output_f.lower()
+    if output_f == 'hdf':
+        pd.read_csv(save_path).to_hdf(save_path.replace('csv', 'h5', 1), key='table', mode='w', format='table')
+    elif output_f == 'parquet':
+        import pyarrow
+        import pyarrow.parquet
+        writer = None
+        try:
+            for chunk in pd.read_csv(save_path, chunksize=chunksize):
+                table = pyarrow.Table.from_pandas(chunk, schema=writer.schema if writer else None,
+                                                  preserve_index=False)
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(save_path.replace('csv', 'parquet', 1), table.schema)
+                writer.write_table(table)
+        finally:
+            if writer:
+                writer.close()
+    else:
+        pandas_extensions().df_to_file(output_f=output_f, dataframe=pd.read_csv(save_path), save_path=save_path)
+
+
 class pandas_extensions:
 
     # ================ Pandas Dataframe Functions ======================================
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Parse Broadcom 'wl' station dumps read from an AP into tables keyed by station MAC.
+
+bs_data (downlink) and rx_report (uplink) print one row per associated station.
+Each dump is parsed once per read, after which a station is a dictionary lookup:
+
+    bs_data = ap_stats_parser.parse_bs_data(ap_stats_text)
+    stats = bs_data.get(port_data['mac'].lower())
+    if stats is not None:
+        ap_row = list(stats.row)            # tokens as printed, for the csv writers
+        phy_mbps = stats.values['PHY Mbps'] # typed value
+
+chanim_stats prints one row per chanspec; chanim_channel_utilization() returns
+100 - txop of the first one.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _number(text):
+    return float(text)
+
+
+def _integer(text):
+    return int(text)
+
+
+def _percent(text):
+    return float(text.rstrip('%'))
+
+
+def _rssi(text):
+    # '(-43dBm)'
+    return int(text.strip('()').replace('dBm', ''))
+
+
+# (column name, converter) in the order the AP prints them; the row tokens line up
+# with ap_stats_col_titles and ap_stats_ul_col_titles in test_l3_longevity.py
+BS_DATA_COLUMNS = (
+    ("Station Address", str),
+    ("PHY Mbps", _number),
+    ("Data Mbps", _number),
+    ("Air Use", _percent),
+    ("Data Use", _percent),
+    ("Retries", _percent),
+    ("bw", _integer),
+    ("mcs", _number),
+    ("Nss", _integer),
+    ("ofdma", _percent),
+    ("mu-mimo", _percent),
+)
+RX_REPORT_COLUMNS = (
+    ("Station Address", str),
+    ("rssi", _rssi),
+    ("tid", _integer),
+    ("ampdu", _integer),
+    ("mpdu", _integer),
+    ("Data Mbps", _number),
+    ("PHY Mbps", _number),
+    ("bw", _integer),
+    ("mcs", _number),
+    ("Nss", _integer),
+    ("oow", _integer),
+    ("holes", _integer),
+    ("dup", _integer),
+    ("rtries", _percent),
+    ("ofdma", _percent),
+    ("tones", _number),
+    ("air", _percent),
+)
+CHANIM_TXOP_COLUMN = "txop"
+# header words the AP prints for a column, where they differ from the column name
+HEADER_LABELS = {"(rssi)": "rssi"}
+
+
+def is_mac(text=""):
+    return (len(text) == 17) and (text.count(':') == 5)
+
+
+def header_positions(header=(), columns=BS_DATA_COLUMNS):
+    """
+    :param header: tokens of the header line, like ['Station', 'Address', 'PHY', 'Mbps', ...]
+    :param columns: BS_DATA_COLUMNS or RX_REPORT_COLUMNS
+    :return: dict of column name to the index of its token in a station row, for the
+    columns found in the header. Column names are one or two words; a header word that
+    names no column is taken to be a column of its own.
+    """
+    names = set(name for name, _convert in columns)
+    positions = {}
+    index = 0
+    # each header label is one token of a station row
+    position = 0
+    while index < len(header):
+        name = " ".join(header[index:index + 2])
+        if name in names:
+            index += 2
+        else:
+            name = HEADER_LABELS.get(header[index], header[index])
+            index += 1
+        if (name in names) and (name not in positions):
+            positions[name] = position
+        position += 1
+    return positions
+
+
+class APStationStats:
+    """
+    One station row. row keeps the whitespace separated tokens as the AP printed
+    them; values maps each column name to its converted value, None where the AP
+    printed something that does not convert (such as '-') or no such column.
+    """
+    __slots__ = ('row', 'values')
+
+    def __init__(self, row=None, columns=(), positions=None):
+        """
+        :param positions: dict of column name to token index, see header_positions();
+        by default the tokens are in the order of columns
+        """
+        self.row = row
+        self.values = {}
+        for index, (name, convert) in enumerate(columns):
+            position = index if positions is None else positions.get(name)
+            if (position is None) or (position >= len(row)):
+                self.values[name] = None
+                continue
+            try:
+                self.values[name] = convert(row[position])
+            except ValueError:
+                self.values[name] = None
+
+    def __repr__(self):
+        return "APStationStats(%s)" % self.values
+
+
+def parse_station_table(text="", columns=BS_DATA_COLUMNS):
+    """
+    :param text: output of a wl station dump, prompt and header lines included
+    :param columns: BS_DATA_COLUMNS or RX_REPORT_COLUMNS
+    :return: dict of lowercase MAC to APStationStats, in the order the AP listed them.
+    Columns are found by their place in the 'Station Address ...' header, so columns
+    the firmware adds or drops do not shift the others; without a header they are
+    taken in the order of columns. Lines that do not start with a MAC (headers,
+    '(overall)' totals, 'No stations are currently associated.') are skipped, and so
+    are station rows too short to hold every column, with a warning.
+    """
+    positions = None
+    needed = len(columns)
+    stations = {}
+    short_rows = 0
+    for line in text.splitlines():
+        row = line.split()
+        if row[0:2] == ["Station", "Address"]:
+            positions = header_positions(row, columns)
+            needed = (max(positions.values()) + 1) if positions else 1
+            continue
+        if (not row) or not is_mac(row[0]):
+            continue
+        if len(row) < needed:
+            short_rows += 1
+            continue
+        stations[row[0].lower()] = APStationStats(row, columns, positions)
+    if short_rows:
+        logger.warning("skipped %d station rows with fewer than %d columns" % (short_rows, needed))
+    return stations
+
+
+def parse_bs_data(text=""):
+    return parse_station_table(text, BS_DATA_COLUMNS)
+
+
+def parse_rx_report(text=""):
+    return parse_station_table(text, RX_REPORT_COLUMNS)
+
+
+def parse_chanim_stats(text=""):
+    """
+    :return: list of dicts, one per chanspec row, of header column to value;
+    numbers are floats, the chanspec itself is kept as text
+    """
+    header = None
+    rows = []
+    for line in text.splitlines():
+        row = line.split()
+        if not row:
+            continue
+        if row[0].lower() == 'chanspec':
+            header = row
+            continue
+        if (header is None) or (len(row) != len(header)):
+            continue
+        values = {header[0]: row[0]}
+        for name, token in zip(header[1:], row[1:]):
+            try:
+                values[name] = float(token)
+            except ValueError:
+                values[name] = None
+        rows.append(values)
+    return rows
+
+
+def chanim_channel_utilization(text="", default=0):
+    """
+    :return: 100 - txop of the first chanspec in a chanim_stats dump, or default
+    when there is none
+    """
+    for values in parse_chanim_stats(text):
+        if values.get(CHANIM_TXOP_COLUMN) is not None:
+            return float(100) - values[CHANIM_TXOP_COLUMN]
+        break
+    return default
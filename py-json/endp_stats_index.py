@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Per-port endpoint statistics for one poll of /endp.
+
+Tests that report latency, jitter and rx rates per station used to scan the whole
+endpoint list for every port. EndpStatsIndex walks the list once and answers each
+port in constant time:
+
+    index = EndpStatsIndex(endps)
+    latency, jitter, dl_rate, dl_rate_ll, dl_pkts_ll, ul_rate, ul_rate_ll, ul_pkts_ll = \\
+        index.stats_for_port(["1", "1", "sta0000"])
+
+endps is a list of endpoint records with the name, eid, delay, jitter, rx rate,
+rx rate ll and rx pkts ll columns.
+"""
+
+
+def endp_cx_side(name=""):
+    """
+    Split an endpoint name into its cross-connect name and side. Names that do not
+    end in -A or -B (multicast endpoints) are reported as side B, the upload side.
+    :return: (cx name, 'A' or 'B')
+    """
+    if name.endswith("-A"):
+        return name[:-2], "A"
+    if name.endswith("-B"):
+        return name[:-2], "B"
+    return name, "B"
+
+
+class EndpStatsIndex:
+    def __init__(self, endps=None):
+        """
+        :param endps: endpoint records from one /endp poll. Kept so callers can tell
+        whether an index was built from the list they hold.
+        """
+        self.endps = endps if endps is not None else []
+        # (shelf, resource, port) to [delay total, jitter total, endpoint count, last endpoint name]
+        self.port_stats = {}
+        # cross-connect name to {side: [rx rate, rx rate ll, rx pkts ll]}
+        self.cx_rates = {}
+        for endp in self.endps:
+            port_key = tuple(endp["eid"].split(".")[:3])
+            stats = self.port_stats.get(port_key)
+            if stats is None:
+                stats = self.port_stats[port_key] = [0, 0, 0, None]
+            stats[0] += int(endp["delay"])
+            stats[1] += int(endp["jitter"])
+            stats[2] += 1
+            stats[3] = endp["name"]
+
+            cx_name, side = endp_cx_side(endp["name"])
+            rates = self.cx_rates.setdefault(cx_name, {}).get(side)
+            if rates is None:
+                rates = self.cx_rates[cx_name][side] = [0, 0, 0]
+            rates[0] += int(endp["rx rate"])
+            rates[1] += int(endp["rx rate ll"])
+            rates[2] += int(endp["rx pkts ll"])
+
+    def stats_for_port(self, eid=None):
+        """
+        Average latency and jitter of the endpoints on a port, and the download (-A)
+        and upload (-B) rx totals of the cross-connect the port's endpoint belongs to.
+        :param eid: port EID as [shelf, resource, port], as returned by name_to_eid()
+        :return: (latency, jitter, dl rate, dl rate ll, dl pkts ll, ul rate, ul rate ll, ul pkts ll)
+        """
+        stats = self.port_stats.get((str(eid[0]), str(eid[1]), str(eid[2])))
+        if stats is None:
+            return 0, 0, 0, 0, 0, 0, 0, 0
+        latency, jitter, count, name = stats
+        if count > 1:
+            latency = int(latency / count)
+            jitter = int(jitter / count)
+        cx_rates = self.cx_rates.get(endp_cx_side(name)[0], {})
+        dl = cx_rates.get("A", (0, 0, 0))
+        ul = cx_rates.get("B", (0, 0, 0))
+        return latency, jitter, dl[0], dl[1], dl[2], ul[0], ul[1], ul[2]
@@ -5,7 +5,6 @@ import importlib
 from pprint import pformat
 from pprint import pprint
 import csv
-import pandas as pd
 import time
 import datetime
 import json
@@ -17,7 +16,6 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
-pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
 
 logger = logging.getLogger(__name__)
 
@@ -452,6 +450,9 @@ class GenCXProfile(LFCliBase):
                 arguments=None,
                 compared_report=None,
                 debug=False):
+        # pandas is imported here so realm and scripts that never monitor do not load it
+        import pandas as pd
+        pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
         try:
             duration_sec = self.parse_time(duration_sec).seconds
         except ValueError:
@@ -2,16 +2,15 @@
 import sys
 import os
 import importlib
-import pandas as pd
 import time
 import datetime
 import logging
+import contextlib
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
-pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
 port_probe = importlib.import_module("py-json.port_probe")
 ProbePort = port_probe.ProbePort
 
@@ -131,6 +130,9 @@ class L3CXProfile(LFCliBase):
                 arguments=None,
                 compared_report=None,
                 debug=False):
+        # pandas is imported here so realm and scripts that never monitor do not load it
+        import pandas as pd
+        pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
         if duration_sec:
             duration_sec = self.parse_time(duration_sec).seconds
         else:
@@ -211,8 +213,17 @@ class L3CXProfile(LFCliBase):
 
         # for x in range(0,int(round(iterations,0))):
         initial_starttime = datetime.datetime.now()
-        timestamp_data = list()
+        # rows go to report_file as they are sampled instead of piling up in memory
+        csv_writer = pandas_extensions.DataFrameCSVWriter(save_path=str(report_file))
         while datetime.datetime.now() < end_time:
+            pass_start = time.monotonic()
+            # probe every station at once and wait for the GUI a single time
+            probe_ports = [ProbePort(lfhost=self.lfclient_host,
+                                     lfport=self.lfclient_port,
+                                     eid_str=station,
+                                     debug=self.debug) for station in sta_list]
+            refreshed_probes = port_probe.refresh_probes(probe_ports)
+            # stamp the rows when the data is read, not when the pass began
             t = datetime.datetime.now()
             timestamp = t.strftime("%m/%d/%Y %I:%M:%S")
             t_to_millisec_epoch = int(self.get_milliseconds(t))
@@ -291,73 +302,25 @@ class L3CXProfile(LFCliBase):
             else:
                 timestamp_df = layer3
             probe_port_df_list = list()
-            for station in sta_list:
-                probe_port = ProbePort(lfhost=self.lfclient_host,
-                                       lfport=self.lfclient_port,
-                                       eid_str=station,
-                                       debug=self.debug)
-                probe_results = dict()
-                probe_port.refreshProbe()
-                probe_results['Signal Avg Combined'] = probe_port.getSignalAvgCombined()
-                probe_results['Signal Avg per Chain'] = probe_port.getSignalAvgPerChain()
-                probe_results['Signal Combined'] = probe_port.getSignalCombined()
-                probe_results['Signal per Chain'] = probe_port.getSignalPerChain()
-                if 'Beacon Av Signal' in probe_results.keys():
-                    probe_results['Beacon Avg Signal'] = probe_port.getBeaconSignalAvg()
-                else:
-                    probe_results['Beacon Avg Signal'] = "0"
-                # probe_results['HE status'] = probe_port.he
-                probe_results['TX Bitrate'] = probe_port.tx_bitrate
-                probe_results['TX Mbps'] = probe_port.tx_mbit
-                probe_results['TX MCS ACTUAL'] = probe_port.tx_mcs
-                if probe_port.tx_mcs:
-                    probe_results['TX MCS'] = int(probe_port.tx_mcs) % 8
-                else:
-                    probe_results['TX MCS'] = probe_port.tx_mcs
-                probe_results['TX NSS'] = probe_port.tx_nss
-                probe_results['TX MHz'] = probe_port.tx_mhz
-                if probe_port.tx_gi:
-                    probe_results['TX GI ns'] = (probe_port.tx_gi * 10**9)
-                else:
-                    probe_results['TX GI ns'] = probe_port.tx_gi
-                probe_results['TX Mbps Calc'] = probe_port.tx_mbit_calc
-                probe_results['TX GI'] = probe_port.tx_gi
-                probe_results['TX Mbps short GI'] = probe_port.tx_data_rate_gi_short_Mbps
-                probe_results['TX Mbps long GI'] = probe_port.tx_data_rate_gi_long_Mbps
-                probe_results['RX Bitrate'] = probe_port.rx_bitrate
-                probe_results['RX Mbps'] = probe_port.rx_mbit
-                probe_results['RX MCS ACTUAL'] = probe_port.rx_mcs
-                if probe_port.rx_mcs:
-                    probe_results['RX MCS'] = int(probe_port.rx_mcs) % 8
-                else:
-                    probe_results['RX MCS'] = probe_port.rx_mcs
-                probe_results['RX NSS'] = probe_port.rx_nss
-                probe_results['RX MHz'] = probe_port.rx_mhz
-                if probe_port.rx_gi:
-                    probe_results['RX GI ns'] = (probe_port.rx_gi * 10**9)
-                else:
-                    probe_results['RX GI ns'] = probe_port.rx_gi
-                probe_results['RX Mbps Calc'] = probe_port.rx_mbit_calc
-                probe_results['RX GI'] = probe_port.rx_gi
-                probe_results['RX Mbps short GI'] = probe_port.rx_data_rate_gi_short_Mbps
-                probe_results['RX Mbps long GI'] = probe_port.rx_data_rate_gi_long_Mbps
-
+            for probe_port in refreshed_probes:
+                probe_results = self.get_probe_results(probe_port)
                 probe_df_initial = pd.DataFrame(probe_results.values()).transpose()
                 probe_df_initial.columns = probe_results.keys()
                 probe_df_initial.columns = ['probe ' + x for x in probe_df_initial.columns]
-                probe_df_initial['alias'] = station.split('.')[-1]
+                probe_df_initial['alias'] = probe_port.eid_str.split('.')[-1]
                 probe_port_df_list.append(probe_df_initial)
-            probe_port_df = pd.concat(probe_port_df_list)
-            timestamp_df = pd.merge(timestamp_df, probe_port_df, on='alias')
+            # stations whose probe failed keep their rows, with empty probe columns
+            if probe_port_df_list:
+                probe_port_df = pd.concat(probe_port_df_list)
+                timestamp_df = pd.merge(timestamp_df, probe_port_df, on='alias', how='left')
             timestamp_df['Timestamp'] = timestamp
             timestamp_df['Timestamp milliseconds epoch'] = t_to_millisec_epoch
             timestamp_df['Timestamp seconds epoch'] = t_to_sec_epoch
             timestamp_df['Duration elapsed'] = time_elapsed
-            timestamp_data.append(timestamp_df)
-            time.sleep(monitor_interval_ms)
-        df = pd.concat(timestamp_data)
-        df = df.drop('alias', axis=1)
-        df.to_csv(str(report_file), index=False)
+            csv_writer.write(timestamp_df.drop('alias', axis=1))
+            # keep a steady cadence: the interval includes the time spent sampling
+            time.sleep(max(0.0, monitor_interval_ms - (time.monotonic() - pass_start)))
+        csv_writer.close()
 
         # comparison to last report / report inputted
         if compared_report:
@@ -367,10 +330,64 @@ class L3CXProfile(LFCliBase):
             exit(1)
             # append compared df to created one
             if output_format.lower() != 'csv':
-                pandas_extensions.df_to_file(dataframe=pd.read_csv(report_file), output_f=output_format, save_path=report_file)
+                pandas_extensions.csv_to_file(output_f=output_format, save_path=report_file)
         else:
             if output_format.lower() != 'csv':
-                pandas_extensions.df_to_file(dataframe=pd.read_csv(report_file), output_f=output_format, save_path=report_file)
+                pandas_extensions.csv_to_file(output_f=output_format, save_path=report_file)
+
+    @staticmethod
+    def get_probe_results(probe_port=None):
+        """
+        Columns monitor() records for one refreshed ProbePort.
+        :param probe_port: ProbePort after refreshProbe() or port_probe.refresh_probes()
+        :return: dict of column name to value
+        """
+        probe_results = dict()
+        probe_results['Signal Avg Combined'] = probe_port.getSignalAvgCombined()
+        probe_results['Signal Avg per Chain'] = probe_port.getSignalAvgPerChain()
+        probe_results['Signal Combined'] = probe_port.getSignalCombined()
+        probe_results['Signal per Chain'] = probe_port.getSignalPerChain()
+        if 'Beacon Av Signal' in probe_results.keys():
+            probe_results['Beacon Avg Signal'] = probe_port.getBeaconSignalAvg()
+        else:
+            probe_results['Beacon Avg Signal'] = "0"
+        # probe_results['HE status'] = probe_port.he
+        probe_results['TX Bitrate'] = probe_port.tx_bitrate
+        probe_results['TX Mbps'] = probe_port.tx_mbit
+        probe_results['TX MCS ACTUAL'] = probe_port.tx_mcs
+        if probe_port.tx_mcs:
+            probe_results['TX MCS'] = int(probe_port.tx_mcs) % 8
+        else:
+            probe_results['TX MCS'] = probe_port.tx_mcs
+        probe_results['TX NSS'] = probe_port.tx_nss
+        probe_results['TX MHz'] = probe_port.tx_mhz
+        if probe_port.tx_gi:
+            probe_results['TX GI ns'] = (probe_port.tx_gi * 10**9)
+        else:
+            probe_results['TX GI ns'] = probe_port.tx_gi
+        probe_results['TX Mbps Calc'] = probe_port.tx_mbit_calc
+        probe_results['TX GI'] = probe_port.tx_gi
+        probe_results['TX Mbps short GI'] = probe_port.tx_data_rate_gi_short_Mbps
+        probe_results['TX Mbps long GI'] = probe_port.tx_data_rate_gi_long_Mbps
+        probe_results['RX Bitrate'] = probe_port.rx_bitrate
+        probe_results['RX Mbps'] = probe_port.rx_mbit
+        probe_results['RX MCS ACTUAL'] = probe_port.rx_mcs
+        if probe_port.rx_mcs:
+            probe_results['RX MCS'] = int(probe_port.rx_mcs) % 8
+        else:
+            probe_results['RX MCS'] = probe_port.rx_mcs
+        probe_results['RX NSS'] = probe_port.rx_nss
+        probe_results['RX MHz'] = probe_port.rx_mhz
+        if probe_port.rx_gi:
+            probe_results['RX GI ns'] = (probe_port.rx_gi * 10**9)
+        else:
+            probe_results['RX GI ns'] = probe_port.rx_gi
+        probe_results['RX Mbps Calc'] = probe_port.rx_mbit_calc
+        probe_results['RX GI'] = probe_port.rx_gi
+        probe_results['RX Mbps short GI'] = probe_port.rx_data_rate_gi_short_Mbps
+        probe_results['RX Mbps long GI'] = probe_port.rx_data_rate_gi_long_Mbps
+
+        return probe_results
 
     def refresh_cx(self):
         for cx_name in self.created_cx.keys():
@@ -442,14 +459,37 @@ class L3CXProfile(LFCliBase):
         self.created_endp.clear()
 
     def create(self, endp_type, side_a, side_b, sleep_time=0.03, suppress_related_commands=None, debug_=False,
-               tos=None, timeout=300):
+               tos=None, timeout=300, batch_size=0):
         # Returns a 2-member array, list of cx, list of endp on success.
         # If endpoints creation fails, returns False, False
         # if Endpoints creation is OK, but CX creation fails, returns False, list of endp
+        # batch_size > 0 submits the endpoint and cross-connect commands in concurrent chunks
         if self.debug:
             debug_ = True
             logger.info('Start L3CXProfile.create')
 
+        # commands posted inside this block are queued when batching; add_endp commands
+        # of a chunk are answered before its set_endp_flag and set_endp_tos commands are sent
+        with (self.local_realm.json_post_batch(chunk_size=batch_size) if batch_size
+              else contextlib.nullcontext()) as endp_batch:
+            these_cx, these_endp, cx_post_data = self._post_endps(endp_type, side_a, side_b,
+                                                                  sleep_time=0 if batch_size else sleep_time,
+                                                                  suppress_related_commands=suppress_related_commands,
+                                                                  debug_=debug_,
+                                                                  tos=tos)
+        if endp_batch is not None:
+            for item in endp_batch.get_failed():
+                logger.error("L3CXProfile::create, {url} {data} failed: {errors}".format(
+                    url=item.url, data=item.post_data, errors=item.errors))
+        return self._post_cxs(these_cx, these_endp, cx_post_data,
+                              suppress_related_commands=suppress_related_commands,
+                              debug_=debug_,
+                              timeout=timeout,
+                              batch_size=batch_size)
+
+    def _post_endps(self, endp_type, side_a, side_b, sleep_time=0.03, suppress_related_commands=None, debug_=False,
+                    tos=None):
+        # Posts the endpoints of create(), returns its cx names, endpoint names and add_cx data
         cx_post_data = []
         timer_post_data = []
         these_endp = []
@@ -653,6 +693,11 @@ class L3CXProfile(LFCliBase):
             raise ValueError(
                 "side_a or side_b must be of type list but not both: side_a is type %s side_b is type %s" % (
                     type(side_a), type(side_b)))
+        return these_cx, these_endp, cx_post_data
+
+    def _post_cxs(self, these_cx, these_endp, cx_post_data, suppress_related_commands=None, debug_=False,
+                  timeout=300, batch_size=0):
+        # Waits for the endpoints of create(), then posts and waits for its cross-connects
         if debug_:
             logger.debug("wait_until_endps_appear these_endp: {these_endp} debug_ {debug_}".format(
                 these_endp=these_endp, debug_=debug_))
@@ -661,10 +706,19 @@ class L3CXProfile(LFCliBase):
             logger.error("L3CXProfile::create, Could not create/find endpoints")
             return False, False
 
-        for data in cx_post_data:
-            url = "/cli-json/add_cx"
-            self.local_realm.json_post(url, data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
-            time.sleep(0.01)
+        if batch_size:
+            with self.local_realm.json_post_batch(chunk_size=batch_size) as cx_batch:
+                for data in cx_post_data:
+                    self.local_realm.json_post("/cli-json/add_cx", data, debug_=debug_,
+                                               suppress_related_commands_=suppress_related_commands)
+            for item in cx_batch.get_failed():
+                logger.error("L3CXProfile::create, add_cx {data} failed: {errors}".format(
+                    data=item.post_data, errors=item.errors))
+        else:
+            for data in cx_post_data:
+                url = "/cli-json/add_cx"
+                self.local_realm.json_post(url, data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
+                time.sleep(0.01)
 
         rv = self.local_realm.wait_until_cxs_appear(these_cx, debug=debug_, timeout=timeout)
         if not rv:
@@ -2,8 +2,6 @@
 import sys
 import os
 import importlib
-import requests
-import pandas as pd
 import time
 import datetime
 import ast
@@ -205,6 +203,9 @@ class L4CXProfile(LFCliBase):
                 arguments=None,
                 iterations=0,
                 debug=False):
+        # pandas and requests are imported here so realm and scripts that never monitor do not load them
+        import pandas as pd
+        import requests
         if duration_sec:
             duration_sec = LFCliBase.parse_time(duration_sec).seconds
         else:
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+In-memory view of port, endpoint and cross-connect state, kept fresh by the GUI's
+websocket (port 8081) instead of polling every second.
+
+The websocket carries events and wifi-events rather than whole records, so an event
+that names a watched port, endpoint or cross-connect marks it stale. The next read
+fetches only the stale records, with the grouped queries LFUtils.query_ports_by_resource
+makes. A waiter sleeps until an event names one of the things it waits for. Everything
+being waited on is also read every refresh_sec, in case an event was missed. When the
+websocket cannot be opened, or websocket-client is not installed, reads fetch every
+record and waits poll every poll_sec, as LFUtils.wait_for_port_state does.
+
+    tracker = StateTracker(lfclient_host="192.168.100.178")
+    tracker.start()
+    result = tracker.wait_for(PORT, station_list, fields=("ip",),
+                              is_ready=lambda record: record is not None and record.get("ip") != "0.0.0.0")
+    tracker.stop()
+
+Realm.start_state_tracker() makes the Realm waiters use one.
+"""
+import importlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+LFRequest = importlib.import_module("py-json.LANforge.LFRequest")
+
+logger = logging.getLogger(__name__)
+
+PORT = "port"
+ENDP = "endp"
+CX = "cx"
+
+# most endpoint or cross-connect names a single /endp or /cx query will carry
+NAME_QUERY_CHUNK = 256
+# keys of a /cx response that are not cross-connects
+CX_NOT_NAMES = ('warnings', 'errors', 'handler', 'uri', 'items')
+# names in event text: sta0000, 1.1.sta0000, udp-sta0000-A, wlan0.100
+EVENT_TOKEN_RE = re.compile(r'[\w.\-]+')
+
+
+def event_tokens(text):
+    """
+    :return: set of the words of a websocket message that could name a port, endpoint or
+    cross-connect, with shelf.resource. prefixes also stripped; None for keepalives
+    """
+    try:
+        message = json.loads(text)
+    except ValueError:
+        message = None
+    if isinstance(message, dict):
+        if ("time" in message) and ("timestamp" in message) and (len(message) <= 3):
+            return None
+        text = " ".join(str(value) for value in message.values() if isinstance(value, (str, int)))
+    tokens = set()
+    for token in EVENT_TOKEN_RE.findall(text):
+        tokens.add(token)
+        parts = token.split(".")
+        if len(parts) >= 3 and parts[0].isdigit() and parts[1].isdigit():
+            tokens.add(".".join(parts[2:]))
+    return tokens
+
+
+def entity_token(kind, name):
+    # the word an event uses for a watched name
+    if kind == PORT:
+        return LFUtils.name_to_eid(name)[2]
+    return name
+
+
+class StateTracker:
+    def __init__(self,
+                 lfclient_host="localhost",
+                 lfclient_port=8080,
+                 ws_port=8081,
+                 use_websocket=True,
+                 refresh_sec=10.0,
+                 poll_sec=1.0,
+                 settle_sec=0.1,
+                 connect_timeout_sec=2.0,
+                 reconnect_sec=2.0,
+                 json_get=None,
+                 debug=False):
+        """
+        :param refresh_sec: while the websocket is up, read everything being waited on this often
+        :param poll_sec: pause between reads while the websocket is down
+        :param settle_sec: after an event, wait this long for the rest of the burst
+        :param json_get: optional function(uri) -> dict, for callers with their own proxy settings
+        """
+        self.base_url = "http://%s:%s" % (lfclient_host, lfclient_port)
+        self.ws_url = "ws://%s:%s" % (lfclient_host, ws_port)
+        self.use_websocket = use_websocket
+        self.refresh_sec = refresh_sec
+        self.poll_sec = poll_sec
+        self.settle_sec = settle_sec
+        self.connect_timeout_sec = connect_timeout_sec
+        self.reconnect_sec = reconnect_sec
+        self.json_get = json_get
+        self.debug = debug
+        # (kind, fields, resource_id) to dict of name to record
+        self.views = {}
+        # words of the names queried or waited on
+        self.watched_tokens = set()
+        # watched words named by events since the records they name were last read
+        self.stale_tokens = set()
+        # kinds to read in full on their next query
+        self.stale_kinds = {PORT, ENDP, CX}
+        self.last_full_read = {}
+        self.condition = threading.Condition()
+        self.connected = threading.Event()
+        self.stopping = False
+        self.ws = None
+        self.ws_thread = None
+        self.events = 0
+        self.requests = 0
+        self.reads = 0
+
+    # ----- websocket -----
+    def start(self):
+        """
+        Open the websocket in a background thread.
+        :return: True when it connected within connect_timeout_sec; reads and waits poll otherwise
+        """
+        if not self.use_websocket or self.ws_thread is not None:
+            return self.streaming
+        try:
+            import websocket
+        except ImportError:
+            logger.info("websocket-client is not installed, state tracker polls {url}".format(url=self.base_url))
+            return False
+        self.stopping = False
+
+        def run():
+            while not self.stopping:
+                self.ws = websocket.WebSocketApp(self.ws_url,
+                                                 on_open=self.on_open,
+                                                 on_message=self.on_message,
+                                                 on_error=self.on_error,
+                                                 on_close=self.on_close)
+                self.ws.run_forever()
+                self.connected.clear()
+                if not self.stopping:
+                    time.sleep(self.reconnect_sec)
+
+        self.ws_thread = threading.Thread(target=run, name="lf-state-tracker", daemon=True)
+        self.ws_thread.start()
+        if not self.connected.wait(self.connect_timeout_sec):
+            logger.info("websocket {url} did not open, state tracker polls until it does".format(url=self.ws_url))
+        return self.streaming
+
+    def stop(self):
+        self.stopping = True
+        if self.ws is not None:
+            self.ws.close()
+        if self.ws_thread is not None:
+            self.ws_thread.join(self.connect_timeout_sec)
+            self.ws_thread = None
+        self.connected.clear()
+
+    @property
+    def streaming(self):
+        return self.connected.is_set()
+
+    def on_open(self, ws):
+        logger.info("state tracker websocket {url} open".format(url=self.ws_url))
+        with self.condition:
+            # events were missed while it was closed
+            self.stale_kinds = {PORT, ENDP, CX}
+            self.connected.set()
+            self.condition.notify_all()
+
+    def on_message(self, ws, text):
+        tokens = event_tokens(text)
+        if tokens is None:
+            return
+        with self.condition:
+            self.events += 1
+            self.stale_tokens |= (tokens & self.watched_tokens)
+            self.condition.notify_all()
+
+    def on_error(self, ws, error):
+        logger.info("state tracker websocket error: {error}".format(error=error))
+
+    def on_close(self, ws, status=None, message=None):
+        with self.condition:
+            self.connected.clear()
+            self.condition.notify_all()
+
+    # ----- reads -----
+    def get_json(self, uri):
+        self.requests += 1
+        if self.json_get:
+            return self.json_get(uri)
+        return LFRequest.LFRequest(self.base_url, uri, debug_=self.debug).get_as_json()
+
+    def fetch(self, kind, names, fields=(), resource_id=0):
+        """
+        Read records with grouped queries.
+        :return: dict of name as passed in to record; names the GUI did not return are absent
+        """
+        if kind == PORT:
+            records, num_requests = LFUtils.query_ports_by_resource(
+                base_url=self.base_url,
+                ports_by_resource=LFUtils.group_ports_by_resource(names, resource_id=resource_id),
+                fields=fields,
+                debug=self.debug,
+                json_get=self.json_get)
+            self.requests += num_requests
+            return records
+        records = {}
+        field_list = list(fields)
+        if field_list and ("name" not in field_list):
+            field_list.append("name")
+        for i in range(0, len(names), NAME_QUERY_CHUNK):
+            chunk = names[i:i + NAME_QUERY_CHUNK]
+            uri = "/%s/%s" % (kind, ",".join(chunk))
+            if field_list:
+                uri += "?fields=%s" % ",".join(field_list)
+            response = self.get_json(uri)
+            if not response:
+                continue
+            if kind == ENDP:
+                endpoints = response.get("endpoint", {})
+                if isinstance(endpoints, dict):
+                    endpoints = [{endpoints.get("name", chunk[0]): endpoints}]
+                for item in endpoints:
+                    records.update(item)
+            else:
+                for name, record in response.items():
+                    if name not in CX_NOT_NAMES:
+                        records[name] = record
+        return {name: records[name] for name in names if name in records}
+
+    def query(self, kind, names, fields=(), resource_id=0):
+        """
+        Records for names, reading again only those an event marked stale since the last
+        read, those never read, and every refresh_sec everything. Reads everything while
+        the websocket is down.
+        :return: dict of name as passed in to record; names the GUI did not return are absent
+        """
+        names = list(names)
+        view = self.views.setdefault((kind, tuple(fields), resource_id), {})
+        now = time.monotonic()
+        with self.condition:
+            self.watched_tokens.update(entity_token(kind, name) for name in names)
+            full_read = (not self.streaming) or (kind in self.stale_kinds) \
+                or (now - self.last_full_read.get(kind, 0) >= self.refresh_sec)
+            if full_read:
+                to_read = names
+                self.stale_kinds.discard(kind)
+                self.last_full_read[kind] = now
+            else:
+                to_read = [name for name in names
+                           if (name not in view) or (entity_token(kind, name) in self.stale_tokens)]
+            for name in to_read:
+                self.stale_tokens.discard(entity_token(kind, name))
+        if to_read:
+            self.reads += 1
+            records = self.fetch(kind, to_read, fields=fields, resource_id=resource_id)
+            for name in to_read:
+                if name in records:
+                    view[name] = records[name]
+                else:
+                    view.pop(name, None)
+        return {name: view[name] for name in names if name in view}
+
+    def wait_for_change(self, kind, names, timeout_sec=None):
+        """
+        Sleep until an event names one of names, everything is due for a read, or
+        timeout_sec passes. Sleeps poll_sec while the websocket is down.
+        :return: True when an event named one of names
+        """
+        started = time.monotonic()
+        tokens = set(entity_token(kind, name) for name in names)
+        with self.condition:
+            while True:
+                elapsed = time.monotonic() - started
+                if not self.streaming:
+                    wait_sec = self.poll_sec - elapsed
+                else:
+                    if (kind in self.stale_kinds) or (tokens & self.stale_tokens):
+                        break
+                    wait_sec = self.last_full_read.get(kind, 0) + self.refresh_sec - time.monotonic()
+                if timeout_sec is not None:
+                    wait_sec = min(wait_sec, timeout_sec - elapsed)
+                if wait_sec <= 0:
+                    return False
+                self.condition.wait(wait_sec)
+        # let the rest of a burst of events arrive, so it is read with one query
+        time.sleep(self.settle_sec)
+        return True
+
+    def wait_for(self, kind, names, is_ready=None, fields=(), resource_id=0, timeout_sec=300, on_pending=None):
+        """
+        Wait until is_ready(record) holds for every name; record is None for names the
+        GUI does not return.
+        :param on_pending: optional function(pending names, records) called after each read
+        :return: LFUtils.PortWaitResult; polls counts reads
+        """
+        started = time.monotonic()
+        requests_before = self.requests
+        pending = list(names)
+        reads = 0
+        while True:
+            records = self.query(kind, pending, fields=fields, resource_id=resource_id)
+            reads += 1
+            pending = [name for name in pending if not is_ready(records.get(name))]
+            elapsed = time.monotonic() - started
+            if not pending:
+                return LFUtils.PortWaitResult(completed=True, elapsed_sec=elapsed, polls=reads,
+                                              requests=self.requests - requests_before)
+            if on_pending:
+                on_pending(pending, records)
+            if elapsed >= timeout_sec:
+                return LFUtils.PortWaitResult(completed=False, pending=pending, elapsed_sec=elapsed, polls=reads,
+                                              requests=self.requests - requests_before)
+            self.wait_for_change(kind, pending, timeout_sec=timeout_sec - elapsed)
+
+    def get_stats(self):
+        return {
+            "streaming": self.streaming,
+            "events": self.events,
+            "reads": self.reads,
+            "requests": self.requests,
+        }
@@ -3,12 +3,16 @@ import sys
 import os
 import importlib
 import pprint
+import contextlib
+import logging
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
 
+logger = logging.getLogger(__name__)
+
 
 class MULTICASTProfile(LFCliBase):
     def __init__(self, lfclient_host, lfclient_port, local_realm,
@@ -85,7 +89,11 @@ class MULTICASTProfile(LFCliBase):
             self.local_realm.rm_endp(endp_name, debug_=debug_, suppress_related_commands_=suppress_related_commands)
 
     def create_mc_tx(self, endp_type, side_tx, mcast_group="224.9.9.9", mcast_dest_port=9999,
-                     suppress_related_commands=None, debug_=False):
+                     suppress_related_commands=None, debug_=False, batch_size=0):
+        """
+        :param batch_size: when greater than zero, submit the add_endp and set_mc_endp
+        commands through LFCliBase.json_post_batch() in chunks of this size
+        """
         if self.debug:
             debug_ = True
 
@@ -116,19 +124,22 @@ class MULTICASTProfile(LFCliBase):
             'multi_conn': 0
         }
 
-        url = "/cli-json/add_endp"
-        self.local_realm.json_post(url, json_data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
+        with (self.local_realm.json_post_batch(chunk_size=batch_size) if batch_size
+              else contextlib.nullcontext()) as mc_batch:
+            url = "/cli-json/add_endp"
+            self.local_realm.json_post(url, json_data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
 
-        json_data = {
-            'name': side_tx_name,
-            'ttl': 32,
-            'mcast_group': mcast_group,
-            'mcast_dest_port': mcast_dest_port,
-            'rcv_mcast': 'No'
-        }
+            json_data = {
+                'name': side_tx_name,
+                'ttl': 32,
+                'mcast_group': mcast_group,
+                'mcast_dest_port': mcast_dest_port,
+                'rcv_mcast': 'No'
+            }
 
-        url = "cli-json/set_mc_endp"
-        self.local_realm.json_post(url, json_data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
+            url = "cli-json/set_mc_endp"
+            self.local_realm.json_post(url, json_data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
+        self.log_failed_batch_items(mc_batch)
 
         self.created_mc[side_tx_name] = side_tx_name
 
@@ -136,58 +147,73 @@ class MULTICASTProfile(LFCliBase):
         self.local_realm.wait_until_endps_appear(these_endp, debug=debug_)
 
     def create_mc_rx(self, endp_type, side_rx, mcast_group="224.9.9.9", mcast_dest_port=9999,
-                     suppress_related_commands=None, debug_=False):
+                     suppress_related_commands=None, debug_=False, batch_size=0):
+        """
+        :param batch_size: when greater than zero, submit the add_endp and set_mc_endp
+        commands through LFCliBase.json_post_batch() in chunks of this size
+        """
         if self.debug:
             debug_ = True
 
         these_endp = []
 
-        for port_name in side_rx:
-            side_rx_info = self.local_realm.name_to_eid(port_name)
-            side_rx_shelf = side_rx_info[0]
-            side_rx_resource = side_rx_info[1]
-            side_rx_port = side_rx_info[2]
-            side_rx_name = "%smrx-%s-%i" % (self.name_prefix, side_rx_port, len(self.created_mc))
-            # add_endp mcast-rcv-sta-001 1 1 sta0002 mc_udp 9999 NO 0 0 NO 1472 0 INCREASING NO 32 0 0
-            json_data = {
-                'alias': side_rx_name,
-                'shelf': side_rx_shelf,
-                'resource': side_rx_resource,
-                'port': side_rx_port,
-                'type': endp_type,
-                'ip_port': 9999,
-                'is_rate_bursty': 'NO',
-                'min_rate': 0,
-                'max_rate': 0,
-                'is_pkt_sz_random': 'NO',
-                'min_pkt': 1472,
-                'max_pkt': 0,
-                'payload_pattern': 'INCREASING',
-                'use_checksum': 'NO',
-                'ttl': 32,
-                'send_bad_crc_per_million': 0,
-                'multi_conn': 0
-            }
-
-            url = "cli-json/add_endp"
-            self.local_realm.json_post(url, json_data, debug_=debug_,
-                                       suppress_related_commands_=suppress_related_commands)
-
-            json_data = {
-                'name': side_rx_name,
-                'ttl': 32,
-                'mcast_group': mcast_group,
-                'mcast_dest_port': mcast_dest_port,
-                'rcv_mcast': 'Yes'
-            }
-            url = "cli-json/set_mc_endp"
-            self.local_realm.json_post(url, json_data, debug_=debug_,
-                                       suppress_related_commands_=suppress_related_commands)
-
-            self.created_mc[side_rx_name] = side_rx_name
-            these_endp.append(side_rx_name)
+        with (self.local_realm.json_post_batch(chunk_size=batch_size) if batch_size
+              else contextlib.nullcontext()) as mc_batch:
+            for port_name in side_rx:
+                side_rx_info = self.local_realm.name_to_eid(port_name)
+                side_rx_shelf = side_rx_info[0]
+                side_rx_resource = side_rx_info[1]
+                side_rx_port = side_rx_info[2]
+                side_rx_name = "%smrx-%s-%i" % (self.name_prefix, side_rx_port, len(self.created_mc))
+                # add_endp mcast-rcv-sta-001 1 1 sta0002 mc_udp 9999 NO 0 0 NO 1472 0 INCREASING NO 32 0 0
+                json_data = {
+                    'alias': side_rx_name,
+                    'shelf': side_rx_shelf,
+                    'resource': side_rx_resource,
+                    'port': side_rx_port,
+                    'type': endp_type,
+                    'ip_port': 9999,
+                    'is_rate_bursty': 'NO',
+                    'min_rate': 0,
+                    'max_rate': 0,
+                    'is_pkt_sz_random': 'NO',
+                    'min_pkt': 1472,
+                    'max_pkt': 0,
+                    'payload_pattern': 'INCREASING',
+                    'use_checksum': 'NO',
+                    'ttl': 32,
+                    'send_bad_crc_per_million': 0,
+                    'multi_conn': 0
+                }
+
+                url = "cli-json/add_endp"
+                self.local_realm.json_post(url, json_data, debug_=debug_,
+                                           suppress_related_commands_=suppress_related_commands)
+
+                json_data = {
+                    'name': side_rx_name,
+                    'ttl': 32,
+                    'mcast_group': mcast_group,
+                    'mcast_dest_port': mcast_dest_port,
+                    'rcv_mcast': 'Yes'
+                }
+                url = "cli-json/set_mc_endp"
+                self.local_realm.json_post(url, json_data, debug_=debug_,
+                                           suppress_related_commands_=suppress_related_commands)
+
+                self.created_mc[side_rx_name] = side_rx_name
+                these_endp.append(side_rx_name)
+        self.log_failed_batch_items(mc_batch)
 
         self.local_realm.wait_until_endps_appear(these_endp, debug=debug_)
 
+    @staticmethod
+    def log_failed_batch_items(mc_batch=None):
+        if mc_batch is None:
+            return
+        for item in mc_batch.get_failed():
+            logger.error("MULTICASTProfile: {url} {data} failed: {errors}".format(
+                url=item.url, data=item.post_data, errors=item.errors))
+
     def to_string(self):
         pprint.pprint(self)
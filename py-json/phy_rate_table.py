@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Theoretical 802.11 PHY data rates, computed once at import.
+
+Rates are kept in PHY_RATE_TABLE, keyed by (phy, mcs, nss, mhz, gi_ns):
+    phy     'HT', 'VHT' or 'HE'
+    mcs     MCS index as reported by iw; HT indexes run 0-31 and fold the stream count in
+    nss     number of spatial streams, 1 to MAX_NSS
+    mhz     channel width, a key of DATA_SUBCARRIERS
+    gi_ns   guard interval in nanoseconds, 400 or 800
+
+rate = N_sd * N_bpscs * R * N_ss / (T_dft + T_gi), with the 3.2 us symbol that
+ProbePort has always used for HE as well (single user, no OFDMA).
+
+Lookups over whole columns:
+    rates = phy_rate_table.phy_rates_mbps(phy=df['phy'], mcs=df['mcs'], nss=df['nss'],
+                                          mhz=df['mhz'], gi_ns=800)
+"""
+from itertools import repeat
+
+# MCS index (HT: index % 8) to (N_bpscs coded bits per subcarrier, coding rate numerator, denominator)
+MCS_MODULATION = (
+    (1, 1, 2),    # 0  BPSK 1/2
+    (2, 1, 2),    # 1  QPSK 1/2
+    (2, 3, 4),    # 2  QPSK 3/4
+    (4, 1, 2),    # 3  16-QAM 1/2
+    (4, 3, 4),    # 4  16-QAM 3/4
+    (6, 2, 3),    # 5  64-QAM 2/3
+    (6, 3, 4),    # 6  64-QAM 3/4
+    (6, 5, 6),    # 7  64-QAM 5/6
+    (8, 3, 4),    # 8  256-QAM 3/4
+    (8, 5, 6),    # 9  256-QAM 5/6
+    (10, 3, 4),   # 10 1024-QAM 3/4
+    (10, 5, 6),   # 11 1024-QAM 5/6
+)
+# channel width in MHz to number of data subcarriers
+DATA_SUBCARRIERS = {20: 52, 40: 108, 80: 234, 160: 468}
+# highest MCS index each PHY reports
+PHY_MAX_MCS = {'HT': 31, 'VHT': 9, 'HE': 11}
+GUARD_INTERVALS_NS = (400, 800)
+MAX_NSS = 8
+T_DFT_SEC = 3.2 * 10 ** -6
+
+
+def data_bits_per_symbol(phy='HT', mcs=0, mhz=20):
+    """
+    Data bits per OFDM symbol for one spatial stream (Ndbps).
+    :return: N_sd * N_bpscs * R, or None when phy, mcs or mhz is unknown
+    """
+    if (mcs < 0) or (mcs > PHY_MAX_MCS.get(phy, -1)) or (mhz not in DATA_SUBCARRIERS):
+        return None
+    n_bpscs, r_num, r_den = MCS_MODULATION[mcs % 8 if phy == 'HT' else mcs]
+    return DATA_SUBCARRIERS[mhz] * n_bpscs * r_num / r_den
+
+
+def _build_rate_table():
+    table = {}
+    for phy, max_mcs in PHY_MAX_MCS.items():
+        for mcs in range(max_mcs + 1):
+            for mhz in DATA_SUBCARRIERS:
+                ndbps = data_bits_per_symbol(phy, mcs, mhz)
+                for nss in range(1, MAX_NSS + 1):
+                    for gi_ns in GUARD_INTERVALS_NS:
+                        table[(phy, mcs, nss, mhz, gi_ns)] = \
+                            (ndbps * nss / (T_DFT_SEC + gi_ns * 10 ** -9)) / 1000000
+    return table
+
+
+PHY_RATE_TABLE = _build_rate_table()
+
+
+def phy_rate_mbps(phy='HT', mcs=0, nss=1, mhz=20, gi_ns=800):
+    """
+    :return: theoretical rate in Mbps, or None for a combination not in the table
+    """
+    return PHY_RATE_TABLE.get((phy, mcs, nss, mhz, gi_ns))
+
+
+def closest_gi_rate(phy='HT', mcs=0, nss=1, mhz=20, mbit=0.0):
+    """
+    The reported bitrate does not say which guard interval is in use, so pick
+    the one whose theoretical rate is nearest to it; ties go to the short GI.
+    :return: (short GI Mbps, long GI Mbps, chosen Mbps, chosen GI in seconds),
+    all None when the combination is not in the table
+    """
+    rate_gi_short = PHY_RATE_TABLE.get((phy, mcs, nss, mhz, 400))
+    rate_gi_long = PHY_RATE_TABLE.get((phy, mcs, nss, mhz, 800))
+    if rate_gi_short is None or rate_gi_long is None:
+        return None, None, None, None
+    if abs(mbit - rate_gi_short) <= abs(mbit - rate_gi_long):
+        return rate_gi_short, rate_gi_long, rate_gi_short, 400 * 10 ** -9
+    return rate_gi_short, rate_gi_long, rate_gi_long, 800 * 10 ** -9
+
+
+def _column(values):
+    # a single value applies to every row; strings are single values
+    if isinstance(values, str) or not hasattr(values, '__iter__'):
+        return repeat(values)
+    return values
+
+
+def phy_rates_mbps(phy='HT', mcs=(), nss=1, mhz=20, gi_ns=800):
+    """
+    Look up rates for whole columns at once. Each argument is either one value
+    used for every row or a sequence (list, pandas Series...) with one value per
+    row; at least one must be a sequence.
+    :return: list of Mbps, None for rows that are missing a value or not in the table
+    """
+    columns = (phy, mcs, nss, mhz, gi_ns)
+    if all(isinstance(values, str) or not hasattr(values, '__iter__') for values in columns):
+        raise ValueError("phy_rates_mbps: at least one argument must be a sequence")
+    lookup = PHY_RATE_TABLE.get
+    rates = []
+    for row in zip(_column(phy), _column(mcs), _column(nss), _column(mhz), _column(gi_ns)):
+        try:
+            rates.append(lookup((row[0], int(row[1]), int(row[2]), int(row[3]), int(row[4]))))
+        except (TypeError, ValueError):
+            rates.append(None)
+    return rates
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 # import pandas as pd
 import sys
@@ -11,9 +13,145 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
+phy_rate_table = importlib.import_module("py-json.phy_rate_table")
 
 logger = logging.getLogger(__name__)
 
+# seconds the GUI needs between a probe request and fresh probe results
+PROBE_SETTLE_SEC = 0.2
+# most probe requests in flight at once from refresh_probes()
+PROBE_MAX_WORKERS = 16
+
+
+def refresh_probes(probe_ports=(), max_workers=PROBE_MAX_WORKERS, settle_sec=PROBE_SETTLE_SEC):
+    """
+    Refresh many ProbePorts in one pass: every probe request is posted concurrently,
+    the settle time is waited once, then every result is fetched and parsed concurrently.
+    :param probe_ports: ProbePort instances
+    :param max_workers: most requests in flight at once
+    :param settle_sec: pause between the probe requests and reading the results
+    :return: list of the ProbePorts that refreshed, in the order given. Ports whose
+    probe failed are logged and left out.
+    """
+    probe_ports = list(probe_ports)
+    if not probe_ports:
+        return []
+
+    def attempt(method, probe_port):
+        try:
+            method(probe_port)
+            return True
+        except Exception as e:
+            logger.warning("probe of {eid} failed: {e}".format(eid=probe_port.eid_str, e=repr(e)))
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(probe_ports))) as executor:
+        requested = list(executor.map(lambda probe_port: attempt(ProbePort.requestProbe, probe_port), probe_ports))
+        sleep(settle_sec)
+        probe_ports = [probe_port for probe_port, ok in zip(probe_ports, requested) if ok]
+        read = list(executor.map(lambda probe_port: attempt(ProbePort.readProbe, probe_port), probe_ports))
+    return [probe_port for probe_port, ok in zip(probe_ports, read) if ok]
+
+
+# fields of a 'tx bitrate' or 'rx bitrate' value, e.g.
+# 866.7 MBit/s VHT-MCS 9 80MHz short GI VHT-NSS 2
+# 1201.0 MBit/s 80MHz HE-MCS 11 HE-NSS 2 HE-GI 0 HE-DCM 0
+PROBE_MBIT_RE = re.compile(r'(\d+(?:\.\d+)?) MBit/s')
+PROBE_MHZ_RE = re.compile(r'(\d+)MHz')
+PROBE_MCS_RE = re.compile(r'(?:(EHT|HE|VHT)-)?MCS (\d+)')
+PROBE_NSS_RE = re.compile(r'NSS (\d+)')
+PROBE_HE_GI_RE = re.compile(r'(?:EHT|HE)-GI (\d)')
+# HE-GI and EHT-GI index reported by iw to guard interval in seconds
+HE_GI_SEC = (.8 * 10 ** -6, 1.6 * 10 ** -6, 3.2 * 10 ** -6)
+HT_SHORT_GI_SEC = .4 * 10 ** -6
+
+
+class ProbeBitrate:
+    """
+    One 'tx bitrate' or 'rx bitrate' line of probe output.
+    phy is HT, VHT, HE or EHT when an MCS was reported, None for legacy rates.
+    mhz, nss and gi_sec are None when the line does not carry them.
+    """
+    __slots__ = ("bitrate", "mbit", "phy", "mcs", "nss", "mhz", "gi_sec")
+
+    def __init__(self, bitrate=""):
+        self.bitrate = bitrate
+        self.mbit = None
+        self.phy = None
+        self.mcs = None
+        self.nss = None
+        self.mhz = None
+        self.gi_sec = None
+        match = PROBE_MBIT_RE.match(bitrate)
+        if match:
+            self.mbit = float(match.group(1))
+        match = PROBE_MHZ_RE.search(bitrate)
+        if match:
+            self.mhz = int(match.group(1))
+        match = PROBE_MCS_RE.search(bitrate)
+        if match:
+            self.phy = match.group(1) or "HT"
+            self.mcs = int(match.group(2))
+        match = PROBE_NSS_RE.search(bitrate)
+        if match:
+            self.nss = int(match.group(1))
+        match = PROBE_HE_GI_RE.search(bitrate)
+        if match:
+            self.gi_sec = HE_GI_SEC[min(int(match.group(1)), 2)]
+        elif 'short GI' in bitrate:
+            self.gi_sec = HT_SHORT_GI_SEC
+
+    def __repr__(self):
+        return "ProbeBitrate(%r)" % self.bitrate
+
+
+class ProbeResults:
+    """
+    Parsed probe results text: signals maps each line naming a signal
+    ('signal', 'signal avg', 'beacon signal avg'...) to its value without dBm,
+    tx and rx are ProbeBitrate or None when the port reported no bitrate.
+    """
+    __slots__ = ("signals", "tx", "rx")
+
+    def __init__(self, signals=None, tx=None, rx=None):
+        self.signals = signals if signals is not None else {}
+        self.tx = tx
+        self.rx = rx
+
+    def __repr__(self):
+        return "ProbeResults(signals=%r, tx=%r, rx=%r)" % (self.signals, self.tx, self.rx)
+
+
+def parse_probe_results(text=""):
+    """
+    Parse the 'probe results' text of a /probe response in a single pass over its lines.
+    :param text: probe results text
+    :return: ProbeResults
+    """
+    results = ProbeResults()
+    for line in text.split('\n'):
+        # most lines are counters; skip them before doing any string work
+        if ('bitrate' not in line) and ('signal' not in line):
+            continue
+        key, sep, value = line.strip().partition(':')
+        if not sep:
+            continue
+        if key == 'tx bitrate':
+            if results.tx is None:
+                results.tx = ProbeBitrate(value.replace('\t', ' ').strip())
+        elif key == 'rx bitrate':
+            if results.rx is None:
+                results.rx = ProbeBitrate(value.replace('\t', ' ').strip())
+        elif 'signal' in key:
+            results.signals[key.strip()] = value.strip().strip('dBm').strip(' ')
+    return results
+
+
+def nss_from_ht_mcs(mcs=0):
+    # HT folds the stream count into the MCS index: 0-7 is one stream, 8-15 two...
+    return (mcs // 8) + 1 if 0 <= mcs <= 31 else None
+
+
 # Probe data can change frequently. It is recommended to update
 
 
@@ -30,6 +168,7 @@ class ProbePort(LFCliBase):
         self.eid_str = eid_str
         self.probepath = "/probe/1/%s/%s" % (hunks[-2], hunks[-1])
         self.response = None
+        self.probe_results = None
         self.signals = None
         self.ofdma = False
 
@@ -59,106 +198,70 @@ class ProbePort(LFCliBase):
         # folder = os.path.dirname(__file__)
 
     def refreshProbe(self):
+        self.requestProbe()
+        sleep(PROBE_SETTLE_SEC)
+        self.readProbe()
+
+    def requestProbe(self):
+        # ask the GUI to re-probe the port; results are read by readProbe()
         self.json_post(self.probepath, {})
-        sleep(0.2)
+
+    def readProbe(self):
         response = self.json_get(self.probepath)
         self.response = response
         if self.debug:
             logger.debug("probepath (eid): {probepath}".format(probepath=self.probepath))
             logger.debug(pformat("Probe response: {response}".format(response=self.response)))
-        text = self.response['probe-results'][0][self.eid_str]['probe results'].split('\n')
-        signals = [x.strip('\t').split('\t') for x in text if 'signal' in x]
-        keys = [x[0].strip(' ').strip(':') for x in signals]
-        values = [x[1].strip('dBm').strip(' ') for x in signals]
+        self.probe_results = parse_probe_results(self.response['probe-results'][0][self.eid_str]['probe results'])
+        self.signals = self.probe_results.signals
         if self.debug:
-            logger.debug("signals keys: {keys}".format(keys=keys))
-            logger.debug("signals values: {values}".format(values=values))
-        self.signals = dict(zip(keys, values))
-
-        tx_bitrate = [x for x in text if 'tx bitrate' in x][0].replace('\t', ' ')
-        # if 'HE' in tx_bitrate:
-        #    logger.info("HE not supported ")
-        logger.debug("tx_bitrate {tx_bitrate}".format(tx_bitrate=tx_bitrate))
-        self.tx_bitrate = tx_bitrate.split(':')[-1].strip(' ')
-        if 'MHz' in tx_bitrate:
-            self.tx_mhz = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split('MHz')[0].rsplit(' ')[-1].strip(
-                ' ')
-            logger.debug("tx_mhz {tx_mhz}".format(tx_mhz=self.tx_mhz))
-        else:
-            self.tx_mhz = 20
-            logger.debug("HT: tx_mhz {tx_mhz}".format(tx_mhz=self.tx_mhz))
-        tx_mcs = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split(':')[1].strip('\t')
-        if 'MCS' in tx_mcs:
-            self.tx_mcs = int(tx_mcs.split('MCS')[1].strip(' ').split(' ')[0])
-            logger.debug("self.tx_mcs {tx_mcs}".format(tx_mcs=self.tx_mcs))
-            if 'NSS' in text:
-                self.tx_nss = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split('NSS')[1].strip(' ')
-            else:
-                # nss is not present need to derive from MCS for HT
-                if 0 <= self.tx_mcs <= 7:
-                    self.tx_nss = 1
-                elif 8 <= self.tx_mcs <= 15:
-                    self.tx_nss = 2
-                elif 16 <= self.tx_mcs <= 23:
-                    self.tx_nss = 3
-                elif 24 <= self.tx_mcs <= 31:
-                    self.tx_nss = 4
-            logger.debug("tx_nss {tx_nss}".format(tx_nss=self.tx_nss))
-            self.tx_mbit = float(self.tx_bitrate.split(' ')[0])
-            logger.debug("tx_mbit {tx_mbit}".format(tx_mbit=self.tx_mbit))
-            if 'HE' in tx_bitrate:
+            logger.debug("signals: {signals}".format(signals=self.signals))
+
+        tx = self.probe_results.tx
+        if tx is None:
+            raise ValueError("probe of {eid} has no tx bitrate".format(eid=self.eid_str))
+        logger.debug("tx_bitrate {tx_bitrate}".format(tx_bitrate=tx.bitrate))
+        self.tx_bitrate = tx.bitrate
+        self.tx_mhz = tx.mhz if tx.mhz else 20
+        if tx.mcs is not None:
+            self.tx_mcs = tx.mcs
+            # nss is not present for HT, derive it from the MCS
+            self.tx_nss = tx.nss if tx.nss is not None else nss_from_ht_mcs(tx.mcs)
+            self.tx_mbit = tx.mbit
+            logger.debug("tx_mcs {tx_mcs} tx_nss {tx_nss} tx_mbit {tx_mbit} tx_mhz {tx_mhz}".format(
+                tx_mcs=self.tx_mcs, tx_nss=self.tx_nss, tx_mbit=self.tx_mbit, tx_mhz=self.tx_mhz))
+            if tx.phy in ('HE', 'EHT'):
                 self.calculated_data_rate_tx_HE()
-            elif 'VHT' in tx_bitrate:
+            elif tx.phy == 'VHT':
                 self.calculated_data_rate_tx_VHT()
             else:
                 self.calculated_data_rate_tx_HT()
         else:
-            logger.debug("No tx MCS value:{tx_bitrate}".format(tx_bitrate=tx_bitrate))
+            logger.debug("No tx MCS value:{tx_bitrate}".format(tx_bitrate=tx.bitrate))
 
-        rx_bitrate = [x for x in text if 'rx bitrate' in x][0].replace('\t', ' ')
-        logger.debug("rx_bitrate {rx_bitrate}".format(rx_bitrate=rx_bitrate))
-        self.rx_bitrate = rx_bitrate.split(':')[-1].strip(' ')
-        logger.debug("self.rx_bitrate {rx_bitrate}".format(rx_bitrate=self.rx_bitrate))
+        rx = self.probe_results.rx
+        if rx is None:
+            raise ValueError("probe of {eid} has no rx bitrate".format(eid=self.eid_str))
+        logger.debug("rx_bitrate {rx_bitrate}".format(rx_bitrate=rx.bitrate))
+        self.rx_bitrate = rx.bitrate
         # rx will received : 6Mbps encoding is legacy frame
         # for 24g - MHz is 20
-        # try:
-        if 'MHz' in rx_bitrate:
-            self.rx_mhz = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split('MHz')[0].rsplit(' ')[
-                -1].strip(' ')
-            logger.debug("rx_mhz {rx_mhz}".format(rx_mhz=self.rx_mhz))
-        else:
-            self.rx_mhz = 20
-
-        rx_mcs = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split(':')[1].strip('\t')
+        self.rx_mhz = rx.mhz if rx.mhz else 20
         # MCS is not in the 6.0MBit/s frame
-        if 'MCS' in rx_mcs:
-            self.rx_mcs = int(rx_mcs.split('MCS')[1].strip(' ').split(' ')[0])
-            logger.debug("self.rx_mcs {rx_mcs}".format(rx_mcs=self.rx_mcs))
-            if 'NSS' in text:
-                self.rx_nss = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split('NSS')[1].strip(' ')
-            else:
-                # nss is not present need to derive from MCS for HT
-                if 0 <= self.rx_mcs <= 7:
-                    self.rx_nss = 1
-                elif 8 <= self.rx_mcs <= 15:
-                    self.rx_nss = 2
-                elif 16 <= self.rx_mcs <= 23:
-                    self.rx_nss = 3
-                elif 24 <= self.rx_mcs <= 31:
-                    self.rx_nss = 4
-
-            self.rx_mbit = self.rx_bitrate.split(' ')[0]
-            logger.debug("rx_nss {rx_nss}".format(rx_nss=self.rx_nss))
-            self.rx_mbit = float(self.rx_bitrate.split(' ')[0])
-            logger.debug("rx_mbit {rx_mbit}".format(rx_mbit=self.rx_mbit))
-            if 'HE' in rx_bitrate:
+        if rx.mcs is not None:
+            self.rx_mcs = rx.mcs
+            self.rx_nss = rx.nss if rx.nss is not None else nss_from_ht_mcs(rx.mcs)
+            self.rx_mbit = rx.mbit
+            logger.debug("rx_mcs {rx_mcs} rx_nss {rx_nss} rx_mbit {rx_mbit} rx_mhz {rx_mhz}".format(
+                rx_mcs=self.rx_mcs, rx_nss=self.rx_nss, rx_mbit=self.rx_mbit, rx_mhz=self.rx_mhz))
+            if rx.phy in ('HE', 'EHT'):
                 self.calculated_data_rate_rx_HE()
-            elif 'VHT' in rx_bitrate:
+            elif rx.phy == 'VHT':
                 self.calculated_data_rate_rx_VHT()
             else:
                 self.calculated_data_rate_rx_HT()
         else:
-            logger.debug("No rx MCS value:{rx_bitrate}".format(rx_bitrate=rx_bitrate))
+            logger.debug("No rx MCS value:{rx_bitrate}".format(rx_bitrate=rx.bitrate))
 
     def getSignalAvgCombined(self):
         return self.signals['signal avg'].split(' ')[0]
@@ -175,537 +278,43 @@ class ProbePort(LFCliBase):
     def getBeaconSignalAvg(self):
         return ' '.join(self.signals['beacon signal avg']).replace(' ', '')
 
-    def calculated_data_rate_tx_HT(self):
-        logger.info("calculated_data_rate_tx_HT")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
+    def calculated_data_rate(self, direction='tx', phy='HT'):
+        """
+        Fill in the short and long GI theoretical rates for the tx or rx bitrate
+        from phy_rate_table, and guess the GI in use from whichever is closer to
+        the reported rate.
+        """
+        mhz = int(getattr(self, direction + '_mhz'))
+        if mhz not in phy_rate_table.DATA_SUBCARRIERS:
             logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0 or self.tx_mcs == 8 or self.tx_mcs == 16 or self.tx_mcs == 24:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1 or self.tx_mcs == 9 or self.tx_mcs == 17 or self.tx_mcs == 25:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2 or self.tx_mcs == 10 or self.tx_mcs == 18 or self.tx_mcs == 26:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3 or self.tx_mcs == 11 or self.tx_mcs == 19 or self.tx_mcs == 27:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4 or self.tx_mcs == 12 or self.tx_mcs == 20 or self.tx_mcs == 28:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5 or self.tx_mcs == 13 or self.tx_mcs == 21 or self.tx_mcs == 29:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6 or self.tx_mcs == 14 or self.tx_mcs == 22 or self.tx_mcs == 30:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7 or self.tx_mcs == 15 or self.tx_mcs == 23 or self.tx_mcs == 31:
-            R = 5 / 6
-            N_bpscs = 6
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.info("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
+            mhz = 20
+            setattr(self, direction + '_mhz', mhz)
+        mcs = getattr(self, direction + '_mcs')
+        nss = getattr(self, direction + '_nss')
+        rate_gi_short, rate_gi_long, rate_calc, gi_sec = phy_rate_table.closest_gi_rate(
+            phy=phy, mcs=mcs, nss=nss, mhz=mhz, mbit=getattr(self, direction + '_mbit'))
+        logger.debug("{direction}: {phy} mcs {mcs} nss {nss} mhz {mhz} gi_short {short} Mbps gi_long {long} Mbps".format(
+            direction=direction, phy=phy, mcs=mcs, nss=nss, mhz=mhz, short=rate_gi_short, long=rate_gi_long))
+        setattr(self, direction + '_data_rate_gi_short_Mbps', rate_gi_short)
+        setattr(self, direction + '_data_rate_gi_long_Mbps', rate_gi_long)
+        setattr(self, direction + '_mbit_calc', rate_calc)
+        setattr(self, direction + '_gi', gi_sec)
+
+    def calculated_data_rate_tx_HT(self):
+        self.calculated_data_rate(direction='tx', phy='HT')
 
     def calculated_data_rate_rx_HT(self):
-        logger.info("calculated_data_rate_rx_HT")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0 or self.rx_mcs == 8 or self.rx_mcs == 16 or self.rx_mcs == 24:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1 or self.rx_mcs == 9 or self.rx_mcs == 17 or self.rx_mcs == 25:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2 or self.rx_mcs == 10 or self.rx_mcs == 18 or self.rx_mcs == 26:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3 or self.rx_mcs == 11 or self.rx_mcs == 19 or self.rx_mcs == 27:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4 or self.rx_mcs == 12 or self.rx_mcs == 20 or self.rx_mcs == 28:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5 or self.rx_mcs == 13 or self.rx_mcs == 21 or self.rx_mcs == 29:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6 or self.rx_mcs == 14 or self.rx_mcs == 22 or self.rx_mcs == 30:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7 or self.rx_mcs == 15 or self.rx_mcs == 23 or self.rx_mcs == 31:
-            R = 5 / 6
-            N_bpscs = 6
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
+        self.calculated_data_rate(direction='rx', phy='HT')
 
     def calculated_data_rate_tx_VHT(self):
-        logger.info("calculated_data_rate_tx_VHT")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.tx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.tx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
+        self.calculated_data_rate(direction='tx', phy='VHT')
 
     def calculated_data_rate_rx_VHT(self):
-        logger.info("calculated_data_rate_rx_VHT")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.rx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.rx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
-        ##########################################
-        #
-        # HE no OFDMA - changes the calculations
-        #
-        ###########################################
+        self.calculated_data_rate(direction='rx', phy='VHT')
 
+    # HE no OFDMA
     def calculated_data_rate_tx_HE(self):
-        logger.info("calculated_data_rate_tx_HE")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.tx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.tx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
+        self.calculated_data_rate(direction='tx', phy='HE')
 
     def calculated_data_rate_rx_HE(self):
-        logger.info("calculated_data_rate_rx_HE")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.rx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.rx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
+        self.calculated_data_rate(direction='rx', phy='HE')
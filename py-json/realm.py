@@ -10,7 +10,9 @@
 import sys
 import os
 import importlib
+import math
 import re
+import statistics
 import time
 from pprint import pprint
 from pprint import pformat
@@ -30,39 +32,50 @@ LFCliBase = lfcli_base.LFCliBase
 
 # ---- ---- ---- ---- Profile Imports ---- ---- ---- ----
 
-l3_cxprofile = importlib.import_module("py-json.l3_cxprofile")
-L3CXProfile = l3_cxprofile.L3CXProfile
-l4_cxprofile = importlib.import_module("py-json.l4_cxprofile")
-L4CXProfile = l4_cxprofile.L4CXProfile
-lf_attenmod = importlib.import_module("py-json.lf_attenmod")
-ATTENUATORProfile = lf_attenmod.ATTENUATORProfile
-multicast_profile = importlib.import_module("py-json.multicast_profile")
-MULTICASTProfile = multicast_profile.MULTICASTProfile
-http_profile = importlib.import_module("py-json.http_profile")
-HTTPProfile = http_profile.HTTPProfile
-station_profile = importlib.import_module("py-json.station_profile")
-StationProfile = station_profile.StationProfile
-fio_endp_profile = importlib.import_module("py-json.fio_endp_profile")
-FIOEndpProfile = fio_endp_profile.FIOEndpProfile
-test_group_profile = importlib.import_module("py-json.test_group_profile")
-TestGroupProfile = test_group_profile.TestGroupProfile
-dut_profile = importlib.import_module("py-json.dut_profile")
-DUTProfile = dut_profile.DUTProfile
-vap_profile = importlib.import_module("py-json.vap_profile")
-VAPProfile = vap_profile.VAPProfile
-mac_vlan_profile = importlib.import_module("py-json.mac_vlan_profile")
-MACVLANProfile = mac_vlan_profile.MACVLANProfile
-wifi_monitor_profile = importlib.import_module("py-json.wifi_monitor_profile")
-WifiMonitor = wifi_monitor_profile.WifiMonitor
-gen_cxprofile = importlib.import_module("py-json.gen_cxprofile")
-GenCXProfile = gen_cxprofile.GenCXProfile
-qvlan_profile = importlib.import_module("py-json.qvlan_profile")
-QVLANProfile = qvlan_profile.QVLANProfile
 port_utils = importlib.import_module("py-json.port_utils")
+lf_state_tracker = importlib.import_module("py-json.lf_state_tracker")
 PortUtils = port_utils.PortUtils
-lfdata = importlib.import_module("py-json.lfdata")
-LFDataCollection = lfdata.LFDataCollection
 
+# Profile modules are imported by the first new_*_profile() call that needs them, so
+# scripts do not pay for every profile, and pandas, at startup. Module attributes such
+# as realm.L3CXProfile and realm.l3_cxprofile still work, through __getattr__ below.
+PROFILE_CLASSES = {
+    "L3CXProfile": "py-json.l3_cxprofile",
+    "L4CXProfile": "py-json.l4_cxprofile",
+    "ATTENUATORProfile": "py-json.lf_attenmod",
+    "MULTICASTProfile": "py-json.multicast_profile",
+    "HTTPProfile": "py-json.http_profile",
+    "StationProfile": "py-json.station_profile",
+    "FIOEndpProfile": "py-json.fio_endp_profile",
+    "TestGroupProfile": "py-json.test_group_profile",
+    "DUTProfile": "py-json.dut_profile",
+    "VAPProfile": "py-json.vap_profile",
+    "MACVLANProfile": "py-json.mac_vlan_profile",
+    "WifiMonitor": "py-json.wifi_monitor_profile",
+    "GenCXProfile": "py-json.gen_cxprofile",
+    "QVLANProfile": "py-json.qvlan_profile",
+    "LFDataCollection": "py-json.lfdata",
+}
+PROFILE_MODULES = {module.split(".")[-1]: module for module in PROFILE_CLASSES.values()}
+
+
+def profile_class(class_name):
+    """
+    :param class_name: a key of PROFILE_CLASSES
+    :return: the class, importing its module the first time
+    """
+    return getattr(importlib.import_module(PROFILE_CLASSES[class_name]), class_name)
+
+
+def __getattr__(name):
+    if name in PROFILE_CLASSES:
+        value = profile_class(name)
+    elif name in PROFILE_MODULES:
+        value = importlib.import_module(PROFILE_MODULES[name])
+    else:
+        raise AttributeError("module {module} has no attribute {name}".format(module=__name__, name=name))
+    globals()[name] = value
+    return value
 
 def wpa_ent_list():
     return [
@@ -110,6 +123,10 @@ class Realm(LFCliBase):
         if _capture_signal_list is None:
             _capture_signal_list = []
         self.debug = debug_
+        # seconds to address per station, from the last wait_for_ip()
+        self.time_to_ip = {}
+        # lf_state_tracker.StateTracker the wait_* methods use, see start_state_tracker()
+        self.state_tracker = None
         # if debug_:
         #     logger.debug("Realm _proxy_str: %s" % _proxy_str)
         #     logger.debug(pformat(_proxy_str))
@@ -210,6 +227,30 @@ class Realm(LFCliBase):
         self.freq_to_chan[4970] = 194
         self.freq_to_chan[4980] = 196
 
+    def start_state_tracker(self, ws_port=8081, refresh_sec=10.0):
+        """
+        Follow the GUI websocket so wait_until_ports_appear(), wait_until_endps_appear(),
+        wait_until_cxs_appear() and wait_for_ip() wake on events instead of polling every
+        second. They poll as before if the websocket cannot be opened.
+        :return: the lf_state_tracker.StateTracker
+        """
+        if self.state_tracker is None:
+            self.state_tracker = lf_state_tracker.StateTracker(
+                lfclient_host=self.lfclient_host,
+                lfclient_port=self.lfclient_port,
+                ws_port=ws_port,
+                refresh_sec=refresh_sec,
+                # reads follow websocket events, a cached response would predate the event
+                json_get=lambda uri: LFCliBase.json_get(self, uri, debug_=self.debug, use_cache=False),
+                debug=self.debug)
+            self.state_tracker.start()
+        return self.state_tracker
+
+    def stop_state_tracker(self):
+        if self.state_tracker is not None:
+            self.state_tracker.stop()
+            self.state_tracker = None
+
     def wait_until_ports_appear(self, sta_list=None, debug_=False, timeout=360):
         if (sta_list is None) or (len(sta_list) < 1):
             logger.info("realm.wait_until_ports_appear: no stations provided")
@@ -217,7 +258,8 @@ class Realm(LFCliBase):
         LFUtils.wait_until_ports_appear(base_url=self.lfclient_url,
                                         port_list=sta_list,
                                         debug=debug_,
-                                        timeout=timeout)
+                                        timeout=timeout,
+                                        tracker=self.state_tracker)
 
     def wait_until_ports_disappear(self, sta_list=None, debug_=False):
         if (sta_list is None) or (len(sta_list) < 1):
@@ -411,6 +453,14 @@ class Realm(LFCliBase):
         return self.wait_until_endps_appear(these_endp, debug=debug, timeout=timeout)
 
     def wait_until_endps_appear(self, these_endp, debug=False, timeout=100):
+        if self.state_tracker is not None:
+            result = self.state_tracker.wait_for(lf_state_tracker.ENDP, these_endp,
+                                                 is_ready=lambda record: record is not None,
+                                                 fields=("name",),
+                                                 timeout_sec=timeout)
+            if not result:
+                logger.error("ERROR:  Could not find all endpoints: %s" % result.pending)
+            return bool(result)
         wait_more = True
         count = 0
         while wait_more:
@@ -448,6 +498,14 @@ class Realm(LFCliBase):
         return self.wait_until_cxs_appear(these_cx, debug=debug, timeout=timeout)
 
     def wait_until_cxs_appear(self, these_cx, debug=False, timeout=100):
+        if self.state_tracker is not None:
+            result = self.state_tracker.wait_for(lf_state_tracker.CX, these_cx,
+                                                 is_ready=lambda record: record is not None,
+                                                 fields=("name",),
+                                                 timeout_sec=timeout)
+            if debug and not result:
+                logger.error("ERROR:  Failed to find all cxs: %s" % result.pending)
+            return bool(result)
         wait_more = True
         count = 0
         while wait_more:
@@ -646,12 +704,78 @@ class Realm(LFCliBase):
     def dump_all_port_info(self):
         return self.json_get('/port/all')
 
+    # port columns wait_for_ip() and get_curr_num_ips() look at
+    Ip_Query_Fields = ("ip", "port type", "ipv6 address")
+
+    def query_port_ips(self, station_list=None, debug=False):
+        """
+        Fetch IP columns for many ports with one grouped /port query per resource.
+        :param station_list: port EIDs or names
+        :return: dict of EID as passed in to its port record; missing ports are absent
+        """
+        ports_by_resource = LFUtils.group_ports_by_resource(station_list)
+        records, _num_requests = LFUtils.query_ports_by_resource(
+            base_url=self.lfclient_url,
+            ports_by_resource=ports_by_resource,
+            fields=self.Ip_Query_Fields,
+            debug=debug,
+            json_get=lambda uri: LFCliBase.json_get(self, uri, debug_=debug))
+        return records
+
+    @staticmethod
+    def port_has_ip(record=None, ipv4=True, ipv6=False):
+        """
+        :param record: port record from query_port_ips(), or None
+        :return: tuple (has IPv4, has global IPv6); families not asked for read False
+        """
+        waiting_states = ["0.0.0.0", "NA", "", 'DELETED', 'AUTO']
+        if record is None:
+            return False, False
+        has_ip4 = False
+        has_ip6 = False
+        if ipv4:
+            has_ip4 = record.get('ip', "") not in waiting_states
+        if ipv6:
+            ip6a = record.get('ipv6 address', record.get('ipv6_address', ""))
+            has_ip6 = (ip6a not in waiting_states) and not ip6a.startswith('fe80')
+        return has_ip4, has_ip6
+
+    def get_time_to_ip_stats(self):
+        """
+        Summarize self.time_to_ip as filled in by the last wait_for_ip() call.
+        :return: dict with count, min, median, p90 and max seconds; empty if no station got an IP
+        """
+        times = sorted(self.time_to_ip.values())
+        if not times:
+            return {}
+        return {
+            "count": len(times),
+            "min": times[0],
+            "median": statistics.median(times),
+            "p90": times[min(len(times) - 1, int(math.ceil(0.9 * len(times))) - 1)],
+            "max": times[-1],
+        }
+
     # timemout_sec of -1 means auto-calculate based on number of stations.
-    def wait_for_ip(self, station_list=None, ipv4=True, ipv6=False, timeout_sec=360, debug=False):
+    def wait_for_ip(self, station_list=None, ipv4=True, ipv6=False, timeout_sec=360, debug=False,
+                    progress_callback=None):
+        """
+        Wait for stations to get addresses. Every second one grouped /port query per
+        resource is made for the stations that are still waiting. With a state tracker
+        (start_state_tracker()) only stations named by websocket events are read again.
+        Seconds from the start of the wait to each station's address are kept in
+        self.time_to_ip; see get_time_to_ip_stats().
+        :param progress_callback: optional function(num_with_ip, num_stations, elapsed_sec)
+        called after each poll
+        :return: True when every station got the requested addresses
+        """
         timeout_auto = False
 
         if not (ipv4 or ipv6):
             raise ValueError("wait_for_ip: ipv4 and/or ipv6 must be set!")
+        if (station_list is None) or (len(station_list) < 1):
+            logger.critical("wait_for_ip: expects non-empty list of ports")
+            raise ValueError("wait_for_ip: expects non-empty list of ports")
         if timeout_sec >= 0:
             if debug:
                 logger.debug("Waiting for ips, timeout: %i..." % timeout_sec)
@@ -661,80 +785,63 @@ class Realm(LFCliBase):
             if debug:
                 logger.debug("Auto-Timeout requested, using: %s" % timeout_sec)
 
-        stas_without_ip4s = {}
-        stas_without_ip6s = {}
-
+        stas_without_ip4s = set(station_list) if ipv4 else set()
+        stas_without_ip6s = set(station_list) if ipv6 else set()
+        self.time_to_ip = {}
+        started = time.monotonic()
         sec_elapsed = 0
-        time_extended = False
-        # logger.info(station_list)
-        waiting_states = ["0.0.0.0", "NA", "", 'DELETED', 'AUTO']
-        if (station_list is None) or (len(station_list) < 1):
-            logger.critical("wait_for_ip: expects non-empty list of ports")
-            raise ValueError("wait_for_ip: expects non-empty list of ports")
-        wait_more = True
 
-        while wait_more and (sec_elapsed <= timeout_sec):
-            wait_more = False
-            some_passed = False
-            stas_without_ip4s = {}
-            stas_without_ip6s = {}
-
-            for sta_eid in station_list:
-                eid = self.name_to_eid(sta_eid)
-
-                response = super().json_get("/port/%s/%s/%s?fields=alias,ip,port+type,ipv6+address" %
-                                            (eid[0], eid[1], eid[2]))
-                # logger.info(pformat(response))
-
-                if (response is None) or ("interface" not in response):
-                    logger.info("station_list: incomplete response for eid: %s:" % sta_eid)
-                    logger.info(pformat(response))
-                    wait_more = True
-                    break
-
-                if ipv4:
-                    v = response['interface']
-                    if v['ip'] in waiting_states:
-                        wait_more = True
-                        stas_without_ip4s[sta_eid] = True
-                        if debug:
-                            logger.debug("Waiting for port %s to get IPv4 Address try %s / %s" % (sta_eid, sec_elapsed, timeout_sec))
-                    else:
-                        some_passed = True
-                        if debug:
-                            logger.debug("Found IP: %s on port: %s" % (v['ip'], sta_eid))
-
-                if ipv6:
-                    v = response['interface']
-                    # logger.info(v)
-                    ip6a = v['ipv6_address']
-                    if ip6a != 'DELETED' and not ip6a.startswith('fe80') and ip6a != 'AUTO':
-                        some_passed = True
-                        if debug:
-                            logger.debug("Found IPv6: %s on port: %s" % (ip6a, sta_eid))
-                    else:
-                        stas_without_ip6s[sta_eid] = True
-                        wait_more = True
-                        if debug:
-                            logger.debug("Waiting for port %s to get IPv6 Address try %s / %s, reported: %s." % (sta_eid, sec_elapsed, timeout_sec, ip6a))
-
-            if wait_more:
-                if timeout_auto and not some_passed:
-                    if sec_elapsed > 60:
-                        # Nothing has gotten IP for 60 seconds, consider timeout reached.
-                        break
+        while sec_elapsed <= timeout_sec:
+            pending = stas_without_ip4s | stas_without_ip6s
+            if self.state_tracker is not None:
+                records = self.state_tracker.query(lf_state_tracker.PORT, pending, fields=self.Ip_Query_Fields)
+            else:
+                records = self.query_port_ips(station_list=list(pending), debug=debug)
+            sec_elapsed = time.monotonic() - started
+            for sta_eid in pending:
+                if debug and (sta_eid not in records):
+                    logger.debug("station_list: incomplete response for eid: %s:" % sta_eid)
+                has_ip4, has_ip6 = self.port_has_ip(records.get(sta_eid), ipv4=ipv4, ipv6=ipv6)
+                if has_ip4 and sta_eid in stas_without_ip4s:
+                    stas_without_ip4s.discard(sta_eid)
+                    if debug:
+                        logger.debug("Found IP: %s on port: %s" % (records[sta_eid]['ip'], sta_eid))
+                if has_ip6 and sta_eid in stas_without_ip6s:
+                    stas_without_ip6s.discard(sta_eid)
+                    if debug:
+                        logger.debug("Found IPv6 on port: %s" % sta_eid)
+                if (sta_eid not in stas_without_ip4s) and (sta_eid not in stas_without_ip6s):
+                    self.time_to_ip[sta_eid] = sec_elapsed
+            if debug and (stas_without_ip4s or stas_without_ip6s):
+                logger.debug("Waiting for %s ports to get IPv4 and %s ports to get IPv6 Addresses, %.0f / %s sec"
+                             % (len(stas_without_ip4s), len(stas_without_ip6s), sec_elapsed, timeout_sec))
+            if progress_callback:
+                progress_callback(len(self.time_to_ip), len(station_list), sec_elapsed)
+            if not (stas_without_ip4s or stas_without_ip6s):
+                break
+            if timeout_auto and not self.time_to_ip and sec_elapsed > 60:
+                # Nothing has gotten IP for 60 seconds, consider timeout reached.
+                break
+            if self.state_tracker is not None:
+                self.state_tracker.wait_for_change(lf_state_tracker.PORT, stas_without_ip4s | stas_without_ip6s,
+                                                   timeout_sec=max(0.0, timeout_sec - sec_elapsed))
+            else:
                 time.sleep(1)
-                sec_elapsed += 1
+            sec_elapsed = time.monotonic() - started
+
+        if self.time_to_ip:
+            logger.info("wait_for_ip: time to IP for %s/%s ports: %s" % (len(self.time_to_ip),
+                                                                         len(station_list),
+                                                                         self.get_time_to_ip_stats()))
 
         # If not all ports got IP addresses before timeout, and debugging is enabled, then
         # add logging.
         if len(stas_without_ip4s) + len(stas_without_ip6s) > 0:
             if debug:
                 if len(stas_without_ip4s) > 0:
-                    logger.info('%s did not acquire IPv4 addresses' % stas_without_ip4s.keys())
+                    logger.info('%s did not acquire IPv4 addresses' % sorted(stas_without_ip4s))
                 if len(stas_without_ip6s) > 0:
-                    logger.info('%s did not acquire IPv6 addresses' % stas_without_ip6s.keys())
-                port_info = self.dump_all_port_info()
+                    logger.info('%s did not acquire IPv6 addresses' % sorted(stas_without_ip6s))
                 logger.debug(pformat(self.dump_all_port_info()))
             return False
         else:
@@ -743,49 +850,25 @@ class Realm(LFCliBase):
             return True
 
     def get_curr_num_ips(self, num_sta_with_ips=0, station_list=None, ipv4=True, ipv6=False, debug=False):
+        """
+        Count addresses on station_list with one grouped /port query per resource.
+        Each station adds one for IPv4 and one for IPv6, when asked for.
+        :param num_sta_with_ips: count to add to
+        :return: num_sta_with_ips plus the addresses found
+        """
         if debug:
             logger.debug("checking number of stations with ips...")
-        waiting_states = ["0.0.0.0", "NA", ""]
         if (station_list is None) or (len(station_list) < 1):
             raise ValueError("check for num curr ips expects non-empty list of ports")
+        records = self.query_port_ips(station_list=station_list, debug=debug)
+        if len(records) < len(station_list):
+            logger.info("station_list: incomplete response, missing: %s"
+                        % [sta_eid for sta_eid in station_list if sta_eid not in records])
         for sta_eid in station_list:
+            has_ip4, has_ip6 = self.port_has_ip(records.get(sta_eid), ipv4=ipv4, ipv6=ipv6)
+            num_sta_with_ips += int(has_ip4) + int(has_ip6)
             if debug:
-                logger.debug("checking sta-eid: %s" % sta_eid)
-            eid = self.name_to_eid(sta_eid)
-            response = super().json_get("/port/%s/%s/%s?fields=alias,ip,port+type,ipv6+address" %
-                                        (eid[0], eid[1], eid[2]))
-            if debug:
-                logger.debug(pformat(response))
-            if (response is None) or ("interface" not in response):
-                logger.info("station_list: incomplete response:")
-                logger.info(pformat(response))
-                # wait_more = True
-                break
-            if ipv4:
-                v = response['interface']
-                if v['ip'] in waiting_states:
-                    if debug:
-                        logger.debug("Waiting for port %s to get IPv4 Address." % sta_eid)
-                else:
-                    if debug:
-                        logger.debug("Found IP: %s on port: %s" % (v['ip'], sta_eid))
-                        logger.debug("Incrementing stations with IP addresses found")
-                        num_sta_with_ips += 1
-                    else:
-                        num_sta_with_ips += 1
-            if ipv6:
-                v = response['interface']
-                if v['ip'] in waiting_states:
-                    if debug:
-                        logger.debug("Waiting for port %s to get IPv6 Address." % sta_eid)
-
-                else:
-                    if debug:
-                        logger.debug("Found IP: %s on port: %s" % (v['ip'], sta_eid))
-                        logger.debug("Incrementing stations with IP addresses found")
-                        num_sta_with_ips += 1
-                    else:
-                        num_sta_with_ips += 1
+                logger.debug("port %s has IPv4: %s IPv6: %s" % (sta_eid, has_ip4, has_ip6))
         return num_sta_with_ips
 
     @staticmethod
@@ -891,13 +974,16 @@ class Realm(LFCliBase):
         return self.json_get('/events/since/%s' % previous_event_id)
 
     def new_station_profile(self, ipv6=False):
+        StationProfile = profile_class("StationProfile")
         return StationProfile(self.lfclient_url, local_realm=self, debug_=self.debug, ipv6=ipv6, up=False)
 
     def new_multicast_profile(self):
+        MULTICASTProfile = profile_class("MULTICASTProfile")
         return MULTICASTProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug,
                                 report_timer_=3000)
 
     def new_wifi_monitor_profile(self, resource_=1, debug_=False, up_=False):
+        WifiMonitor = profile_class("WifiMonitor")
         return WifiMonitor(self.lfclient_url,
                            local_realm=self,
                            resource_=resource_,
@@ -905,6 +991,7 @@ class Realm(LFCliBase):
                            debug_=(self.debug or debug_))
 
     def new_l3_cx_profile(self):
+        L3CXProfile = profile_class("L3CXProfile")
         return L3CXProfile(self.lfclient_host,
                            self.lfclient_port,
                            local_realm=self,
@@ -912,12 +999,15 @@ class Realm(LFCliBase):
                            report_timer_=3000)
 
     def new_l4_cx_profile(self):
+        L4CXProfile = profile_class("L4CXProfile")
         return L4CXProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_attenuator_profile(self):
+        ATTENUATORProfile = profile_class("ATTENUATORProfile")
         return ATTENUATORProfile(self.lfclient_host, self.lfclient_port, debug_=self.debug)
 
     def new_generic_endp_profile(self):
+        GenCXProfile = profile_class("GenCXProfile")
         return GenCXProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_generic_cx_profile(self):
@@ -925,9 +1015,11 @@ class Realm(LFCliBase):
         @deprecated
         :return: new GenCXProfile
         """
+        GenCXProfile = profile_class("GenCXProfile")
         return GenCXProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_vap_profile(self):
+        VAPProfile = profile_class("VAPProfile")
         return VAPProfile(lfclient_host=self.lfclient_host, lfclient_port=self.lfclient_port, local_realm=self,
                           debug_=self.debug)
 
@@ -936,27 +1028,33 @@ class Realm(LFCliBase):
     # debug=self.debug)
 
     def new_http_profile(self):
+        HTTPProfile = profile_class("HTTPProfile")
         return HTTPProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_fio_endp_profile(self):
+        FIOEndpProfile = profile_class("FIOEndpProfile")
         return FIOEndpProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_dut_profile(self):
+        DUTProfile = profile_class("DUTProfile")
         return DUTProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_mvlan_profile(self):
+        MACVLANProfile = profile_class("MACVLANProfile")
         return MACVLANProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_qvlan_profile(self):
+        QVLANProfile = profile_class("QVLANProfile")
         return QVLANProfile(self.host, self.port, local_realm=self, debug_=self.debug)
 
     def new_test_group_profile(self):
+        TestGroupProfile = profile_class("TestGroupProfile")
         return TestGroupProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
     def new_lf_data_collection(self):
+        LFDataCollection = profile_class("LFDataCollection")
         return LFDataCollection(local_realm=self)
 
-
 class PacketFilter:
 
     @staticmethod
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+One station, its parent radio and one layer-3 cross-connect driven through a single
+lanforge_client LFSession. Replaces the lf_portmod.pl / lf_firemod.pl calls that
+lf_tx_power.py made for every sweep step: each of those started perl and opened a
+new telnet connection to the manager, then the text it printed was scraped with
+regular expressions. Here the GUI's JSON API is used and values come back typed.
+
+    station = StationCxSession(lfmgr="192.168.100.178", resource=1, station="wlan0",
+                               upstream_resource=1, upstream_port="eth2", cx_name="c-udp-power")
+    station.create_cx(upstream_bps=1000000)
+    station.set_station_up(False)
+    station.set_cx_state("RUNNING")
+    probe = station.probe()         # port_probe.ProbeResults
+    status = station.port_status()  # dict of ap, ip, mode, channel, noise...
+"""
+import importlib
+import logging
+import os
+import sys
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+port_probe = importlib.import_module("py-json.port_probe")
+
+logger = logging.getLogger(__name__)
+
+# /port columns read by port_status()
+PORT_STATUS_COLUMNS = ["alias", "ap", "ip", "mode", "channel", "signal", "noise", "rx-rate", "status"]
+
+# set_port interest and current_flags for admin up/down, as LFUtils.port_down_request
+SET_PORT_IFDOWN = 0x1
+SET_PORT_INTEREST_IFDOWN = 0x800002
+
+
+def _noise_dbm(noise=None):
+    # the port table reports noise as '-95' or '-95 dBm'
+    if noise is None:
+        return None
+    text = str(noise).replace('dBm', '').strip()
+    return text if text else None
+
+
+def _endpoint_records(response=None):
+    # one endpoint comes back as {columns}, several as [{name: {columns}}, ...]
+    if not response:
+        return {}
+    if isinstance(response, dict):
+        if 'name' in response:
+            return {response['name']: response}
+        return response
+    records = {}
+    for item in response:
+        records.update(item)
+    return records
+
+
+class StationCxSession:
+    def __init__(self,
+                 lfmgr="localhost",
+                 lfmgr_port=8080,
+                 resource=1,
+                 station=None,
+                 upstream_resource=1,
+                 upstream_port=None,
+                 cx_name="c-udp-power",
+                 report_timer_ms=1000,
+                 debug=False):
+        """
+        :param resource: resource of the station
+        :param upstream_resource: resource of upstream_port
+        :param cx_name: the endpoints are cx_name-A on the station and cx_name-B on upstream_port
+        """
+        self.resource = int(resource)
+        self.station = station
+        self.upstream_resource = int(upstream_resource)
+        self.upstream_port = upstream_port
+        self.cx_name = cx_name
+        self.endp_a = cx_name + "-A"
+        self.endp_b = cx_name + "-B"
+        self.report_timer_ms = report_timer_ms
+        self.station_eid = "1.%s.%s" % (self.resource, station)
+        self.session = lanforge_api.LFSession(lfclient_url="http://%s:%s" % (lfmgr, lfmgr_port),
+                                              debug=debug)
+        self.command = self.session.get_command()
+        self.query = self.session.get_query()
+
+    def port_parent(self):
+        """
+        :return: parent radio of the station, such as wiphy0
+        """
+        port = self.query.get_port(eid_list=[self.station_eid], requested_col_names=["parent+dev"])
+        if not port:
+            return None
+        return port.get("parent dev")
+
+    def set_station_up(self, up=True):
+        self.command.post_set_port(shelf=1,
+                                   resource=self.resource,
+                                   port=self.station,
+                                   current_flags=0 if up else SET_PORT_IFDOWN,
+                                   interest=SET_PORT_INTEREST_IFDOWN)
+
+    def set_radio_antenna(self, radio=None, antenna=0):
+        """
+        :param antenna: 0 all, 1 (1x1), 4 (2x2), 7 (3x3), 8 (4x4)
+        """
+        self.command.post_set_wifi_radio(shelf=1, resource=self.resource, radio=radio, antenna=antenna)
+
+    def remove_cx(self):
+        self.command.post_rm_cx(test_mgr="all", cx_name=self.cx_name)
+        self.command.post_rm_endp(endp_name=self.endp_a)
+        self.command.post_rm_endp(endp_name=self.endp_b)
+
+    def create_cx(self, upstream_bps=1000000, station_bps=0, endp_type="lf_udp"):
+        """
+        Remove any old cross-connect of the same name, then create the downstream one:
+        cx_name-B on the upstream port transmits upstream_bps to cx_name-A on the station.
+        """
+        self.remove_cx()
+        for alias, resource, port, bps in ((self.endp_b, self.upstream_resource, self.upstream_port, upstream_bps),
+                                           (self.endp_a, self.resource, self.station, station_bps)):
+            self.command.post_add_endp(alias=alias,
+                                       shelf=1,
+                                       resource=resource,
+                                       port=port,
+                                       p_type=endp_type,
+                                       ip_port=-1,
+                                       is_rate_bursty="NO",
+                                       min_rate=bps,
+                                       max_rate=bps,
+                                       min_pkt=-1,
+                                       max_pkt=0,
+                                       payload_pattern="increasing")
+            self.command.post_set_endp_report_timer(endp_name=alias, milliseconds=self.report_timer_ms)
+        self.command.post_add_cx(alias=self.cx_name, test_mgr="default_tm", tx_endp=self.endp_a, rx_endp=self.endp_b)
+        self.command.post_set_cx_report_timer(test_mgr="default_tm", cx_name=self.cx_name,
+                                              milliseconds=self.report_timer_ms)
+
+    def set_cx_state(self, state="STOPPED"):
+        """
+        :param state: RUNNING, STOPPED or DELETED
+        """
+        self.command.post_set_cx_state(test_mgr="all", cx_name=self.cx_name, cx_state=state)
+
+    def delete_cx(self):
+        self.set_cx_state("DELETED")
+        self.command.post_rm_endp(endp_name=self.endp_a)
+        self.command.post_rm_endp(endp_name=self.endp_b)
+
+    def port_status(self):
+        """
+        :return: dict of PORT_STATUS_COLUMNS for the station, 'noise' without dBm;
+        empty when the port could not be read
+        """
+        port = self.query.get_port(eid_list=[self.station_eid], requested_col_names=PORT_STATUS_COLUMNS)
+        if not port:
+            return {}
+        status = dict(port)
+        status["noise"] = _noise_dbm(status.get("noise"))
+        return status
+
+    def is_associated(self, status=None):
+        """
+        :param status: a port_status() result, read when not given
+        :return: (associated, has_ip)
+        """
+        if status is None:
+            status = self.port_status()
+        ap = status.get("ap")
+        ip = status.get("ip")
+        associated = bool(ap) and (ap != "Not-Associated")
+        return associated, associated and bool(ip) and (ip != "0.0.0.0")
+
+    def probe(self, settle_sec=port_probe.PROBE_SETTLE_SEC):
+        """
+        Ask the GUI to probe the station, then read and parse the probe results.
+        :return: (port_probe.ProbeResults, probe results text); empty results when the
+        GUI returned none
+        """
+        self.command.post_probe_port(shelf=1, resource=self.resource, port=self.station)
+        time.sleep(settle_sec)
+        response = self.query.get_probe(eid_list=[self.station_eid], requested_col_names=["probe+results"])
+        text = ""
+        if isinstance(response, list):
+            for item in response:
+                for record in item.values():
+                    text = record.get("probe results", "")
+        elif isinstance(response, dict):
+            text = response.get("probe results", "")
+        return port_probe.parse_probe_results(text), text
+
+    def endp_rx_bytes(self):
+        """
+        :return: dict of endpoint name to rx bytes for both ends of the cross-connect
+        """
+        response = self.query.get_endp(eid_list=[self.endp_a, self.endp_b], requested_col_names=["name", "rx+bytes"])
+        rx_bytes = {}
+        for name, record in _endpoint_records(response).items():
+            try:
+                rx_bytes[name] = int(record.get("rx bytes"))
+            except (TypeError, ValueError):
+                logger.info("endpoint {name} has no rx bytes: {record}".format(name=name, record=record))
+        return rx_bytes
@@ -404,7 +404,13 @@ class StationProfile:
                use_radius=False,
                hs20_enable=False,
                sleep_time=0.02,
-               timeout=300):
+               timeout=300,
+               batch_size=0):
+        """
+        :param batch_size: when greater than zero, submit the add_sta, set_port and wifi
+        commands in concurrent chunks of this many commands instead of posting and sleeping
+        per station
+        """
         if debug:
             logger.debug('Start station_profile.create')
             logger.debug(pformat('Current ports:{ports}'.format(ports=LFRequest.LFRequest(self.lfclient_url + '/ports', debug_=debug))))
@@ -505,6 +511,10 @@ class StationProfile:
         # track the names of stations in case we have stations added multiple times
         finished_sta = []
 
+        batch = None
+        if batch_size and not dry_run:
+            batch = self.local_realm.get_lf_session().get_command().batch(chunk_size=batch_size)
+
         for eidn in my_sta_eids:
             if eidn in self.station_names:
                 logger.info("Station {eidn} already created, skipping.".format(eidn=eidn))
@@ -541,6 +551,21 @@ class StationProfile:
                 if debug:
                     logger.debug("dry run: not creating {eidn} ".format(eidn=eidn))
                 continue
+            if batch is not None:
+                # the batch sends every add_sta of a chunk before its set_port commands
+                batch.json_post(url="/cli-json/add_sta", post_data=self.add_sta_data, debug=debug)
+                finished_sta.append(eidn)
+                batch.json_post(url="/cli-json/set_port", post_data=self.set_port_data, debug=debug)
+                if self.wifi_extra_data_modified:
+                    self.wifi_extra_data["resource"] = radio_resource
+                    self.wifi_extra_data["port"] = name
+                    batch.json_post(url="/cli-json/set_wifi_extra", post_data=self.wifi_extra_data, debug=debug)
+                if self.wifi_txo_data_modified:
+                    self.wifi_txo_data["resource"] = radio_resource
+                    self.wifi_txo_data["port"] = name
+                    batch.json_post(url="/cli-json/set_wifi_txo", post_data=self.wifi_txo_data, debug=debug)
+                self.station_names.append("%s.%s.%s" % (radio_shelf, radio_resource, name))
+                continue
             if debug:
                 logger.debug('Timestamp: {time_}'.format(time_=(time.time() * 1000)))
                 logger.debug("- 3264 - ## {eidn} ##  add_sta_r.jsonPost - - - - - - - - - - - - - - - - - - ".format(eidn=eidn))
@@ -572,6 +597,14 @@ class StationProfile:
             self.station_names.append("%s.%s.%s" % (radio_shelf, radio_resource, name))
             time.sleep(sleep_time)
 
+        if batch is not None:
+            batch.flush()
+            # the batch posts around LFCliBase.json_post, which keeps the json_get cache current
+            self.local_realm.invalidate_json_cache()
+            for item in batch.get_failed():
+                logger.error("StationProfile.create: {url} {data} failed: {errors}".format(
+                    url=item.url, data=item.post_data, errors=item.errors))
+
         logger.debug('StationProfile.create debug: {port}'.format(port=pformat(self.local_realm.json_get('/port/'))))
         logger.debug("- ~3287 - waitUntilPortsAppear - - - - - - - - - - - - - - - - - - ")
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Checks ap_stats_parser against the test mode AP output of test_l3_longevity.py, then
+times one poll of station lookups: the row rescan test_l3_longevity used to do for
+every station, against one parse_bs_data() table per read. Synthetic bs_data, no AP
+or LANforge system is needed.
+
+Example:
+    ./ap_stats_parser_benchmark.py --stations 100 500 1000
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+ap_stats_parser = importlib.import_module("py-json.ap_stats_parser")
+
+# same text as L3VariableTime.read_ap_*_test_mode()
+BS_DATA_FIXTURE = \
+    "root@Docsis-Gateway:~# wl -i wl2 bs_data\n" \
+    "Station Address   PHY Mbps  Data Mbps    Air Use   Data Use    Retries   bw   mcs   Nss   ofdma mu-mimo\n" \
+    "04:f0:21:82:2f:d6     1016.6       48.9       6.5%      24.4%      16.6%   80   9.7     2    0.0%    0.0%\n" \
+    "50:E0:85:84:7A:E7      880.9       52.2       7.7%      26.1%      20.0%   80   8.5     2    0.0%    0.0%\n" \
+    "50:E0:85:89:5D:00      840.0       47.6       6.4%      23.8%       2.3%   80   8.0     2    0.0%    0.0%\n" \
+    "50:E0:85:87:5B:F4      960.7       51.5       5.9%      25.7%       0.0%   80     9     2    0.0%    0.0%\n"
+RX_REPORT_FIXTURE = \
+    "root@Docsis-Gateway:~#  wl -i wl1 rx_report\n" \
+    "Station Address (rssi)  tid   ampdu     mpdu  Data Mbps   PHY Mbps    bw   mcs   Nss   oow holes   dup rtries  ofdma  tones    air\n" \
+    "50:E0:85:87:5B:F4 (-43dBm)   0    2062   127078       32.5      571.9    80  11.0     2     0     0    64     0%   100%  483.3     6%\n" \
+    "50:E0:85:84:7A:E7 (-44dBm)   0    2334   144373       36.9      343.1    80  10.9     2     0     0    63     0%   100%  291.4    11%\n" \
+    "50:E0:85:88:F4:5F (-45dBm)   0    2296   142463       36.4      346.3    80  10.9     2     0     0    64     0%   100%  294.1    11%\n"
+CHANIM_FIXTURE = \
+    "root@Docsis-Gateway:~# wl -i wl2 chanim_stats\n" \
+    "version: 3\n" \
+    "chanspec tx   inbss   obss   nocat   nopkt   doze     txop     goodtx  badtx   glitch   badplcp  knoise  idle  timestamp\n" \
+    "0xe06a\t41.82\t20.22\t0.00\t13.56\t0.02\t0.00\t17.58\t29.54\t1.94\t3\t0\t-90\t58\t146903490\n"
+
+
+def check_fixtures():
+    bs_data = ap_stats_parser.parse_bs_data(BS_DATA_FIXTURE
+                                            + "(overall)          -      200.2      26.5%         -         - \n")
+    assert list(bs_data) == ["04:f0:21:82:2f:d6", "50:e0:85:84:7a:e7", "50:e0:85:89:5d:00", "50:e0:85:87:5b:f4"]
+    stats = bs_data["50:e0:85:84:7a:e7"]
+    assert stats.row[0] == "50:E0:85:84:7A:E7" and len(stats.row) == 11
+    assert stats.values["PHY Mbps"] == 880.9 and stats.values["Air Use"] == 7.7
+    assert stats.values["bw"] == 80 and stats.values["mcs"] == 8.5 and stats.values["Nss"] == 2
+
+    rx_report = ap_stats_parser.parse_rx_report(RX_REPORT_FIXTURE)
+    assert len(rx_report) == 3
+    stats = rx_report["50:e0:85:87:5b:f4"]
+    assert len(stats.row) == 17
+    assert stats.values["rssi"] == -43 and stats.values["mpdu"] == 127078
+    assert stats.values["ofdma"] == 100.0 and stats.values["air"] == 6.0
+
+    assert abs(ap_stats_parser.chanim_channel_utilization(CHANIM_FIXTURE) - 82.42) < 0.001
+    assert ap_stats_parser.chanim_channel_utilization("No stations are currently associated.\n") == 0
+    assert ap_stats_parser.parse_bs_data("No stations are currently associated.\n") == {}
+
+    # firmware that prints an extra column and drops another: columns follow the header
+    bs_data = ap_stats_parser.parse_bs_data(
+        "Station Address   PHY Mbps  Data Mbps    Air Use   Data Use    Retries   bw   sgi   mcs   Nss   ofdma\n"
+        "04:f0:21:82:2f:d6     1016.6       48.9       6.5%      24.4%      16.6%   80   on   9.7     2    0.0%\n"
+        "50:E0:85:84:7A:E7      880.9       52.2       7.7%\n")
+    assert list(bs_data) == ["04:f0:21:82:2f:d6"], bs_data
+    stats = bs_data["04:f0:21:82:2f:d6"]
+    assert stats.values["mcs"] == 9.7 and stats.values["Nss"] == 2 and stats.values["ofdma"] == 0.0
+    assert stats.values["mu-mimo"] is None
+    print("fixtures parsed as expected")
+
+
+def make_bs_data(num_stations):
+    lines = [BS_DATA_FIXTURE.splitlines()[0], BS_DATA_FIXTURE.splitlines()[1]]
+    for sta in range(num_stations):
+        lines.append("50:E0:85:%02X:%02X:%02X      880.9       52.2       7.7%%      26.1%%      20.0%%   80   8.5     2"
+                     "    0.0%%    0.0%%" % (sta >> 16, (sta >> 8) & 0xff, sta & 0xff))
+    return "\n".join(lines) + "\n"
+
+
+def scan_rows(ap_stats_rows, mac):
+    # the per-station loop of test_l3_longevity before ap_stats_parser
+    ap_row = None
+    for row in ap_stats_rows:
+        split_row = row.split()
+        if split_row[0].lower() == mac.lower():
+            ap_row = split_row
+    return ap_row
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='ap_stats_parser_benchmark.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--stations', type=int, nargs='+', default=[100, 500, 1000],
+                        help='associated station counts to time')
+    args = parser.parse_args()
+
+    check_fixtures()
+    print("%8s %14s %14s %9s" % ("stations", "scan sec/read", "table sec/read", "speedup"))
+    for num_stations in args.stations:
+        ap_stats = make_bs_data(num_stations)
+        macs = ["50:e0:85:%02x:%02x:%02x" % (sta >> 16, (sta >> 8) & 0xff, sta & 0xff)
+                for sta in range(num_stations)]
+
+        started = time.perf_counter()
+        ap_stats_rows = ap_stats.splitlines()
+        scanned = [scan_rows(ap_stats_rows, mac) for mac in macs]
+        scan_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        table = ap_stats_parser.parse_bs_data(ap_stats)
+        looked_up = [table[mac].row for mac in macs]
+        table_sec = time.perf_counter() - started
+
+        if scanned != looked_up:
+            print("rows differ for %s stations" % num_stations)
+            exit(1)
+        print("%8d %14.4f %14.4f %8.0fx" % (num_stations, scan_sec, table_sec, scan_sec / table_sec))
+
+
+if __name__ == "__main__":
+    main()
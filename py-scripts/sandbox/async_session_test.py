@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Awaits concurrent get_port and post_add_sta calls of lanforge_async_api.AsyncLFSession
+against a local stand-in for the GUI, no LANforge system is needed. Some of the ports
+are not found (HTTP 404). Each get_port call must report only its own errors, the
+others none, and every post must reach the stand-in once.
+
+Example:
+    ./async_session_test.py --calls 64 --pool_size 8
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lanforge_async_api = importlib.import_module("lanforge_client.lanforge_async_api")
+stand_in_gui = importlib.import_module("py-scripts.sandbox.stand_in_gui")
+
+
+class FakeGui(stand_in_gui.StandInGui):
+    def __init__(self, delay_sec=0.05):
+        super().__init__()
+        self.delay_sec = delay_sec
+        self.stations = []
+
+    def get(self, path, query):
+        if path[0] != "port":
+            return {}
+        # keep requests on the wire long enough to overlap
+        time.sleep(self.delay_sec)
+        name = path[-1]
+        if name.startswith("bad"):
+            raise stand_in_gui.StandInHttpError(404, "Not Found")
+        return {"interface": {"alias": name}}
+
+    def post(self, path, data):
+        time.sleep(self.delay_sec)
+        if path[-1] == "add_sta":
+            with self.lock:
+                self.stations.append(data["sta_name"])
+        return {}
+
+
+async def get_port(lf_query, name):
+    # json_get only fills a list that already holds something, so start with the name
+    errors = [name]
+    response = await lf_query.get_port(eid_list=["1.1.%s" % name], errors_warnings=errors)
+    return name, response, errors[1:]
+
+
+async def run_calls(gui, calls, pool_size):
+    async with lanforge_async_api.AsyncLFSession(lfclient_url=gui.get_url(),
+                                                 stream_errors=False,
+                                                 connection_pool_size=pool_size) as session:
+        lf_query = session.get_query()
+        lf_command = session.get_command()
+        names = [("bad%03d" if number % 3 == 0 else "good%03d") % number for number in range(calls)]
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *[get_port(lf_query, name) for name in names],
+            *[lf_command.post_add_sta(shelf=1, resource=1, radio="wiphy0", sta_name="sta%03d" % number)
+              for number in range(calls)])
+        elapsed = time.monotonic() - started
+
+        for name, response, errors in results[:calls]:
+            others = [other for other in names if (other != name) and any(other in error for error in errors)]
+            assert not others, "%s reported errors of %s: %s" % (name, others, errors)
+            if name.startswith("bad"):
+                assert response is None, response
+                assert any(name in error for error in errors), "%s lost its errors: %s" % (name, errors)
+            else:
+                assert response, name
+                assert not errors, "%s reported errors: %s" % (name, errors)
+        # the query instance collects the errors of every call
+        all_errors = await lf_query.get_errors()
+        failed = sorted(set(name for name in names for error in all_errors if name in error))
+        assert failed == [name for name in names if name.startswith("bad")], failed
+        assert sorted(gui.stations) == ["sta%03d" % number for number in range(calls)], gui.stations
+        print("calls %d pool_size %d: %d gets with errors, %d posts, %.3f sec, %s" % (
+            calls, pool_size, len(failed), len(gui.stations), elapsed, session.get_connection_pool_stats()))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='async_session_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--calls', type=int, default=64, help='get_port and post_add_sta calls to await at once')
+    parser.add_argument('--pool_size', type=int, default=8, help='AsyncLFSession connection_pool_size')
+    args = parser.parse_args()
+
+    gui = FakeGui().start()
+    asyncio.run(run_calls(gui, args.calls, args.pool_size))
+    print("every call reported only its own errors")
+    gui.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Sends LFJsonCommand batches (LFJsonCommand.batch) to a local stand-in for the GUI
+that records every command it is sent, no LANforge system is needed. Batches
+queue more commands than chunk_size, with add_sta and set_port mixed, through
+batch.post_* and batch.json_post, one worker and several. Each queued command
+must reach the stand-in exactly once, in order within its URL.
+
+Example:
+    ./command_batch_test.py --commands 50 --chunk_size 3
+"""
+import argparse
+import gc
+import importlib
+import os
+import sys
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+stand_in_gui = importlib.import_module("py-scripts.sandbox.stand_in_gui")
+
+
+class FakeGui(stand_in_gui.StandInGui):
+    def __init__(self):
+        super().__init__()
+        # (command, port name) in the order received
+        self.commands = []
+
+    def post(self, path, data):
+        if path[0] == "cli-json":
+            with self.lock:
+                self.commands.append((path[1], data.get("sta_name", data.get("port"))))
+        return {}
+
+
+def queue_commands(batch, commands, use_json_post):
+    for number in range(commands):
+        name = "sta%04d" % (number // 2)
+        if use_json_post:
+            url = "/cli-json/add_sta" if number % 2 == 0 else "/cli-json/set_port"
+            batch.json_post(url=url, post_data={"shelf": 1, "resource": 1, "radio": "wiphy0",
+                                                "sta_name" if number % 2 == 0 else "port": name})
+        elif number % 2 == 0:
+            batch.post_add_sta(shelf=1, resource=1, radio="wiphy0", sta_name=name)
+        else:
+            batch.post_set_port(shelf=1, resource=1, port=name, current_flags=0, interest=0)
+
+
+def run_batch(gui, command, commands, chunk_size, max_workers, use_json_post):
+    gui.commands = []
+    with command.batch(chunk_size=chunk_size, max_workers=max_workers) as batch:
+        queue_commands(batch, commands, use_json_post)
+    sent = list(gui.commands)
+    print("commands %3d chunk_size %2d max_workers %s json_post %-5s: items %3d failed %d posts %3d" % (
+        commands, chunk_size, max_workers, use_json_post, len(batch.get_items()), len(batch.get_failed()),
+        len(sent)))
+    assert len(batch.get_items()) == commands, len(batch.get_items())
+    assert not batch.get_failed(), [item.errors for item in batch.get_failed()]
+    assert len(sent) == commands, sent
+    for url in ("add_sta", "set_port"):
+        names = [name for sent_url, name in sent if sent_url == url]
+        assert len(names) == len(set(names)), "%s sent twice: %s" % (url, names)
+        if max_workers == 1:
+            assert names == sorted(names), names
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='command_batch_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--commands', type=int, default=50, help='commands to queue per batch')
+    parser.add_argument('--chunk_size', type=int, default=3, help='batch chunk_size')
+    args = parser.parse_args()
+
+    gui = FakeGui().start()
+    session = lanforge_api.LFSession(lfclient_url=gui.get_url())
+    command = session.get_command()
+
+    for use_json_post in (False, True):
+        for max_workers in (1, 4):
+            for commands in (4, args.commands):
+                run_batch(gui, command, commands, args.chunk_size, max_workers, use_json_post)
+    print("every command was sent once")
+    # end the session while the stand-in still answers /endsession
+    del command, session
+    gc.collect()
+
+
+if __name__ == "__main__":
+    main()
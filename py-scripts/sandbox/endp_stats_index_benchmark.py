@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compares per-port endpoint stats lookups: the two full scans of the endpoint list
+that test_l3_longevity used to do for every port, against one EndpStatsIndex per
+poll. Synthetic endpoints, no LANforge system is needed.
+
+Example:
+    ./endp_stats_index_benchmark.py --stations 100 500 1000
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+endp_stats_index = importlib.import_module("py-json.endp_stats_index")
+
+
+def make_endps(num_stations):
+    # one cross-connect per station: -A on the station, -B on the upstream port
+    endps = []
+    for sta in range(num_stations):
+        cx_name = "cx-%04d" % sta
+        endps.append({"name": cx_name + "-A", "eid": "1.1.%d.%d" % (sta + 10, 2 * sta),
+                      "delay": 1000 + sta, "jitter": 10 + sta % 7,
+                      "rx rate": 1000000, "rx rate ll": 1000100, "rx pkts ll": 500})
+        endps.append({"name": cx_name + "-B", "eid": "1.1.2.%d" % (2 * sta + 1),
+                      "delay": 900, "jitter": 9,
+                      "rx rate": 2000000, "rx rate ll": 2000100, "rx pkts ll": 700})
+    return endps
+
+
+def scan_stats_for_port(eid, endps):
+    # the per-port scans get_endp_stats_for_port did before EndpStatsIndex, minus logging
+    lat = jit = count = 0
+    total_dl_rate = total_dl_rate_ll = total_dl_pkts_ll = 0
+    total_ul_rate = total_ul_rate_ll = total_ul_pkts_ll = 0
+    sta_name = 'no_station'
+    for endp in endps:
+        eid_endp = endp["eid"].split(".")
+        if eid[0] == eid_endp[0] and eid[1] == eid_endp[1] and eid[2] == eid_endp[2]:
+            lat += int(endp["delay"])
+            jit += int(endp["jitter"])
+            sta_name = endp["name"].replace('-A', '')
+            count += 1
+    if count > 1:
+        lat = int(lat / count)
+        jit = int(jit / count)
+    for endp in endps:
+        if sta_name in endp["name"]:
+            if endp["name"].endswith("-A"):
+                total_dl_rate += int(endp["rx rate"])
+                total_dl_rate_ll += int(endp["rx rate ll"])
+                total_dl_pkts_ll += int(endp["rx pkts ll"])
+            else:
+                total_ul_rate += int(endp["rx rate"])
+                total_ul_rate_ll += int(endp["rx rate ll"])
+                total_ul_pkts_ll += int(endp["rx pkts ll"])
+    return lat, jit, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='endp_stats_index_benchmark.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--stations', type=int, nargs='+', default=[100, 500, 1000],
+                        help='station counts to time, two endpoints per station')
+    args = parser.parse_args()
+
+    print("%8s %10s %14s %14s %9s" % ("stations", "endpoints", "scan sec/poll", "index sec/poll", "speedup"))
+    for num_stations in args.stations:
+        endps = make_endps(num_stations)
+        port_eids = [["1", "1", str(sta + 10)] for sta in range(num_stations)]
+
+        started = time.perf_counter()
+        scanned = [scan_stats_for_port(eid, endps) for eid in port_eids]
+        scan_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index = endp_stats_index.EndpStatsIndex(endps)
+        indexed = [index.stats_for_port(eid) for eid in port_eids]
+        index_sec = time.perf_counter() - started
+
+        if scanned != indexed:
+            print("results differ for %s stations" % num_stations)
+            exit(1)
+        print("%8d %10d %14.4f %14.4f %8.0fx" % (num_stations, len(endps), scan_sec, index_sec, scan_sec / index_sec))
+
+
+if __name__ == "__main__":
+    main()
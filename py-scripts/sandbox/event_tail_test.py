@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Drives lanforge_api.LFEventTail against a local stand-in for the GUI event log, no
+LANforge system is needed. The stand-in starts with a long log, then adds station
+connect and disconnect events, other events and a gap of event ids while the tail
+and an events_since loop follow it. It counts the rows each one reads, to compare
+the cost of a poll with the log size.
+
+Example:
+    ./event_tail_test.py --log_size 50000 --stations 20 --polls 10
+"""
+import argparse
+import gc
+import importlib
+import os
+import sys
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+stand_in_gui = importlib.import_module("py-scripts.sandbox.stand_in_gui")
+
+
+class FakeEventLog(stand_in_gui.StandInGui):
+    def __init__(self):
+        super().__init__()
+        self.events = {}
+        self.next_id = 1
+        self.requests = 0
+        self.rows_sent = 0
+
+    def add(self, event="Link-Up", entity_type="Port", name="eth1", description="", skip_ids=0):
+        with self.lock:
+            self.next_id += skip_ids
+            self.events[self.next_id] = {
+                "id": str(self.next_id), "event": event, "type": entity_type, "name": name,
+                "entity id": "1.1.%s" % name, "time-stamp": "2026-10-18 10:00:00.000", "priority": "Info",
+                "event description": description if description else "%s %s" % (name, event),
+                "eid": "1.1.%s" % name,
+            }
+            self.next_id += 1
+
+    def select(self, path):
+        ids = sorted(self.events)
+        if path[1] == "last":
+            return ids[-int(path[2]):]
+        if path[1] == "since":
+            return [event_id for event_id in ids if event_id > int(path[2])]
+        if path[1] == "between":
+            return [event_id for event_id in ids if int(path[2]) <= event_id <= int(path[3])]
+        return ids
+
+    def get(self, path, query):
+        columns = query["fields"][0].split(",") if query.get("fields") else None
+        with self.lock:
+            self.requests += 1
+            rows = []
+            for event_id in self.select(path):
+                record = self.events[event_id]
+                if columns:
+                    record = {column: record[column] for column in columns if column in record}
+                rows.append({str(event_id): record})
+            self.rows_sent += len(rows)
+        if len(rows) == 1:
+            return {"event": list(rows[0].values())[0]}
+        return {"events": rows}
+
+
+def add_activity(log, stations, poll):
+    for station in range(stations):
+        name = "sta%04d" % station
+        log.add(event="Connect" if poll % 2 == 0 else "Disconnect", name=name)
+        log.add(event="Link-Up", name=name)
+    log.add(event="Cleared", entity_type="Endp", name="udp-A")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='event_tail_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--log_size', type=int, default=50000, help='events in the log before following it')
+    parser.add_argument('--stations', type=int, default=20, help='stations connecting or disconnecting per poll')
+    parser.add_argument('--polls', type=int, default=10, help='polls to make')
+    parser.add_argument('--page_size', type=int, default=256, help='LFEventTail page size')
+    args = parser.parse_args()
+
+    log = FakeEventLog()
+    for _event in range(args.log_size):
+        log.add(description="old event")
+    log.start()
+
+    session = lanforge_api.LFSession(lfclient_url=log.get_url())
+    query = session.get_query()
+    tail = query.event_tail(event_types=["Connect", "Disconnect"], entity_types=["Port"],
+                            page_size=args.page_size)
+    since_id = tail.newest_id()
+    assert not tail.poll()
+
+    expected = 0
+    for poll in range(args.polls):
+        add_activity(log, args.stations, poll)
+        expected += args.stations
+        if poll == args.polls // 2:
+            # ids the tail has to step over
+            log.add(event="Connect", name="sta-gap", skip_ids=args.page_size * 3)
+            expected += 1
+
+        log.requests = log.rows_sent = 0
+        records = tail.poll()
+        tail_requests, tail_rows = log.requests, log.rows_sent
+        assert all(record.event in ("Connect", "Disconnect") and record.type == "Port" for record in records)
+
+        log.requests = log.rows_sent = 0
+        # what find_new_events callers do: everything since the id they started at, filtered here
+        new_events = query.events_since(event_id=since_id)
+        matched = [list(event.values())[0] for event in new_events
+                   if list(event.values())[0]["event"] in ("Connect", "Disconnect")]
+        print("poll %2d  tail: matched %3d requests %d rows %4d   events_since: matched %4d rows %6d" % (
+            poll, len(records), tail_requests, tail_rows, len(matched), log.rows_sent))
+
+    stats = tail.get_stats()
+    print("stats: %s" % stats)
+    assert stats["rows_matched"] == expected, (stats, expected)
+    assert stats["last_id"] == log.next_id - 1
+
+    # a second tail started at the log start walks it in pages
+    log.requests = 0
+    walked = query.event_tail(start_id=0, page_size=args.page_size).poll()
+    print("from the start: %d records in %d requests" % (len(walked), log.requests))
+    assert len(walked) == len(log.events)
+    # end the session while the stand-in still answers /endsession
+    del tail, query, session
+    gc.collect()
+
+
+if __name__ == "__main__":
+    main()
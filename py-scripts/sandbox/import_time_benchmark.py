@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Times importing realm and lfcli_base in fresh interpreters, the startup every
+py-scripts test pays before it does anything. Exits 1 when the median import
+takes longer than --budget_sec, or when an import loads a module that is meant
+to wait until it is used: pandas, lanforge_api and the profile modules. The
+slowest imports are listed on failure. No LANforge system is needed.
+
+Example:
+    ./import_time_benchmark.py --runs 10 --budget_sec 0.4
+    ./import_time_benchmark.py --module py-json.realm --module py-scripts.test_ip_variable_time
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+
+DEFAULT_MODULES = ["py-json.realm", "py-json.LANforge.lfcli_base"]
+
+# not to be loaded by importing DEFAULT_MODULES
+DEFERRED_MODULES = [
+    "pandas",
+    "numpy",
+    "requests",
+    "lanforge_client.lanforge_api",
+    "py-json.l3_cxprofile",
+    "py-json.l4_cxprofile",
+    "py-json.gen_cxprofile",
+    "py-json.station_profile",
+    "py-json.LANforge.pandas_extensions",
+]
+
+TIMER = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"sec": elapsed, "loaded": [name for name in {deferred!r} if name in sys.modules]}}))
+"""
+
+
+def time_import(module, deferred):
+    output = subprocess.run([sys.executable, "-c", TIMER.format(root=REPO_ROOT, module=module, deferred=deferred)],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(module, count=10):
+    # -X importtime lines: 'import time: self [us] | cumulative | imported package'
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             "import importlib, sys; sys.path.insert(0, %r); importlib.import_module(%r)"
+                             % (REPO_ROOT, module)],
+                            cwd=REPO_ROOT, capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='import_time_benchmark.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--module', action='append', help='module to import, repeat for several; '
+                                                          'default %s' % ", ".join(DEFAULT_MODULES))
+    parser.add_argument('--runs', type=int, default=7, help='fresh interpreters per module')
+    parser.add_argument('--budget_sec', type=float, default=0.4, help='most seconds the median import may take')
+    parser.add_argument('--allow_deferred', action='store_true',
+                        help='do not fail when pandas, lanforge_api or a profile module is loaded')
+    args = parser.parse_args()
+
+    failed = False
+    for module in (args.module if args.module else DEFAULT_MODULES):
+        results = [time_import(module, DEFERRED_MODULES) for _run in range(args.runs)]
+        median_sec = statistics.median(result["sec"] for result in results)
+        loaded = results[0]["loaded"]
+        print("%-40s median %.3f sec  min %.3f sec  budget %.3f sec  loaded: %s" % (
+            module, median_sec, min(result["sec"] for result in results), args.budget_sec,
+            ", ".join(loaded) if loaded else "-"))
+        over_budget = median_sec > args.budget_sec
+        if over_budget or (loaded and not args.allow_deferred):
+            failed = True
+            print("    slowest imports of %s (cumulative usec):" % module)
+            for usec, name in slowest_imports(module):
+                print("    %10d %s" % (usec, name))
+    if failed:
+        print("import time regressed")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Drives InfluxRequest.RecordInflux against a local stand-in for the influx v2 write
+API, no influx server or LANforge system is needed. The stand-in counts requests
+and lines, so the batching can be compared with the one write per value the
+monitor used to make.
+
+Example:
+    ./influx_batch_writer_test.py --stations 50 --intervals 5
+    ./influx_batch_writer_test.py --fail_every 3     # stand-in rejects every third write
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+InfluxRequest = importlib.import_module("py-dashboard.InfluxRequest")
+RecordInflux = InfluxRequest.RecordInflux
+
+KPI_FIXTURE = \
+    "Date\ttest-rig\ttest-tag\tdut-hw-version\tdut-sw-version\tdut-model-num\tdut-serial-num\ttest-priority\t" \
+    "test-id\tshort-description\tpass/fail\tnumeric-score\ttest details\tUnits\tGraph-Group\tSubtest-Pass\tSubtest-Fail\n" \
+    "1650000000000\tCT-US-001\tAX88U\t1.0\t3.0.0.4\tRT-AX88U\t12345\t95\tdataplane\tUDP 1024 Mbps\t\t935.2\t" \
+    "UDP download\tMbps\tThroughput\t0\t0\n" \
+    "1650000000000\tCT-US-001\tAX88U\t1.0\t3.0.0.4\tRT-AX88U\t12345\t95\tdataplane\tTCP 1024 Mbps\t\t870.5\t" \
+    "TCP download\tMbps\tThroughput\t0\t0\n"
+
+# a /port 'interface' record as test_ip_variable_time.py monitors it
+PORT_FIXTURE = {
+    "alias": "sta0000", "ap": "94:a6:7e:54:d4:33", "bps rx": 1200000, "bps tx": 64000, "channel": "36",
+    "down": False, "ip": "192.168.1.100", "mode": "802.11an-AC", "noise": -95, "phantom": False,
+    "rx bytes": 123456789, "rx drop %": 0.0, "signal": "-41 dBm", "tx bytes": 4567890, "tx-rate": 866.7,
+}
+
+
+class WriteStandIn(BaseHTTPRequestHandler):
+    requests = 0
+    lines = []
+    fail_every = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8')
+        with WriteStandIn.lock:
+            WriteStandIn.requests += 1
+            failed = WriteStandIn.fail_every and (WriteStandIn.requests % WriteStandIn.fail_every == 0)
+            if not failed:
+                WriteStandIn.lines += body.split("\n")
+        self.send_response(503 if failed else 204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='influx_batch_writer_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--stations', type=int, default=50, help='stations per port snapshot')
+    parser.add_argument('--intervals', type=int, default=5, help='port snapshots to post')
+    parser.add_argument('--batch_size', type=int, default=500, help='lines per write')
+    parser.add_argument('--fail_every', type=int, default=0, help='stand-in answers 503 to every nth write')
+    args = parser.parse_args()
+
+    WriteStandIn.fail_every = args.fail_every
+    server = ThreadingHTTPServer(('127.0.0.1', 0), WriteStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    influxdb = RecordInflux(_influx_host='127.0.0.1',
+                            _influx_port=server.server_address[1],
+                            _influx_org='lanforge',
+                            _influx_token='token',
+                            _influx_bucket='bucket',
+                            _batch_size=args.batch_size,
+                            _flush_interval=0.2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kpi = os.path.join(tmp, 'kpi.csv')
+        with open(kpi, 'w') as kpi_file:
+            kpi_file.write(KPI_FIXTURE)
+        influxdb.csv_to_influx(kpi)
+    influxdb.flush()
+    assert WriteStandIn.lines[0].startswith('UDP\\ 1024\\ Mbps,')
+    assert WriteStandIn.lines[0].endswith(' value=935.2 1650000000000000000'), WriteStandIn.lines[0]
+    assert 'testbed=CT-US-001' in WriteStandIn.lines[0]
+    print("kpi.csv lines: %s" % WriteStandIn.lines)
+
+    started = time.perf_counter()
+    tags = {'script': 'influx_batch_writer_test'}
+    for _interval in range(args.intervals):
+        for station in range(args.stations):
+            interface = dict(PORT_FIXTURE, alias="sta%04d" % station)
+            influxdb.post_port_snapshot("sta%04d" % station, interface, tags)
+    influxdb.close()
+    elapsed = time.perf_counter() - started
+
+    values = args.stations * args.intervals * len(PORT_FIXTURE)
+    stats = influxdb.get_stats()
+    print("port values: %d  writes before: %d  writes now: %d  sec: %.3f" % (
+        values, values, WriteStandIn.requests, elapsed))
+    print("stats: %s" % stats)
+    assert stats['points_written'] + stats['points_dropped'] == values + 2
+    assert stats['points_written'] == len(WriteStandIn.lines)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
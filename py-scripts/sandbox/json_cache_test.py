@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Drives the Realm json_get cache (LFCliBase.enable_json_cache) against a local
+stand-in for the GUI, no LANforge system is needed. Each test step calls the
+Realm helpers that list cross-connects, endpoints and ports, the way a test
+script does between commands, with and without the cache, and counts the GET
+requests the stand-in answers. It then checks that /cli-json/ commands drop the
+cached listings they change, and only those.
+
+Example:
+    ./json_cache_test.py --cxs 400 --stations 400 --steps 20
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+realm = importlib.import_module("py-json.realm")
+stand_in_gui = importlib.import_module("py-scripts.sandbox.stand_in_gui")
+
+
+class FakeGui(stand_in_gui.StandInGui):
+    def __init__(self, cxs=0, stations=0):
+        super().__init__()
+        self.cxs = ["udp-%04d" % cx for cx in range(cxs)]
+        self.stations = {"sta%04d" % sta: "0.0.0.0" for sta in range(stations)}
+        self.gets = 0
+        self.posts = 0
+
+    def endps(self):
+        return [name + suffix for name in self.cxs for suffix in ("-A", "-B")]
+
+    def response(self, path):
+        if path[0] == "misc":
+            return {"license": "foo 1 forever"}
+        if path[0] == "cx":
+            body = {name: {"name": name, "state": "Stopped"} for name in self.cxs}
+            body["handler"] = "candela.lanforge.GenericJsonResponder"
+            return body
+        if path[0] == "endp":
+            return {"endpoint": [{name: {"name": name}} for name in self.endps()]}
+        if path[0] == "port":
+            return {"interfaces": [{"1.1.%s" % name: {"_links": "/port/1/1/%s" % name, "alias": name,
+                                                      "device": name, "port type": "WIFI-STA", "ip": ip}}
+                                   for name, ip in self.stations.items()]}
+        return {}
+
+    def command(self, command, data):
+        if command == "add_cx":
+            self.cxs.append(data["alias"])
+        elif command == "rm_cx":
+            self.cxs.remove(data["cx_name"])
+        elif command == "set_port":
+            self.stations[data["port"]] = data["ip_addr"]
+
+    def get(self, path, query):
+        with self.lock:
+            self.gets += 1
+            return self.response(path)
+
+    def post(self, path, data):
+        with self.lock:
+            self.posts += 1
+            if path[0] == "cli-json":
+                self.command(path[1], data)
+        return {}
+
+
+def test_step(local_realm):
+    # the listings a script reads between commands
+    local_realm.cx_list()
+    local_realm.cleanup_cxe_prefix("no-such-prefix")
+    local_realm.find_ports_like("sta+")
+    local_realm.wait_until_endps_appear(["udp-0000-A", "udp-0000-B"])
+    local_realm.cx_list()
+    local_realm.dump_all_port_info()
+    local_realm.dump_all_port_info()
+
+
+def run_steps(gui, local_realm, steps):
+    gui.gets = 0
+    started = time.monotonic()
+    for _step in range(steps):
+        test_step(local_realm)
+    return gui.gets, time.monotonic() - started
+
+
+def check_invalidation(gui, local_realm):
+    cache = local_realm.get_json_cache()
+    local_realm.cx_list()
+    local_realm.dump_all_port_info()
+    # a port command drops /port/all and /port/1/list, and leaves the cx listing cached
+    entries = cache.get_stats()["entries"]
+    local_realm.json_post("/cli-json/set_port", {"shelf": 1, "resource": 1, "port": "sta0000",
+                                                 "ip_addr": "10.0.0.1"})
+    assert cache.get_stats()["entries"] == entries - 2, cache.get_stats()
+    ports = local_realm.dump_all_port_info()["interfaces"]
+    assert list(ports[0].values())[0]["ip"] == "10.0.0.1"
+    gets = gui.gets
+    local_realm.cx_list()
+    assert gui.gets == gets, "cx listing was dropped by set_port"
+
+    # a new cross-connect shows at once
+    local_realm.json_post("/cli-json/add_cx", {"alias": "udp-new", "test_mgr": "default_tm",
+                                               "tx_endp": "udp-new-A", "rx_endp": "udp-new-B"})
+    assert "udp-new" in local_realm.cx_list()
+    local_realm.rm_cx("udp-new")
+    assert "udp-new" not in local_realm.cx_list()
+
+    # use_cache=False reads a change the cache has not seen, and caches it
+    local_realm.dump_all_port_info()
+    with gui.lock:
+        gui.stations["sta0000"] = "10.0.0.2"
+    ports = local_realm.json_get("/port/all", use_cache=False)["interfaces"]
+    assert list(ports[0].values())[0]["ip"] == "10.0.0.2"
+    gets = gui.gets
+    assert list(local_realm.dump_all_port_info()["interfaces"][0].values())[0]["ip"] == "10.0.0.2"
+    assert gui.gets == gets, "use_cache=False response was not cached"
+
+    # commands the cache does not know drop everything
+    local_realm.json_post("/cli-json/load", {"name": "BLANK", "action": "overwrite"})
+    assert cache.get_stats()["entries"] == 0
+
+    # responses are copies
+    local_realm.cx_list()["udp-0000"]["state"] = "Run"
+    assert local_realm.cx_list()["udp-0000"]["state"] == "Stopped"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='json_cache_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--cxs', type=int, default=400, help='cross-connects the stand-in lists')
+    parser.add_argument('--stations', type=int, default=400, help='stations the stand-in lists')
+    parser.add_argument('--steps', type=int, default=20, help='test steps to run')
+    parser.add_argument('--ttl_sec', type=float, default=1.0, help='cache ttl_sec')
+    args = parser.parse_args()
+
+    gui = FakeGui(cxs=args.cxs, stations=args.stations).start()
+    local_realm = realm.Realm(lfclient_host="127.0.0.1", lfclient_port=gui.get_port())
+
+    gets, elapsed = run_steps(gui, local_realm, args.steps)
+    print("no cache  %2d steps: GET requests %4d  %.3f sec" % (args.steps, gets, elapsed))
+    local_realm.enable_json_cache(ttl_sec=args.ttl_sec)
+    gets, elapsed = run_steps(gui, local_realm, args.steps)
+    print("cache     %2d steps: GET requests %4d  %.3f sec  %s" % (args.steps, gets, elapsed,
+                                                                  local_realm.get_json_cache().get_stats()))
+    check_invalidation(gui, local_realm)
+    print("invalidation checks passed: %s" % local_realm.get_json_cache().get_stats())
+    gui.shutdown()
+
+
+if __name__ == "__main__":
+    main()
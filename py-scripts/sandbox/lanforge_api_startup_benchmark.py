@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Compares the startup cost of lanforge_client.lanforge_api with every generated
+member in the one file, as it was before lanforge_api_split.py, and split into
+the lanforge_client/generated modules loaded on first use. Each run is a fresh
+interpreter that imports lanforge_api, then uses post_add_sta and
+SetPortCurrentFlags; memory is the resident size after each step, read from
+/proc. Cold runs use a copy of the package without bytecode, as the first run
+after an install does. No LANforge system is needed.
+
+The one file version is read from --monolith, or from git: the lanforge_api.py
+of the commit before lanforge_client/generated was added.
+
+Example:
+    ./lanforge_api_startup_benchmark.py --runs 7
+    ./lanforge_api_startup_benchmark.py --monolith /tmp/lanforge_api.py
+"""
+import argparse
+import compileall
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+CLIENT_DIR = os.path.join(REPO_ROOT, "lanforge_client")
+
+# resident KB now; ru_maxrss would include the peak of the process that started this one
+TIMER = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+
+
+def rss_kb():
+    with open("/proc/self/status") as status:
+        return int([line.split()[1] for line in status if line.startswith("VmRSS:")][0])
+
+
+started = time.perf_counter()
+api = importlib.import_module("lanforge_client.lanforge_api")
+imported = time.perf_counter()
+import_rss_kb = rss_kb()
+api.LFJsonCommand.post_add_sta
+api.LFJsonCommand.SetPortCurrentFlags.if_down
+used = time.perf_counter()
+print(json.dumps({{"import_sec": imported - started, "first_use_sec": used - imported,
+                  "import_rss_kb": import_rss_kb, "rss_kb": rss_kb()}}))
+"""
+
+
+def monolith_source():
+    # the parent of the commit that added the generated package
+    added = subprocess.run(["git", "log", "--diff-filter=A", "--format=%H", "--",
+                            "lanforge_client/generated/__init__.py"],
+                           cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.split()
+    if not added:
+        raise ValueError("lanforge_client/generated is not committed, pass --monolith")
+    return subprocess.run(["git", "show", "%s^:lanforge_client/lanforge_api.py" % added[-1]],
+                          cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def one_file_package(root, source):
+    package_dir = os.path.join(root, "lanforge_client")
+    os.makedirs(package_dir)
+    for name in ("__init__.py", "logg.py", "strutil.py"):
+        shutil.copy(os.path.join(CLIENT_DIR, name), package_dir)
+    with open(os.path.join(package_dir, "lanforge_api.py"), "w") as api_file:
+        api_file.write(source)
+    return package_dir
+
+
+def run_once(package_dir, cold):
+    root = tempfile.mkdtemp(prefix="lf_api_run_") if cold else os.path.dirname(package_dir)
+    try:
+        if cold:
+            shutil.copytree(package_dir, os.path.join(root, "lanforge_client"),
+                            ignore=shutil.ignore_patterns("__pycache__"))
+        output = subprocess.run([sys.executable, "-c", TIMER.format(root=root)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout
+    finally:
+        if cold:
+            shutil.rmtree(root, ignore_errors=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(package_dir, runs):
+    row = {}
+    # the bytecode warm runs read, also when PYTHONDONTWRITEBYTECODE is set
+    compileall.compile_dir(package_dir, quiet=1)
+    for cold in (False, True):
+        results = [run_once(package_dir, cold) for _run in range(runs)]
+        label = "cold" if cold else "warm"
+        for key in ("import_sec", "first_use_sec"):
+            row["%s_%s" % (label, key)] = statistics.median(result[key] for result in results)
+        if not cold:
+            row["import_rss_kb"] = statistics.median(result["import_rss_kb"] for result in results)
+            row["rss_kb"] = statistics.median(result["rss_kb"] for result in results)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lanforge_api_startup_benchmark.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--monolith', help='lanforge_api.py with every generated member in it; default from git')
+    parser.add_argument('--runs', type=int, default=7, help='fresh interpreters per measurement')
+    args = parser.parse_args()
+
+    if args.monolith:
+        with open(args.monolith) as monolith_file:
+            source = monolith_file.read()
+    else:
+        source = monolith_source()
+    scratch = tempfile.mkdtemp(prefix="lf_api_bench_")
+    try:
+        rows = [("one file", measure(one_file_package(scratch, source), args.runs)),
+                ("split", measure(CLIENT_DIR, args.runs))]
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    print("%-9s %10s %10s %10s %10s %12s %12s" % ("", "warm imp", "warm use", "cold imp", "cold use",
+                                                  "imp rss KB", "use rss KB"))
+    for name, row in rows:
+        print("%-9s %9.3fs %9.3fs %9.3fs %9.3fs %12d %12d" % (
+            name, row["warm_import_sec"], row["warm_first_use_sec"], row["cold_import_sec"],
+            row["cold_first_use_sec"], row["import_rss_kb"], row["rss_kb"]))
+
+
+if __name__ == "__main__":
+    main()
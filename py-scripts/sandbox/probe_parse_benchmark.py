@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Times port_probe.parse_probe_results() against the multi-scan parsing that
+ProbePort.refreshProbe used to do, over a corpus of HT, VHT, HE and legacy
+probe outputs. No LANforge system is needed.
+
+Example:
+    ./probe_parse_benchmark.py --iterations 20000
+"""
+import argparse
+import importlib
+import os
+import sys
+import timeit
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+port_probe = importlib.import_module("py-json.port_probe")
+
+PROBE_HEADER = "Station 00:0e:8e:aa:bb:cc (on wlan0)\n" \
+               "\tinactive time:\t12 ms\n" \
+               "\trx bytes:\t81924352\n" \
+               "\trx packets:\t61291\n" \
+               "\ttx bytes:\t2131672\n" \
+               "\ttx packets:\t22018\n" \
+               "\ttx retries:\t118\n" \
+               "\ttx failed:\t0\n" \
+               "\tbeacon loss:\t0\n" \
+               "\tbeacon rx:\t3184\n" \
+               "\trx drop misc:\t1\n" \
+               "\tsignal:  \t-41 [-44, -44] dBm\n" \
+               "\tsignal avg:\t-40 [-43, -43] dBm\n" \
+               "\tbeacon signal avg:\t-39 dBm\n"
+PROBE_FOOTER = "\texpected throughput:\t245.360Mbps\n" \
+               "\tauthorized:\tyes\n" \
+               "\tauthenticated:\tyes\n" \
+               "\tassociated:\tyes\n" \
+               "\tpreamble:\tlong\n" \
+               "\tWMM/WME:\tyes\n" \
+               "\tMFP:\t\tno\n" \
+               "\tTDLS peer:\tno\n" \
+               "\tDTIM period:\t2\n" \
+               "\tbeacon interval:100\n" \
+               "\tconnected time:\t412 seconds\n"
+
+CORPUS = [
+    PROBE_HEADER
+    + "\ttx bitrate:\t300.0 MBit/s MCS 15 40MHz short GI\n"
+    + "\trx bitrate:\t270.0 MBit/s MCS 15 40MHz\n" + PROBE_FOOTER,
+    PROBE_HEADER
+    + "\ttx bitrate:\t866.7 MBit/s VHT-MCS 9 80MHz short GI VHT-NSS 2\n"
+    + "\trx bitrate:\t780.0 MBit/s VHT-MCS 8 80MHz VHT-NSS 2\n" + PROBE_FOOTER,
+    PROBE_HEADER
+    + "\ttx bitrate:\t1201.0 MBit/s 80MHz HE-MCS 11 HE-NSS 2 HE-GI 0 HE-DCM 0\n"
+    + "\trx bitrate:\t1080.6 MBit/s 80MHz HE-MCS 10 HE-NSS 2 HE-GI 0 HE-DCM 0\n" + PROBE_FOOTER,
+    PROBE_HEADER
+    + "\ttx bitrate:\t65.0 MBit/s MCS 7\n"
+    + "\trx bitrate:\t6.0 MBit/s\n" + PROBE_FOOTER,
+]
+
+
+def multi_scan_parse(probe_text):
+    # the list comprehension and split/strip chains refreshProbe used before parse_probe_results()
+    text = probe_text.split('\n')
+    signals = [x.strip('\t').split('\t') for x in text if 'signal' in x]
+    keys = [x[0].strip(' ').strip(':') for x in signals]
+    values = [x[1].strip('dBm').strip(' ') for x in signals]
+    parsed = {"signals": dict(zip(keys, values))}
+    for direction in ('tx', 'rx'):
+        label = direction + ' bitrate'
+        bitrate = [x for x in text if label in x][0].replace('\t', ' ')
+        parsed[direction + '_bitrate'] = bitrate.split(':')[-1].strip(' ')
+        if 'MHz' in bitrate:
+            parsed[direction + '_mhz'] = [x.strip('\t') for x in text if label in x][0] \
+                .split('MHz')[0].rsplit(' ')[-1].strip(' ')
+        mcs = [x.strip('\t') for x in text if label in x][0].split(':')[1].strip('\t')
+        if 'MCS' in mcs:
+            parsed[direction + '_mcs'] = int(mcs.split('MCS')[1].strip(' ').split(' ')[0])
+            if 'NSS' in text:
+                parsed[direction + '_nss'] = [x.strip('\t') for x in text if label in x][0].split('NSS')[1].strip(' ')
+            parsed[direction + '_mbit'] = float(parsed[direction + '_bitrate'].split(' ')[0])
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='probe_parse_benchmark.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--iterations', type=int, default=10000,
+                        help='times to parse the whole corpus')
+    args = parser.parse_args()
+
+    for probe_text in CORPUS:
+        print(port_probe.parse_probe_results(probe_text))
+
+    multi_scan_sec = timeit.timeit(lambda: [multi_scan_parse(x) for x in CORPUS], number=args.iterations)
+    single_pass_sec = timeit.timeit(lambda: [port_probe.parse_probe_results(x) for x in CORPUS],
+                                    number=args.iterations)
+    parses = args.iterations * len(CORPUS)
+    print("multi-scan:  %.2f us per probe" % (multi_scan_sec * 10 ** 6 / parses))
+    print("single-pass: %.2f us per probe" % (single_pass_sec * 10 ** 6 / parses))
+    print("speedup:     %.2fx" % (multi_scan_sec / single_pass_sec))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the LANforge GUI http server, for the sandbox scripts that
+need no LANforge system. Subclasses answer requests by overriding get() and
+post(); the stand-in turns the returned dict into a JSON response, and sends the
+session header on every post so LFSession gets a session id. Raise StandInHttpError
+to answer with an HTTP error status instead.
+
+    class FakeGui(StandInGui):
+        def get(self, path, query):
+            return {"interfaces": []}
+
+    gui = FakeGui().start()
+    session = lanforge_api.LFSession(lfclient_url=gui.get_url())
+    ...
+    gui.shutdown()
+"""
+import importlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+
+
+class StandInHttpError(Exception):
+    def __init__(self, status=500, reason="Internal Server Error"):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+
+class StandInGui:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.server = None
+
+    def get(self, path, query):
+        """
+        :param path: URL path segments, like ['port', '1', '1', 'list']
+        :param query: dict of query parameter to list of values, see urllib.parse.parse_qs
+        :return: dict to send as the JSON response
+        """
+        return {}
+
+    def post(self, path, data):
+        """
+        :param path: URL path segments, like ['cli-json', 'add_sta']
+        :param data: posted JSON as a dict
+        :return: dict to send as the JSON response
+        """
+        return {}
+
+    def start(self):
+        """
+        Serve on a free port of 127.0.0.1 from a daemon thread.
+        :return: self
+        """
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), http_handler(self))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def get_port(self):
+        return self.server.server_address[1]
+
+    def get_url(self):
+        return "http://127.0.0.1:%s" % self.get_port()
+
+    def shutdown(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def http_handler(gui):
+    class Handler(BaseHTTPRequestHandler):
+        def send_json(self, body, headers=(), status=200):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                self.send_json(gui.get(url.path.strip('/').split('/'), parse_qs(url.query)))
+            except StandInHttpError as http_error:
+                self.send_json({"errors": [http_error.reason]}, status=http_error.status)
+
+        def do_POST(self):
+            data = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b"{}")
+            path = urlparse(self.path).path.strip('/').split('/')
+            headers = [(lanforge_api.SESSION_HEADER, "1")]
+            try:
+                self.send_json(gui.post(path, data), headers=headers)
+            except StandInHttpError as http_error:
+                self.send_json({"errors": [http_error.reason]}, headers=headers, status=http_error.status)
+
+        def log_message(self, format, *args):
+            pass
+    return Handler
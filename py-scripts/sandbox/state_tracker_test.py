@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Drives lf_state_tracker.StateTracker against local stand-ins for the GUI: an http
+server answering grouped /port, /endp and /cx queries and a websocket on another
+port sending an event each time a station gets its address. No LANforge system is
+needed. The same wait runs with the websocket and polling, to compare the /port
+requests and records each one reads, and how long after the last address each one
+returns.
+
+Example:
+    ./state_tracker_test.py --stations 800 --spread_sec 5
+"""
+import argparse
+import base64
+import hashlib
+import importlib
+import json
+import os
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lf_state_tracker = importlib.import_module("py-json.lf_state_tracker")
+StateTracker = lf_state_tracker.StateTracker
+stand_in_gui = importlib.import_module("py-scripts.sandbox.stand_in_gui")
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class FakeGui(stand_in_gui.StandInGui):
+    def __init__(self, stations=(), endps=(), cxs=()):
+        super().__init__()
+        self.ips = {station: "0.0.0.0" for station in stations}
+        self.endps = list(endps)
+        self.cxs = list(cxs)
+        self.port_requests = 0
+        self.port_records = 0
+        self.sockets = []
+        self.last_ip_at = None
+
+    def assign_ips(self, spread_sec):
+        # every station gets an address at a random time within spread_sec
+        last_sec = random.uniform(spread_sec / 2, spread_sec)
+        schedule = sorted((random.uniform(0, last_sec), station) for station in self.ips)
+        started = time.monotonic()
+        for at, station in schedule:
+            time.sleep(max(0.0, started + at - time.monotonic()))
+            with self.lock:
+                self.ips[station] = "10.0.%d.%d" % (len(self.ips) // 250, len(self.ips) % 250)
+                self.last_ip_at = time.monotonic()
+            self.send_event({"event_type": "Port", "is_alert": False, "resource": 1, "name": station,
+                             "details": "Port %s IP change from 0.0.0.0 to 10.0.0.1" % station})
+
+    def send_event(self, message):
+        payload = json.dumps(message).encode('utf-8')
+        if len(payload) < 126:
+            frame = bytes([0x81, len(payload)]) + payload
+        else:
+            frame = bytes([0x81, 126]) + len(payload).to_bytes(2, 'big') + payload
+        for sock in list(self.sockets):
+            try:
+                sock.sendall(frame)
+            except OSError:
+                self.sockets.remove(sock)
+
+    def get(self, path, query):
+        if path[0] == 'port':
+            with self.lock:
+                self.port_requests += 1
+                records = [{"1.1.%s" % name: {"alias": name, "ip": self.ips[name]}}
+                           for name in path[3].split(',') if name in self.ips]
+                self.port_records += len(records)
+            return {"interfaces": records}
+        if path[0] == 'endp':
+            return {"endpoint": [{name: {"name": name}} for name in path[1].split(',') if name in self.endps]}
+        body = {name: {"name": name} for name in path[1].split(',') if name in self.cxs}
+        body["handler"] = "candela.lanforge.GenericJsonResponder"
+        return body
+
+
+def ws_handler(gui):
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += self.request.recv(4096)
+            key = [line.split(b":", 1)[1].strip() for line in request.split(b"\r\n")
+                   if line.lower().startswith(b"sec-websocket-key")][0]
+            accept = base64.b64encode(hashlib.sha1(key + WS_GUID.encode()).digest())
+            self.request.sendall(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                                 b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+            gui.sockets.append(self.request)
+            try:
+                while self.request.recv(4096):
+                    pass
+            except OSError:
+                pass
+    return Handler
+
+
+def run_wait(gui, http_port, ws_port, use_websocket, spread_sec):
+    tracker = StateTracker(lfclient_host="127.0.0.1", lfclient_port=http_port, ws_port=ws_port,
+                           use_websocket=use_websocket)
+    streaming = tracker.start()
+    gui.port_requests = 0
+    gui.port_records = 0
+    assigner = threading.Thread(target=gui.assign_ips, args=(spread_sec,), daemon=True)
+    assigner.start()
+    result = tracker.wait_for(lf_state_tracker.PORT, ["1.1.%s" % station for station in gui.ips],
+                              fields=("ip",),
+                              is_ready=lambda record: (record is not None) and (record["ip"] != "0.0.0.0"),
+                              timeout_sec=spread_sec + 30)
+    done_at = time.monotonic()
+    assigner.join()
+    assert result, result
+    print("websocket %-5s  streaming %-5s  /port requests %4d  port records %6d  reads %3d  events %4d  "
+          "sec after last ip %.3f" % (use_websocket, streaming, gui.port_requests, gui.port_records, result.polls,
+                                      tracker.events, done_at - gui.last_ip_at))
+    tracker.stop()
+    for station in gui.ips:
+        gui.ips[station] = "0.0.0.0"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='state_tracker_test.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__doc__)
+    parser.add_argument('--stations', type=int, default=800, help='stations to wait on')
+    parser.add_argument('--spread_sec', type=float, default=5.0, help='seconds over which stations get addresses')
+    args = parser.parse_args()
+
+    gui = FakeGui(stations=["sta%04d" % sta for sta in range(args.stations)],
+                  endps=["udp-A", "udp-B"],
+                  cxs=["udp"])
+    gui.start()
+    ws_server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), ws_handler(gui))
+    ws_server.daemon_threads = True
+    threading.Thread(target=ws_server.serve_forever, daemon=True).start()
+    http_port = gui.get_port()
+    ws_port = ws_server.server_address[1]
+
+    tracker = StateTracker(lfclient_host="127.0.0.1", lfclient_port=http_port, use_websocket=False)
+    assert tracker.wait_for(lf_state_tracker.ENDP, ["udp-A", "udp-B"], is_ready=lambda record: record is not None,
+                            fields=("name",), timeout_sec=2)
+    assert tracker.wait_for(lf_state_tracker.CX, ["udp"], is_ready=lambda record: record is not None,
+                            fields=("name",), timeout_sec=2)
+    assert not tracker.wait_for(lf_state_tracker.CX, ["udp", "tcp"], is_ready=lambda record: record is not None,
+                                fields=("name",), timeout_sec=1)
+
+    run_wait(gui, http_port, ws_port, True, args.spread_sec)
+    run_wait(gui, http_port, ws_port, False, args.spread_sec)
+    # nothing listens on the websocket port: falls back to polling
+    with socket.socket() as unused:
+        unused.bind(('127.0.0.1', 0))
+        closed_port = unused.getsockname()[1]
+    run_wait(gui, http_port, closed_port, True, args.spread_sec)
+    gui.shutdown()
+    ws_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
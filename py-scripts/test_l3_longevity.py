@@ -62,9 +62,12 @@ import csv
 import datetime
 import importlib
 import os
+import math
 import random
+import statistics
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
 import logging
 
@@ -89,6 +92,9 @@ csv_to_influx = importlib.import_module("py-scripts.csv_to_influx")
 InfluxRequest = importlib.import_module("py-dashboard.InfluxRequest")
 influx_add_parser_args = InfluxRequest.influx_add_parser_args
 RecordInflux = InfluxRequest.RecordInflux
+endp_stats_index = importlib.import_module("py-json.endp_stats_index")
+EndpStatsIndex = endp_stats_index.EndpStatsIndex
+ap_stats_parser = importlib.import_module("py-json.ap_stats_parser")
 
 logger = logging.getLogger(__name__)
 
@@ -227,6 +233,17 @@ class L3VariableTime(Realm):
         self.outfile = outfile
         self.csv_started = False
         self.epoch_time = int(time.time())
+        # built once per poll of /endp by get_endp_stats_for_port()
+        self.endp_stats_index = None
+        # port EID name to /port record, refreshed once per poll by snapshot_ports()
+        self.port_snapshot = {}
+        # AP reads run on this worker while the main loop waits for the next poll,
+        # see start_ap_read()
+        self.ap_read_executor = None
+        # start the AP read this many seconds before a poll; the last read's duration
+        self.ap_read_lead_sec = 0
+        # actual poll interval minus polling_interval_seconds, for the current test step
+        self.interval_jitter_sec = []
         self.debug = debug
         self.mconn = mconn
         self.user_tags = user_tags
@@ -423,79 +440,26 @@ class L3VariableTime(Realm):
         return self.csv_results_file.name
 
     # Find avg latency, jitter for connections using specified port.
+    # The endps list is indexed once per poll, so each port is a dictionary lookup
+    # rather than two scans of every endpoint.
     def get_endp_stats_for_port(self, eid_name, endps):
-        lat = 0
-        jit = 0
-        total_dl_rate = 0
-        total_dl_rate_ll = 0
-        total_dl_pkts_ll = 0
-        total_ul_rate = 0
-        total_ul_rate_ll = 0
-        total_ul_pkts_ll = 0
-        count = 0
-        sta_name = 'no_station'
-
-        # logger.debug("endp-stats-for-port, port-eid: {}".format(eid_name))
+        if (self.endp_stats_index is None) or (self.endp_stats_index.endps is not endps):
+            self.endp_stats_index = EndpStatsIndex(endps)
         eid = self.name_to_eid(eid_name)
-        logger.info(
-            "eid_name: {eid_name} eid: {eid}".format(
-                eid_name=eid_name,
-                eid=eid))
-
-        # Convert all eid elements to strings
-        eid[0] = str(eid[0])
-        eid[1] = str(eid[1])
-        eid[2] = str(eid[2])
-
-        for endp in endps:
-            logger.info(pformat(endp))
-            eid_endp = endp["eid"].split(".")
-            logger.info(
-                "Comparing eid:{eid} to endp-id {eid_endp}".format(eid=eid, eid_endp=eid_endp))
-            # Look through all the endpoints (endps), to find the port the eid_name is using.
-            # The eid_name that has the same Shelf, Resource, and Port as the eid_endp (looking at all the endps)
-            # Then read the eid_endp to get the delay, jitter and rx rate
-            # Note: the endp eid is shelf.resource.port.endp-id, the eid can be treated somewhat as
-            # child class of port-eid , and look up the port the eid is using.
-            if eid[0] == eid_endp[0] and eid[1] == eid_endp[1] and eid[2] == eid_endp[2]:
-                lat += int(endp["delay"])
-                jit += int(endp["jitter"])
-                name = endp["name"]
-                logger.debug("endp name {name}".format(name=name))
-                sta_name = name.replace('-A', '')
-                # only the -A endpoint will be found so need to look
-
-                count += 1
-                logger.debug(
-                    "Matched: name: {name} eid:{eid} to endp-id {eid_endp}".format(
-                        name=name, eid=eid, eid_endp=eid_endp))
-            else:
-                name = endp["name"]
-                logger.debug(
-                    "No Match: name: {name} eid:{eid} to endp-id {eid_endp}".format(
-                        name=name, eid=eid, eid_endp=eid_endp))
-
-        if count > 1:
-            lat = int(lat / count)
-            jit = int(jit / count)
-
-        # need to loop though again to find the upload and download per station
-        # if the name matched
-        for endp in endps:
-            if sta_name in endp["name"]:
-                name = endp["name"]
-                if name.endswith("-A"):
-                    logger.debug("name has -A")
-                    total_dl_rate += int(endp["rx rate"])
-                    total_dl_rate_ll += int(endp["rx rate ll"])
-                    total_dl_pkts_ll += int(endp["rx pkts ll"])
-                # -B upload side
-                else:
-                    total_ul_rate += int(endp["rx rate"])
-                    total_ul_rate_ll += int(endp["rx rate ll"])
-                    total_ul_pkts_ll += int(endp["rx pkts ll"])
-
-        return lat, jit, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll
+        logger.debug("eid_name: {eid_name} eid: {eid}".format(eid_name=eid_name, eid=eid))
+        return self.endp_stats_index.stats_for_port(eid)
+
+    # Read every monitored port with one /port query per resource and keep the
+    # records for this poll, so the AP and csv reporting below share them instead
+    # of each requesting the same port again.
+    def snapshot_ports(self, port_eids):
+        records, num_requests = LFUtils.query_ports_by_resource(
+            ports_by_resource=LFUtils.group_ports_by_resource(port_eids),
+            json_get=self.json_get)
+        logger.debug("port snapshot: {num_ports} of {num_eids} ports in {num_requests} requests".format(
+            num_ports=len(records), num_eids=len(port_eids), num_requests=num_requests))
+        self.port_snapshot = records
+        return records
 
     # Query all endpoints to generate rx and other stats, returned
     # as an array of objects.
@@ -903,6 +867,77 @@ class L3VariableTime(Realm):
 
         return ap_stats_ul_2g
 
+    # Row the AP reported for a LANforge mac, from a table parsed once per read by
+    # ap_stats_parser. The test mode AP output has made-up macs, so as before the
+    # last station that is not this port is used. Returns a copy, as callers append
+    # the channel utilization to it.
+    def find_ap_row(self, ap_stats_table, mac):
+        mac = mac.lower()
+        if self.ap_test_mode:
+            for ap_mac in reversed(ap_stats_table):
+                if ap_mac != mac:
+                    return list(ap_stats_table[ap_mac].row)
+            return None
+        stats = ap_stats_table.get(mac)
+        if stats is None:
+            return None
+        return list(stats.row)
+
+    # Read bs_data, chanim_stats and rx_report for every band, stamped with the
+    # time the read was requested and completed.
+    def read_ap_all_bands(self):
+        ap_reads = {"requested": time.time()}
+        if self.ap_test_mode:
+            for band in ("6g", "5g", "2g"):
+                ap_reads[band] = (self.read_ap_bs_data_test_mode(),
+                                  self.read_ap_chanim_stats_test_mode(),
+                                  self.read_ap_rx_report_test_mode())
+        else:
+            ap_reads["6g"] = (self.read_ap_stats_6g(), self.read_ap_chanim_stats_6g(), self.read_ap_stats_ul_6g())
+            ap_reads["5g"] = (self.read_ap_stats_5g(), self.read_ap_chanim_stats_5g(), self.read_ap_stats_ul_5g())
+            ap_reads["2g"] = (self.read_ap_stats_2g(), self.read_ap_chanim_stats_2g(), self.read_ap_stats_ul_2g())
+        ap_reads["completed"] = time.time()
+        return ap_reads
+
+    # Start read_ap_all_bands() in the background. There is a single worker because
+    # every command goes over the same AP serial port.
+    def start_ap_read(self):
+        if self.ap_read_executor is None:
+            self.ap_read_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ap_read")
+        return self.ap_read_executor.submit(self.read_ap_all_bands)
+
+    # Wait for the AP read started for the poll at poll_epoch and use its duration
+    # to decide when to start the next one, so it finishes around the next poll.
+    def collect_ap_read(self, ap_read_future, poll_epoch):
+        ap_reads = ap_read_future.result()
+        read_sec = ap_reads["completed"] - ap_reads["requested"]
+        self.ap_read_lead_sec = min(read_sec, self.polling_interval_seconds)
+        logger.info("AP read took {read_sec:.2f}s, completed {offset:+.2f}s from the poll".format(
+            read_sec=read_sec, offset=ap_reads["completed"] - poll_epoch))
+        return ap_reads
+
+    def stop_ap_reads(self):
+        if self.ap_read_executor is not None:
+            self.ap_read_executor.shutdown(wait=True)
+            self.ap_read_executor = None
+
+    def get_interval_jitter_stats(self):
+        """
+        Summarize self.interval_jitter_sec for the current test step.
+        :return: dict with count, min, median, p90 and max of the absolute jitter in
+        seconds; empty before the second poll
+        """
+        jitter = sorted(abs(x) for x in self.interval_jitter_sec)
+        if not jitter:
+            return {}
+        return {
+            "count": len(jitter),
+            "min": jitter[0],
+            "median": statistics.median(jitter),
+            "p90": jitter[min(len(jitter) - 1, int(math.ceil(0.9 * len(jitter))) - 1)],
+            "max": jitter[-1],
+        }
+
     # provide fake bs_data for testing without AP wl2 is the 6E interface, wl1
     # 5G, wl0 2G
 
@@ -1075,23 +1110,41 @@ class L3VariableTime(Realm):
                     mac_found_5g = False
                     mac_found_2g = False
                     reset_timer = 0
-
+                    ap_read_future = None
+                    # first AP read starts right away
+                    self.ap_read_lead_sec = self.polling_interval_seconds
+                    self.interval_jitter_sec = []
+                    last_poll_epoch = None
+
+                    # polls are scheduled from the previous deadline, not from when
+                    # the previous poll finished, so processing time does not add up
+                    interval_time = cur_time
                     while cur_time < end_time:
-                        # interval_time = cur_time + datetime.timedelta(seconds=5)
-                        interval_time = cur_time + \
-                            datetime.timedelta(
-                                seconds=self.polling_interval_seconds)
+                        interval_time = max(interval_time + datetime.timedelta(seconds=self.polling_interval_seconds),
+                                            datetime.datetime.now())
                         # print("polling_interval_seconds {}".format(self.polling_interval_seconds))
 
                         while cur_time < interval_time:
+                            # start the AP read early enough to be done by the poll
+                            if self.ap_read and (ap_read_future is None) and \
+                                    (interval_time - cur_time).total_seconds() <= self.ap_read_lead_sec:
+                                ap_read_future = self.start_ap_read()
                             cur_time = datetime.datetime.now()
                             time.sleep(.2)
                             reset_timer += 1
                             if reset_timer % 5 == 0:
                                 self.reset_port_check()
 
-                        self.epoch_time = int(time.time())
+                        poll_epoch = time.time()
+                        if last_poll_epoch is not None:
+                            self.interval_jitter_sec.append(poll_epoch - last_poll_epoch - self.polling_interval_seconds)
+                        last_poll_epoch = poll_epoch
+                        if self.ap_read and (ap_read_future is None):
+                            ap_read_future = self.start_ap_read()
+
+                        self.epoch_time = int(poll_epoch)
                         new_rx_values, rx_drop_percent, endps, total_dl_bps, total_ul_bps, total_dl_ll_bps, total_ul_ll_bps = self.__get_rx_values()
+                        port_snapshot = self.snapshot_ports(self.gather_port_eids())
 
                         print(
                             "main loop, total-dl: ",
@@ -1108,30 +1161,23 @@ class L3VariableTime(Realm):
                         # bs_data command shows the OFDMA and MU-MIMO on the
                         # downlink
                         if self.ap_read:
-                            # 6G test mode
-                            if self.ap_test_mode:
-                                ap_stats_6g = self.read_ap_bs_data_test_mode()
-                                ap_chanim_stats_6g = self.read_ap_chanim_stats_test_mode()
-                                ap_stats_ul_6g = self.read_ap_rx_report_test_mode()
-                            else:
-                                # read from the AP 6g
-                                ap_stats_6g = self.read_ap_stats_6g()
-                                ap_chanim_stats_6g = self.read_ap_chanim_stats_6g()
-                                ap_stats_ul_6g = self.read_ap_stats_ul_6g()
+                            # AP reads for this poll, test mode or from the AP
+                            ap_reads = self.collect_ap_read(ap_read_future, poll_epoch)
+                            ap_read_future = None
+                            ap_stats_6g, ap_chanim_stats_6g, ap_stats_ul_6g = ap_reads["6g"]
 
-                            ap_stats_6g_rows = ap_stats_6g.splitlines()
+                            ap_stats_6g_table = ap_stats_parser.parse_bs_data(ap_stats_6g)
                             print(
-                                "From AP stats: ap_stats_6g_rows {}".format(ap_stats_6g_rows))
+                                "From AP stats: ap_stats_6g_table {}".format(ap_stats_6g_table))
 
-                            ap_chanim_stats_rows_6g = ap_chanim_stats_6g.splitlines()
+                            ap_stats_ul_6g_table = ap_stats_parser.parse_rx_report(ap_stats_ul_6g)
                             print(
-                                "From AP chanim: ap_chanim_stats_rows_6g {}".format(ap_chanim_stats_rows_6g))
+                                "From AP stats ul: ap_stats_ul_6g_table {}".format(ap_stats_ul_6g_table))
 
-                            ap_stats_ul_6g_rows = ap_stats_ul_6g.splitlines()
+                            # one channel utilization per AP read, reported with every station row
+                            channel_utilization = ap_stats_parser.chanim_channel_utilization(ap_chanim_stats_6g)
                             print(
-                                "From AP stats ul: ap_stats_ul_6g_rows {}".format(ap_stats_ul_6g_rows))
-
-                            channel_utilization = 0
+                                "From AP chanim: 6g channel_utilization {}".format(channel_utilization))
 
                             # Query all of our ports
                             # Note: the endp eid is the
@@ -1139,97 +1185,32 @@ class L3VariableTime(Realm):
                             port_eids = self.gather_port_eids()
                             # read find the bs_data
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     print(
-                                        "6g query-port: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "6g query-port: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     print(
-                                        "#### 6g From LANforge: port_data, response['insterface']:{}".format(port_data))
+                                        "#### 6g From LANforge: port_data:{}".format(port_data))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_6g_rows:
-                                        split_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_row = split_row
-                                                mac_found_6g = True
-                                        else:
-                                            try:
-                                                # split_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_row = split_row
-                                                    mac_found_6g = True
-                                            except BaseException:
-                                                print(
-                                                    "6g 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    " since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_6g_table, mac)
+                                    if found_row is not None:
+                                        ap_row = found_row
+                                        mac_found_6g = True
                                     if mac_found_6g:
                                         mac_found_6g = False
                                         print(
-                                            "6g selected ap_row (from split_row): {}".format(ap_row))
+                                            "6g selected ap_row (from ap stats): {}".format(ap_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
                                         self.get_endp_stats_for_port(port_data["port"], endps)
 
-                                        # now report the ap_chanim_stats along
-                                        # side of the ap_stats_6g
-                                        xtop_reported = False
-                                        for row in ap_chanim_stats_rows_6g:
-                                            split_row = row.split()
-                                            if xtop_reported:
-                                                print(
-                                                    "6g xtop_reported row: {row}".format(
-                                                        row=row))
-                                                print(
-                                                    "6g xtop_reported split_row: {split_row}".format(
-                                                        split_row=split_row))
-                                                try:
-                                                    xtop = split_row[7]
-                                                    print(
-                                                        "6g xtop {xtop}".format(xtop=xtop))
-                                                    channel_utilization = float(
-                                                        100) - float(xtop)
-                                                    print("6g channel_utilization {utilization}".format(utilization=channel_utilization))
-                                                except BaseException:
-                                                    print(
-                                                        "6g detected chanspec with reading chanim_stats, exception reading xtop")
-
-                                                # should be only one channel
-                                                # utilization
-                                                break
-                                            else:
-                                                try:
-                                                    if split_row[0].lower(
-                                                    ) == 'chanspec':
-                                                        print(
-                                                            "6g chanspec found xtop_reported = True")
-                                                        xtop_reported = True
-                                                except BaseException:
-                                                    print(
-                                                        "6g Error reading xtop")
                                         # ap information is passed with ap_row
                                         # so all information needs to be
                                         # contained in ap_row
@@ -1237,56 +1218,27 @@ class L3VariableTime(Realm):
 
                             # work though the ul rx_data 6G
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "6g query-port: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "6g query-port: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     logger.info(
-                                        "#### 6g From LANforge: port_data, response['insterface']:{}".format(port_data))
+                                        "#### 6g From LANforge: port_data:{}".format(port_data))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_ul_6g_rows:
-                                        split_ul_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_ul_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_ul_row = split_ul_row
-                                                mac_found_ul_6g = True
-                                        else:
-                                            try:
-                                                # split_ul_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_ul_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_ul_row = split_ul_row
-                                                    mac_found_ul_6g = True
-                                            except BaseException:
-                                                print(
-                                                    "6g ul 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    " ul since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_ul_6g_table, mac)
+                                    if found_row is not None:
+                                        ap_ul_row = found_row
+                                        mac_found_ul_6g = True
                                     if mac_found_ul_6g:
                                         mac_found_ul_6g = False
                                         print(
-                                            "6g ul selected ap_ul_row (from split_ul_row): {}".format(ap_ul_row))
+                                            "6g ul selected ap_ul_row (from ap stats): {}".format(ap_ul_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
@@ -1316,135 +1268,54 @@ class L3VariableTime(Realm):
                                             total_dl_pkts_ll,
                                             ap_row)
                                 #####
-                            # 5G test mode
-                            if self.ap_test_mode:
-                                ap_stats_5g = self.read_ap_bs_data_test_mode()
-                                print("ap_stats 5g {}".format(ap_stats_5g))
-                                ap_chanim_stats_5g = self.read_ap_chanim_stats_test_mode()
-                                ap_stats_ul_5g = self.read_ap_rx_report_test_mode()
-                            else:
-                                # read from the AP
-                                ap_stats_5g = self.read_ap_stats_5g()
-                                ap_chanim_stats_5g = self.read_ap_chanim_stats_5g()
-                                ap_stats_ul_5g = self.read_ap_stats_ul_5g()
+                            # 5G from the same AP read
+                            ap_stats_5g, ap_chanim_stats_5g, ap_stats_ul_5g = ap_reads["5g"]
 
-                            ap_stats_5g_rows = ap_stats_5g.splitlines()
+                            ap_stats_5g_table = ap_stats_parser.parse_bs_data(ap_stats_5g)
                             print(
-                                "From AP stats: ap_stats_5g_rows {}".format(ap_stats_5g_rows))
+                                "From AP stats: ap_stats_5g_table {}".format(ap_stats_5g_table))
 
-                            ap_chanim_stats_rows_5g = ap_chanim_stats_5g.splitlines()
+                            ap_stats_ul_5g_table = ap_stats_parser.parse_rx_report(ap_stats_ul_5g)
                             print(
-                                "From AP chanim: ap_chanim_stats_rows_5g {}".format(ap_chanim_stats_rows_5g))
+                                "From AP stats ul: ap_stats_ul_5g_table {}".format(ap_stats_ul_5g_table))
 
-                            ap_stats_ul_5g_rows = ap_stats_ul_5g.splitlines()
+                            # one channel utilization per AP read, reported with every station row
+                            channel_utilization = ap_stats_parser.chanim_channel_utilization(ap_chanim_stats_5g)
                             print(
-                                "From AP stats ul: ap_stats_ul_5g_rows {}".format(ap_stats_ul_5g_rows))
-
-                            channel_utilization = 0
+                                "From AP chanim: 5g channel_utilization {}".format(channel_utilization))
 
                             # Query all of our ports
                             # Note: the endp eid is the shelf.resource.port.endp-id
                             # reading the data for bs_data
                             port_eids = self.gather_port_eids()
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "query-port 5g: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "query-port 5g: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     logger.info(
-                                        "#### From LANforge: port_data, response['insterface']:{}".format(port_data))
+                                        "#### From LANforge: port_data:{}".format(port_data))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_5g_rows:
-                                        split_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_row = split_row
-                                                mac_found_5g = True
-                                        else:
-                                            try:
-                                                # split_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_row = split_row
-                                                    mac_found_5g = True
-                                            except BaseException:
-                                                print(
-                                                    "5g 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    "5g since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_5g_table, mac)
+                                    if found_row is not None:
+                                        ap_row = found_row
+                                        mac_found_5g = True
                                     if mac_found_5g:
                                         mac_found_5g = False
                                         print(
-                                            "5g selected ap_row (from split_row): {}".format(ap_row))
+                                            "5g selected ap_row (from ap stats): {}".format(ap_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
                                         latency, jitter, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll = self.get_endp_stats_for_port(
                                             port_data["port"], endps)
 
-                                        # now report the ap_chanim_stats along
-                                        # side of the ap_stats_5g
-                                        xtop_reported = False
-                                        for row in ap_chanim_stats_rows_5g:
-                                            split_row = row.split()
-                                            if xtop_reported:
-                                                print(
-                                                    "xtop_reported 5g row: {row}".format(
-                                                        row=row))
-                                                print(
-                                                    "xtop_reported 5g split_row: {split_row}".format(
-                                                        split_row=split_row))
-                                                try:
-                                                    xtop = split_row[7]
-                                                    print(
-                                                        "5g xtop {xtop}".format(xtop=xtop))
-                                                except BaseException:
-                                                    print(
-                                                        "5g detected chanspec with reading chanim_stats, exception reading xtop")
-
-                                                try:
-                                                    channel_utilization = float(
-                                                        100) - float(xtop)
-                                                    print(
-                                                        "5g channel_utilization {utilization}".format(
-                                                            utilization=channel_utilization))
-                                                except BaseException:
-                                                    print(
-                                                        "5g detected chanspec with reading chanim_stats, failed calcluating channel_utilization from xtop")
-                                                # should be only one channel
-                                                # utilization
-                                                break
-                                            else:
-                                                try:
-                                                    if split_row[0].lower(
-                                                    ) == 'chanspec':
-                                                        print(
-                                                            "5g chanspec found xtop_reported = True")
-                                                        xtop_reported = True
-                                                except BaseException:
-                                                    print(
-                                                        "5g Error reading xtop")
                                         # ap information is passed with ap_row
                                         # so all information needs to be
                                         # contained in ap_row
@@ -1477,56 +1348,27 @@ class L3VariableTime(Realm):
 
                             # work though the ul rx_data 5G
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "5g query-port: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "5g query-port: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     logger.info(
-                                        "#### 5g From LANforge: port_data, response['insterface']:{}".format(port_data))
+                                        "#### 5g From LANforge: port_data:{}".format(port_data))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_ul_5g_rows:
-                                        split_ul_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_ul_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_ul_row = split_ul_row
-                                                mac_found_ul_5g = True
-                                        else:
-                                            try:
-                                                # split_ul_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_ul_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_ul_row = split_ul_row
-                                                    mac_found_ul_5g = True
-                                            except BaseException:
-                                                print(
-                                                    "5g ul 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    "5g ul since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_ul_5g_table, mac)
+                                    if found_row is not None:
+                                        ap_ul_row = found_row
+                                        mac_found_ul_5g = True
                                     if mac_found_ul_5g:
                                         mac_found_ul_5g = False
                                         print(
-                                            "5g ul selected ap_ul_row (from split_ul_row): {}".format(ap_ul_row))
+                                            "5g ul selected ap_ul_row (from ap stats): {}".format(ap_ul_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
@@ -1555,135 +1397,54 @@ class L3VariableTime(Realm):
                                             total_dl_pkts_ll,
                                             ap_ul_row)
 
-                            # 2g test mode
-                            if self.ap_test_mode:
-                                ap_stats_2g = self.read_ap_bs_data_test_mode()
-                                print("ap_stats 2g {}".format(ap_stats_2g))
-                                ap_chanim_stats_2g = self.read_ap_chanim_stats_test_mode()
-                                ap_stats_ul_2g = self.read_ap_rx_report_test_mode()
-                            else:
-                                # read from the AP
-                                ap_stats_2g = self.read_ap_stats_2g()
-                                ap_chanim_stats_2g = self.read_ap_chanim_stats_2g()
-                                ap_stats_ul_2g = self.read_ap_stats_ul_2g()
+                            # 2g from the same AP read
+                            ap_stats_2g, ap_chanim_stats_2g, ap_stats_ul_2g = ap_reads["2g"]
 
-                            ap_stats_2g_rows = ap_stats_2g.splitlines()
+                            ap_stats_2g_table = ap_stats_parser.parse_bs_data(ap_stats_2g)
                             print(
-                                "From AP stats: ap_stats_2g_rows {}".format(ap_stats_2g_rows))
+                                "From AP stats: ap_stats_2g_table {}".format(ap_stats_2g_table))
 
-                            ap_chanim_stats_rows_2g = ap_chanim_stats_2g.splitlines()
+                            ap_stats_ul_2g_table = ap_stats_parser.parse_rx_report(ap_stats_ul_2g)
                             print(
-                                "From AP chanim: ap_chanim_stats_rows_2g {}".format(ap_chanim_stats_rows_2g))
+                                "From AP stats ul: ap_stats_ul_2g_table {}".format(ap_stats_ul_2g_table))
 
-                            ap_stats_ul_2g_rows = ap_stats_ul_2g.splitlines()
+                            # one channel utilization per AP read, reported with every station row
+                            channel_utilization = ap_stats_parser.chanim_channel_utilization(ap_chanim_stats_2g)
                             print(
-                                "From AP stats ul: ap_stats_ul_2g_rows {}".format(ap_stats_ul_2g_rows))
-
-                            channel_utilization = 0
+                                "From AP chanim: 2g channel_utilization {}".format(channel_utilization))
 
                             # Query all of our ports
                             # Note: the endp eid is the
                             # shelf.resource.port.endp-id
                             port_eids = self.gather_port_eids()
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "2g query-port: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "2g query-port: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     # print("#### From LANforge: port_data,
                                     # response['insterface']:{}".format(p))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_2g_rows:
-                                        split_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_row = split_row
-                                                mac_found_2g = True
-                                        else:
-                                            try:
-                                                # split_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_row = split_row
-                                                    mac_found_2g = True
-                                            except BaseException:
-                                                print(
-                                                    "2g 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    "2g since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_2g_table, mac)
+                                    if found_row is not None:
+                                        ap_row = found_row
+                                        mac_found_2g = True
                                     if mac_found_2g:
                                         mac_found_2g = False
                                         print(
-                                            "2g selected ap_row (from split_row): {}".format(ap_row))
+                                            "2g selected ap_row (from ap stats): {}".format(ap_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
                                         latency, jitter, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll = self.get_endp_stats_for_port(
                                             port_data["port"], endps)
 
-                                        # now report the ap_chanim_stats along
-                                        # side of the ap_stats_2g
-                                        xtop_reported = False
-                                        for row in ap_chanim_stats_rows_2g:
-                                            split_row = row.split()
-                                            if xtop_reported:
-                                                print(
-                                                    "2g xtop_reported row: {row}".format(
-                                                        row=row))
-                                                print(
-                                                    "2g xtop_reported split_row: {split_row}".format(
-                                                        split_row=split_row))
-                                                try:
-                                                    xtop = split_row[7]
-                                                    print(
-                                                        "2g xtop {xtop}".format(xtop=xtop))
-                                                except BaseException:
-                                                    print(
-                                                        "2g detected chanspec with reading chanim_stats, exception reading xtop")
-
-                                                try:
-                                                    channel_utilization = float(
-                                                        100) - float(xtop)
-                                                    print(
-                                                        "2g channel_utilization {utilization}".format(
-                                                            utilization=channel_utilization))
-                                                except BaseException:
-                                                    print(
-                                                        "2g detected chanspec with reading chanim_stats, failed calcluating channel_utilization from xtop")
-                                                # should be only one channel
-                                                # utilization
-                                                break
-                                            else:
-                                                try:
-                                                    if split_row[0].lower(
-                                                    ) == 'chanspec':
-                                                        print(
-                                                            "2g chanspec found xtop_reported = True")
-                                                        xtop_reported = True
-                                                except BaseException:
-                                                    print(
-                                                        "2g Error reading xtop")
                                         # ap information is passed with ap_row
                                         # so all information needs to be
                                         # contained in ap_row
@@ -1715,56 +1476,27 @@ class L3VariableTime(Realm):
                                             ap_row)
                             # work though the ul rx_data 5G
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                # read LANforge to get the mac
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "5g query-port: %s: incomplete response:" %
-                                        url)
-                                    logger.info(pformat(response))
+                                        "5g query-port: %s: not in port snapshot" %
+                                        eid_name)
                                 else:
-                                    # print("response".format(response))
-                                    logger.info(pformat(response))
-                                    port_data = response['interface']
                                     logger.info(
-                                        "#### 2g From LANforge: port_data, response['insterface']:{}".format(port_data))
+                                        "#### 2g From LANforge: port_data:{}".format(port_data))
                                     mac = port_data['mac']
                                     # print("#### From LANforge: port_data['mac']:
                                     # {mac}".format(mac=mac))
 
-                                    # Parse the ap stats to find the matching
-                                    # mac then use that row for reporting
-                                    for row in ap_stats_ul_2g_rows:
-                                        split_ul_row = row.split()
-                                        # print("split_row {}".format(split_row))
-                                        # print("split_row[0] {}  mac {}".format(split_row[0].lower(),mac.lower()))
-                                        if self.ap_test_mode:
-                                            if split_ul_row[0].lower(
-                                            ) != mac.lower():
-                                                ap_ul_row = split_ul_row
-                                                mac_found_ul_2g = True
-                                        else:
-                                            try:
-                                                # split_ul_row[0].lower() , mac from AP
-                                                # mac.lower() , mac from
-                                                # LANforge
-                                                if split_ul_row[0].lower(
-                                                ) == mac.lower():
-                                                    ap_ul_row = split_ul_row
-                                                    mac_found_ul_2g = True
-                                            except BaseException:
-                                                print(
-                                                    "2g ul 'No stations are currently associated.'? from AP")
-                                                print(
-                                                    "2g ul since possibly no stations: excption on compare split_row[0].lower() ")
+                                    # Look up the row the AP reported for this mac
+                                    found_row = self.find_ap_row(ap_stats_ul_2g_table, mac)
+                                    if found_row is not None:
+                                        ap_ul_row = found_row
+                                        mac_found_ul_2g = True
                                     if mac_found_ul_2g:
                                         mac_found_ul_2g = False
                                         print(
-                                            "2g ul selected ap_ul_row (from split_ul_row): {}".format(ap_ul_row))
+                                            "2g ul selected ap_ul_row (from ap stats): {}".format(ap_ul_row))
 
                                         # Find latency, jitter for connections
                                         # using this port.
@@ -1799,17 +1531,11 @@ class L3VariableTime(Realm):
                             # shelf.resource.port.endp-id
                             port_eids = self.gather_port_eids()
                             for eid_name in port_eids:
-                                eid = self.name_to_eid(eid_name)
-                                url = "/port/%s/%s/%s" % (eid[0],
-                                                          eid[1], eid[2])
-                                response = self.json_get(url)
-                                if (response is None) or (
-                                        "interface" not in response):
+                                port_data = port_snapshot.get(eid_name)
+                                if port_data is None:
                                     logger.info(
-                                        "query-port: %s: incomplete response:" % url)
-                                    logger.info(pformat(response))
+                                        "query-port: %s: not in port snapshot" % eid_name)
                                 else:
-                                    port_data = response['interface']
                                     latency, jitter, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll = self.get_endp_stats_for_port(
                                         port_data["port"], endps)
 
@@ -1832,6 +1558,10 @@ class L3VariableTime(Realm):
                                         total_dl_pkts_ll,
                                         ap_row)
 
+                    # the loop waits out each interval, so jitter is how late polls were
+                    logger.info("polling interval {interval}s jitter: {jitter}".format(
+                        interval=self.polling_interval_seconds, jitter=self.get_interval_jitter_stats()))
+
                     # At end of test step, record KPI into kpi.csv
                     self.record_kpi_csv(
                         len(temp_stations_list),
@@ -2142,6 +1872,7 @@ class L3VariableTime(Realm):
 
     # Stop traffic and admin down stations.
     def stop(self):
+        self.stop_ap_reads()
         self.cx_profile.stop_cx()
         self.multicast_profile.stop_mc()
         for station_list in self.station_lists:
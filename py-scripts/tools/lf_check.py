@@ -18,6 +18,15 @@ rig is the LANforge
 dut is the device under test
 NOTE : if all json data (rig,dut,tests)  in same json file pass same json in for all 3 inputs
 
+Running tests concurrently:
+./lf_check.py --json_rig <rig_json> --json_dut <dut_json> --json_test <tests json> --test_suite <suite_name> --parallel_tests 3
+A test states what it uses in the test json, space separated; UPSTREAM_PORT is replaced from the rig json:
+    "claim_radios": "1.1.wiphy0 1.1.wiphy1",
+    "claim_upstream_ports": "UPSTREAM_PORT",
+    "claim_resources": "1.2"
+Tests whose claims do not overlap run at the same time. Tests without claims, and tests
+with a load_db, run alone. The html and csv results keep the suite order.
+
 NOTES:
 Create three json files: 1. discribes rig (lanforge), dut (device under test) and other for the description of the tests
 
@@ -103,7 +112,6 @@ Starting LANforge:
 
 '''
 
-from psutil import TimeoutExpired
 import requests
 import pandas as pd
 import paramiko
@@ -123,6 +131,8 @@ import os
 import datetime
 import sys
 import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 if sys.version_info[0] != 3:
     print("This script requires Python3")
@@ -145,6 +155,58 @@ sys.path.insert(0, parent_dir_path)
 # setup logging FORMAT
 FORMAT = '%(asctime)s %(name)s %(levelname)s: %(message)s'
 
+# test json keys naming what a test uses on the LANforge, space separated:
+#   "claim_radios": "1.1.wiphy0 1.1.wiphy1", "claim_upstream_ports": "UPSTREAM_PORT", "claim_resources": "1.2"
+# --parallel_tests runs tests whose claims do not overlap at the same time.
+CLAIM_KEYS = {
+    "claim_radios": "radio",
+    "claim_upstream_ports": "port",
+    "claim_resources": "resource",
+}
+
+
+def read_test_claims(test_config, upstream_port=""):
+    """
+    :param test_config: dictionary of one test from the test json
+    :param upstream_port: value substituted for UPSTREAM_PORT
+    :return: frozenset of (kind, eid) claims, eids as shelf.resource[.port].
+    Empty when the test claims nothing, such a test runs alone.
+    """
+    claims = set()
+    for key, kind in CLAIM_KEYS.items():
+        for name in str(test_config.get(key, "")).replace('UPSTREAM_PORT', upstream_port).split():
+            hunks = name.split('.')
+            if kind == "resource":
+                # 2 or 1.2
+                eid = "1.{}".format(hunks[-1]) if len(hunks) == 1 else "{}.{}".format(hunks[-2], hunks[-1])
+            elif len(hunks) == 1:
+                # wiphy0 is on shelf 1 resource 1
+                eid = "1.1.{}".format(name)
+            elif len(hunks) == 2:
+                eid = "1.{}".format(name)
+            else:
+                eid = name
+            claims.add((kind, eid))
+    return frozenset(claims)
+
+
+def claims_conflict(claims_a, claims_b):
+    """
+    Two tests conflict when either claims nothing, when they claim the same radio,
+    port or resource, or when one claims the resource a radio or port of the other is on.
+    """
+    if not claims_a or not claims_b:
+        return True
+    if claims_a & claims_b:
+        return True
+    resources_a = {eid for kind, eid in claims_a if kind == "resource"}
+    resources_b = {eid for kind, eid in claims_b if kind == "resource"}
+    for resources, claims in ((resources_a, claims_b), (resources_b, claims_a)):
+        for kind, eid in claims:
+            if '.'.join(eid.split('.')[:2]) in resources:
+                return True
+    return False
+
 
 # lf_check class contains verificaiton configuration and ocastrates the
 # testing.
@@ -161,7 +223,8 @@ class lf_check():
                  _outfile,
                  _outfile_name,
                  _report_path,
-                 _log_path):
+                 _log_path,
+                 _parallel_tests=1):
         self.json_rig = _json_rig
         self.json_dut = _json_dut
         self.json_test = _json_test
@@ -171,6 +234,9 @@ class lf_check():
         self.production_run = _production
         self.report_path = _report_path
         self.log_path = _log_path
+        self.parallel_tests = _parallel_tests
+        # runs prepared for run_scheduled_scripts when parallel_tests > 1
+        self.scheduled_runs = []
         self.test_dict = {}
         # This is needed for iterations and batch testing.
         self.test_dict_original_json = {}
@@ -239,6 +305,7 @@ class lf_check():
         # current test running
         self.test = None
         self.report_index = 0
+        self.report_group = None
         self.iteration = 0
         self.channel_list = []
         self.channel = 'NA'
@@ -783,7 +850,12 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
         # The underlying netsmith objects
         sleep(15)
 
-    def run_script(self):
+    def prepare_script(self):
+        """
+        Substitute the rig, dut and batch values into the arguments of self.test
+        :return: dictionary describing the run, for load_test_database, execute_script
+        and record_script_result
+        """
         # The network arguments need to be changed when in a list
         for index, args_list_element in enumerate(
                 self.test_dict[self.test]['args_list']):
@@ -922,26 +994,15 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                 self.test_dict[self.test]['timeout'])
         else:
             self.test_timeout = self.test_timeout_default
+        # the database is loaded just before the test runs, see load_test_database
+        load_db = None
         if 'load_db' in self.test_dict[self.test]:
             self.logger.info(
                 "load_db : {}".format(
                     self.test_dict[self.test]['load_db']))
             if str(self.test_dict[self.test]['load_db']).lower() != "none" and str(
                     self.test_dict[self.test]['load_db']).lower() != "skip":
-                try:
-                    self.load_custom_database(
-                        self.test_dict[self.test]['load_db'])
-                except BaseException:
-                    self.logger.info("custom database failed to load check existance and location: {}".format(
-                        self.test_dict[self.test]['load_db']))
-        try:
-            os.chdir(self.scripts_wd)
-            self.logger.info("Current Working Directory {}".format(os.getcwd()))
-
-        except BaseException:
-            self.logger.info(
-                "failed to change to {}".format(
-                    self.scripts_wd))
+                load_db = self.test_dict[self.test]['load_db']
         cmd_args = "{}".format(self.test_dict[self.test]['args'])
         # TODO the the tx_power went back in the command
         command = "./{} {}".format(
@@ -956,7 +1017,6 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                 self.log_path, "{}-{}-stdout.txt".format(self.outfile_name, self.test))
             self.logger.info(
                 "stdout_log_txt: {}".format(stdout_log_txt))
-            stdout_log = open(stdout_log_txt, 'a')
             stderr_log_txt = os.path.join(
                 self.log_path, "{}-{}-stderr.txt".format(self.outfile_name, self.test))
             self.logger.info(
@@ -970,28 +1030,58 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
         self.logger.info("command : {command}".format(command=command))
         command_to_run = shlex.split(command_to_run)
 
+        return {
+            "test": self.test,
+            "iteration": self.iteration,
+            # the iterations of one batch setting append to the same stdout log
+            "report_group": (self.test, self.channel, self.nss, self.bandwidth, self.tx_power),
+            "command": command,
+            "command_to_run": command_to_run,
+            "timeout": int(self.test_timeout),
+            "load_db": load_db,
+            "claims": read_test_claims(self.test_dict[self.test], upstream_port=self.upstream_port),
+            "stdout_log_txt": stdout_log_txt,
+            "stderr_log_txt": stderr_log_txt,
+        }
+
+    def load_test_database(self, run):
+        if run["load_db"] is None:
+            return
+        try:
+            self.load_custom_database(run["load_db"])
+        except BaseException:
+            self.logger.info("custom database failed to load check existance and location: {}".format(
+                run["load_db"]))
+
+    def execute_script(self, run):
+        """
+        Run one prepared test to completion or its timeout. Safe to call from several
+        threads at once: the working directory is passed to Popen instead of changed.
+        :param run: dictionary returned by prepare_script
+        :return: dictionary of return_code, timed_out, output, start_time, end_time
+        """
+        command_to_run = run["command_to_run"]
         self.logger.info(
             "running {command_to_run}".format(
                 command_to_run=command_to_run))
-        self.test_start_time = str(datetime.datetime.now().strftime(
+        test_start_time = str(datetime.datetime.now().strftime(
             "%Y-%m-%d-%H-%M-%S")).replace(':', '-')
         self.logger.info(
             "Test start: {time} Timeout: {timeout}".format(
-                time=self.test_start_time, timeout=self.test_timeout))
+                time=test_start_time, timeout=run["timeout"]))
         start_time = datetime.datetime.now()
         summary_output = ''
+        summary = None
         # have stderr go to stdout
         try:
             summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+                                       universal_newlines=True, cwd=self.scripts_wd)
         # TODO the looks one directory higher,  there needs to be a way to execute from higher directory.
         except FileNotFoundError:
             # TODO tx_power is one directory up from py-scripts
-            self.logger.info("FileNotFoundError will try to execute from lanforge Top directory")
-            os.chdir(self.lanforge_wd)
-            self.logger.info("Changed Current Working Directory to {}".format(os.getcwd()))
+            self.logger.info("FileNotFoundError will try to execute from lanforge Top directory {}".format(self.lanforge_wd))
             summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+                                       universal_newlines=True, cwd=self.lanforge_wd)
 
         except PermissionError:
             self.logger.info("PermissionError on execution of {command}".format(command=command_to_run))
@@ -999,44 +1089,81 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
         except IsADirectoryError:
             self.logger.info("IsADirectoryError on execution of {command}".format(command=command_to_run))
 
-        # This code will read the output as the script is running and log 
-        for line in iter(summary.stdout.readline, ''):
-            self.logger.info(line)
-            summary_output += line
-        try:
-            if int(self.test_timeout != 0):
-                summary.wait(timeout=int(self.test_timeout))
-            else:
+        return_code = None
+        timed_out = False
+        if summary is not None:
+            # the output is read until the script exits, so the timeout is enforced by a timer
+            # that terminates the script, the read then ends at end of file
+            timed_out_event = threading.Event()
+
+            def expire():
+                timed_out_event.set()
+                summary.terminate()
+
+            timer = None
+            if run["timeout"] != 0:
+                timer = threading.Timer(run["timeout"], expire)
+                timer.daemon = True
+                timer.start()
+            # This code will read the output as the script is running and log
+            for line in iter(summary.stdout.readline, ''):
+                self.logger.info(line)
+                summary_output += line
+            try:
+                summary.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                summary.kill()
                 summary.wait()
-        except TimeoutExpired:
-            summary.terminate
-            self.test_result = "TIMEOUT"
-        # TODO will change back to the scripts_wd since a script like tx_power.py will run in the parent directoy to
-        # py-scripts
-        os.chdir(self.scripts_wd)
-        self.logger.info("Current Working Directory {}".format(os.getcwd()))
-
-        # Since using "wait" above the return code will be set. 
-        try:
-            return_code = summary.returncode 
-            if return_code == '0':
-                self.logger.info("Script returned pass return code: {return_code} for test: {command}".format(return_code=return_code,command=command_to_run))
-            else: 
-                self.logger.info("Script returned non-zero return code: {return_code} for test: {command}".format(return_code=return_code,command=command_to_run))
-
-        except BaseException as err:
-            self.logger.info("issue reading return code err:{err}".format(err=err))
-
-        self.logger.info(summary_output)
-        stdout_log.write(summary_output)
-        stdout_log.close()
-        end_time = datetime.datetime.now()
-        self.test_end_time = str(datetime.datetime.now().strftime(
+            if timer is not None:
+                timer.cancel()
+            timed_out = timed_out_event.is_set()
+            return_code = summary.returncode
+            if return_code == 0:
+                self.logger.info("Script returned pass return code: {return_code} for test: {command}".format(return_code=return_code, command=command_to_run))
+            else:
+                self.logger.info("Script returned non-zero return code: {return_code} for test: {command}".format(return_code=return_code, command=command_to_run))
+
+        with open(run["stdout_log_txt"], 'a') as stdout_log:
+            stdout_log.write(summary_output)
+        return {
+            "return_code": return_code,
+            "timed_out": timed_out,
+            "output": summary_output,
+            "start_time": start_time,
+            "end_time": datetime.datetime.now(),
+            "test_start_time": test_start_time,
+        }
+
+    def run_script(self):
+        run = self.prepare_script()
+        self.load_test_database(run)
+        self.record_script_result(run, self.execute_script(run))
+
+    def record_script_result(self, run, result):
+        """
+        Classify a finished test and add its rows to the html and csv results.
+        Called in suite order, also when the tests ran concurrently.
+        """
+        self.test = run["test"]
+        self.iteration = run["iteration"]
+        if run["report_group"] != self.report_group:
+            self.report_group = run["report_group"]
+            self.report_index = 0
+        command = run["command"]
+        command_to_run = run["command_to_run"]
+        stdout_log_txt = run["stdout_log_txt"]
+        stderr_log_txt = run["stderr_log_txt"]
+        return_code = result["return_code"]
+        self.test_result = "TIMEOUT" if result["timed_out"] else "Failure"
+        self.logger.info(result["output"])
+        self.test_start_time = result["test_start_time"]
+        end_time = result["end_time"]
+        self.test_end_time = str(end_time.strftime(
             "%Y-%m-%d-%H-%M-%S")).replace(':', '-')
         self.logger.info(
             "Test end time {time}".format(
                 time=self.test_end_time))
-        time_delta = end_time - start_time
+        time_delta = end_time - result["start_time"]
         minutes, seconds = divmod(time_delta.seconds, 60)
         hours, minutes = divmod(minutes, 60)
         self.duration = "{day}d {hours}h {minutes}m {seconds}s {msec} ms".format(
@@ -1272,6 +1399,55 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
         # self.logger.info("row: {}".format(row))
         self.logger.info("test: {} executed".format(self.test))
 
+    def schedule_script(self):
+        # without --parallel_tests the test runs now, with it the test is queued for run_scheduled_scripts
+        if self.parallel_tests > 1:
+            self.scheduled_runs.append(self.prepare_script())
+        else:
+            self.run_script()
+
+    @staticmethod
+    def runs_conflict(run_a, run_b):
+        # loading a database changes the whole LANforge configuration
+        if run_a["load_db"] is not None or run_b["load_db"] is not None:
+            return True
+        return claims_conflict(run_a["claims"], run_b["claims"])
+
+    def run_scheduled_scripts(self):
+        """
+        Run the queued tests, up to parallel_tests at a time. A test starts once it
+        conflicts with no running test and no earlier queued test, so tests sharing a
+        radio, port or resource keep their suite order and tests loading a database run
+        alone. Results are recorded in suite order as soon as every earlier test finished.
+        """
+        runs = self.scheduled_runs
+        self.scheduled_runs = []
+        pending = list(range(len(runs)))
+        running = {}
+        results = {}
+        next_record = 0
+        with ThreadPoolExecutor(max_workers=self.parallel_tests) as executor:
+            while pending or running:
+                for index in list(pending):
+                    if len(running) >= self.parallel_tests:
+                        break
+                    run = runs[index]
+                    if any(self.runs_conflict(run, runs[other]) for other in running.values()):
+                        continue
+                    if any(self.runs_conflict(run, runs[other]) for other in pending[:pending.index(index)]):
+                        continue
+                    pending.remove(index)
+                    self.load_test_database(run)
+                    self.logger.info("starting test: {test} iteration: {iteration} with {running} running".format(
+                        test=run["test"], iteration=run["iteration"], running=len(running)))
+                    running[executor.submit(self.execute_script, run)] = index
+                done, _not_done = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+                while next_record in results:
+                    self.record_script_result(runs[next_record], results.pop(next_record))
+                    next_record += 1
+
     # TODO the command needs to be updated for the batch iterations
     def run_script_test(self):
         self.start_html_results()
@@ -1329,7 +1505,7 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                                     for self.iteration in range(self.test_iterations):
                                         self.iteration += 1
                                         # Runs the scripts
-                                        self.run_script()
+                                        self.schedule_script()
                     # once done clear out the lists
                     self.channel_list = []
                     self.nss_list = []
@@ -1348,7 +1524,7 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                                     self.iteration += 1
                                     # in batch mode need to set the VARIABLES back into the test
                                     # Runs the scripts
-                                    self.run_script()
+                                    self.schedule_script()
                     self.channel_list = []
                     self.nss_list = []
                     self.bandwidth_list = []
@@ -1366,7 +1542,7 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                             for self.iteration in range(self.test_iterations):
                                 self.iteration += 1
                                 # Runs the scripts
-                                self.run_script()
+                                self.schedule_script()
                     self.channel_list = []
                     self.nss_list = []
                     self.bandwidth_list = []
@@ -1381,12 +1557,15 @@ QA Report Dashboard: lf_qa.py was not run as last script of test suite"""
                         self.iteration += 1
 
                     # Runs the scripts
-                    self.run_script()
+                    self.schedule_script()
 
             else:
                 self.logger.warning(
                     "enable value {} for test: {} ".format(self.test_dict[self.test]['enabled'], self.test))
 
+        if self.scheduled_runs:
+            self.run_scheduled_scripts()
+
         suite_end_time = datetime.datetime.now()
         self.suite_end_time = str(datetime.datetime.now().strftime(
             "%Y-%m-%d-%H-%M-%S")).replace(':', '-')
@@ -1468,6 +1647,12 @@ note if all json data (rig,dut,tests)  in same json file pass same json in for a
         '--update_latest',
         help="--update_latest  copy latest results to top dir",
         action='store_true')
+    parser.add_argument(
+        '--parallel_tests',
+        help="--parallel_tests <number>  run up to this many tests at once, tests run together only when their\n"
+             "claim_radios, claim_upstream_ports and claim_resources in the test json do not overlap",
+        type=int,
+        default=1)
     # logging configuration:
     parser.add_argument("--lf_logger_config_json",
                         help="--lf_logger_config_json <json file> , json configuration of logger")
@@ -1560,7 +1745,8 @@ note if all json data (rig,dut,tests)  in same json file pass same json in for a
                      _outfile=outfile,
                      _outfile_name=outfile_name,
                      _report_path=report_path,
-                     _log_path=log_path)
+                     _log_path=log_path,
+                     _parallel_tests=args.parallel_tests)
 
     # set up logging
     logfile = args.logfile[:-4]
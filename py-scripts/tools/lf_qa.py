@@ -15,6 +15,8 @@ import argparse
 from pathlib import Path
 import time
 import logging
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
 
@@ -27,6 +29,73 @@ lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 
+def kpi_figure(df_tmp, group, test_id, test_tag, test_rig, units):
+    if group == 'Score':
+        # group of Score will have subtest
+        kpi_fig = (
+            px.scatter(
+                df_tmp,
+                x="Date",
+                y="numeric-score",
+                custom_data=[
+                    'numeric-score',
+                    'Subtest-Pass',
+                    'Subtest-Fail'],
+                color="short-description",
+                hover_name="short-description",
+                size_max=60)).update_traces(
+            mode='lines+markers')
+
+        kpi_fig.update_traces(
+            hovertemplate="<br>".join([
+                "numeric-score: %{customdata[0]}",
+                "Subtest-Pass: %{customdata[1]}",
+                "Subtest-Fail: %{customdata[2]}"
+            ])
+        )
+    else:
+        kpi_fig = (
+            px.scatter(
+                df_tmp,
+                x="Date",
+                y="numeric-score",
+                color="short-description",
+                hover_name="short-description",
+                size_max=60)).update_traces(
+            mode='lines+markers')
+
+    kpi_fig.update_layout(
+        title="{test_id} : {group} : {test_tag} : {test_rig}".format(
+            test_id=test_id, group=group, test_tag=test_tag, test_rig=test_rig),
+        xaxis_title="Time",
+        yaxis_title="{units}".format(units=units),
+        xaxis={'type': 'date'}
+    )
+    kpi_fig.update_layout(autotypenumbers='convert types')
+    return kpi_fig
+
+
+def render_kpi_chart(chart):
+    # runs in a worker process, returns True if the png was written
+    kpi_fig = kpi_figure(df_tmp=chart['df_tmp'],
+                         group=chart['group'],
+                         test_id=chart['test_id'],
+                         test_tag=chart['test_tag'],
+                         test_rig=chart['test_rig'],
+                         units=chart['units'])
+    try:
+        kpi_fig.write_image(chart['png_path'], scale=1, width=1200, height=300)
+    except ValueError as err:
+        logger.info("ValueError kpi_fig.write_image {msg}".format(msg=err))
+        return False
+    except BaseException as err:
+        logger.info("BaseException kpi_fig.write_image{msg}".format(msg=err))
+        return False
+    # generate html image (interactive)
+    kpi_fig.write_html(chart['html_path'])
+    return True
+
+
 class csv_sql:
     def __init__(self,
                  _path='.',
@@ -35,7 +104,9 @@ class csv_sql:
                  _table='qa_table',
                  _server='',
                  _cut='/home/lanforge/',
-                 _png=False):
+                 _png=False,
+                 _store_batch=50,
+                 _png_workers=1):
         self.path = _path
         self.file = _file
         self.database = _database
@@ -43,6 +114,8 @@ class csv_sql:
         self.server = _server
         self.cut = _cut
         self.png = _png
+        self.store_batch = _store_batch
+        self.png_workers = _png_workers
         self.kpi_list = []
         self.html_list = []
         self.conn = None
@@ -281,6 +354,10 @@ class csv_sql:
     # Fedora  sudo dnf install sqlitebrowser
     # Ubuntu sudo apt-get install sqlite3
     #
+    # <table>_manifest holds the path, mtime and size of every kpi.csv stored,
+    # so --store only reads kpi.csv files that are new or have changed since the
+    # last run. Rows of the table are unique on (kpi_path, kpi_row), kpi_row being
+    # the row number within the kpi.csv, and a changed kpi.csv replaces its rows.
     def store(self):
         logger.info("reading kpi and storing in db {}".format(self.database))
         path = Path(self.path)
@@ -289,40 +366,112 @@ class csv_sql:
         if not self.kpi_list:
             logger.info("WARNING: used --store , no new kpi.csv found, check input path or remove --store from command line")
 
-        for kpi in self.kpi_list:  # TODO note empty kpi.csv failed test
-            df_kpi_tmp = pd.read_csv(kpi, sep='\t')
-            # only store the path to the kpi.csv file
-            _kpi_path = str(kpi).replace('kpi.csv', '')
-            df_kpi_tmp['kpi_path'] = _kpi_path
-            test_run = self.get_test_run_from_meta(_kpi_path)
-            df_kpi_tmp['test_run'] = test_run
-            use_meta_test_tag, test_tag = self.get_test_tag_from_meta(_kpi_path)
-            if use_meta_test_tag:
-                df_kpi_tmp['test-tag'] = test_tag
-            df_kpi_tmp = df_kpi_tmp.append(df_kpi_tmp, ignore_index=True)
-            self.df = self.df.append(df_kpi_tmp, ignore_index=True)
-
         self.conn = sqlite3.connect(self.database)
-        try:
-            self.df.to_sql(self.table, self.conn, if_exists='append')
-        except BaseException:
-            logger.info("attempt to append to database with different column layout,\
-                 caused an exception, input new name --database <new name>")
-            print(
-                "Error attempt to append to database with different column layout,\
-                     caused an exception, input new name --database <new name>",
-                file=sys.stderr)
-            exit(1)
+        self.create_manifest()
+        manifest = self.read_manifest()
+        kpi_changed = []
+        for kpi in self.kpi_list:
+            kpi_stat = kpi.stat()
+            if manifest.get(str(kpi)) != (kpi_stat.st_mtime, kpi_stat.st_size):
+                kpi_changed.append((kpi, kpi_stat))
+        logger.info("kpi.csv found: {found} new or changed: {changed}".format(
+            found=len(self.kpi_list), changed=len(kpi_changed)))
+
+        for batch_start in range(0, len(kpi_changed), self.store_batch):
+            batch = kpi_changed[batch_start:batch_start + self.store_batch]
+            # read the batch before opening the transaction, meta.txt reads are slow on nfs
+            df_kpi_list = [(kpi, kpi_stat, self.read_kpi(kpi)) for kpi, kpi_stat in batch]
+            try:
+                with self.conn:
+                    for kpi, kpi_stat, df_kpi_tmp in df_kpi_list:
+                        if df_kpi_tmp is not None:
+                            self.insert_kpi(df_kpi_tmp)
+                        self.conn.execute(
+                            'INSERT OR REPLACE INTO "{table}_manifest" (path, mtime, size, rows, stored) '
+                            'VALUES (?, ?, ?, ?, ?)'.format(table=self.table),
+                            (str(kpi), kpi_stat.st_mtime, kpi_stat.st_size,
+                             0 if df_kpi_tmp is None else len(df_kpi_tmp), time.time()))
+            except sqlite3.Error as err:
+                logger.info("attempt to store kpi in database {db} caused an exception: {err}".format(
+                    db=self.database, err=err))
+                print(
+                    "Error storing kpi in database {db}: {err}, input new name --database <new name>".format(
+                        db=self.database, err=err),
+                    file=sys.stderr)
+                exit(1)
         self.conn.close()
 
-    def generate_png(self, group, test_id_list, test_tag,
-                     test_rig, kpi_path_list, kpi_fig, df_tmp):
+    def create_manifest(self):
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS "{table}_manifest" '
+            '(path TEXT PRIMARY KEY, mtime REAL, size INTEGER, rows INTEGER, stored REAL)'.format(table=self.table))
+        self.conn.commit()
+
+    def read_manifest(self):
+        rows = self.conn.execute(
+            'SELECT path, mtime, size FROM "{table}_manifest"'.format(table=self.table)).fetchall()
+        return {kpi_path: (mtime, size) for kpi_path, mtime, size in rows}
+
+    def read_kpi(self, kpi):
+        # returns None for an empty kpi.csv, as written by a failed test
+        try:
+            df_kpi_tmp = pd.read_csv(kpi, sep='\t')
+        except pd.errors.EmptyDataError:
+            logger.info("empty kpi.csv {kpi}".format(kpi=kpi))
+            return None
+        # only store the path to the kpi.csv file
+        _kpi_path = str(kpi).replace('kpi.csv', '')
+        df_kpi_tmp['kpi_path'] = _kpi_path
+        df_kpi_tmp['kpi_row'] = range(len(df_kpi_tmp))
+        test_run = self.get_test_run_from_meta(_kpi_path)
+        df_kpi_tmp['test_run'] = test_run
+        use_meta_test_tag, test_tag = self.get_test_tag_from_meta(_kpi_path)
+        if use_meta_test_tag:
+            df_kpi_tmp['test-tag'] = test_tag
+        return df_kpi_tmp
+
+    def insert_kpi(self, df_kpi_tmp):
+        # caller holds the transaction
+        table_info = self.conn.execute('PRAGMA table_info("{table}")'.format(table=self.table)).fetchall()
+        if not table_info:
+            self.conn.execute(pd.io.sql.get_schema(df_kpi_tmp, self.table, con=self.conn))
+        else:
+            # a newer kpi.csv may carry more columns than the table was created with
+            table_columns = [column[1] for column in table_info]
+            for column in df_kpi_tmp.columns:
+                if column not in table_columns:
+                    logger.info("adding column {column} to {table}".format(column=column, table=self.table))
+                    self.conn.execute('ALTER TABLE "{table}" ADD COLUMN "{column}"'.format(
+                        table=self.table, column=column))
+        self.conn.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS "{table}_kpi_row" ON "{table}" (kpi_path, kpi_row)'.format(
+                table=self.table))
+        # rows of an earlier version of this kpi.csv, and duplicates stored before the manifest
+        self.conn.execute('DELETE FROM "{table}" WHERE kpi_path = ?'.format(table=self.table),
+                          (df_kpi_tmp['kpi_path'].iloc[0],))
+        columns = ", ".join('"{}"'.format(column) for column in df_kpi_tmp.columns)
+        placeholders = ", ".join("?" for _column in df_kpi_tmp.columns)
+        rows = df_kpi_tmp.astype(object).where(pd.notnull(df_kpi_tmp), None).values.tolist()
+        self.conn.executemany('INSERT INTO "{table}" ({columns}) VALUES ({placeholders})'.format(
+            table=self.table, columns=columns, placeholders=placeholders), rows)
+
+    def create_indexes(self):
+        # one index per query made by sub_test_information and generate_graph_png
+        try:
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS "{table}_graph" ON "{table}" '
+                '("test-rig", "test-tag", "Graph-Group", Date)'.format(table=self.table))
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS "{table}_date" ON "{table}" (Date)'.format(table=self.table))
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS "{table}_test_run" ON "{table}" (test_run)'.format(table=self.table))
+            self.conn.commit()
+        except sqlite3.OperationalError as err:
+            # missing table or columns, reported by the queries that follow
+            logger.info("could not index {table}: {err}".format(table=self.table, err=err))
+
+    def chart_paths(self, group, test_tag, test_rig, kpi_path_list):
         # save the figure - figures will be over written png
-        # for testing
-        png_server_img = ''
-        # generate the png files
-        logger.info("generate png and kpi images from kpi kpi_path:{}".format(
-            df_tmp['kpi_path']))
         # generate png img path
         png_path = os.path.join(
             kpi_path_list[-1], "{}_{}_{}_kpi.png".format(group, test_tag, test_rig))
@@ -331,51 +480,31 @@ class csv_sql:
         html_path = os.path.join(
             kpi_path_list[-1], "{}_{}_{}_kpi.html".format(group, test_tag, test_rig))
         html_path = html_path.replace(' ', '')
+        return png_path, html_path
+
+    def chart_html(self, group, test_id_list, test_tag,
+                   test_rig, kpi_path_list, png_path, html_path):
         # NOTE: html links to png do not like spaces
         png_server_img = self.server + png_path.replace(self.cut, '')
-        # generate png image
-        png_present = True
-        try:
-            kpi_fig.write_image(png_path, scale=1, width=1200, height=300)
-        except ValueError as err:
-            logger.info("ValueError kpi_fig.write_image {msg}".format(msg=err))
-            png_present = False
-            # exit(1)
-        except BaseException as err:
-            logger.info("BaseException kpi_fig.write_image{msg}".format(msg=err))
-            png_present = False
-            # exit(1)
-        # generate html image (interactive)
-        # TODO Do not crash if a PNG is not present
-        if png_present:
-            kpi_fig.write_html(html_path)
-            img_kpi_html_path = self.server + html_path
-            img_kpi_html_path = img_kpi_html_path.replace(self.cut, '')
-            self.html_results += """
-            <a href={img_kpi_html_path} target="_blank">
-                <img src={png_server_img}>
-            </a>
-            """.format(img_kpi_html_path=img_kpi_html_path, png_server_img=png_server_img)
-            # link to interactive results
-            kpi_html_path = self.server + html_path
-            kpi_html_path = kpi_html_path.replace(self.cut, '')
-            # self.html_results +="""<br>"""
-            # link to full test results
-            # if self.server == '':
-            #    report_index_html_path = self.server + kpi_path_list[-1] 
-            # else:
-            report_index_html_path = self.server + kpi_path_list[-1] + "index.html"
-            report_index_html_path = report_index_html_path.replace(self.cut, '')
-            self.html_results += """<a href={report_index_html_path} target="_blank">{test_id}_{group}_{test_tag}_{test_rig}_Report </a>
-            """.format(report_index_html_path=report_index_html_path, test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig)
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-    
+        img_kpi_html_path = self.server + html_path
+        img_kpi_html_path = img_kpi_html_path.replace(self.cut, '')
+        self.html_results += """
+        <a href={img_kpi_html_path} target="_blank">
+            <img src={png_server_img}>
+        </a>
+        """.format(img_kpi_html_path=img_kpi_html_path, png_server_img=png_server_img)
+        # link to full test results
+        report_index_html_path = self.server + kpi_path_list[-1] + "index.html"
+        report_index_html_path = report_index_html_path.replace(self.cut, '')
+        self.html_results += """<a href={report_index_html_path} target="_blank">{test_id}_{group}_{test_tag}_{test_rig}_Report </a>
+        """.format(report_index_html_path=report_index_html_path, test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig)
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+
     # TODO determin the subtest pass and fail graph
-    # df is sorted by date oldest to newest
     # get the test_run for last run
     # query the db for  all pass and fail or last run
     # put in table
@@ -385,27 +514,29 @@ class csv_sql:
         # https://datacarpentry.org/python-ecology-lesson/09-working-with-sql/index.html-
         self.conn = sqlite3.connect(self.database)
         # current connection is sqlite3 /TODO move to SQLAlchemy
-        df3 = pd.read_sql_query(
-            "SELECT * from {}".format(self.table), self.conn)
-        # sort by date from oldest to newest.
+        self.create_indexes()
+        # test_run are used for detemining the subtest-pass, subtest-fail
+        # the last run is the one with the newest Date
         try:
-            df3 = df3.sort_values(by='Date')
-        except BaseException:
+            last_run = self.conn.execute(
+                'SELECT test_run FROM "{table}" WHERE Date = (SELECT MAX(Date) FROM "{table}") LIMIT 1'.format(
+                    table=self.table)).fetchone()
+        except sqlite3.OperationalError:
+            last_run = None
+        if last_run is None:
             logger.info(("Database empty reading subtest: "
-                   "KeyError(key) when sorting by Date for db: {db},"
+                   "no Date in db: {db},"
                    " check Database name, path to kpi, typo in path, exiting".format(db=self.database)))
             exit(1)
-        self.conn.close()
+        self.test_run = last_run[0]
+        logger.info("test_run last {}".format(self.test_run))
 
-        # test_run are used for detemining the subtest-pass, subtest-fail
-        # the tests are sorted by date above.
-        test_run_list = list(df3['test_run'])
-        logger.info("test_run_list first [0] {}".format(test_run_list[0]))
-        logger.info("test_run_list last [-1] {}".format(test_run_list[-1]))
-
-        self.test_run = test_run_list[-1]
         # collect this runs subtest totals
-        df_tmp = df3.loc[df3['test_run'] == self.test_run]
+        df_tmp = pd.read_sql_query(
+            'SELECT "Subtest-Pass", "Subtest-Fail", "dut-model-num", "dut-sw-version", "dut-hw-version", '
+            '"dut-serial-num" FROM "{table}" WHERE test_run = ?'.format(table=self.table),
+            self.conn, params=(self.test_run,))
+        self.conn.close()
         subtest_passed_list = list(df_tmp['Subtest-Pass'])
         subtest_failed_list = list(df_tmp['Subtest-Fail'])
 
@@ -466,130 +597,99 @@ class csv_sql:
         # https://datacarpentry.org/python-ecology-lesson/09-working-with-sql/index.html-
         self.conn = sqlite3.connect(self.database)
         # current connection is sqlite3 /TODO move to SQLAlchemy
-        df3 = pd.read_sql_query(
-            "SELECT * from {}".format(self.table), self.conn)
-        # sort by date from oldest to newest.
-        try:
-            df3 = df3.sort_values(by='Date')
-        except BaseException:
-            logger.info("Database empty: KeyError(key) when sorting by Date, check Database name, path to kpi, typo in path, exiting")
-            exit(1)
-        self.conn.close()
-
+        self.create_indexes()
+        self.create_chart_manifest()
         # graph group and test-tag are used for detemining the graphs, can use any columns
-        # the following list manipulation removes the duplicates
-        graph_group_list = list(df3['Graph-Group'])
-        graph_group_list = [x for x in graph_group_list if x is not None]
-        graph_group_list = list(set(graph_group_list))
-        logger.info("graph_group_list: {}".format(graph_group_list))
-
         # prior to 5.4.3 there was not test-tag, the test tag is in the meta data
-        # logger.info("dataframe df3 {df3}".format(df3=df3))
-
-        test_tag_list = list(df3['test-tag'])
-        test_tag_list = [x for x in test_tag_list if x is not None]
-        test_tag_list = list(sorted(set(test_tag_list)))
-        # logger.info("test_tag_list: {}".format(test_tag_list) )
-
-        test_rig_list = list(df3['test-rig'])
-        test_rig_list = [x for x in test_rig_list if x is not None]
-        test_rig_list = list(sorted(set(test_rig_list)))
+        try:
+            graph_list = self.conn.execute(
+                'SELECT DISTINCT "test-rig", "test-tag", "Graph-Group" FROM "{table}" '
+                'WHERE "test-rig" IS NOT NULL AND "test-tag" IS NOT NULL AND "Graph-Group" IS NOT NULL '
+                'ORDER BY "test-rig", "test-tag", "Graph-Group"'.format(table=self.table)).fetchall()
+            test_rig_list = [row[0] for row in self.conn.execute(
+                'SELECT DISTINCT "test-rig" FROM "{table}" WHERE "test-rig" IS NOT NULL '
+                'ORDER BY "test-rig"'.format(table=self.table))]
+        except sqlite3.OperationalError:
+            logger.info("Database empty: no table or columns to graph, check Database name, path to kpi, typo in path, exiting")
+            exit(1)
         self.test_rig_list = test_rig_list
         logger.info("test_rig_list: {}".format(test_rig_list))
 
-        # create the rest of the graphs
-        for test_rig in test_rig_list:
-            for test_tag in test_tag_list:
-                for group in graph_group_list:
-                    df_tmp = df3.loc[(df3['test-rig'] == test_rig) & (
-                        df3['Graph-Group'] == str(group)) & (df3['test-tag'] == str(test_tag))]
-                    if not df_tmp.empty:
-                        # Note if graph group is score there is sub tests for pass and fail
-                        # would like a percentage
-
-                        df_tmp = df_tmp.sort_values(by='Date')
-                        test_id_list = list(df_tmp['test-id'])
-                        kpi_path_list = list(df_tmp['kpi_path'])
-
-                        # get Device Under Test Information ,
-                        # the set command uses a hash , sorted puts it back in order
-                        # the set reduces the redundency the filster removes None
-                        # list puts it back into a list
-                        # This code is since the dut is not passed in to lf_qa.py when
-                        # regernation of graphs from db
-
-                        units_list = list(df_tmp['Units'])
-                        logger.info(
-                            "GRAPHING::: test-rig {} test-tag {}  Graph-Group {}".format(test_rig, test_tag, group))
-                        # group of Score will have subtest
-                        if group == 'Score':
-                            # Print out the Standard Score report
-                            kpi_fig = (
-                                px.scatter(
-                                    df_tmp,
-                                    x="Date",
-                                    y="numeric-score",
-                                    custom_data=[
-                                        'numeric-score',
-                                        'Subtest-Pass',
-                                        'Subtest-Fail'],
-                                    color="short-description",
-                                    hover_name="short-description",
-                                    size_max=60)).update_traces(
-                                mode='lines+markers')
-
-                            kpi_fig.update_traces(
-                                hovertemplate="<br>".join([
-                                    "numeric-score: %{customdata[0]}",
-                                    "Subtest-Pass: %{customdata[1]}",
-                                    "Subtest-Fail: %{customdata[2]}"
-                                ])
-                            )
-
-                            kpi_fig.update_layout(
-                                title="{test_id} : {group} : {test_tag} : {test_rig}".format(
-                                    test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig),
-                                xaxis_title="Time",
-                                yaxis_title="{}".format(units_list[-1]),
-                                xaxis={'type': 'date'}
-                            )
-                            kpi_fig.update_layout(autotypenumbers='convert types')
-
-                            self.generate_png(df_tmp=df_tmp,
-                                              group=group,
-                                              test_id_list=test_id_list,
-                                              test_tag=test_tag,
-                                              test_rig=test_rig,
-                                              kpi_path_list=kpi_path_list,
-                                              kpi_fig=kpi_fig)
-
-                        else:
-                            kpi_fig = (
-                                px.scatter(
-                                    df_tmp,
-                                    x="Date",
-                                    y="numeric-score",
-                                    color="short-description",
-                                    hover_name="short-description",
-                                    size_max=60)).update_traces(
-                                mode='lines+markers')
-
-                            kpi_fig.update_layout(
-                                title="{test_id} : {group} : {test_tag} : {test_rig}".format(
-                                    test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig),
-                                xaxis_title="Time",
-                                yaxis_title="{units}".format(units=units_list[-1]),
-                                xaxis={'type': 'date'}
-                            )
-                            kpi_fig.update_layout(autotypenumbers='convert types')
-
-                            self.generate_png(df_tmp=df_tmp,
-                                              group=group,
-                                              test_id_list=test_id_list,
-                                              test_tag=test_tag,
-                                              test_rig=test_rig,
-                                              kpi_path_list=kpi_path_list,
-                                              kpi_fig=kpi_fig)
+        chart_manifest = self.read_chart_manifest()
+        chart_list = []
+        for test_rig, test_tag, group in graph_list:
+            df_tmp = pd.read_sql_query(
+                'SELECT * FROM "{table}" WHERE "test-rig" = ? AND "test-tag" = ? AND "Graph-Group" = ? '
+                'ORDER BY Date'.format(table=self.table),
+                self.conn, params=(test_rig, test_tag, group))
+            # Note if graph group is score there is sub tests for pass and fail
+            # would like a percentage
+            test_id_list = list(df_tmp['test-id'])
+            kpi_path_list = list(df_tmp['kpi_path'])
+            units_list = list(df_tmp['Units'])
+            png_path, html_path = self.chart_paths(group=group,
+                                                   test_tag=test_tag,
+                                                   test_rig=test_rig,
+                                                   kpi_path_list=kpi_path_list)
+            digest = hashlib.sha1(pd.util.hash_pandas_object(df_tmp, index=False).values.tobytes()).hexdigest()
+            unchanged = (chart_manifest.get(png_path) == digest
+                         and os.path.exists(png_path) and os.path.exists(html_path))
+            logger.info(
+                "GRAPHING::: test-rig {} test-tag {}  Graph-Group {} unchanged {}".format(test_rig, test_tag, group, unchanged))
+            chart_list.append({
+                'df_tmp': df_tmp,
+                'group': group,
+                'test_id_list': test_id_list,
+                'test_id': test_id_list[-1],
+                'test_tag': test_tag,
+                'test_rig': test_rig,
+                'units': units_list[-1],
+                'kpi_path_list': kpi_path_list,
+                'png_path': png_path,
+                'html_path': html_path,
+                'digest': digest,
+                'unchanged': unchanged})
+
+        render_list = [chart for chart in chart_list if not chart['unchanged']]
+        logger.info("charts: {charts} to render: {render} workers: {workers}".format(
+            charts=len(chart_list), render=len(render_list), workers=self.png_workers))
+        if self.png_workers > 1 and len(render_list) > 1:
+            with ProcessPoolExecutor(max_workers=self.png_workers) as executor:
+                png_present_list = list(executor.map(render_kpi_chart, render_list))
+        else:
+            png_present_list = [render_kpi_chart(chart) for chart in render_list]
+        for chart, png_present in zip(render_list, png_present_list):
+            chart['png_present'] = png_present
+            if png_present:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO "{table}_charts" (png_path, digest, rendered) VALUES (?, ?, ?)'.format(
+                        table=self.table), (chart['png_path'], chart['digest'], time.time()))
+        self.conn.commit()
+        self.conn.close()
+
+        # TODO Do not crash if a PNG is not present
+        for chart in chart_list:
+            if chart['unchanged'] or chart['png_present']:
+                self.chart_html(group=chart['group'],
+                                test_id_list=chart['test_id_list'],
+                                test_tag=chart['test_tag'],
+                                test_rig=chart['test_rig'],
+                                kpi_path_list=chart['kpi_path_list'],
+                                png_path=chart['png_path'],
+                                html_path=chart['html_path'])
+
+    # <table>_charts holds a digest of the rows behind each png written, a chart
+    # whose rows hash the same and whose png and html are still on disk is not redrawn
+    def create_chart_manifest(self):
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS "{table}_charts" '
+            '(png_path TEXT PRIMARY KEY, digest TEXT, rendered REAL)'.format(table=self.table))
+        self.conn.commit()
+
+    def read_chart_manifest(self):
+        rows = self.conn.execute(
+            'SELECT png_path, digest FROM "{table}_charts"'.format(table=self.table)).fetchall()
+        return {png_path: digest for png_path, digest in rows}
 
 
 # Feature, Sum up the subtests passed/failed from the kpi files for each
@@ -632,8 +732,18 @@ Usage: lf_qa.py --store --png --path <path to directories to traverse> --databas
         default='/home/lanforge/')
     parser.add_argument(
         '--store',
-        help='--store , store kpi to db, action store_true',
+        help='--store , store kpi.csv files that are new or changed since the last --store to db, action store_true',
         action='store_true')
+    parser.add_argument(
+        '--store_batch',
+        help='--store_batch <number> kpi.csv files stored per database transaction default: 50',
+        type=int,
+        default=50)
+    parser.add_argument(
+        '--png_workers',
+        help='--png_workers <number> processes rendering png and html charts, charts whose data is unchanged are not redrawn default: 4',
+        type=int,
+        default=4)
     parser.add_argument(
         '--png',
         help='--png,  generate png for kpi in path, generate display, action store_true',
@@ -695,7 +805,9 @@ Usage: lf_qa.py --store --png --path <path to directories to traverse> --databas
         _table=__table,
         _server=__server,
         _cut=__cut,
-        _png=__png)
+        _png=__png,
+        _store_batch=args.store_batch,
+        _png_workers=args.png_workers)
     # csv_dash.sub_test_information()
 
     if args.store: